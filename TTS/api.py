@@ -4,9 +4,11 @@ import logging
 import os
 import tempfile
 import warnings
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 from torch import nn
 
 from TTS.config import load_config
@@ -298,8 +300,9 @@ class TTS(nn.Module):
         speaker_wav: str | os.PathLike[Any] | list[str | os.PathLike[Any]] | None = None,
         emotion: str | None = None,
         split_sentences: bool = True,
+        return_list: bool = False,
         **kwargs,
-    ):
+    ) -> np.ndarray | list[float]:
         """Convert text to speech.
 
         Args:
@@ -319,8 +322,13 @@ class TTS(nn.Module):
                 Split text into sentences, synthesize them separately and concatenate the file audio.
                 Setting it False uses more VRAM and possibly hit model specific text length or VRAM limits. Only
                 applicable to the 🐸TTS models. Defaults to True.
+            return_list (bool, optional):
+                Return the waveform as a list of floats, as in earlier versions. Defaults to False.
             **kwargs (optional):
                 Additional arguments for the model.
+
+        Returns:
+            np.ndarray: the float32 waveform.
         """
         if self.synthesizer is None:
             msg = "The selected model does not support speech synthesis."
@@ -332,10 +340,92 @@ class TTS(nn.Module):
             language_name=language,
             speaker_wav=speaker_wav,
             split_sentences=split_sentences,
+            return_list=return_list,
             **kwargs,
         )
         return wav
 
+    def tts_stream(
+        self,
+        text: str,
+        speaker: str | None = None,
+        language: str | None = None,
+        speaker_wav: str | os.PathLike[Any] | list[str | os.PathLike[Any]] | None = None,
+        split_sentences: bool = True,
+        **kwargs,
+    ) -> Iterator[np.ndarray]:
+        """Convert text to speech and yield the audio in chunks as soon as they are ready.
+
+        XTTS and Bark stream several chunks per sentence, other models yield one chunk per sentence. Arguments are the
+        same as for `tts()`.
+
+        Yields:
+            np.ndarray: the next float32 audio chunk.
+        """
+        if self.synthesizer is None:
+            msg = "The selected model does not support speech synthesis."
+            raise RuntimeError(msg)
+        self._check_arguments(speaker=speaker, language=language, speaker_wav=speaker_wav, **kwargs)
+        yield from self.synthesizer.tts_stream(
+            text=text,
+            speaker_name=speaker,
+            language_name=language,
+            speaker_wav=speaker_wav,
+            split_sentences=split_sentences,
+            **kwargs,
+        )
+
+    def tts_batch(
+        self,
+        texts: list[str],
+        speakers: list[str | None] | None = None,
+        languages: list[str | None] | None = None,
+        speaker_wavs: list[str | os.PathLike[Any] | list[str | os.PathLike[Any]] | None] | None = None,
+        split_sentences: bool = True,
+        return_list: bool = False,
+        **kwargs,
+    ) -> list[np.ndarray] | list[list[float]]:
+        """Convert several texts to speech at once.
+
+        Models that support batched inference synthesize all texts in a single padded batch, others one by one.
+
+        Args:
+            texts (List[str]):
+                Input texts to synthesize.
+            speakers (List[str], optional):
+                Speaker name for each text. Defaults to None.
+            languages (List[str], optional):
+                Language of each text. Defaults to None.
+            speaker_wavs (List, optional):
+                Reference audio for each text, for models with voice cloning. Defaults to None.
+            split_sentences (bool, optional):
+                Split texts into sentences, see `tts()`. Defaults to True.
+            return_list (bool, optional):
+                Return lists of floats instead of arrays, see `tts()`. Defaults to False.
+            **kwargs (optional):
+                Additional arguments for the model, shared by all texts.
+
+        Returns:
+            One waveform per text.
+        """
+        if self.synthesizer is None:
+            msg = "The selected model does not support speech synthesis."
+            raise RuntimeError(msg)
+        speakers = speakers or [None] * len(texts)
+        languages = languages or [None] * len(texts)
+        speaker_wavs = speaker_wavs or [None] * len(texts)
+        for speaker, language, speaker_wav in zip(speakers, languages, speaker_wavs):
+            self._check_arguments(speaker=speaker, language=language, speaker_wav=speaker_wav, **kwargs)
+        return self.synthesizer.tts_batch(
+            texts,
+            speaker_names=speakers,
+            language_names=languages,
+            speaker_wavs=speaker_wavs,
+            split_sentences=split_sentences,
+            return_list=return_list,
+            **kwargs,
+        )
+
     def tts_to_file(
         self,
         text: str,
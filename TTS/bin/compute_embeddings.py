@@ -1,6 +1,7 @@
 import argparse
 import logging
 import os
+import shutil
 import sys
 from argparse import RawTextHelpFormatter
 
@@ -10,7 +11,7 @@ from tqdm import tqdm
 from TTS.config import load_config
 from TTS.config.shared_configs import BaseDatasetConfig
 from TTS.tts.datasets import load_tts_samples
-from TTS.tts.utils.managers import save_file
+from TTS.tts.utils.managers import load_file, save_file
 from TTS.tts.utils.speakers import SpeakerManager
 from TTS.utils.generic_utils import ConsoleFormatter, setup_logger
 
@@ -94,7 +95,20 @@ def parse_args(arg_list: list[str] | None) -> argparse.Namespace:
         help="Path to the evaluation meta file. If not set, dataset formatter uses the default metafile if it is defined in the formatter. You either need to provide this or `config_dataset_path`",
         default=None,
     )
-    return parser.parse_args()
+    parser.add_argument("--batch_size", type=int, help="Number of audio clips per encoder batch.", default=32)
+    parser.add_argument(
+        "--num_workers", type=int, help="Number of processes loading the audio clips in parallel.", default=4
+    )
+    parser.add_argument(
+        "--checkpoint_interval",
+        type=int,
+        help=(
+            "Number of computed embeddings after which they are saved in `{output_path}.partial/`. An interrupted "
+            "run continues from there when started again."
+        ),
+        default=1000,
+    )
+    return parser.parse_args(arg_list)
 
 
 def compute_embeddings(
@@ -111,6 +125,9 @@ def compute_embeddings(
     meta_file_val=None,
     disable_cuda=False,
     no_eval=False,
+    batch_size=32,
+    num_workers=4,
+    checkpoint_interval=1000,
 ):
     use_cuda = torch.cuda.is_available() and not disable_cuda
 
@@ -142,46 +159,80 @@ def compute_embeddings(
 
     class_name_key = encoder_manager.encoder_config.class_name_key
 
+    if os.path.isdir(output_path):
+        mapping_file_path = os.path.join(output_path, "speakers.pth")
+    else:
+        mapping_file_path = output_path
+    checkpoint_dir = f"{mapping_file_path}.partial"
+
     # compute speaker embeddings
     if old_speakers_file is not None and old_append:
         speaker_mapping = encoder_manager.embeddings
     else:
         speaker_mapping = {}
+    # embeddings saved by an interrupted run
+    speaker_mapping.update(_load_checkpoints(checkpoint_dir))
 
-    for fields in tqdm(samples):
+    new_samples = []
+    for fields in samples:
         class_name = fields[class_name_key]
-        audio_file = fields["audio_file"]
         embedding_key = fields["audio_unique_name"]
 
         # Only update the speaker name when the embedding is already in the old file.
         if embedding_key in speaker_mapping:
             speaker_mapping[embedding_key]["name"] = class_name
-            continue
-
-        if old_speakers_file is not None and embedding_key in encoder_manager.clip_ids:
+        elif old_speakers_file is not None and embedding_key in encoder_manager.embeddings:
             # get the embedding from the old file
             embedd = encoder_manager.get_embedding_by_clip(embedding_key)
+            speaker_mapping[embedding_key] = {"name": class_name, "embedding": embedd}
         else:
-            # extract the embedding
-            embedd = encoder_manager.compute_embedding_from_clip(audio_file)
+            new_samples.append(fields)
+    print(f" > Computing {len(new_samples)} of {len(samples)} embeddings.")
 
-        # create speaker_mapping if target dataset is defined
-        speaker_mapping[embedding_key] = {}
-        speaker_mapping[embedding_key]["name"] = class_name
-        speaker_mapping[embedding_key]["embedding"] = embedd
+    # extract the embeddings, while the audio of the next batches is loaded in parallel
+    new_mapping = {}
+    embeddings = encoder_manager.compute_embeddings_from_clips(
+        [fields["audio_file"] for fields in new_samples], batch_size=batch_size, num_workers=num_workers
+    )
+    with tqdm(total=len(new_samples)) as pbar:
+        for start, batch_embeddings in zip(range(0, len(new_samples), batch_size), embeddings):
+            for fields, embedd in zip(new_samples[start : start + batch_size], batch_embeddings):
+                new_mapping[fields["audio_unique_name"]] = {"name": fields[class_name_key], "embedding": embedd}
+            if len(new_mapping) >= checkpoint_interval:
+                _save_checkpoint(new_mapping, checkpoint_dir)
+                speaker_mapping.update(new_mapping)
+                new_mapping = {}
+            pbar.update(len(batch_embeddings))
+    speaker_mapping.update(new_mapping)
 
     if speaker_mapping:
         # save speaker_mapping if target dataset is defined
-        if os.path.isdir(output_path):
-            mapping_file_path = os.path.join(output_path, "speakers.pth")
-        else:
-            mapping_file_path = output_path
-
         if os.path.dirname(mapping_file_path) != "":
             os.makedirs(os.path.dirname(mapping_file_path), exist_ok=True)
 
         save_file(speaker_mapping, mapping_file_path)
         print("Speaker embeddings saved at:", mapping_file_path)
+    if os.path.isdir(checkpoint_dir):
+        shutil.rmtree(checkpoint_dir)
+
+
+def _load_checkpoints(checkpoint_dir: str) -> dict:
+    speaker_mapping = {}
+    if os.path.isdir(checkpoint_dir):
+        for name in sorted(os.listdir(checkpoint_dir)):
+            if name.endswith(".pth") and not name.endswith(".tmp.pth"):
+                speaker_mapping.update(load_file(os.path.join(checkpoint_dir, name)))
+        print(f" > Resuming with {len(speaker_mapping)} embeddings from {checkpoint_dir}")
+    return speaker_mapping
+
+
+def _save_checkpoint(speaker_mapping: dict, checkpoint_dir: str) -> None:
+    """Save the embeddings computed since the previous checkpoint as a new file in `checkpoint_dir`."""
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    path = os.path.join(checkpoint_dir, f"{len(os.listdir(checkpoint_dir)):06d}.pth")
+    # write to a temporary file first so that an interruption leaves no partial checkpoint behind
+    save_file(speaker_mapping, f"{path}.tmp.pth")
+    os.replace(f"{path}.tmp.pth", path)
 
 
 def main(arg_list: list[str] | None = None):
@@ -202,6 +253,9 @@ def main(arg_list: list[str] | None = None):
         meta_file_val=args.meta_file_val,
         disable_cuda=args.disable_cuda,
         no_eval=args.no_eval,
+        batch_size=args.batch_size,
+        num_workers=args.num_workers,
+        checkpoint_interval=args.checkpoint_interval,
     )
 
 
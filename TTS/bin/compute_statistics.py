@@ -5,6 +5,7 @@ import glob
 import logging
 import os
 import sys
+from multiprocessing import Pool
 
 import numpy as np
 from tqdm import tqdm
@@ -15,6 +16,8 @@ from TTS.tts.datasets import load_tts_samples
 from TTS.utils.audio import AudioProcessor
 from TTS.utils.generic_utils import ConsoleFormatter, setup_logger
 
+FEATURES = ("mel", "linear")
+
 
 def parse_args(arg_list: list[str] | None) -> tuple[argparse.Namespace, list[str]]:
     parser = argparse.ArgumentParser(description="Compute mean and variance of spectrogtram features.")
@@ -26,9 +29,56 @@ def parse_args(arg_list: list[str] | None) -> tuple[argparse.Namespace, list[str
         required=False,
         help="folder including the target set of wavs overriding dataset config.",
     )
+    parser.add_argument("--num_workers", type=int, default=os.cpu_count(), help="Number of processes to use.")
+    parser.add_argument(
+        "--chunk_size", type=int, default=32, help="Number of files each process reduces to one partial result."
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Add the files missing from the existing stats at `out_path` instead of recomputing all of them.",
+    )
     return parser.parse_known_args(arg_list)
 
 
+def empty_stats(dim: int) -> dict[str, np.ndarray]:
+    """Accumulator of the per channel count, mean and sum of squared deviations (Welford) of a feature."""
+    return {"count": np.zeros(1), "mean": np.zeros(dim), "m2": np.zeros(dim)}
+
+
+def feature_stats(x: np.ndarray) -> dict[str, np.ndarray]:
+    """Accumulator of a `[C, T]` feature matrix."""
+    x = x.astype(np.float64)
+    mean = x.mean(1)
+    return {"count": np.array([x.shape[1]], dtype=np.float64), "mean": mean, "m2": ((x - mean[:, None]) ** 2).sum(1)}
+
+
+def merge_stats(a: dict[str, np.ndarray], b: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Combine two accumulators with the parallel algorithm of Chan et al., which is stable for large counts."""
+    count = a["count"] + b["count"]
+    if count[0] == 0:
+        return a
+    delta = b["mean"] - a["mean"]
+    mean = a["mean"] + delta * b["count"] / count
+    m2 = a["m2"] + b["m2"] + delta**2 * a["count"] * b["count"] / count
+    return {"count": count, "mean": mean, "m2": m2}
+
+
+def _init_worker(audio_config: dict) -> None:
+    global ap  # pylint: disable=global-variable-undefined
+    ap = AudioProcessor(**audio_config)
+
+
+def compute_chunk_stats(files: list[str]) -> dict[str, dict[str, np.ndarray]]:
+    """Reduce the features of some files to one accumulator per feature."""
+    stats = {"mel": empty_stats(ap.num_mels), "linear": empty_stats(ap.fft_size // 2 + 1)}
+    for file in files:
+        wav = ap.load_wav(file)
+        stats["linear"] = merge_stats(stats["linear"], feature_stats(ap.spectrogram(wav)))
+        stats["mel"] = merge_stats(stats["mel"], feature_stats(ap.melspectrogram(wav)))
+    return stats
+
+
 def main(arg_list: list[str] | None = None):
     """Run preprocessing process."""
     setup_logger("TTS", level=logging.INFO, stream=sys.stderr, formatter=ConsoleFormatter())
@@ -40,41 +90,56 @@ def main(arg_list: list[str] | None = None):
     # load config
     CONFIG.audio.signal_norm = False  # do not apply earlier normalization
     CONFIG.audio.stats_path = None  # discard pre-defined stats
+    audio_config = CONFIG.audio.to_dict()
 
-    # load audio processor
-    ap = AudioProcessor(**CONFIG.audio.to_dict())
+    # set default config values for mean-var scaling
+    output_file_path = args.out_path
+    CONFIG.audio.stats_path = output_file_path
+    CONFIG.audio.signal_norm = True
+    # remove redundant values
+    del CONFIG.audio.max_norm
+    del CONFIG.audio.min_level_db
+    del CONFIG.audio.symmetric_norm
+    del CONFIG.audio.clip_norm
 
     # load the meta data of target dataset
     if args.data_path:
         dataset_items = glob.glob(os.path.join(args.data_path, "**", "*.wav"), recursive=True)
     else:
         dataset_items = load_tts_samples(CONFIG.datasets)[0]  # take only train data
-    print(f" > There are {len(dataset_items)} files.")
-
-    mel_sum = 0
-    mel_square_sum = 0
-    linear_sum = 0
-    linear_square_sum = 0
-    N = 0
-    for item in tqdm(dataset_items):
-        # compute features
-        wav = ap.load_wav(item if isinstance(item, str) else item["audio_file"])
-        linear = ap.spectrogram(wav)
-        mel = ap.melspectrogram(wav)
-
-        # compute stats
-        N += mel.shape[1]
-        mel_sum += mel.sum(1)
-        linear_sum += linear.sum(1)
-        mel_square_sum += (mel**2).sum(axis=1)
-        linear_square_sum += (linear**2).sum(axis=1)
-
-    mel_mean = mel_sum / N
-    mel_scale = np.sqrt(mel_square_sum / N - mel_mean**2)
-    linear_mean = linear_sum / N
-    linear_scale = np.sqrt(linear_square_sum / N - linear_mean**2)
+    files = [item if isinstance(item, str) else item["audio_file"] for item in dataset_items]
+    print(f" > There are {len(files)} files.")
+
+    # resume from the partial stats of a previous run
+    accumulators = {"mel": empty_stats(CONFIG.audio.num_mels), "linear": empty_stats(CONFIG.audio.fft_size // 2 + 1)}
+    done_files = []
+    if args.update and os.path.exists(output_file_path):
+        old_stats = np.load(output_file_path, allow_pickle=True).item()
+        if "accumulators" not in old_stats:
+            msg = f"{output_file_path} has no partial stats to update, compute it again without `--update`."
+            raise ValueError(msg)
+        if {**old_stats["audio_config"], "stats_path": None} != {**CONFIG.audio.to_dict(), "stats_path": None}:
+            msg = f"The audio parameters of {output_file_path} differ from the ones of {args.config_path}."
+            raise ValueError(msg)
+        accumulators = old_stats["accumulators"]
+        done_files = old_stats["files"]
+        done = set(done_files)
+        files = [file for file in files if file not in done]
+        print(f" > {len(done_files)} files are already in {output_file_path}, computing the {len(files)} new ones.")
+
+    chunks = [files[i : i + args.chunk_size] for i in range(0, len(files), args.chunk_size)]
+    with Pool(processes=max(1, args.num_workers), initializer=_init_worker, initargs=(audio_config,)) as pool:
+        with tqdm(total=len(files)) as pbar:
+            for chunk, chunk_stats in zip(chunks, pool.imap(compute_chunk_stats, chunks)):
+                for name in FEATURES:
+                    accumulators[name] = merge_stats(accumulators[name], chunk_stats[name])
+                pbar.update(len(chunk))
+
+    mel_mean = accumulators["mel"]["mean"]
+    mel_scale = np.sqrt(accumulators["mel"]["m2"] / accumulators["mel"]["count"])
+    linear_mean = accumulators["linear"]["mean"]
+    linear_scale = np.sqrt(accumulators["linear"]["m2"] / accumulators["linear"]["count"])
 
-    output_file_path = args.out_path
     stats = {}
     stats["mel_mean"] = mel_mean
     stats["mel_std"] = mel_scale
@@ -86,15 +151,10 @@ def main(arg_list: list[str] | None = None):
     print(f" > Avg linear spec mean: {linear_mean.mean()}")
     print(f" > Avg linear spec scale: {linear_scale.mean()}")
 
-    # set default config values for mean-var scaling
-    CONFIG.audio.stats_path = output_file_path
-    CONFIG.audio.signal_norm = True
-    # remove redundant values
-    del CONFIG.audio.max_norm
-    del CONFIG.audio.min_level_db
-    del CONFIG.audio.symmetric_norm
-    del CONFIG.audio.clip_norm
     stats["audio_config"] = CONFIG.audio.to_dict()
+    # keep the partial stats to add new files with `--update`
+    stats["accumulators"] = accumulators
+    stats["files"] = done_files + files
     np.save(output_file_path, stats, allow_pickle=True)
     print(f" > stats saved to {output_file_path}")
     sys.exit(0)
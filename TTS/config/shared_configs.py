@@ -29,6 +29,10 @@ class BaseAudioConfig(Coqpit):
         stft_pad_mode (str):
             Padding method used in STFT. 'reflect' or 'center'. Defaults to 'reflect'.
 
+        feature_backend (str):
+            Backend for computing spectrograms, 'numpy' (librosa) or 'torch'. The torch backend computes the features
+            of a whole batch with a single STFT. Defaults to 'numpy'.
+
         sample_rate (int):
             Audio sampling rate. Defaults to 22050.
 
@@ -79,6 +83,10 @@ class BaseAudioConfig(Coqpit):
         griffin_lim_iters (int):
             Number of Griffing Lim iterations. Defaults to 60.
 
+        griffin_lim_momentum (float):
+            Momentum in [0, 1) of the fast Griffin-Lim algorithm, which needs fewer iterations than the original
+            algorithm (momentum 0), e.g. 0.99. Defaults to 0.0.
+
         num_mels (int):
             Number of mel-basis frames that defines the frame lengths of each mel-spectrogram frame. Defaults to 80.
 
@@ -118,6 +126,7 @@ class BaseAudioConfig(Coqpit):
     frame_shift_ms: int = None
     frame_length_ms: int = None
     stft_pad_mode: str = "reflect"
+    feature_backend: str = "numpy"
     # audio processing parameters
     sample_rate: int = 22050
     resample: bool = False
@@ -134,6 +143,7 @@ class BaseAudioConfig(Coqpit):
     # griffin-lim params
     power: float = 1.5
     griffin_lim_iters: int = 60
+    griffin_lim_momentum: float = 0.0
     # mel-spec params
     num_mels: int = 80
     mel_fmin: float = 0.0
@@ -174,6 +184,11 @@ class BaseAudioConfig(Coqpit):
         check_argument("ref_level_db", c, restricted=True, min_val=0, max_val=1000)
         check_argument("power", c, restricted=True, min_val=1, max_val=5)
         check_argument("griffin_lim_iters", c, restricted=True, min_val=10, max_val=1000)
+        check_argument("griffin_lim_momentum", c, restricted=False, min_val=0, max_val=1)
+        if c["griffin_lim_momentum"] == 1:
+            msg = " [!] griffin_lim_momentum has to be smaller than 1."
+            raise ValueError(msg)
+        check_argument("feature_backend", c, restricted=False, enum_list=["numpy", "torch"])
 
         # normalization parameters
         check_argument("signal_norm", c, restricted=True)
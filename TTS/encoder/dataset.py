@@ -116,7 +116,7 @@ class EncoderDataset(Dataset):
     def collate_fn(self, batch):
         # get the batch class_ids
         labels = []
-        feats = []
+        wavs = []
         for item in batch:
             utter_path = item["wav_file_path"]
             class_name = item["class_name"]
@@ -132,15 +132,11 @@ class EncoderDataset(Dataset):
                 if random.random() < self.data_augmentation_p:
                     wav = self.augmentator.apply_one(wav)
 
-            if not self.use_torch_spec:
-                mel = self.ap.melspectrogram(wav)
-                feats.append(torch.FloatTensor(mel))
-            else:
-                feats.append(torch.FloatTensor(wav))
-
+            wavs.append(wav)
             labels.append(class_id)
 
-        feats = torch.stack(feats)
+        feats = wavs if self.use_torch_spec else self.ap.melspectrogram_batch(wavs)
+        feats = torch.stack([torch.FloatTensor(feat) for feat in feats])
         labels = torch.LongTensor(labels)
 
         return feats, labels
@@ -99,6 +99,43 @@ class BaseEncoder(nn.Module):
             embeddings = torch.mean(embeddings, dim=0, keepdim=True)
         return embeddings
 
+    @torch.inference_mode()
+    def compute_embedding_batch(self, xs, num_frames=250, num_eval=10, l2_norm=True, max_batch_size=16):
+        """
+        Generate the mean embedding of each utterance like `compute_embedding()`, for many utterances at once.
+
+        The evaluation windows of all utterances are grouped by shape and run through the model in batches of up to
+        `max_batch_size` windows. Windows that repeat, e.g. all windows of an utterance shorter than `num_frames`, are
+        only computed once.
+
+        xs: list of 1xTxD
+        Returns: NxE
+        """
+        if self.use_torch_spec:
+            num_frames = num_frames * self.audio_config["hop_length"]
+
+        # window shape -> list of (utterance index, weight, window)
+        groups = {}
+        for i, x in enumerate(xs):
+            max_len = x.shape[1]
+            length = min(num_frames, max_len)
+            offsets = [int(offset) for offset in np.linspace(0, max_len - length, num=num_eval)]
+            for offset in sorted(set(offsets)):
+                frames = x[:, offset : offset + length]
+                groups.setdefault(tuple(frames.shape), []).append((i, offsets.count(offset), frames))
+
+        embeddings = None
+        for windows in groups.values():
+            for start in range(0, len(windows), max_batch_size):
+                chunk = windows[start : start + max_batch_size]
+                outputs = self.inference(torch.cat([frames for _, _, frames in chunk]), l2_norm=l2_norm)
+                if embeddings is None:
+                    embeddings = outputs.new_zeros(len(xs), outputs.shape[1])
+                index = torch.tensor([i for i, _, _ in chunk], device=outputs.device)
+                weights = torch.tensor([weight for _, weight, _ in chunk], device=outputs.device, dtype=outputs.dtype)
+                embeddings.index_add_(0, index, outputs * weights[:, None])
+        return embeddings / num_eval
+
     def get_criterion(self, c: Coqpit, num_classes=None):
         if c.loss == "ge2e":
             criterion = GE2ELoss(loss_method="softmax")
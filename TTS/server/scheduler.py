@@ -0,0 +1,209 @@
+"""Dynamic request batching for the TTS server.
+
+Requests submitted from the HTTP handlers are collected for a short time window and compatible ones are
+synthesized together in one batch, see :meth:`TTS.api.TTS.tts_batch`.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class SynthesisRequest:
+    """A single synthesis request handled by the :class:`BatchScheduler`.
+
+    Timestamps are taken with :func:`time.perf_counter` and filled in by the scheduler.
+    """
+
+    text: str
+    speaker: str | None = None
+    language: str | None = None
+    speaker_wav: str | os.PathLike[Any] | list[str | os.PathLike[Any]] | None = None
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    future: Future = field(default_factory=Future)
+    submit_time: float = field(default_factory=time.perf_counter)
+    start_time: float | None = None
+    end_time: float | None = None
+    batch_size: int = 0
+
+    @property
+    def batch_key(self) -> tuple:
+        """Requests with the same key can be synthesized in the same batch.
+
+        They need the same kind of speaker and language input and the same extra model arguments, but the
+        actual speakers, languages and texts may differ.
+        """
+        return (
+            self.speaker is None,
+            self.speaker_wav is None,
+            self.language is None,
+            repr(sorted(self.kwargs.items())),
+        )
+
+    @property
+    def queue_time(self) -> float:
+        """Time spent waiting for a batch, in seconds."""
+        return self.start_time - self.submit_time
+
+    @property
+    def latency(self) -> float:
+        """Total time from submission to result, in seconds."""
+        return self.end_time - self.submit_time
+
+    def result(self, timeout: float | None = None) -> Any:
+        """Block until the request is synthesized and return the waveform."""
+        return self.future.result(timeout)
+
+
+class BatchScheduler:
+    """Collect concurrent synthesis requests into batches and run them on a single worker thread.
+
+    The first request of a batch waits at most ``max_wait_ms`` for other requests with the same
+    :attr:`SynthesisRequest.batch_key` to arrive, or until ``max_batch_size`` requests are collected.
+    Requests that do not fit into the current batch are kept for the next ones.
+
+    Args:
+        synthesize_batch (Callable): Function that takes a list of :class:`SynthesisRequest` and returns one
+            waveform per request.
+        max_batch_size (int): Maximum number of requests in one batch. Defaults to 8.
+        max_wait_ms (float): Maximum time the first request of a batch waits for more requests. Defaults to 10.
+        stats_window (int): Number of recent requests the latency statistics are computed over. Defaults to 1000.
+    """
+
+    def __init__(
+        self,
+        synthesize_batch: Callable[[list[SynthesisRequest]], list[Any]],
+        *,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0,
+        stats_window: int = 1000,
+    ) -> None:
+        if max_batch_size < 1:
+            msg = f"`max_batch_size` must be at least 1, got {max_batch_size}."
+            raise ValueError(msg)
+        self.synthesize_batch = synthesize_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: queue.Queue[SynthesisRequest | None] = queue.Queue()
+        self._pending: list[SynthesisRequest] = []
+        self._stats_lock = threading.Lock()
+        self._num_requests = 0
+        self._num_batches = 0
+        self._num_failed = 0
+        self._recent: deque[SynthesisRequest] = deque(maxlen=stats_window)
+        self._worker = threading.Thread(target=self._run, name="tts-batch-scheduler", daemon=True)
+        self._worker.start()
+
+    def submit(
+        self,
+        text: str,
+        *,
+        speaker: str | None = None,
+        language: str | None = None,
+        speaker_wav: str | os.PathLike[Any] | list[str | os.PathLike[Any]] | None = None,
+        **kwargs: Any,
+    ) -> SynthesisRequest:
+        """Queue a request for synthesis. Call :meth:`SynthesisRequest.result` to wait for the waveform."""
+        request = SynthesisRequest(text, speaker=speaker, language=language, speaker_wav=speaker_wav, kwargs=kwargs)
+        self._queue.put(request)
+        return request
+
+    def close(self, timeout: float | None = None) -> None:
+        """Stop the worker thread after all queued requests are processed."""
+        self._queue.put(None)
+        self._worker.join(timeout)
+
+    def stats(self) -> dict[str, float]:
+        """Return request counters and latency statistics over the recent requests (in seconds)."""
+        with self._stats_lock:
+            recent = list(self._recent)
+            stats = {
+                "requests": self._num_requests,
+                "failed_requests": self._num_failed,
+                "batches": self._num_batches,
+                "mean_batch_size": self._num_requests / self._num_batches if self._num_batches else 0.0,
+            }
+        latencies = sorted(r.latency for r in recent)
+        for name, values in (("latency", latencies), ("queue_time", sorted(r.queue_time for r in recent))):
+            if values:
+                stats[f"{name}_mean"] = sum(values) / len(values)
+                stats[f"{name}_p50"] = values[len(values) // 2]
+                stats[f"{name}_p95"] = values[min(len(values) - 1, int(0.95 * len(values)))]
+        return stats
+
+    def _next_batch(self) -> list[SynthesisRequest]:
+        first = self._pending.pop(0) if self._pending else self._queue.get()
+        if first is None:
+            return []
+        batch = [first]
+        for request in list(self._pending):
+            if len(batch) == self.max_batch_size:
+                break
+            if request.batch_key == first.batch_key:
+                batch.append(request)
+                self._pending.remove(request)
+
+        deadline = first.submit_time + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if request is None:
+                # process everything that is already waiting before stopping
+                self._queue.put(None)
+                break
+            if request.batch_key == first.batch_key:
+                batch.append(request)
+            else:
+                self._pending.append(request)
+        return batch
+
+    def _process(self, batch: list[SynthesisRequest]) -> None:
+        start_time = time.perf_counter()
+        try:
+            results = self.synthesize_batch(batch)
+        except Exception as e:  # pylint: disable=broad-except
+            if len(batch) > 1:
+                # find out which requests failed
+                logger.warning("Batch of %d requests failed, retrying them one by one: %s", len(batch), e)
+                for request in batch:
+                    self._process([request])
+                return
+            results = None
+            error = e
+        end_time = time.perf_counter()
+
+        with self._stats_lock:
+            self._num_batches += 1
+            self._num_requests += len(batch)
+            self._num_failed += results is None
+            for request in batch:
+                request.start_time = start_time
+                request.end_time = end_time
+                request.batch_size = len(batch)
+                self._recent.append(request)
+        logger.info("Synthesized batch of %d request(s) in %.3fs", len(batch), end_time - start_time)
+
+        if results is None:
+            batch[0].future.set_exception(error)
+            return
+        for request, result in zip(batch, results):
+            request.future.set_result(result)
+
+    def _run(self) -> None:
+        while batch := self._next_batch():
+            self._process(batch)
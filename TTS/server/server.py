@@ -13,16 +13,19 @@ from pathlib import Path
 from threading import Lock
 from urllib.parse import parse_qs
 
-import torch
-import torchaudio
+import numpy as np
 
 try:
-    from flask import Flask, render_template, render_template_string, request, send_file
+    from flask import Flask, Response, render_template, render_template_string, request, send_file, stream_with_context
 except ImportError as e:
     msg = "Server requires requires flask, use `pip install coqui-tts[server]`"
     raise ImportError(msg) from e
 
 from TTS.api import TTS
+from TTS.server.scheduler import BatchScheduler, SynthesisRequest
+from TTS.server.streaming import AUDIO_FORMATS, STREAM_FORMATS, encode_audio, encode_stream
+from TTS.tts.utils.text.token_cache import SqliteTokenStore, TokenCache
+from TTS.tts.utils.text.tokenizer import TTSTokenizer
 from TTS.utils.generic_utils import ConsoleFormatter, setup_logger
 from TTS.utils.manage import ModelManager
 
@@ -72,6 +75,30 @@ def create_argparser() -> argparse.ArgumentParser:
         "--show_details", action=argparse.BooleanOptionalAction, default=False, help="Generate model detail page."
     )
     parser.add_argument("--language_idx", type=str, help="Default language ID for multilingual models.", default="en")
+    parser.add_argument(
+        "--max_batch_size",
+        type=int,
+        default=1,
+        help="Maximum number of concurrent requests synthesized together in one batch. 1 disables batching.",
+    )
+    parser.add_argument(
+        "--max_batch_wait_ms",
+        type=float,
+        default=10.0,
+        help="Maximum time in milliseconds that a request waits for other requests to form a batch.",
+    )
+    parser.add_argument(
+        "--token_cache_size",
+        type=int,
+        default=0,
+        help="Number of tokenized sentences kept in memory to skip text processing of repeated inputs. 0 disables it.",
+    )
+    parser.add_argument(
+        "--token_cache_path",
+        type=str,
+        default=None,
+        help="SQLite file to persist tokenized sentences across restarts and share them between server processes.",
+    )
     return parser
 
 
@@ -109,11 +136,70 @@ api = TTS(
     # language_ids_file_path=args.language_ids_file_path,
 ).to(device)
 
+token_cache = None
+if args.token_cache_size > 0 or args.token_cache_path is not None:
+    tokenizer = getattr(api.synthesizer.tts_model, "tokenizer", None)
+    if isinstance(tokenizer, TTSTokenizer):
+        store = SqliteTokenStore(args.token_cache_path) if args.token_cache_path is not None else None
+        token_cache = TokenCache(args.token_cache_size, store=store)
+        tokenizer.cache = token_cache
+    else:
+        logger.warning("The token cache is not supported by this model's tokenizer.")
+
 # TODO: set this from SpeakerManager
 use_gst = api.synthesizer.tts_config.get("use_gst", False)
 
 app = Flask(__name__)
 
+lock = Lock()
+
+
+def synthesize_batch(requests: list[SynthesisRequest]) -> list[np.ndarray]:
+    with lock:
+        return api.tts_batch(
+            [r.text for r in requests],
+            speakers=[r.speaker for r in requests],
+            languages=[r.language for r in requests],
+            speaker_wavs=[r.speaker_wav for r in requests],
+            **requests[0].kwargs,
+        )
+
+
+scheduler = None
+if args.max_batch_size > 1:
+    scheduler = BatchScheduler(synthesize_batch, max_batch_size=args.max_batch_size, max_wait_ms=args.max_batch_wait_ms)
+
+
+def synthesize(text: str, **kwargs) -> np.ndarray:
+    """Run the TTS model, through the batch scheduler if batching is enabled, and return the float32 waveform."""
+    if scheduler is None:
+        with lock:
+            return api.tts(text, **kwargs)
+    if not kwargs.get("speaker_wav"):
+        kwargs["speaker_wav"] = None
+    request = scheduler.submit(text, **kwargs)
+    wavs = request.result()
+    logger.info(
+        "Latency: %.3fs (queued: %.3fs, batch size: %d)", request.latency, request.queue_time, request.batch_size
+    )
+    return wavs
+
+
+def stream_response(text: str, fmt: str, **kwargs) -> Response:
+    """Stream the encoded audio while it is synthesized, with chunked transfer encoding."""
+
+    def generate():
+        # the lock is held until the stream is complete or the client disconnects
+        with lock:
+            chunks = api.tts_stream(text, **kwargs)
+            yield from encode_stream(chunks, fmt, api.synthesizer.output_sample_rate)
+
+    return Response(stream_with_context(generate()), mimetype=STREAM_FORMATS[fmt])
+
+
+def is_true(value: str | bool | None) -> bool:
+    return str(value).lower() in ("1", "true", "yes")
+
 
 def style_wav_uri_to_dict(style_wav: str) -> str | dict:
     """Transform an uri style_wav, in either a string (path to wav file to be use for style transfer)
@@ -162,52 +248,59 @@ def details():
     )
 
 
-lock = Lock()
-
-
 @app.route("/api/tts", methods=["GET", "POST"])
 def tts():
-    with lock:
-        text = request.headers.get("text") or request.values.get("text", "")
-        speaker_idx = (
-            request.headers.get("speaker-id") or request.values.get("speaker_id", args.speaker_idx)
-            if api.is_multi_speaker
-            else None
+    text = request.headers.get("text") or request.values.get("text", "")
+    speaker_idx = (
+        request.headers.get("speaker-id") or request.values.get("speaker_id", args.speaker_idx)
+        if api.is_multi_speaker
+        else None
+    )
+    # Handle empty speaker_id for voice cloning scenarios
+    if speaker_idx == "":
+        speaker_idx = None
+    language_idx = (
+        request.headers.get("language-id") or request.values.get("language_id", args.language_idx)
+        if api.is_multi_lingual
+        else None
+    )
+    # Handle empty language_id
+    if language_idx == "":
+        language_idx = None
+    style_wav = request.headers.get("style-wav") or request.values.get("style_wav", "")
+    style_wav = style_wav_uri_to_dict(style_wav)
+    speaker_wav = request.headers.get("speaker-wav") or request.values.get("speaker_wav", "")
+    stream = is_true(request.headers.get("stream") or request.values.get("stream"))
+
+    # Basic validation
+    if not text.strip():
+        return {"error": "Text parameter is required"}, 400
+
+    logger.info("Model input: %s", text)
+    logger.info("Speaker idx: %s", speaker_idx)
+    logger.info("Speaker wav: %s", speaker_wav)
+    logger.info("Language idx: %s", language_idx)
+
+    if stream:
+        return stream_response(
+            text,
+            "wav",
+            speaker=speaker_idx,
+            language=language_idx,
+            style_wav=style_wav,
+            speaker_wav=speaker_wav or None,
         )
-        # Handle empty speaker_id for voice cloning scenarios
-        if speaker_idx == "":
-            speaker_idx = None
-        language_idx = (
-            request.headers.get("language-id") or request.values.get("language_id", args.language_idx)
-            if api.is_multi_lingual
-            else None
+
+    try:
+        wavs = synthesize(
+            text, speaker=speaker_idx, language=language_idx, style_wav=style_wav, speaker_wav=speaker_wav
         )
-        # Handle empty language_id
-        if language_idx == "":
-            language_idx = None
-        style_wav = request.headers.get("style-wav") or request.values.get("style_wav", "")
-        style_wav = style_wav_uri_to_dict(style_wav)
-        speaker_wav = request.headers.get("speaker-wav") or request.values.get("speaker_wav", "")
-
-        # Basic validation
-        if not text.strip():
-            return {"error": "Text parameter is required"}, 400
-
-        logger.info("Model input: %s", text)
-        logger.info("Speaker idx: %s", speaker_idx)
-        logger.info("Speaker wav: %s", speaker_wav)
-        logger.info("Language idx: %s", language_idx)
-
-        try:
-            wavs = api.tts(
-                text, speaker=speaker_idx, language=language_idx, style_wav=style_wav, speaker_wav=speaker_wav
-            )
-        except Exception as e:
-            logger.error("TTS synthesis failed: %s", str(e))
-            return {"error": f"TTS synthesis failed: {str(e)}"}, 500
-
-        out = io.BytesIO()
-        api.synthesizer.save_wav(wavs, out)
+    except Exception as e:
+        logger.error("TTS synthesis failed: %s", str(e))
+        return {"error": f"TTS synthesis failed: {str(e)}"}, 500
+
+    out = io.BytesIO()
+    api.synthesizer.save_wav(wavs, out)
     return send_file(out, mimetype="audio/wav")
 
 
@@ -248,21 +341,20 @@ def mary_tts_api_voices():
 @app.route("/process", methods=["GET", "POST"])
 def mary_tts_api_process():
     """MaryTTS-compatible /process endpoint"""
-    with lock:
-        if request.method == "POST":
-            data = parse_qs(request.get_data(as_text=True))
-            speaker_idx = data.get("VOICE", [args.speaker_idx])[0]
-            # NOTE: we ignore parameter LOCALE for now since we have only one active model
-            text = data.get("INPUT_TEXT", [""])[0]
-        else:
-            text = request.args.get("INPUT_TEXT", "")
-            speaker_idx = request.args.get("VOICE", args.speaker_idx)
-
-        logger.info("Model input: %s", text)
-        logger.info("Speaker idx: %s", speaker_idx)
-        wavs = api.tts(text, speaker=speaker_idx)
-        out = io.BytesIO()
-        api.synthesizer.save_wav(wavs, out)
+    if request.method == "POST":
+        data = parse_qs(request.get_data(as_text=True))
+        speaker_idx = data.get("VOICE", [args.speaker_idx])[0]
+        # NOTE: we ignore parameter LOCALE for now since we have only one active model
+        text = data.get("INPUT_TEXT", [""])[0]
+    else:
+        text = request.args.get("INPUT_TEXT", "")
+        speaker_idx = request.args.get("VOICE", args.speaker_idx)
+
+    logger.info("Model input: %s", text)
+    logger.info("Speaker idx: %s", speaker_idx)
+    wavs = synthesize(text, speaker=speaker_idx)
+    out = io.BytesIO()
+    api.synthesizer.save_wav(wavs, out)
     return send_file(out, mimetype="audio/wav")
 
 
@@ -275,7 +367,8 @@ def openai_tts():
       "model": "tts-1",           # ignored, defaults to args.model_name
       "voice": "alloy",           # required: a speaker ID or a file/folder for voice cloning
       "input": "Hello world!",    # required text to speak
-      "response_format": "wav"    # optional: wav, opus, aac, flac, wav, pcm (alternative to format)
+      "response_format": "wav",   # optional: wav, opus, aac, flac, wav, pcm (alternative to format)
+      "stream": false             # optional: stream the audio while it is generated (wav, mp3, opus and pcm only)
     }
     """
     payload = request.get_json(force=True)
@@ -284,6 +377,7 @@ def openai_tts():
     speaker_idx = payload.get("voice", args.speaker_idx) if api.is_multi_speaker else None
     fmt = payload.get("response_format", "mp3").lower()  # OpenAI default is .mp3
     speed = payload.get("speed", 1.0)
+    stream = is_true(payload.get("stream", False))
     language_idx = args.language_idx if api.is_multi_lingual else None
 
     speaker_wav = None
@@ -295,61 +389,40 @@ def openai_tts():
 
     # here we ignore payload["model"] since its loaded at startup
 
-    def _save_audio(waveform, sample_rate, format_args):
-        buf = io.BytesIO()
-        torchaudio.save(buf, waveform, sample_rate, **format_args)
-        buf.seek(0)
-        return buf
+    if fmt not in AUDIO_FORMATS:
+        return f"Unsupported format, use one of: {', '.join(AUDIO_FORMATS)}", 400
+    if stream:
+        if fmt not in STREAM_FORMATS:
+            return f"Unsupported streaming format, use one of: {', '.join(STREAM_FORMATS)}", 400
+        logger.info("Streaming model input: %s", text)
+        return stream_response(
+            text, fmt, speaker=speaker_idx, language=language_idx, speaker_wav=speaker_wav, speed=speed
+        )
 
-    def _save_pcm(waveform):
-        """Raw PCM (16-bit little-endian)."""
-        waveform_int16 = (waveform * 32767).to(torch.int16)
-        buf = io.BytesIO()
-        buf.write(waveform_int16.numpy().tobytes())
-        buf.seek(0)
-        return buf
+    logger.info("Model input: %s", text)
+    logger.info("Speaker idx: %s", speaker_idx)
+    logger.info("Speaker wav: %s", speaker_wav)
+    logger.info("Language idx: %s", language_idx)
 
-    with lock:
-        logger.info("Model input: %s", text)
-        logger.info("Speaker idx: %s", speaker_idx)
-        logger.info("Speaker wav: %s", speaker_wav)
-        logger.info("Language idx: %s", language_idx)
-
-        wavs = api.tts(text, speaker=speaker_idx, language=language_idx, speaker_wav=speaker_wav, speed=speed)
-        out = io.BytesIO()
-        api.synthesizer.save_wav(wavs, out)
-        out.seek(0)
-        waveform, sample_rate = torchaudio.load(out)
-
-        mimetypes = {
-            "wav": "audio/wav",
-            "mp3": "audio/mpeg",
-            "opus": "audio/ogg",
-            "aac": "audio/aac",
-            "flac": "audio/flac",
-            "pcm": "audio/L16",
-        }
-
-        mimetype = mimetypes.get(fmt, "audio/mpeg")
-        if fmt == "wav":
-            out.seek(0)
-            return send_file(out, mimetype=mimetype)
-
-        format_dispatch = {
-            "mp3": lambda: _save_audio(waveform, sample_rate, {"format": "mp3"}),
-            "opus": lambda: _save_audio(waveform, sample_rate, {"format": "ogg", "encoding": "opus"}),
-            "aac": lambda: _save_audio(waveform, sample_rate, {"format": "mp4", "encoding": "aac"}),  # m4a container
-            "flac": lambda: _save_audio(waveform, sample_rate, {"format": "flac"}),
-            "pcm": lambda: _save_pcm(waveform),
-        }
-
-        # Check if format is supported
-        if fmt not in format_dispatch:
-            return "Unsupported format", 400
-
-        # Generate and send file
-        audio_buffer = format_dispatch[fmt]()
-        return send_file(audio_buffer, mimetype=mimetype)
+    wavs = synthesize(text, speaker=speaker_idx, language=language_idx, speaker_wav=speaker_wav, speed=speed)
+    data = encode_audio(wavs, fmt, api.synthesizer.output_sample_rate)
+    return Response(data, mimetype=AUDIO_FORMATS[fmt])
+
+
+@app.route("/api/scheduler_stats", methods=["GET"])
+def scheduler_stats():
+    """Request counters and latency statistics of the batch scheduler."""
+    if scheduler is None:
+        return {"error": "Request batching is disabled, start the server with `--max_batch_size` > 1."}, 404
+    return scheduler.stats()
+
+
+@app.route("/api/token_cache_stats", methods=["GET"])
+def token_cache_stats():
+    """Hit rate and time saved by the tokenizer cache."""
+    if token_cache is None:
+        return {"error": "The token cache is disabled, start the server with `--token_cache_size` > 0."}, 404
+    return token_cache.stats()
 
 
 def main():
@@ -0,0 +1,337 @@
+"""Audio encoders for HTTP responses.
+
+Complete responses are encoded from the float32 waveform in one pass with :func:`encode_audio`. Streamed responses
+are encoded chunk by chunk with :func:`encode_stream`. The streamed audio is not peak-normalized like in
+:func:`encode_audio` and :func:`TTS.utils.audio.numpy_transforms.save_wav` because the full waveform is not known in
+advance, samples are only clipped to [-1, 1].
+"""
+
+import io
+import math
+import struct
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+import soundfile as sf
+import torch
+import torchaudio
+
+# Supported response formats and their MIME types
+AUDIO_FORMATS = {
+    "pcm": "audio/L16",
+    "wav": "audio/wav",
+    "mp3": "audio/mpeg",
+    "opus": "audio/ogg",
+    "aac": "audio/aac",
+    "flac": "audio/flac",
+}
+
+# Supported streaming formats and their MIME types
+STREAM_FORMATS = {fmt: AUDIO_FORMATS[fmt] for fmt in ("pcm", "wav", "mp3", "opus")}
+
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+MP3_SAMPLE_RATES = (8000, 11025, 12000, 16000, 22050, 24000, 32000, 44100, 48000)
+
+WAV_HEADER_SIZE = 44
+
+
+def float_to_pcm16(wav: np.ndarray) -> bytes:
+    """Convert a float waveform in [-1, 1] to 16-bit little-endian PCM."""
+    return (np.clip(wav, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+
+def wav_header(sample_rate: int, num_samples: int, num_channels: int = 1) -> bytes:
+    """Return the header of a 16-bit PCM WAV file with ``num_samples`` samples per channel."""
+    block_align = num_channels * 2
+    data_size = num_samples * block_align
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        min(data_size + WAV_HEADER_SIZE - 8, 0xFFFFFFFF),
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # PCM
+        num_channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        16,
+        b"data",
+        min(data_size, 0xFFFFFFFF),
+    )
+
+
+def wav_stream_header(sample_rate: int, num_channels: int = 1) -> bytes:
+    """Return a header for a 16-bit PCM WAV stream of unknown length.
+
+    The RIFF and data chunk sizes are set to the maximum value, which players interpret as "until the end of the
+    stream".
+    """
+    header = bytearray(wav_header(sample_rate, 0, num_channels))
+    header[4:8] = header[40:44] = b"\xff\xff\xff\xff"
+    return bytes(header)
+
+
+class StreamResampler:
+    """Resample audio chunk by chunk, with the same output as resampling the whole stream at once.
+
+    :func:`torchaudio.functional.resample` computes blocks of ``new_freq / gcd`` output samples from windows of the
+    input that overlap by the filter width. The input is kept from the first window that still misses samples of the
+    next chunks, so the filter never sees the zero padding at the chunk boundaries. Only the end of the stream is
+    zero padded, in :meth:`flush`.
+
+    Args:
+        orig_freq (int): Sample rate of the input.
+        new_freq (int): Sample rate of the output.
+    """
+
+    def __init__(self, orig_freq: int, new_freq: int) -> None:
+        self.orig_freq = orig_freq
+        self.new_freq = new_freq
+        gcd = math.gcd(orig_freq, new_freq)
+        self._orig_step = orig_freq // gcd
+        self._new_step = new_freq // gcd
+        # filter width of `torchaudio.functional.resample()` with its default parameters
+        lowpass_filter_width, rolloff = 6, 0.99
+        base_freq = min(self._orig_step, self._new_step) * rolloff
+        self._width = math.ceil(lowpass_filter_width * self._orig_step / base_freq)
+        self._buffer = np.zeros(0, dtype=np.float32)
+        self._buffer_start = 0  # input index of the first buffered sample, a multiple of `_orig_step`
+        self._num_out = 0  # output samples returned so far
+
+    def _resample(self, end: int | None) -> np.ndarray:
+        """Resample the buffer and return the new output samples up to output index `end`, or all of them."""
+        out = torchaudio.functional.resample(torch.from_numpy(self._buffer), self.orig_freq, self.new_freq).numpy()
+        out_start = self._buffer_start // self._orig_step * self._new_step
+        return out[self._num_out - out_start : None if end is None else end - out_start]
+
+    def resample(self, wav: np.ndarray) -> np.ndarray:
+        """Add an input chunk and return the output samples that don't depend on later input."""
+        self._buffer = np.concatenate([self._buffer, np.asarray(wav, dtype=np.float32)])
+        num_in = self._buffer_start + len(self._buffer)
+        # block `i` reads the input samples [i * orig_step - width, (i + 1) * orig_step + width)
+        num_blocks = max(0, (num_in - self._width) // self._orig_step)
+        end = num_blocks * self._new_step
+        if end <= self._num_out:
+            return np.zeros(0, dtype=np.float32)
+        out = self._resample(end)
+        self._num_out = end
+        start = max(
+            self._buffer_start, (num_blocks * self._orig_step - self._width) // self._orig_step * self._orig_step
+        )
+        self._buffer = self._buffer[start - self._buffer_start :]
+        self._buffer_start = start
+        return out
+
+    def flush(self) -> np.ndarray:
+        """Return the remaining output samples at the end of the stream."""
+        if not len(self._buffer):
+            return np.zeros(0, dtype=np.float32)
+        out = self._resample(None)
+        self._num_out += len(out)
+        self._buffer = self._buffer[:0]
+        return out
+
+
+class SoundFileEncoder:
+    """Encode audio chunks incrementally with libsndfile.
+
+    The encoded stream is written to a memory buffer and :meth:`encode` returns the bytes added since the last call,
+    which may be empty if the encoder is still buffering. Formats that only support some sample rates are
+    resampled to the highest one.
+
+    Args:
+        sample_rate (int): Sample rate of the input audio.
+        format (str): libsndfile major format, e.g. "FLAC".
+        subtype (str): libsndfile subtype, e.g. "PCM_16".
+        **kwargs: Additional arguments for :class:`soundfile.SoundFile`.
+    """
+
+    sample_rates: tuple[int, ...] | None = None
+
+    def __init__(
+        self,
+        sample_rate: int,
+        format: str,  # pylint: disable=redefined-builtin
+        subtype: str,
+        **kwargs,
+    ) -> None:
+        self.input_sample_rate = sample_rate
+        self.sample_rate = sample_rate
+        if self.sample_rates is not None and sample_rate not in self.sample_rates:
+            self.sample_rate = max(self.sample_rates)
+        self._resampler = None
+        if self.sample_rate != sample_rate:
+            self._resampler = StreamResampler(sample_rate, self.sample_rate)
+        self._buffer = io.BytesIO()
+        self._file = sf.SoundFile(
+            self._buffer, mode="w", samplerate=self.sample_rate, channels=1, format=format, subtype=subtype, **kwargs
+        )
+        self._num_read = 0
+
+    def encode(self, wav: np.ndarray) -> bytes:
+        """Add an audio chunk and return the encoded bytes that are ready."""
+        if self._resampler is not None:
+            wav = self._resampler.resample(wav)
+        if wav.dtype != np.int16:
+            wav = np.clip(wav, -1.0, 1.0)
+        self._file.write(wav)
+        return self._read()
+
+    def close(self) -> bytes:
+        """Finish the stream and return the remaining bytes."""
+        if self._resampler is not None:
+            self._file.write(np.clip(self._resampler.flush(), -1.0, 1.0))
+        self._file.close()
+        return self._read()
+
+    def getvalue(self) -> bytes:
+        """Return the complete encoded file after :meth:`close`, including the header updates made when closing."""
+        return self._buffer.getvalue()
+
+    def _read(self) -> bytes:
+        with self._buffer.getbuffer() as view:
+            data = bytes(view[self._num_read :])
+        self._num_read += len(data)
+        return data
+
+
+class OggOpusEncoder(SoundFileEncoder):
+    """Encode audio chunks into an Ogg Opus stream.
+
+    Opus only supports some sample rates, other inputs are resampled to 48kHz. Ogg pages are written by libsndfile
+    about once per second of audio, so :meth:`encode` returns empty bytes until a page is complete.
+
+    Args:
+        sample_rate (int): Sample rate of the input audio.
+    """
+
+    sample_rates = OPUS_SAMPLE_RATES
+
+    def __init__(self, sample_rate: int) -> None:
+        super().__init__(sample_rate, format="OGG", subtype="OPUS")
+
+
+class Mp3Encoder(SoundFileEncoder):
+    """Encode audio chunks into an MP3 stream.
+
+    Constant bitrate is used, so that players can estimate the duration of a stream from its first frame.
+
+    Args:
+        sample_rate (int): Sample rate of the input audio.
+        compression_level (float): Between 0 (highest bitrate) and 1 (lowest bitrate). Defaults to 0.5.
+    """
+
+    sample_rates = MP3_SAMPLE_RATES
+
+    def __init__(self, sample_rate: int, compression_level: float = 0.5) -> None:
+        super().__init__(
+            sample_rate,
+            format="MP3",
+            subtype="MPEG_LAYER_III",
+            compression_level=compression_level,
+            bitrate_mode="CONSTANT",
+        )
+
+
+class FlacEncoder(SoundFileEncoder):
+    """Encode audio into 16-bit FLAC.
+
+    Args:
+        sample_rate (int): Sample rate of the input audio.
+    """
+
+    def __init__(self, sample_rate: int) -> None:
+        super().__init__(sample_rate, format="FLAC", subtype="PCM_16")
+
+
+# Encoders for formats that libsndfile supports
+SOUNDFILE_ENCODERS: dict[str, type[SoundFileEncoder]] = {
+    "mp3": Mp3Encoder,
+    "opus": OggOpusEncoder,
+    "flac": FlacEncoder,
+}
+
+
+def _peak(wav: np.ndarray) -> float:
+    """Return the maximum absolute value of a waveform, without computing ``np.abs(wav)``."""
+    return max(float(wav.max()), -float(wav.min())) if wav.size else 0.0
+
+
+def _to_pcm16(wav: np.ndarray, scale: float, out: np.ndarray | None = None) -> np.ndarray:
+    """Scale a float waveform into 16-bit integers, without an intermediate float array if it doesn't clip."""
+    if out is None:
+        out = np.empty(wav.shape, dtype="<i2")
+    if scale * _peak(wav) <= 1.0:
+        np.multiply(wav, np.float32(32767 * scale), out=out, casting="unsafe")
+    else:
+        np.multiply(np.clip(wav * scale, -1.0, 1.0), 32767, out=out, casting="unsafe")
+    return out
+
+
+def encode_audio(wav: np.ndarray, fmt: str, sample_rate: int, *, normalize: bool = True) -> bytes:
+    """Encode a complete float waveform.
+
+    PCM, WAV, FLAC and MP3 are encoded from a single 16-bit copy of the waveform, without an intermediate container.
+
+    Args:
+        wav (np.ndarray): Float waveform, normally in [-1, 1].
+        fmt (str): One of :data:`AUDIO_FORMATS`.
+        sample_rate (int): Sample rate of the audio.
+        normalize (bool): Scale the waveform to the full range, like
+            :func:`~TTS.utils.audio.numpy_transforms.save_wav`. Otherwise samples are only clipped. Defaults to True.
+
+    Returns:
+        bytes: The encoded audio.
+    """
+    if fmt not in AUDIO_FORMATS:
+        msg = f"Unsupported audio format `{fmt}`, use one of {list(AUDIO_FORMATS)}."
+        raise ValueError(msg)
+    wav = np.asarray(wav, dtype=np.float32).reshape(-1)
+    scale = 1.0 / max(0.01, _peak(wav)) if normalize else 1.0
+    if fmt == "aac":
+        # not supported by libsndfile
+        buffer = io.BytesIO()
+        waveform = torch.from_numpy(wav * scale if normalize else np.clip(wav, -1.0, 1.0)).unsqueeze(0)
+        torchaudio.save(buffer, waveform, sample_rate, format="mp4", encoding="aac")
+        return buffer.getvalue()
+    if fmt == "wav":
+        # write the header and the samples into the same buffer
+        data = np.empty(WAV_HEADER_SIZE // 2 + len(wav), dtype="<i2")
+        data[: WAV_HEADER_SIZE // 2].view(np.uint8)[:] = np.frombuffer(wav_header(sample_rate, len(wav)), np.uint8)
+        _to_pcm16(wav, scale, out=data[WAV_HEADER_SIZE // 2 :])
+        return data.tobytes()
+    if fmt == "pcm":
+        return _to_pcm16(wav, scale).tobytes()
+    encoder = SOUNDFILE_ENCODERS[fmt](sample_rate)
+    encoder.encode(_to_pcm16(wav, scale) if encoder.sample_rate == sample_rate else wav * scale)
+    encoder.close()
+    return encoder.getvalue()
+
+
+def encode_stream(chunks: Iterable[np.ndarray], fmt: str, sample_rate: int) -> Iterator[bytes]:
+    """Encode float audio chunks incrementally.
+
+    Args:
+        chunks (Iterable[np.ndarray]): Float audio chunks in [-1, 1].
+        fmt (str): One of :data:`STREAM_FORMATS`.
+        sample_rate (int): Sample rate of the audio.
+
+    Yields:
+        bytes: The encoded stream, starting with the header for ``wav``.
+    """
+    if fmt not in STREAM_FORMATS:
+        msg = f"Unsupported streaming format `{fmt}`, use one of {list(STREAM_FORMATS)}."
+        raise ValueError(msg)
+    if fmt in SOUNDFILE_ENCODERS:
+        encoder = SOUNDFILE_ENCODERS[fmt](sample_rate)
+        for chunk in chunks:
+            if data := encoder.encode(chunk):
+                yield data
+        yield encoder.close()
+        return
+    if fmt == "wav":
+        yield wav_stream_header(sample_rate)
+    for chunk in chunks:
+        yield float_to_pcm16(chunk)
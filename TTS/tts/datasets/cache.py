@@ -0,0 +1,144 @@
+import base64
+import contextlib
+import json
+import logging
+import mmap
+import os
+from collections.abc import Callable, Iterator
+
+import numpy as np
+import numpy.typing as npt
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+def string2filename(string: str) -> str:
+    # generate a safe and reversible filename based on a string
+    return base64.urlsafe_b64encode(string.encode("utf-8")).decode("utf-8", "ignore")
+
+
+class PackedCache:
+    """Cache of 1D arrays, e.g. the token IDs or F0 values of each sample, packed in a single file.
+
+    The arrays are appended to ``{cache_path}/{name}.bin`` and an index line ``{"key", "offset", "length", "dtype"}``
+    per array to ``{cache_path}/{name}.index``. Reads are zero-copy read-only views into a memory map of the data
+    file. Writes hold a file lock, so the processes of a data loader can fill the same cache concurrently, and new
+    samples can be appended to an existing cache at any time. A partial index line left by a process that crashed
+    while writing is removed by the next write, and malformed index lines are skipped.
+
+    Arrays cached by previous versions as one ``{cache_path}/{string2filename(key)}{legacy_suffix}`` file per sample
+    are imported into the packed cache when they are first read.
+
+    Args:
+        cache_path (str): Cache directory.
+        name (str): Name of the cached feature, used for the file names.
+        legacy_suffix (str): Suffix of the per sample ``.npy`` files of previous versions. Defaults to None.
+    """
+
+    def __init__(self, cache_path: str | os.PathLike, name: str, legacy_suffix: str | None = None) -> None:
+        os.makedirs(cache_path, exist_ok=True)
+        self.cache_path = cache_path
+        self.legacy_suffix = legacy_suffix
+        self.data_file = os.path.join(cache_path, f"{name}.bin")
+        self.index_file = os.path.join(cache_path, f"{name}.index")
+        self.lock_file = os.path.join(cache_path, f"{name}.lock")
+        self._index = {}
+        self._index_pos = 0
+        self._mmap = None
+
+    def __getstate__(self) -> dict:
+        # memory maps can't be pickled, data loader workers reopen the files
+        state = self.__dict__.copy()
+        state.update(_index={}, _index_pos=0, _mmap=None)
+        return state
+
+    def __len__(self) -> int:
+        self._read_index()
+        return len(self._index)
+
+    def _read_index(self) -> None:
+        """Read the index lines appended since the last call."""
+        if not os.path.exists(self.index_file):
+            return
+        with open(self.index_file, "rb") as f:
+            f.seek(self._index_pos)
+            for line in f:
+                if not line.endswith(b"\n"):  # being written
+                    break
+                self._index_pos += len(line)
+                try:
+                    entry = json.loads(line)
+                    self._index[entry["key"]] = (entry["offset"], entry["length"], entry["dtype"])
+                except (ValueError, KeyError, TypeError):
+                    logger.warning("Skipping malformed line in %s: %r", self.index_file, line)
+
+    @contextlib.contextmanager
+    def _lock(self) -> Iterator[None]:
+        with open(self.lock_file, "a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def get(self, key: str) -> npt.NDArray | None:
+        """Return the cached array of `key` or None if it is not cached."""
+        if key not in self._index:
+            self._read_index()
+            if key not in self._index:
+                return self._import_legacy(key)
+        offset, length, dtype = self._index[key]
+        if length == 0:
+            return np.zeros(0, dtype=dtype)
+        end = offset + length * np.dtype(dtype).itemsize
+        if self._mmap is None or len(self._mmap) < end:
+            # the data file grew since it was mapped, views into the old map stay valid
+            with open(self.data_file, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return np.frombuffer(self._mmap, dtype=dtype, count=length, offset=offset)
+
+    def put(self, key: str, array: npt.ArrayLike) -> npt.NDArray:
+        """Append the 1D `array` to the cache and return it as stored."""
+        array = np.ascontiguousarray(array)
+        assert array.ndim == 1, f" [!] Only 1D arrays can be cached, got shape {array.shape}."
+        with self._lock():
+            self._read_index()
+            if key not in self._index:  # otherwise another process was faster
+                with open(self.data_file, "ab") as f:
+                    offset = f.seek(0, os.SEEK_END)
+                    f.write(array.tobytes())
+                entry = {"key": key, "offset": offset, "length": len(array), "dtype": array.dtype.str}
+                with open(self.index_file, "ab") as f:
+                    # drop the partial last line of a process that crashed while holding the lock
+                    f.truncate(self._index_pos)
+                    f.write(json.dumps(entry).encode() + b"\n")
+                self._read_index()
+        return self.get(key)
+
+    def get_or_compute(self, key: str, compute_fn: Callable[[], npt.ArrayLike]) -> npt.NDArray:
+        """Return the cached array of `key`, computing and caching it with `compute_fn()` if necessary."""
+        array = self.get(key)
+        if array is None:
+            array = self.put(key, compute_fn())
+        return array
+
+    def _import_legacy(self, key: str) -> npt.NDArray | None:
+        if self.legacy_suffix is None:
+            return None
+        legacy_file = os.path.join(self.cache_path, string2filename(key) + self.legacy_suffix)
+        if not os.path.exists(legacy_file):
+            return None
+        return self.put(key, np.load(legacy_file))
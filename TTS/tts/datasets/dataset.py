@@ -1,4 +1,3 @@
-import base64
 import collections
 import logging
 import os
@@ -12,6 +11,7 @@ import torchaudio
 import tqdm
 from torch.utils.data import Dataset
 
+from TTS.tts.datasets.cache import PackedCache
 from TTS.tts.utils.data import prepare_data, prepare_stop_target, prepare_tensor
 from TTS.utils.audio import AudioProcessor
 from TTS.utils.audio.numpy_transforms import compute_energy as calculate_energy
@@ -42,11 +42,6 @@ def noise_augment_audio(wav: npt.NDArray) -> npt.NDArray:
     return wav + (1.0 / 32768.0) * np.random.rand(*wav.shape)
 
 
-def string2filename(string: str) -> str:
-    # generate a safe and reversible filename based on a string
-    return base64.urlsafe_b64encode(string.encode("utf-8")).decode("utf-8", "ignore")
-
-
 def get_audio_size(audiopath: str | os.PathLike[Any]) -> int:
     """Return the number of samples in the audio file."""
     if not isinstance(audiopath, str):
@@ -158,8 +153,8 @@ class TTSDataset(Dataset):
                 The maximum length in the dataset defines the VRAM used in the training. Hence, pay attention to
                 this value if you encounter an OOM error in training. Defaults to float("inf").
 
-            phoneme_cache_path (str): Path to cache computed phonemes. It writes phonemes of each sample to a
-                separate file. Defaults to None.
+            phoneme_cache_path (str): Path to cache computed phonemes. The phonemes of all samples are packed in a
+                single file, see `PackedCache`. Defaults to None.
 
             precompute_num_workers (int): Number of workers to precompute features. Defaults to 0.
 
@@ -295,7 +290,7 @@ class TTSDataset(Dataset):
             token_ids = self.get_phonemes(idx, text)["token_ids"]
         else:
             token_ids = self.tokenizer.text_to_ids(text)
-        return np.array(token_ids, dtype=np.int32)
+        return np.asarray(token_ids, dtype=np.int32)
 
     def load_data(self, idx) -> dict[str, Any]:
         item = self.samples[idx]
@@ -496,7 +491,7 @@ class TTSDataset(Dataset):
             else:
                 speaker_ids = None
             # compute features
-            mel = [self.ap.melspectrogram(w).astype("float32") for w in batch["wav"]]
+            mel = self.ap.melspectrogram_batch(batch["wav"])
 
             mel_lengths = [m.shape[1] for m in mel]
 
@@ -545,7 +540,7 @@ class TTSDataset(Dataset):
             # compute linear spectrogram
             linear = None
             if self.compute_linear_spec:
-                linear = [self.ap.spectrogram(w).astype("float32") for w in batch["wav"]]
+                linear = self.ap.spectrogram_batch(batch["wav"])
                 linear = prepare_tensor(linear, self.outputs_per_step)
                 linear = linear.transpose(0, 2, 1)
                 assert mel.shape[1] == linear.shape[1]
@@ -648,32 +643,32 @@ class PhonemeDataset(Dataset):
         self.samples = samples
         self.tokenizer = tokenizer
         self.cache_path = cache_path
-        if cache_path is not None and not os.path.exists(cache_path):
-            os.makedirs(cache_path)
+        precompute = cache_path is not None and not os.path.exists(cache_path)
+        self.cache = None if cache_path is None else PackedCache(cache_path, "phoneme", legacy_suffix="_phoneme.npy")
+        if precompute:
             self.precompute(precompute_num_workers)
 
     def __getitem__(self, index) -> dict[str, Any]:
         item = self.samples[index]
-        ids = self.compute_or_load(string2filename(item["audio_unique_name"]), item["text"], item["language"])
+        ids = self.compute_or_load(item["audio_unique_name"], item["text"], item["language"])
         ph_hat = self.tokenizer.ids_to_text(ids)
         return {"text": item["text"], "ph_hat": ph_hat, "token_ids": ids, "token_ids_len": len(ids)}
 
     def __len__(self) -> int:
         return len(self.samples)
 
-    def compute_or_load(self, file_name: str, text: str, language: str) -> list[int]:
+    def compute_or_load(self, audio_unique_name: str, text: str, language: str) -> npt.NDArray:
         """Compute phonemes for the given text.
 
         If the phonemes are already cached, load them from cache.
         """
-        file_ext = "_phoneme.npy"
-        cache_path = os.path.join(self.cache_path, file_name + file_ext)
-        try:
-            ids = np.load(cache_path)
-        except FileNotFoundError:
-            ids = self.tokenizer.text_to_ids(text, language=language)
-            np.save(cache_path, ids)
-        return ids
+
+        def compute():
+            return np.array(self.tokenizer.text_to_ids(text, language=language), dtype=np.int32)
+
+        if self.cache is None:
+            return compute()
+        return self.cache.get_or_compute(audio_unique_name, compute)
 
     def get_pad_id(self) -> int:
         """Get pad token ID for sequence padding."""
@@ -705,7 +700,7 @@ class PhonemeDataset(Dataset):
         ids_lens_max = max(ids_lens)
         ids_torch = torch.LongTensor(len(ids), ids_lens_max).fill_(self.get_pad_id())
         for i, ids_len in enumerate(ids_lens):
-            ids_torch[i, :ids_len] = torch.LongTensor(ids[i])
+            ids_torch[i, :ids_len] = torch.LongTensor(np.array(ids[i]))
         return {"text": texts, "ph_hat": texts_hat, "token_ids": ids_torch}
 
     def print_logs(self, level: int = 0) -> None:
@@ -758,15 +753,16 @@ class F0Dataset:
         self.pad_id = 0.0
         self.mean = None
         self.std = None
-        if cache_path is not None and not os.path.exists(cache_path):
-            os.makedirs(cache_path)
+        precompute = cache_path is not None and not os.path.exists(cache_path)
+        self.cache = None if cache_path is None else PackedCache(cache_path, "pitch", legacy_suffix="_pitch.npy")
+        if precompute:
             self.precompute(precompute_num_workers)
         if normalize_f0:
             self.load_stats(cache_path)
 
     def __getitem__(self, idx):
         item = self.samples[idx]
-        f0 = self.compute_or_load(item["audio_file"], string2filename(item["audio_unique_name"]))
+        f0 = self.compute_or_load(item["audio_file"], item["audio_unique_name"])
         if self.normalize_f0:
             assert self.mean is not None and self.std is not None, " [!] Mean and STD is not available"
             f0 = self.normalize(f0)
@@ -805,10 +801,6 @@ class F0Dataset:
     def get_pad_id(self):
         return self.pad_id
 
-    @staticmethod
-    def create_pitch_file_path(file_name: str, cache_path: str) -> str:
-        return os.path.join(cache_path, file_name + "_pitch.npy")
-
     @staticmethod
     def _compute_and_save_pitch(ap, wav_file, pitch_file=None):
         wav = ap.load_wav(wav_file)
@@ -845,12 +837,13 @@ class F0Dataset:
 
     def compute_or_load(self, wav_file, audio_unique_name):
         """Compute pitch and return a numpy array of pitch values."""
-        pitch_file = self.create_pitch_file_path(audio_unique_name, self.cache_path)
-        if not os.path.exists(pitch_file):
-            pitch = self._compute_and_save_pitch(self.ap, wav_file, pitch_file)
-        else:
-            pitch = np.load(pitch_file)
-        return pitch.astype(np.float32)
+
+        def compute():
+            return self._compute_and_save_pitch(self.ap, wav_file).astype(np.float32)
+
+        if self.cache is None:
+            return compute()
+        return self.cache.get_or_compute(audio_unique_name, compute).astype(np.float32, copy=False)
 
     def collate_fn(self, batch):
         audio_unique_name = [item["audio_unique_name"] for item in batch]
@@ -859,7 +852,7 @@ class F0Dataset:
         f0_lens_max = max(f0_lens)
         f0s_torch = torch.LongTensor(len(f0s), f0_lens_max).fill_(self.get_pad_id())
         for i, f0_len in enumerate(f0_lens):
-            f0s_torch[i, :f0_len] = torch.LongTensor(f0s[i])
+            f0s_torch[i, :f0_len] = torch.LongTensor(np.array(f0s[i]))
         return {"audio_unique_name": audio_unique_name, "f0": f0s_torch, "f0_lens": f0_lens}
 
     def print_logs(self, level: int = 0) -> None:
@@ -909,15 +902,16 @@ class EnergyDataset:
         self.pad_id = 0.0
         self.mean = None
         self.std = None
-        if cache_path is not None and not os.path.exists(cache_path):
-            os.makedirs(cache_path)
+        precompute = cache_path is not None and not os.path.exists(cache_path)
+        self.cache = None if cache_path is None else PackedCache(cache_path, "energy", legacy_suffix="_energy.npy")
+        if precompute:
             self.precompute(precompute_num_workers)
         if normalize_energy:
             self.load_stats(cache_path)
 
     def __getitem__(self, idx):
         item = self.samples[idx]
-        energy = self.compute_or_load(item["audio_file"], string2filename(item["audio_unique_name"]))
+        energy = self.compute_or_load(item["audio_file"], item["audio_unique_name"])
         if self.normalize_energy:
             assert self.mean is not None and self.std is not None, " [!] Mean and STD is not available"
             energy = self.normalize(energy)
@@ -956,11 +950,6 @@ class EnergyDataset:
     def get_pad_id(self):
         return self.pad_id
 
-    @staticmethod
-    def create_energy_file_path(wav_file, cache_path):
-        file_name = os.path.splitext(os.path.basename(wav_file))[0]
-        return os.path.join(cache_path, file_name + "_energy.npy")
-
     @staticmethod
     def _compute_and_save_energy(ap, wav_file, energy_file=None):
         wav = ap.load_wav(wav_file)
@@ -997,12 +986,13 @@ class EnergyDataset:
 
     def compute_or_load(self, wav_file, audio_unique_name):
         """Compute energy and return a numpy array of energy values."""
-        energy_file = self.create_energy_file_path(audio_unique_name, self.cache_path)
-        if not os.path.exists(energy_file):
-            energy = self._compute_and_save_energy(self.ap, wav_file, energy_file)
-        else:
-            energy = np.load(energy_file)
-        return energy.astype(np.float32)
+
+        def compute():
+            return self._compute_and_save_energy(self.ap, wav_file).astype(np.float32)
+
+        if self.cache is None:
+            return compute()
+        return self.cache.get_or_compute(audio_unique_name, compute).astype(np.float32, copy=False)
 
     def collate_fn(self, batch):
         audio_unique_name = [item["audio_unique_name"] for item in batch]
@@ -1011,7 +1001,7 @@ class EnergyDataset:
         energy_lens_max = max(energy_lens)
         energys_torch = torch.LongTensor(len(energys), energy_lens_max).fill_(self.get_pad_id())
         for i, energy_len in enumerate(energy_lens):
-            energys_torch[i, :energy_len] = torch.LongTensor(energys[i])
+            energys_torch[i, :energy_len] = torch.LongTensor(np.array(energys[i]))
         return {"audio_unique_name": audio_unique_name, "energy": energys_torch, "energy_lens": energy_lens}
 
     def print_logs(self, level: int = 0) -> None:
@@ -1,13 +1,13 @@
 import logging
 import re
+from collections.abc import Iterator
 
 import numpy as np
 import torch
 import tqdm
-from scipy.special import softmax
 from torch.nn import functional as F
 
-from TTS.tts.layers.bark.load_model import clear_cuda_cache
+from TTS.tts.layers.bark.model import KVCache
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +24,33 @@ def _normalize_whitespace(text: str) -> str:
     return re.sub(r"\s+", " ", text).strip()
 
 
+def _sample(
+    logits: torch.Tensor, temp: float, top_k: int | None = None, top_p: float | None = None
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Sample one token per row from ``[B, V]`` logits with top-k and nucleus filtering.
+
+    Returns:
+        The sampled tokens ``[B]`` and the probabilities they were sampled from ``[B, V]``.
+    """
+    if top_p is not None:
+        sorted_logits, sorted_indices = torch.sort(logits, descending=True, dim=-1)
+        cumulative_probs = torch.softmax(sorted_logits.float(), dim=-1).cumsum(dim=-1)
+        # keep the first token above the threshold
+        sorted_indices_to_remove = cumulative_probs > top_p
+        sorted_indices_to_remove[:, 1:] = sorted_indices_to_remove[:, :-1].clone()
+        sorted_indices_to_remove[:, 0] = False
+        logits = logits.scatter(-1, sorted_indices, sorted_logits.masked_fill(sorted_indices_to_remove, -float("Inf")))
+    if top_k is not None:
+        v, _ = torch.topk(logits, min(top_k, logits.size(-1)), dim=-1)
+        logits = logits.masked_fill(logits < v[:, [-1]], -float("Inf"))
+    probs = torch.softmax(logits.float() / temp, dim=-1)
+    return torch.multinomial(probs, num_samples=1).squeeze(-1), probs
+
+
+def _model_dtype(model: torch.nn.Module) -> torch.dtype:
+    return next(model.parameters()).dtype
+
+
 @torch.inference_mode()
 def generate_text_semantic(
     text: str,
@@ -61,8 +88,49 @@ def generate_text_semantic(
         The generated semantic tokens.
     """
     assert isinstance(text, str)
-    text = _normalize_whitespace(text)
-    assert len(text.strip()) > 0
+    return generate_text_semantic_batch(
+        [text],
+        model,
+        history_prompt,
+        temp=temp,
+        top_k=top_k,
+        top_p=top_p,
+        silent=silent,
+        min_eos_p=min_eos_p,
+        max_gen_duration_s=max_gen_duration_s,
+        allow_early_stop=allow_early_stop,
+        base=base,
+        use_kv_caching=use_kv_caching,
+    )[0]
+
+
+@torch.inference_mode()
+def generate_text_semantic_batch(
+    texts: list[str],
+    model: "Bark",
+    history_prompt: tuple[torch.Tensor | None, torch.Tensor | None, torch.Tensor | None],
+    temp: float = 0.7,
+    top_k: int | None = None,
+    top_p: float | None = None,
+    silent: bool = False,
+    min_eos_p: float = 0.2,
+    max_gen_duration_s: float | None = None,
+    allow_early_stop: bool = True,
+    base: tuple[torch.Tensor, torch.Tensor, torch.Tensor] | None = None,
+    use_kv_caching: bool = True,
+    **kwargs,  # pylint: disable=unused-argument
+) -> list[torch.Tensor]:
+    """Generate semantic tokens for several texts in one batch.
+
+    All texts share the same history prompt. Pass the same text several times to sample several candidates. Rows
+    that reach the end of sentence token are masked until all rows are finished. Arguments are the same as for
+    :func:`generate_text_semantic`.
+
+    Returns:
+        The generated semantic tokens of each text.
+    """
+    assert len(texts) > 0
+    config = model.config
     if all(v is not None for v in history_prompt) or base is not None:
         semantic_history = history_prompt[0]
         if base is not None:
@@ -72,99 +140,95 @@ def generate_text_semantic(
             and len(semantic_history.shape) == 1
             and len(semantic_history) > 0
             and semantic_history.min() >= 0
-            and semantic_history.max() <= model.config.SEMANTIC_VOCAB_SIZE - 1
+            and semantic_history.max() <= config.SEMANTIC_VOCAB_SIZE - 1
         )
     else:
         semantic_history = None
-    encoded_text = (
-        torch.tensor(_tokenize(model.tokenizer, text), device=model.device, dtype=torch.long)
-        + model.config.TEXT_ENCODING_OFFSET
-    )
-    if len(encoded_text) > 256:
-        p = (len(encoded_text) - 256) / len(encoded_text) * 100
-        logger.warning("warning, text too long, lopping of last %.1f%%", p)
-        encoded_text = encoded_text[:256]
-    encoded_text = F.pad(
-        encoded_text,
-        (0, 256 - len(encoded_text)),
-        mode="constant",
-        value=model.config.TEXT_PAD_TOKEN,
-    )
+
+    n_tot_steps = 768
+    batch_size = len(texts)
+    prefix_len = 256 + 256 + 1
+    # context and generated tokens of all texts
+    x = torch.empty((batch_size, prefix_len + n_tot_steps), dtype=torch.long, device=model.device)
+    for i, text in enumerate(texts):
+        text = _normalize_whitespace(text)
+        assert len(text.strip()) > 0
+        encoded_text = torch.tensor(_tokenize(model.tokenizer, text), dtype=torch.long) + config.TEXT_ENCODING_OFFSET
+        if len(encoded_text) > 256:
+            p = (len(encoded_text) - 256) / len(encoded_text) * 100
+            logger.warning("warning, text too long, lopping of last %.1f%%", p)
+            encoded_text = encoded_text[:256]
+        x[i, :256] = F.pad(encoded_text, (0, 256 - len(encoded_text)), mode="constant", value=config.TEXT_PAD_TOKEN)
     if semantic_history is not None:
-        semantic_history = semantic_history.to(dtype=torch.int64)
         # lop off if history is too long, pad if needed
-        semantic_history = semantic_history[-256:]
-        semantic_history = F.pad(
+        semantic_history = semantic_history.to(dtype=torch.int64)[-256:]
+        x[:, 256:512] = F.pad(
             semantic_history,
             (0, 256 - len(semantic_history)),
             mode="constant",
-            value=model.config.SEMANTIC_PAD_TOKEN,
-        )
+            value=config.SEMANTIC_PAD_TOKEN,
+        ).to(model.device)
     else:
-        semantic_history = torch.full((256,), model.config.SEMANTIC_PAD_TOKEN, dtype=torch.int64)
-    x = torch.cat(
-        [encoded_text, semantic_history, torch.tensor([model.config.SEMANTIC_INFER_TOKEN], device=model.device)]
-    ).unsqueeze(0)
-    assert x.shape[1] == 256 + 256 + 1
+        x[:, 256:512] = config.SEMANTIC_PAD_TOKEN
+    x[:, 512] = config.SEMANTIC_INFER_TOKEN
 
-    n_tot_steps = 768
+    # the text and the semantic history are merged into 256 positions
+    kv_cache = None
+    if use_kv_caching:
+        kv_cache = KVCache(
+            model.semantic_model.config,
+            batch_size,
+            prefix_len - 256 + n_tot_steps,
+            device=model.device,
+            dtype=_model_dtype(model.semantic_model),
+        )
+    done = torch.zeros(batch_size, dtype=torch.bool, device=model.device)
+    lengths = torch.zeros(batch_size, dtype=torch.long, device=model.device)
+    length = prefix_len
     # custom tqdm updates since we don't know when eos will occur
     pbar = tqdm.tqdm(disable=silent, total=100)
     pbar_state = 0
     tot_generated_duration_s = 0
-    kv_cache = None
     for n in range(n_tot_steps):
-        if use_kv_caching and kv_cache is not None:
-            x_input = x[:, [-1]]
+        if kv_cache is not None and kv_cache.length > 0:
+            x_input = x[:, length - 1 : length]
         else:
-            x_input = x
-        logits, kv_cache = model.semantic_model(x_input, merge_context=True, use_cache=use_kv_caching, past_kv=kv_cache)
-        relevant_logits = logits[0, 0, : model.config.SEMANTIC_VOCAB_SIZE]
+            x_input = x[:, :length]
+        logits, _ = model.semantic_model(x_input, merge_context=True, past_kv=kv_cache)
+        relevant_logits = logits[:, 0, : config.SEMANTIC_VOCAB_SIZE]
         if allow_early_stop:
-            relevant_logits = torch.hstack((relevant_logits, logits[0, 0, [model.config.SEMANTIC_PAD_TOKEN]]))  # eos
-        if top_p is not None:
-            # faster to convert to numpy
-            logits_device = relevant_logits.device
-            logits_dtype = relevant_logits.type()
-            relevant_logits = relevant_logits.detach().cpu().type(torch.float32).numpy()
-            sorted_indices = np.argsort(relevant_logits)[::-1]
-            sorted_logits = relevant_logits[sorted_indices]
-            cumulative_probs = np.cumsum(softmax(sorted_logits))
-            sorted_indices_to_remove = cumulative_probs > top_p
-            sorted_indices_to_remove[1:] = sorted_indices_to_remove[:-1].copy()
-            sorted_indices_to_remove[0] = False
-            relevant_logits[sorted_indices[sorted_indices_to_remove]] = -np.inf
-            relevant_logits = torch.from_numpy(relevant_logits)
-            relevant_logits = relevant_logits.to(logits_device).type(logits_dtype)
-        if top_k is not None:
-            v, _ = torch.topk(relevant_logits, min(top_k, relevant_logits.size(-1)))
-            relevant_logits[relevant_logits < v[-1]] = -float("Inf")
-        probs = torch.softmax(relevant_logits / temp, dim=-1)
-        item_next = torch.multinomial(probs, num_samples=1)
-        if allow_early_stop and (
-            item_next == model.config.SEMANTIC_VOCAB_SIZE or (min_eos_p is not None and probs[-1] >= min_eos_p)
-        ):
-            # eos found, so break
-            pbar.update(100 - pbar_state)
-            break
-        x = torch.cat((x, item_next.unsqueeze(0)), dim=1)
-        tot_generated_duration_s += 1 / model.config.SEMANTIC_RATE_HZ
+            relevant_logits = torch.cat((relevant_logits, logits[:, 0, [config.SEMANTIC_PAD_TOKEN]]), dim=-1)  # eos
+        item_next, probs = _sample(relevant_logits, temp, top_k, top_p)
+        if allow_early_stop:
+            is_eos = item_next == config.SEMANTIC_VOCAB_SIZE
+            if min_eos_p is not None:
+                is_eos |= probs[:, -1] >= min_eos_p
+            lengths = torch.where(is_eos & ~done, n, lengths)
+            done |= is_eos
+            if done.all():
+                # eos found in all rows, so break
+                pbar.update(100 - pbar_state)
+                break
+            # finished rows keep decoding padding until all rows are done
+            item_next = item_next.masked_fill(done, config.SEMANTIC_PAD_TOKEN)
+        x[:, length] = item_next
+        length += 1
+        tot_generated_duration_s += 1 / config.SEMANTIC_RATE_HZ
         if max_gen_duration_s is not None and tot_generated_duration_s > max_gen_duration_s:
             pbar.update(100 - pbar_state)
             break
         if n == n_tot_steps - 1:
             pbar.update(100 - pbar_state)
             break
-        del logits, relevant_logits, probs, item_next
         req_pbar_state = np.min([100, int(round(100 * n / n_tot_steps))])
         if req_pbar_state > pbar_state:
             pbar.update(req_pbar_state - pbar_state)
         pbar_state = req_pbar_state
     pbar.close()
-    out = x.squeeze()[256 + 256 + 1 :]
-    assert all(out >= 0) and all(out < model.config.SEMANTIC_VOCAB_SIZE)
-    clear_cuda_cache()
-    return out
+    lengths = torch.where(done, lengths, length - prefix_len).tolist()
+    outs = [x[i, prefix_len : prefix_len + lengths[i]] for i in range(batch_size)]
+    assert all(((out >= 0) & (out < config.SEMANTIC_VOCAB_SIZE)).all() for out in outs)
+    return outs
 
 
 @torch.inference_mode()
@@ -209,18 +273,152 @@ def generate_coarse(
     Returns:
         The generated coarse audio codes.
     """
-    assert (
-        isinstance(x_semantic, torch.Tensor)
-        and len(x_semantic.shape) == 1
-        and len(x_semantic) > 0
-        and x_semantic.min() >= 0
-        and x_semantic.max() <= model.config.SEMANTIC_VOCAB_SIZE - 1
+    return generate_coarse_batch(
+        [x_semantic],
+        model,
+        history_prompt,
+        temp=temp,
+        top_k=top_k,
+        top_p=top_p,
+        silent=silent,
+        max_coarse_history=max_coarse_history,
+        sliding_window_len=sliding_window_len,
+        base=base,
+        use_kv_caching=use_kv_caching,
+    )[0]
+
+
+@torch.inference_mode()
+def generate_coarse_batch(
+    x_semantics: list[torch.Tensor],
+    model: "Bark",
+    history_prompt: tuple[torch.Tensor | None, torch.Tensor | None, torch.Tensor | None],
+    temp: float = 0.7,
+    top_k: int | None = None,
+    top_p: float | None = None,
+    silent: bool = False,
+    max_coarse_history: int = 630,  # min 60 (faster), max 630 (more context)
+    sliding_window_len: int = 60,
+    base: tuple[torch.Tensor, torch.Tensor, torch.Tensor] | None = None,
+    use_kv_caching: bool = True,
+) -> list[torch.Tensor]:
+    """Generate coarse audio codes from several semantic token sequences in one batch.
+
+    All inputs share the same history prompt, so the sliding windows of all rows are aligned. Shorter inputs are
+    padded and their extra codes are discarded. Arguments are the same as for :func:`generate_coarse`.
+
+    Returns:
+        The generated coarse audio codes of each input.
+    """
+    for x_coarse_gen in _generate_coarse_windows(
+        x_semantics,
+        model,
+        history_prompt,
+        temp=temp,
+        top_k=top_k,
+        top_p=top_p,
+        silent=silent,
+        max_coarse_history=max_coarse_history,
+        sliding_window_len=sliding_window_len,
+        base=base,
+        use_kv_caching=use_kv_caching,
+    ):
+        pass
+    n_steps = [_n_coarse_steps(len(x_semantic), model.config) for x_semantic in x_semantics]
+    return [_unflatten_coarse(x_coarse_gen[i, :n], model.config) for i, n in enumerate(n_steps)]
+
+
+@torch.inference_mode()
+def generate_coarse_stream(
+    x_semantic: torch.Tensor,
+    model: "Bark",
+    history_prompt: tuple[torch.Tensor | None, torch.Tensor | None, torch.Tensor | None],
+    temp: float = 0.7,
+    top_k: int | None = None,
+    top_p: float | None = None,
+    silent: bool = False,
+    max_coarse_history: int = 630,  # min 60 (faster), max 630 (more context)
+    sliding_window_len: int = 60,
+    base: tuple[torch.Tensor, torch.Tensor, torch.Tensor] | None = None,
+    use_kv_caching: bool = True,
+) -> Iterator[torch.Tensor]:
+    """Generate coarse audio codes from semantic tokens one sliding window at a time.
+
+    The concatenation of the yielded codes is the output of :func:`generate_coarse` for the same random state.
+    Arguments are the same as for :func:`generate_coarse`.
+
+    Yields:
+        The coarse audio codes of each window, of shape ``[N_COARSE_CODEBOOKS, n]``.
+    """
+    n_codebooks = model.config.N_COARSE_CODEBOOKS
+    n_frames = 0
+    for x_coarse_gen in _generate_coarse_windows(
+        [x_semantic],
+        model,
+        history_prompt,
+        temp=temp,
+        top_k=top_k,
+        top_p=top_p,
+        silent=silent,
+        max_coarse_history=max_coarse_history,
+        sliding_window_len=sliding_window_len,
+        base=base,
+        use_kv_caching=use_kv_caching,
+    ):
+        # a window may end in the middle of a frame if `sliding_window_len` is odd
+        n_done = x_coarse_gen.shape[1] // n_codebooks
+        if n_done > n_frames:
+            yield _unflatten_coarse(x_coarse_gen[0, n_frames * n_codebooks : n_done * n_codebooks], model.config)
+            n_frames = n_done
+
+
+def _n_coarse_steps(n_semantic: int, config) -> int:
+    """Return the number of flattened coarse codes generated for ``n_semantic`` semantic tokens."""
+    semantic_to_coarse_ratio = config.COARSE_RATE_HZ / config.SEMANTIC_RATE_HZ * config.N_COARSE_CODEBOOKS
+    return int(
+        round(np.floor(n_semantic * semantic_to_coarse_ratio / config.N_COARSE_CODEBOOKS) * config.N_COARSE_CODEBOOKS)
     )
+
+
+def _unflatten_coarse(arr: torch.Tensor, config) -> torch.Tensor:
+    """Turn flattened coarse tokens into codes of shape ``[N_COARSE_CODEBOOKS, n]``, reverting `_flatten_codebooks`."""
+    arr = arr.reshape(-1, config.N_COARSE_CODEBOOKS).T - config.SEMANTIC_VOCAB_SIZE
+    for n in range(1, config.N_COARSE_CODEBOOKS):
+        arr[n, :] -= n * config.CODEBOOK_SIZE
+    return arr
+
+
+def _generate_coarse_windows(
+    x_semantics: list[torch.Tensor],
+    model: "Bark",
+    history_prompt: tuple[torch.Tensor | None, torch.Tensor | None, torch.Tensor | None],
+    temp: float,
+    top_k: int | None,
+    top_p: float | None,
+    silent: bool,
+    max_coarse_history: int,
+    sliding_window_len: int,
+    base: tuple[torch.Tensor, torch.Tensor, torch.Tensor] | None,
+    use_kv_caching: bool,
+) -> Iterator[torch.Tensor]:
+    """Run the coarse model over the sliding windows of :func:`generate_coarse_batch`.
+
+    Yields:
+        After each window, the flattened coarse tokens generated so far, of shape ``[batch_size, n]``. Tokens of
+        shorter inputs beyond their own number of steps are padding.
+    """
+    config = model.config
+    for x_semantic in x_semantics:
+        assert (
+            isinstance(x_semantic, torch.Tensor)
+            and len(x_semantic.shape) == 1
+            and len(x_semantic) > 0
+            and x_semantic.min() >= 0
+            and x_semantic.max() <= config.SEMANTIC_VOCAB_SIZE - 1
+        )
     assert 60 <= max_coarse_history <= 630
     assert max_coarse_history + sliding_window_len <= 1024 - 256
-    semantic_to_coarse_ratio = (
-        model.config.COARSE_RATE_HZ / model.config.SEMANTIC_RATE_HZ * model.config.N_COARSE_CODEBOOKS
-    )
+    semantic_to_coarse_ratio = config.COARSE_RATE_HZ / config.SEMANTIC_RATE_HZ * config.N_COARSE_CODEBOOKS
     max_semantic_history = int(np.floor(max_coarse_history / semantic_to_coarse_ratio))
     if all(v is not None for v in history_prompt) or base is not None:
         x_history = history_prompt
@@ -234,21 +432,19 @@ def generate_coarse(
             and len(x_semantic_history.shape) == 1
             and len(x_semantic_history) > 0
             and x_semantic_history.min() >= 0
-            and x_semantic_history.max() <= model.config.SEMANTIC_VOCAB_SIZE - 1
+            and x_semantic_history.max() <= config.SEMANTIC_VOCAB_SIZE - 1
             and isinstance(x_coarse_history, torch.Tensor)
             and len(x_coarse_history.shape) == 2
-            and x_coarse_history.shape[0] == model.config.N_COARSE_CODEBOOKS
+            and x_coarse_history.shape[0] == config.N_COARSE_CODEBOOKS
             and x_coarse_history.shape[-1] >= 0
             and x_coarse_history.min() >= 0
-            and x_coarse_history.max() <= model.config.CODEBOOK_SIZE - 1
+            and x_coarse_history.max() <= config.CODEBOOK_SIZE - 1
             and (
                 round(x_coarse_history.shape[-1] / len(x_semantic_history), 1)
-                == round(semantic_to_coarse_ratio / model.config.N_COARSE_CODEBOOKS, 1)
+                == round(semantic_to_coarse_ratio / config.N_COARSE_CODEBOOKS, 1)
             )
         )
-        x_coarse_history = (
-            _flatten_codebooks(x_coarse_history, model.config.CODEBOOK_SIZE) + model.config.SEMANTIC_VOCAB_SIZE
-        )
+        x_coarse_history = _flatten_codebooks(x_coarse_history, config.CODEBOOK_SIZE) + config.SEMANTIC_VOCAB_SIZE
         # trim histories correctly
         n_semantic_hist_provided = np.min(
             [
@@ -263,92 +459,79 @@ def generate_coarse(
         # TODO: bit of a hack for time alignment (sounds better)
         x_coarse_history = x_coarse_history[:-2]
     else:
-        x_semantic_history = torch.tensor([], dtype=torch.int32)
-        x_coarse_history = torch.tensor([], dtype=torch.int32)
+        x_semantic_history = torch.tensor([], dtype=torch.long)
+        x_coarse_history = torch.tensor([], dtype=torch.long)
     # start loop
-    n_steps = int(
-        round(
-            np.floor(len(x_semantic) * semantic_to_coarse_ratio / model.config.N_COARSE_CODEBOOKS)
-            * model.config.N_COARSE_CODEBOOKS
-        )
-    )
-    assert n_steps > 0 and n_steps % model.config.N_COARSE_CODEBOOKS == 0
-    x_semantic = torch.cat([x_semantic_history.to(model.device), x_semantic]).to(dtype=torch.int32)
+    all_n_steps = [_n_coarse_steps(len(x_semantic), config) for x_semantic in x_semantics]
+    assert all(n > 0 and n % config.N_COARSE_CODEBOOKS == 0 for n in all_n_steps)
+    n_steps = max(all_n_steps)
+    batch_size = len(x_semantics)
     base_semantic_idx = len(x_semantic_history)
 
-    x_semantic_in = x_semantic.unsqueeze(0)
-    x_coarse_in = x_coarse_history.unsqueeze(0).to(model.device)
+    # semantic tokens of all rows, padded from the right side
+    x_semantic_in = torch.full(
+        (batch_size, base_semantic_idx + max(len(x) for x in x_semantics)),
+        config.COARSE_SEMANTIC_PAD_TOKEN,
+        dtype=torch.long,
+        device=model.device,
+    )
+    x_semantic_in[:, :base_semantic_idx] = x_semantic_history.to(model.device)
+    for i, x_semantic in enumerate(x_semantics):
+        x_semantic_in[i, base_semantic_idx : base_semantic_idx + len(x_semantic)] = x_semantic
+    # coarse history and generated codes
+    n_history = len(x_coarse_history)
+    x_coarse_in = torch.empty((batch_size, n_history + n_steps), dtype=torch.long, device=model.device)
+    x_coarse_in[:, :n_history] = x_coarse_history.to(model.device)
+    # model input of the current window
+    x_in = torch.empty(
+        (batch_size, 256 + 1 + max_coarse_history + sliding_window_len), dtype=torch.long, device=model.device
+    )
+    kv_cache = None
+    if use_kv_caching:
+        kv_cache = KVCache(
+            model.coarse_model.config,
+            batch_size,
+            x_in.shape[1],
+            device=model.device,
+            dtype=_model_dtype(model.coarse_model),
+        )
+
     n_window_steps = int(np.ceil(n_steps / sliding_window_len))
     n_step = 0
+    n_coarse = n_history
     for _ in tqdm.tqdm(range(n_window_steps), total=n_window_steps, disable=silent):
         semantic_idx = base_semantic_idx + int(round(n_step / semantic_to_coarse_ratio))
-        # pad from right side
-        x_in = x_semantic_in[:, np.max([0, semantic_idx - max_semantic_history]) :]
-        x_in = x_in[:, :256]
-        x_in = F.pad(
-            x_in,
-            (0, 256 - x_in.shape[-1]),
-            "constant",
-            model.config.COARSE_SEMANTIC_PAD_TOKEN,
-        )
-        x_in = torch.hstack(
-            [
-                x_in,
-                torch.tensor([model.config.COARSE_INFER_TOKEN]).unsqueeze(0).to(model.device),
-                x_coarse_in[:, -max_coarse_history:],
-            ]
-        )
-        kv_cache = None
+        semantic_start = np.max([0, semantic_idx - max_semantic_history])
+        x_semantic_window = x_semantic_in[:, semantic_start : semantic_start + 256]
+        x_in[:, : x_semantic_window.shape[1]] = x_semantic_window
+        x_in[:, x_semantic_window.shape[1] : 256] = config.COARSE_SEMANTIC_PAD_TOKEN
+        x_in[:, 256] = config.COARSE_INFER_TOKEN
+        n_window_history = min(n_coarse, max_coarse_history)
+        x_in[:, 257 : 257 + n_window_history] = x_coarse_in[:, n_coarse - n_window_history : n_coarse]
+        length = 257 + n_window_history
+        if kv_cache is not None:
+            kv_cache.reset()
         for _ in range(sliding_window_len):
             if n_step >= n_steps:
-                continue
-            is_major_step = n_step % model.config.N_COARSE_CODEBOOKS == 0
+                break
+            is_major_step = n_step % config.N_COARSE_CODEBOOKS == 0
 
-            if use_kv_caching and kv_cache is not None:
-                x_input = x_in[:, [-1]]
+            if kv_cache is not None and kv_cache.length > 0:
+                x_input = x_in[:, length - 1 : length]
             else:
-                x_input = x_in
-
-            logits, kv_cache = model.coarse_model(x_input, use_cache=use_kv_caching, past_kv=kv_cache)
-            logit_start_idx = model.config.SEMANTIC_VOCAB_SIZE + (1 - int(is_major_step)) * model.config.CODEBOOK_SIZE
-            logit_end_idx = model.config.SEMANTIC_VOCAB_SIZE + (2 - int(is_major_step)) * model.config.CODEBOOK_SIZE
-            relevant_logits = logits[0, 0, logit_start_idx:logit_end_idx]
-            if top_p is not None:
-                # faster to convert to numpy
-                logits_device = relevant_logits.device
-                logits_dtype = relevant_logits.type()
-                relevant_logits = relevant_logits.detach().cpu().type(torch.float32).numpy()
-                sorted_indices = np.argsort(relevant_logits)[::-1]
-                sorted_logits = relevant_logits[sorted_indices]
-                cumulative_probs = np.cumsum(torch.nn.functional.softmax(sorted_logits))
-                sorted_indices_to_remove = cumulative_probs > top_p
-                sorted_indices_to_remove[1:] = sorted_indices_to_remove[:-1].copy()
-                sorted_indices_to_remove[0] = False
-                relevant_logits[sorted_indices[sorted_indices_to_remove]] = -np.inf
-                relevant_logits = torch.from_numpy(relevant_logits)
-                relevant_logits = relevant_logits.to(logits_device).type(logits_dtype)
-            if top_k is not None:
-                v, _ = torch.topk(relevant_logits, min(top_k, relevant_logits.size(-1)))
-                relevant_logits[relevant_logits < v[-1]] = -float("Inf")
-            probs = torch.nn.functional.softmax(relevant_logits / temp, dim=-1)
-            item_next = torch.multinomial(probs, num_samples=1)
+                x_input = x_in[:, :length]
+
+            logits, _ = model.coarse_model(x_input, past_kv=kv_cache)
+            logit_start_idx = config.SEMANTIC_VOCAB_SIZE + (1 - int(is_major_step)) * config.CODEBOOK_SIZE
+            logit_end_idx = config.SEMANTIC_VOCAB_SIZE + (2 - int(is_major_step)) * config.CODEBOOK_SIZE
+            item_next, _ = _sample(logits[:, 0, logit_start_idx:logit_end_idx], temp, top_k, top_p)
             item_next += logit_start_idx
-            x_coarse_in = torch.cat((x_coarse_in, item_next.unsqueeze(0)), dim=1)
-            x_in = torch.cat((x_in, item_next.unsqueeze(0)), dim=1)
-            del logits, relevant_logits, probs, item_next
+            x_coarse_in[:, n_coarse] = item_next
+            x_in[:, length] = item_next
+            n_coarse += 1
+            length += 1
             n_step += 1
-        del x_in
-    del x_semantic_in
-    gen_coarse_arr = x_coarse_in.squeeze()[len(x_coarse_history) :]
-    del x_coarse_in
-    assert len(gen_coarse_arr) == n_steps
-    gen_coarse_audio_arr = (
-        gen_coarse_arr.reshape(-1, model.config.N_COARSE_CODEBOOKS).T - model.config.SEMANTIC_VOCAB_SIZE
-    )
-    for n in range(1, model.config.N_COARSE_CODEBOOKS):
-        gen_coarse_audio_arr[n, :] -= n * model.config.CODEBOOK_SIZE
-    clear_cuda_cache()
-    return gen_coarse_audio_arr
+        yield x_coarse_in[:, n_history:n_coarse]
 
 
 @torch.inference_mode()
@@ -432,9 +615,7 @@ def generate_fine(
             else:
                 relevant_logits = logits[0, :, : model.config.CODEBOOK_SIZE] / temp
                 probs = F.softmax(relevant_logits, dim=-1)
-                codebook_preds = torch.hstack(
-                    [torch.multinomial(probs[n], num_samples=1) for n in range(rel_start_fill_idx, 1024)]
-                )
+                codebook_preds = torch.multinomial(probs[rel_start_fill_idx:], num_samples=1).squeeze(-1)
             in_buffer[0, rel_start_fill_idx:, nn] = codebook_preds
             del logits, codebook_preds
         # transfer over info into model_in and convert to numpy
@@ -449,7 +630,6 @@ def generate_fine(
     if n_remove_from_end > 0:
         gen_fine_arr = gen_fine_arr[:, :-n_remove_from_end]
     assert gen_fine_arr.shape[-1] == x_coarse_gen.shape[-1]
-    clear_cuda_cache()
     return gen_fine_arr
 
 
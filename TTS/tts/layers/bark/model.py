@@ -10,6 +10,44 @@ from coqpit import Coqpit
 from torch import nn
 
 
+class KVCache:
+    """Preallocated keys and values of all attention layers for incremental decoding.
+
+    New keys and values are written in place instead of being concatenated with the previous ones at every step.
+    :meth:`reset` allows reusing the buffers, e.g. for each window of a sliding-window generation.
+    """
+
+    def __init__(
+        self,
+        config: "GPTConfig",
+        batch_size: int,
+        max_len: int,
+        device: torch.device | str | None = None,
+        dtype: torch.dtype = torch.float32,
+    ) -> None:
+        shape = (config.n_layer, batch_size, config.n_head, max_len, config.n_embd // config.n_head)
+        self.keys = torch.empty(shape, device=device, dtype=dtype)
+        self.values = torch.empty(shape, device=device, dtype=dtype)
+        self.length = 0
+
+    @property
+    def max_len(self) -> int:
+        return self.keys.shape[-2]
+
+    def update(self, layer_idx: int, k: torch.Tensor, v: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Write the keys and values of new positions and return those of all positions so far."""
+        end = self.length + k.shape[-2]
+        if end > self.max_len:
+            msg = f"KV cache is full ({self.max_len} positions)"
+            raise RuntimeError(msg)
+        self.keys[layer_idx, :, :, self.length : end] = k
+        self.values[layer_idx, :, :, self.length : end] = v
+        return self.keys[layer_idx, :, :, :end], self.values[layer_idx, :, :, :end]
+
+    def reset(self) -> None:
+        self.length = 0
+
+
 class CausalSelfAttention(nn.Module):
     def __init__(self, config):
         super().__init__()
@@ -25,7 +63,7 @@ class CausalSelfAttention(nn.Module):
         self.n_embd = config.n_embd
         self.dropout = config.dropout
 
-    def forward(self, x, past_kv=None, use_cache=False):
+    def forward(self, x, past_kv=None, use_cache=False, layer_idx=0):
         B, T, C = x.size()  # batch size, sequence length, embedding dimensionality (n_embd)
 
         # calculate query, key, values for all heads in batch and move head forward to be the batch dim
@@ -34,22 +72,22 @@ class CausalSelfAttention(nn.Module):
         q = q.view(B, T, self.n_head, C // self.n_head).transpose(1, 2)  # (B, nh, T, hs)
         v = v.view(B, T, self.n_head, C // self.n_head).transpose(1, 2)  # (B, nh, T, hs)
 
-        if past_kv is not None:
-            past_key = past_kv[0]
-            past_value = past_kv[1]
-            k = torch.cat((past_key, k), dim=-2)
-            v = torch.cat((past_value, v), dim=-2)
-
-        FULL_T = k.shape[-2]
-
-        if use_cache is True:
-            present = (k, v)
+        if isinstance(past_kv, KVCache):
+            is_incremental = past_kv.length > 0
+            k, v = past_kv.update(layer_idx, k, v)
+            present = past_kv
         else:
-            present = None
+            is_incremental = past_kv is not None
+            if past_kv is not None:
+                past_key = past_kv[0]
+                past_value = past_kv[1]
+                k = torch.cat((past_key, k), dim=-2)
+                v = torch.cat((past_value, v), dim=-2)
+            present = (k, v) if use_cache else None
 
         # causal self-attention; Self-attend: (B, nh, T, hs) x (B, nh, hs, T) -> (B, nh, T, T)
         # efficient attention using Flash Attention CUDA kernels
-        if past_kv is not None:
+        if is_incremental:
             # When `past_kv` is provided, we're doing incremental decoding and `q.shape[2] == 1`: q only contains
             # the query for the last token. scaled_dot_product_attention interprets this as the first token in the
             # sequence, so if is_causal=True it will mask out all attention from it. This is not what we want, so
@@ -93,7 +131,7 @@ class Block(nn.Module):
         self.layer_idx = layer_idx
 
     def forward(self, x, past_kv=None, use_cache=False):
-        attn_output, prev_kvs = self.attn(self.ln_1(x), past_kv=past_kv, use_cache=use_cache)
+        attn_output, prev_kvs = self.attn(self.ln_1(x), past_kv=past_kv, use_cache=use_cache, layer_idx=self.layer_idx)
         x = x + attn_output
         x = x + self.mlp(self.ln_2(x))
         return (x, prev_kvs)
@@ -144,8 +182,16 @@ class GPT(nn.Module):
         return n_params
 
     def forward(self, idx, merge_context=False, past_kv=None, position_ids=None, use_cache=False):
+        """Compute the logits of the next token.
+
+        ``past_kv`` is either the tuple of keys and values returned by the previous call or a :class:`KVCache`,
+        which is updated in place and returned.
+        """
         device = idx.device
         _, t = idx.size()
+        kv_cache = past_kv if isinstance(past_kv, KVCache) else None
+        if kv_cache is not None and kv_cache.length == 0:
+            past_kv = None
         if past_kv is not None:
             assert t == 1
             tok_emb = self.transformer.wte(idx)  # token embeddings of shape (b, t, n_embd)
@@ -170,7 +216,10 @@ class GPT(nn.Module):
             else:
                 tok_emb = self.transformer.wte(idx)  # token embeddings of shape (b, t, n_embd)
 
-        if past_kv is None:
+        if kv_cache is not None:
+            past_length = kv_cache.length
+            past_kv = [kv_cache] * len(self.transformer.h)
+        elif past_kv is None:
             past_length = 0
             past_kv = tuple([None] * len(self.transformer.h))
         else:
@@ -193,6 +242,10 @@ class GPT(nn.Module):
             if use_cache:
                 new_kv = new_kv + (kv,)
 
+        if kv_cache is not None:
+            kv_cache.length += t
+            new_kv = kv_cache
+
         x = self.transformer.ln_f(x)
 
         # inference-time mini-optimization: only forward the lm_head on the very last position
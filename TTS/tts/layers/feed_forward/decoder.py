@@ -114,10 +114,15 @@ class FFTransformerDecoder(nn.Module):
         self.transformer_block = FFTransformerBlock(in_channels, **params)
         self.postnet = nn.Conv1d(in_channels, out_channels, 1)
 
-    def forward(self, x, x_mask=None, g=None):  # pylint: disable=unused-argument
+    def forward(self, x, x_mask=None, g=None, mask_padding=False):  # pylint: disable=unused-argument
         # TODO: handle multi-speaker
+        if mask_padding:
+            # keep padded frames out of the attention and the convolutions for batched inference
+            o = self.transformer_block(x, x_mask, mask_padding=True)
+        else:
+            o = self.transformer_block(x)
         x_mask = 1 if x_mask is None else x_mask
-        o = self.transformer_block(x) * x_mask
+        o = o * x_mask
         o = self.postnet(o) * x_mask
         return o
 
@@ -216,13 +221,17 @@ class Decoder(nn.Module):
         else:
             raise ValueError(f"[!] Unknown decoder type - {decoder_type}")
 
-    def forward(self, x, x_mask, g=None):  # pylint: disable=unused-argument
+    def forward(self, x, x_mask, g=None, mask_padding=False):  # pylint: disable=unused-argument
         """
         Args:
             x: [B, C, T]
             x_mask: [B, 1, T]
             g: [B, C_g, 1]
+            mask_padding (bool): keep padded frames out of the `fftransformer` decoder. Defaults to False.
         """
         # TODO: implement multi-speaker
-        o = self.decoder(x, x_mask, g)
+        if isinstance(self.decoder, FFTransformerDecoder):
+            o = self.decoder(x, x_mask, g, mask_padding=mask_padding)
+        else:
+            o = self.decoder(x, x_mask, g)
         return o
@@ -151,12 +151,18 @@ class Encoder(nn.Module):
         else:
             raise NotImplementedError(" [!] unknown encoder type.")
 
-    def forward(self, x, x_mask, g=None):  # pylint: disable=unused-argument
+    def forward(self, x, x_mask, g=None, mask_padding=False):  # pylint: disable=unused-argument
         """
+        Args:
+            mask_padding (bool): keep padded frames out of the `fftransformer` encoder. Defaults to False.
+
         Shapes:
             x: [B, C, T]
             x_mask: [B, 1, T]
             g: [B, C, 1]
         """
-        o = self.encoder(x, x_mask)
+        if isinstance(self.encoder, FFTransformerBlock):
+            o = self.encoder(x, x_mask, mask_padding=mask_padding)
+        else:
+            o = self.encoder(x, x_mask)
         return o * x_mask
@@ -18,15 +18,24 @@ class FFTransformer(nn.Module):
         self.dropout1 = nn.Dropout(dropout_p)
         self.dropout2 = nn.Dropout(dropout_p)
 
-    def forward(self, src, src_mask=None, src_key_padding_mask=None):
-        """😦 ugly looking with all the transposing"""
+    def forward(self, src, src_mask=None, src_key_padding_mask=None, mask_padding=False):
+        """😦 ugly looking with all the transposing
+
+        With ``mask_padding``, padded frames are kept out of the convolutions, so that batched and unbatched
+        inference outputs match. It is off by default to keep the numerics of existing models in training.
+        """
         src = src.permute(2, 0, 1)
         src2, enc_align = self.self_attn(src, src, src, attn_mask=src_mask, key_padding_mask=src_key_padding_mask)
         src = src + self.dropout1(src2)
         src = self.norm1(src + src2)
         # T x B x D -> B x D x T
         src = src.permute(1, 2, 0)
-        src2 = self.conv2(F.relu(self.conv1(src)))
+        if src_key_padding_mask is None or not mask_padding:
+            src2 = self.conv2(F.relu(self.conv1(src)))
+        else:
+            padding_mask = src_key_padding_mask.unsqueeze(1)
+            src2 = F.relu(self.conv1(src.masked_fill(padding_mask, 0.0)))
+            src2 = self.conv2(src2.masked_fill(padding_mask, 0.0))
         src2 = self.dropout2(src2)
         src = src + src2
         src = src.transpose(1, 2)
@@ -50,9 +59,12 @@ class FFTransformerBlock(nn.Module):
             ]
         )
 
-    def forward(self, x, mask=None, g=None):  # pylint: disable=unused-argument
+    def forward(self, x, mask=None, g=None, mask_padding=False):  # pylint: disable=unused-argument
         """
         TODO: handle multi-speaker
+        Args:
+            mask_padding (bool): keep padded frames out of the convolutions. Defaults to False.
+
         Shapes:
             - x: :math:`[B, C, T]`
             - mask:  :math:`[B, 1, T] or [B, T]`
@@ -63,7 +75,7 @@ class FFTransformerBlock(nn.Module):
             mask = ~mask.bool()
         alignments = []
         for layer in self.fft_layers:
-            x, align = layer(x, src_key_padding_mask=mask)
+            x, align = layer(x, src_key_padding_mask=mask, mask_padding=mask_padding)
             alignments.append(align.unsqueeze(1))
         alignments = torch.cat(alignments, 1)
         return x
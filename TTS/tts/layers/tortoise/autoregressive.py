@@ -537,8 +537,22 @@ class UnifiedVoice(nn.Module):
         max_generate_length=None,
         typical_sampling=False,
         typical_mass=0.9,
+        return_latent=False,
+        calm_token=83,
+        num_calm_tokens=8,
         **hf_generate_kwargs,
     ):
+        """Sample speech codes for the given text.
+
+        If ``return_latent`` is True, the final hidden states of each generation step are returned as well. They are
+        the latents that `forward(..., return_latent=True)` computes for the codes after
+        `fix_autoregressive_output()`: once a sequence has reached the stop token, it is fed the calm token. After the
+        generation, calm tokens are fed until all sequences have ``num_calm_tokens`` latents after their stop token.
+
+        Returns:
+            The generated codes of shape ``[b, t]``, and their latents of shape ``[b, t', model_dim]`` with
+            ``t' >= t`` if ``return_latent`` is True.
+        """
         text_inputs = F.pad(text_inputs, (0, 1), value=self.stop_text_token)
         text_inputs, text_targets = self.build_aligned_inputs_and_targets(
             text_inputs, self.start_text_token, self.stop_text_token
@@ -578,18 +592,73 @@ class UnifiedVoice(nn.Module):
         )
         stop_token_tensor = torch.tensor(self.stop_mel_token, device=inputs.device, dtype=torch.long)
         attention_mask = _prepare_attention_mask_for_generation(inputs, stop_token_tensor, stop_token_tensor)
-        gen = self.inference_model.generate(
-            inputs,
-            bos_token_id=self.start_mel_token,
-            pad_token_id=self.stop_mel_token,
-            eos_token_id=self.stop_mel_token,
-            max_length=max_length,
-            logits_processor=logits_processor,
-            num_return_sequences=num_return_sequences,
-            attention_mask=attention_mask,
-            **hf_generate_kwargs,
-        )
-        return gen[:, trunc_index:]
+        if not return_latent:
+            gen = self.inference_model.generate(
+                inputs,
+                bos_token_id=self.start_mel_token,
+                pad_token_id=self.stop_mel_token,
+                eos_token_id=self.stop_mel_token,
+                max_length=max_length,
+                logits_processor=logits_processor,
+                num_return_sequences=num_return_sequences,
+                attention_mask=attention_mask,
+                **hf_generate_kwargs,
+            )
+            return gen[:, trunc_index:]
+
+        assert input_tokens is None, "Latents can only be returned without input tokens"
+        latents = []
+
+        def embed_stop_as_calm(_module, args):
+            return (torch.where(args[0] == self.stop_mel_token, calm_token, args[0]),)
+
+        def store_latent(_module, _args, output):
+            # the first step processes the whole prompt
+            latents.append(output[:, -1:])
+
+        hooks = [
+            self.inference_model.embeddings.register_forward_pre_hook(embed_stop_as_calm),
+            self.final_norm.register_forward_hook(store_latent),
+        ]
+        try:
+            # finished sequences are padded with the calm token instead of the stop token
+            gen = self.inference_model.generate(
+                inputs,
+                bos_token_id=self.start_mel_token,
+                pad_token_id=calm_token,
+                eos_token_id=self.stop_mel_token,
+                max_length=max_length,
+                logits_processor=logits_processor,
+                num_return_sequences=num_return_sequences,
+                attention_mask=attention_mask,
+                return_dict_in_generate=True,
+                **hf_generate_kwargs,
+            )
+            codes = gen.sequences[:, trunc_index:]
+            # Feed calm tokens until all sequences have `num_calm_tokens` latents after their stop token. The last
+            # generated token hasn't been fed to the model yet.
+            is_stop = codes == self.stop_mel_token
+            stop_indices = is_stop.int().argmax(dim=1)[is_stop.any(dim=1)]
+            num_codes = int(stop_indices.max()) + 1 + num_calm_tokens if len(stop_indices) > 0 else 0
+            num_codes = min(num_codes, max_length - trunc_index)
+            next_tokens = gen.sequences[:, -1:]
+            past_key_values = gen.past_key_values
+            seq_len = gen.sequences.shape[1]
+            for _ in range(num_codes - codes.shape[1]):
+                outputs = self.inference_model(
+                    next_tokens,
+                    past_key_values=past_key_values,
+                    attention_mask=torch.ones((next_tokens.shape[0], seq_len), dtype=torch.long, device=inputs.device),
+                    use_cache=True,
+                    return_dict=True,
+                )
+                past_key_values = outputs.past_key_values
+                next_tokens = torch.full_like(next_tokens, calm_token)
+                seq_len += 1
+        finally:
+            for hook in hooks:
+                hook.remove()
+        return codes, torch.cat(latents, dim=1)
 
 
 def _prepare_attention_mask_for_generation(
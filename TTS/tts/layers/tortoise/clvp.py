@@ -97,6 +97,36 @@ class CLVP(nn.Module):
             self.text_pos_emb = nn.Embedding(text_seq_len, dim_text)
             self.speech_pos_emb = nn.Embedding(num_speech_tokens, dim_speech)
 
+    def encode_text(self, text, text_mask=None):
+        """Return the normalized latents of the given text tokens, of shape ``[b, dim_latent]``."""
+        if text_mask is None:
+            text_mask = torch.ones_like(text, dtype=torch.bool)
+        text_emb = self.text_emb(text)
+        if not self.xformers:
+            text_emb += self.text_pos_emb(torch.arange(text.shape[1], device=text.device))
+        enc_text = self.text_transformer(text_emb, mask=text_mask)
+        text_latents = self.to_text_latent(masked_mean(enc_text, text_mask, dim=1))
+        return F.normalize(text_latents, p=2, dim=-1)
+
+    def encode_speech(self, speech_tokens, voice_mask=None):
+        """Return the normalized latents of the given speech tokens, of shape ``[b, dim_latent]``."""
+        if voice_mask is None:
+            voice_mask = torch.ones_like(speech_tokens, dtype=torch.bool)
+        speech_emb = self.speech_emb(speech_tokens)
+        if not self.xformers:
+            speech_emb += self.speech_pos_emb(torch.arange(speech_emb.shape[1], device=speech_tokens.device))
+        enc_speech = self.speech_transformer(speech_emb, mask=voice_mask)
+        speech_latents = self.to_speech_latent(masked_mean(enc_speech, voice_mask, dim=1))
+        return F.normalize(speech_latents, p=2, dim=-1)
+
+    def similarity(self, text_latents, speech_latents):
+        """Return the similarity of each pair of text and speech latents.
+
+        A single text latent of shape ``[1, dim_latent]`` is compared to all speech latents, so the text encoding can
+        be reused for several speech candidates.
+        """
+        return (text_latents * speech_latents).sum(dim=-1) * self.temperature.exp()
+
     def forward(self, text, speech_tokens, return_loss=False):
         b, device = text.shape[0], text.device
         if self.training:
@@ -106,30 +136,13 @@ class CLVP(nn.Module):
             text_mask = torch.ones_like(text.float()).bool()
             voice_mask = torch.ones_like(speech_tokens.float()).bool()
 
-        text_emb = self.text_emb(text)
-        speech_emb = self.speech_emb(speech_tokens)
-
-        if not self.xformers:
-            text_emb += self.text_pos_emb(torch.arange(text.shape[1], device=device))
-            speech_emb += self.speech_pos_emb(torch.arange(speech_emb.shape[1], device=device))
-
-        enc_text = self.text_transformer(text_emb, mask=text_mask)
-        enc_speech = self.speech_transformer(speech_emb, mask=voice_mask)
-
-        text_latents = masked_mean(enc_text, text_mask, dim=1)
-        speech_latents = masked_mean(enc_speech, voice_mask, dim=1)
-
-        text_latents = self.to_text_latent(text_latents)
-        speech_latents = self.to_speech_latent(speech_latents)
-
-        text_latents, speech_latents = (F.normalize(t, p=2, dim=-1) for t in (text_latents, speech_latents))
-
-        temp = self.temperature.exp()
+        text_latents = self.encode_text(text, text_mask)
+        speech_latents = self.encode_speech(speech_tokens, voice_mask)
 
         if not return_loss:
-            sim = einsum("n d, n d -> n", text_latents, speech_latents) * temp
-            return sim
+            return self.similarity(text_latents, speech_latents)
 
+        temp = self.temperature.exp()
         sim = einsum("i d, j d -> i j", text_latents, speech_latents) * temp
         labels = torch.arange(b, device=device)
         loss = (F.cross_entropy(sim, labels) + F.cross_entropy(sim.t(), labels)) / 2
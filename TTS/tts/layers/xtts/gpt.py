@@ -1,11 +1,12 @@
 # ported from: https://github.com/neonbjb/tortoise-tts
 
+import hashlib
 import random
 
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
-from transformers import GPT2Config
+from transformers import DynamicCache, GPT2Config
 
 from TTS.tts.layers.tortoise.autoregressive import (
     ConditioningEncoder,
@@ -15,6 +16,7 @@ from TTS.tts.layers.tortoise.autoregressive import (
 )
 from TTS.tts.layers.xtts.gpt_inference import GPT2InferenceModel
 from TTS.tts.layers.xtts.perceiver_encoder import PerceiverResampler
+from TTS.utils.voices import VoiceCache
 
 
 class GPT(nn.Module):
@@ -127,7 +129,18 @@ class GPT(nn.Module):
             "heads": list(self.text_head.parameters()) + list(self.mel_head.parameters()),
         }
 
-    def init_gpt_for_inference(self, kv_cache=True, use_deepspeed=False):
+    def init_gpt_for_inference(self, kv_cache=True, use_deepspeed=False, prefix_cache_entries=None):
+        """
+        Set up the model for generation.
+
+        `prefix_cache_entries` is the number of voices for which the transformer keys and values of the conditioning
+        latents are kept, see `get_prefix_cache()`. 0 disables the cache. Defaults to 32, or to 0 with DeepSpeed,
+        whose injected kernels keep the keys and values in their own layout.
+        """
+        if prefix_cache_entries is None:
+            prefix_cache_entries = 0 if use_deepspeed else 32
+        # the cached keys and values depend on the weights
+        self.prefix_cache = VoiceCache(max_entries=prefix_cache_entries, max_bytes=512 * 2**20)
         seq_length = self.max_prompt_tokens + self.max_mel_tokens + self.max_text_tokens + 1
         gpt_config = GPT2Config(
             vocab_size=self.max_mel_tokens,
@@ -481,10 +494,31 @@ class GPT(nn.Module):
         self,
         cond_latents,
         text_inputs,
+        text_lengths=None,
     ):
+        """
+        Store the conditioning and text embeddings in `self.gpt_inference` and return the fake input IDs to generate
+        audio codes from.
+
+        For a batch of texts with different `text_lengths`, the padding of the shorter texts is moved between their
+        conditioning latents and their text, so that the audio codes of all rows start at the same position. The
+        padding is hidden by `compute_attention_mask()`. A single `cond_latents` is used for all texts.
+        """
+        if text_lengths is not None:
+            text_inputs = text_inputs[:, : text_lengths.max()]
         text_inputs = F.pad(text_inputs, (0, 1), value=self.stop_text_token)
+        if text_lengths is not None:
+            text_inputs[torch.arange(text_inputs.shape[0], device=text_inputs.device), text_lengths] = (
+                self.stop_text_token
+            )
         text_inputs = F.pad(text_inputs, (1, 0), value=self.start_text_token)
         emb = self.text_embedding(text_inputs) + self.text_pos_embedding(text_inputs)
+        if text_lengths is not None:
+            num_pad = text_inputs.shape[1] - 2 - text_lengths
+            index = (torch.arange(emb.shape[1], device=emb.device) - num_pad[:, None]) % emb.shape[1]
+            emb = emb.gather(1, index[..., None].expand(-1, -1, emb.shape[2]))
+        if cond_latents.shape[0] != emb.shape[0]:
+            cond_latents = cond_latents.expand(emb.shape[0], -1, -1)
         emb = torch.cat([cond_latents, emb], dim=1)
         self.gpt_inference.store_prefix_emb(emb)
         gpt_inputs = torch.full(
@@ -499,29 +533,112 @@ class GPT(nn.Module):
         gpt_inputs[:, -1] = self.start_audio_token
         return gpt_inputs
 
+    def compute_attention_mask(self, gpt_inputs, text_lengths=None):
+        """Return the attention mask of the `gpt_inputs` of `compute_embeddings()`, without the padding of the texts."""
+        attention_mask = torch.ones_like(gpt_inputs)
+        if text_lengths is not None:
+            max_text_len = text_lengths.max()
+            cond_len = gpt_inputs.shape[1] - max_text_len - 3  # start and stop text tokens, start audio token
+            positions = torch.arange(gpt_inputs.shape[1], device=gpt_inputs.device)
+            is_pad = (positions >= cond_len) & (positions < cond_len + (max_text_len - text_lengths)[:, None])
+            attention_mask[is_pad] = 0
+        return attention_mask
+
+    def get_prefix_cache(self, cond_latents, batch_size):
+        """
+        Return the transformer keys and values of the conditioning latents as a cache to generate from.
+
+        The conditioning latents of a voice are the start of the inputs of all its sentences, so they are only run
+        through the transformer once per voice and then taken from the LRU `self.prefix_cache`. Generation then only
+        prefills the text tokens. Each row of `cond_latents` is cached separately, so batches can mix voices.
+        """
+        rows = []
+        for latents in cond_latents.split(1):
+            key = (
+                hashlib.blake2b(latents.detach().float().cpu().numpy().tobytes(), digest_size=16).digest(),
+                tuple(latents.shape),
+                latents.dtype,
+                latents.device,
+            )
+            past_key_values = self.prefix_cache.get(key)
+            if past_key_values is None:
+                outputs = self.gpt_inference.transformer(
+                    inputs_embeds=latents.to(self.gpt_inference.embeddings.weight.dtype),
+                    past_key_values=DynamicCache(),
+                    use_cache=True,
+                    return_dict=True,
+                )
+                past_key_values = outputs.past_key_values.to_legacy_cache()
+                self.prefix_cache.put(key, past_key_values)
+            rows.append(past_key_values)
+        if len(rows) > 1:
+            # (layers, 2, rows) -> (layers, 2)
+            rows = [tuple(tuple(torch.cat(tensors) for tensors in zip(*layer)) for layer in zip(*rows))]
+        cache = DynamicCache.from_legacy_cache(rows[0])
+        if batch_size != cond_latents.shape[0]:
+            cache.batch_repeat_interleave(batch_size // cond_latents.shape[0])
+        return cache
+
     def generate(
         self,
         cond_latents,
         text_inputs,
+        text_lengths=None,
+        return_latents=False,
         **hf_generate_kwargs,
     ):
-        gpt_inputs = self.compute_embeddings(cond_latents, text_inputs)
-        stop_token_tensor = torch.tensor(self.stop_audio_token, device=gpt_inputs.device, dtype=torch.long)
-        attention_mask = _prepare_attention_mask_for_generation(gpt_inputs, stop_token_tensor, stop_token_tensor)
-        gen = self.gpt_inference.generate(
-            gpt_inputs,
-            bos_token_id=self.start_audio_token,
-            pad_token_id=self.stop_audio_token,
-            eos_token_id=self.stop_audio_token,
-            max_length=self.max_gen_mel_tokens + gpt_inputs.shape[-1],
-            attention_mask=attention_mask,
-            **hf_generate_kwargs,
-        )
+        """
+        Sample audio codes for the text tokens.
+
+        A batch of padded `text_inputs` with their `text_lengths` is decoded together, with one row of `cond_latents`
+        per text (different voices) or a single one for all texts. Rows that are finished earlier than others are
+        padded with the stop token.
+
+        If `return_latents` is specified, the codes are returned with their latents `(b, m, d)`, the same as
+        `forward(..., return_latent=True)` computes for them. They are taken from the output of the final norm at each
+        decoding step, so no second pass over the whole sequence is needed. Not supported with beam search. The
+        latents take precedence over the output object of `return_dict_in_generate`.
+        """
+        gpt_inputs = self.compute_embeddings(cond_latents, text_inputs, text_lengths)
+        attention_mask = self.compute_attention_mask(gpt_inputs, text_lengths)
+        if self.prefix_cache.max_entries > 0 and hf_generate_kwargs.get("num_beams", 1) == 1:
+            batch_size = gpt_inputs.shape[0] * hf_generate_kwargs.get("num_return_sequences", 1)
+            hf_generate_kwargs["past_key_values"] = self.get_prefix_cache(cond_latents, batch_size)
+        latents = []
+        hook = None
+        if return_latents:
+            assert hf_generate_kwargs.get("num_beams", 1) == 1, " ❗ return_latents is not supported with beam search."
+            # the LM head normalizes the hidden states of all positions, the last one predicts the next code
+            hook = self.final_norm.register_forward_hook(lambda _module, _input, output: latents.append(output[:, -1]))
+        try:
+            gen = self.gpt_inference.generate(
+                gpt_inputs,
+                bos_token_id=self.start_audio_token,
+                pad_token_id=self.stop_audio_token,
+                eos_token_id=self.stop_audio_token,
+                max_length=self.max_gen_mel_tokens + gpt_inputs.shape[-1],
+                attention_mask=attention_mask,
+                **hf_generate_kwargs,
+            )
+        finally:
+            if hook is not None:
+                hook.remove()
+        if return_latents:
+            # `return_dict_in_generate` may be set, but the latents are returned instead of the output object
+            sequences = gen if isinstance(gen, torch.Tensor) else gen.sequences
+            return sequences[:, gpt_inputs.shape[1] :], torch.stack(latents, dim=1)
         if "return_dict_in_generate" in hf_generate_kwargs:
             return gen.sequences[:, gpt_inputs.shape[1] :], gen
         return gen[:, gpt_inputs.shape[1] :]
 
-    def get_generator(self, fake_inputs, **hf_generate_kwargs):
+    def get_generator(self, fake_inputs, cond_latents=None, **hf_generate_kwargs):
+        if (
+            cond_latents is not None
+            and self.prefix_cache.max_entries > 0
+            and hf_generate_kwargs.get("num_beams", 1) == 1
+        ):
+            batch_size = fake_inputs.shape[0] * hf_generate_kwargs.get("num_return_sequences", 1)
+            hf_generate_kwargs["past_key_values"] = self.get_prefix_cache(cond_latents, batch_size)
         stop_token_tensor = torch.tensor(self.stop_audio_token, device=fake_inputs.device, dtype=torch.long)
         attention_mask = _prepare_attention_mask_for_generation(fake_inputs, stop_token_tensor, stop_token_tensor)
         return self.gpt_inference.generate_stream(
@@ -50,7 +50,9 @@ class GPT2InferenceModel(GPT2PreTrainedModel, GenerationMixin):
         # Create embedding
         prefix_len = self.cached_prefix_emb.shape[1]
         if input_ids.shape[1] != 1:
-            gen_inputs = input_ids[:, prefix_len:]
+            # the start of the prefix may already be in `past_key_values`, see `GPT.get_prefix_cache()`
+            past_len = attention_mask.shape[1] - input_ids.shape[1]
+            gen_inputs = input_ids[:, prefix_len - past_len :]
             gen_emb = self.embeddings(gen_inputs)
             gen_emb = gen_emb + self.pos_embedding(gen_emb)
             if self.cached_prefix_emb.shape[0] != gen_emb.shape[0]:
@@ -59,7 +61,7 @@ class GPT2InferenceModel(GPT2PreTrainedModel, GenerationMixin):
                 )
             else:
                 prefix_emb = self.cached_prefix_emb.to(gen_emb.dtype)
-            emb = torch.cat([prefix_emb, gen_emb], dim=1)
+            emb = torch.cat([prefix_emb[:, past_len:], gen_emb], dim=1)
         else:
             emb = self.embeddings(input_ids)
             emb = emb + self.pos_embedding.get_fixed_embedding(
@@ -1,4 +1,5 @@
 import logging
+import math
 
 import torch
 from trainer.io import load_fsspec
@@ -40,6 +41,7 @@ class HifiDecoder(torch.nn.Module):
         self.output_hop_length = output_hop_length
         self.ar_mel_length_compression = ar_mel_length_compression
         self.speaker_encoder_audio_config = speaker_encoder_audio_config
+        self.upsample_factor = math.prod(upsample_rates_decoder)
         self.waveform_decoder = HifiganGenerator(
             decoder_input_dim,
             1,
@@ -97,6 +99,17 @@ class HifiDecoder(torch.nn.Module):
         o = self.waveform_decoder(z, g=g)
         return o
 
+    def get_output_length(self, num_latents: int) -> int:
+        """Return the number of samples that :meth:`forward` produces for ``num_latents`` GPT latent frames.
+
+        Mirrors the two linear interpolations in :meth:`forward` (``F.interpolate`` floors the scaled length) and
+        the upsampling of the waveform decoder, whose transposed convolutions keep ``length * stride``.
+        """
+        num_frames = math.floor(num_latents * (self.ar_mel_length_compression / self.output_hop_length))
+        if self.output_sample_rate != self.input_sample_rate:
+            num_frames = math.floor(num_frames * (self.output_sample_rate / self.input_sample_rate))
+        return num_frames * self.upsample_factor
+
     @torch.inference_mode()
     def inference(self, c, g):
         """
@@ -2,7 +2,8 @@ import logging
 import os
 import re
 import textwrap
-from functools import cached_property
+import threading
+from functools import cache, cached_property, lru_cache
 
 import torch
 from num2words import num2words
@@ -40,42 +41,92 @@ def get_spacy_lang(lang):
         return English()
 
 
-def split_sentence(text, lang, text_split_length=250):
-    """Preprocess the input text"""
-    text_splits = []
-    if text_split_length is not None and len(text) >= text_split_length:
-        text_splits.append("")
-        nlp = get_spacy_lang(lang)
-        nlp.add_pipe("sentencizer")
-        doc = nlp(text)
-        for sentence in doc.sents:
-            if len(text_splits[-1]) + len(str(sentence)) <= text_split_length:
-                # if the last sentence + the current sentence is less than the text_split_length
-                # then add the current sentence to the last sentence
-                text_splits[-1] += " " + str(sentence)
-                text_splits[-1] = text_splits[-1].lstrip()
-            elif len(str(sentence)) > text_split_length:
-                # if the current sentence is greater than the text_split_length
-                for line in textwrap.wrap(
-                    str(sentence),
-                    width=text_split_length,
-                    drop_whitespace=True,
-                    break_on_hyphens=False,
-                    tabsize=1,
-                ):
-                    text_splits.append(str(line))
-            else:
-                text_splits.append(str(sentence))
-
-        if len(text_splits) > 1:
-            if text_splits[0] == "":
-                del text_splits[0]
-    else:
-        text_splits = [text.lstrip()]
+# languages with their own spaCy tokenizer, English does the job for the others
+_SPACY_LANGS = ("zh", "ja", "ar", "es", "hi")
+_sentencizers = {}
+_sentencizers_lock = threading.Lock()
+
+# end of sentence punctuation followed by whitespace, Chinese and Japanese full stops need no whitespace
+_sentence_end_re = re.compile(r"(?<=[.!?…؟।])\s+|(?<=[。！？])\s*")
+
+
+def get_sentencizer(lang):
+    """Return the spaCy pipeline that splits `lang` texts into sentences.
+
+    The pipeline is built on first use and shared by all threads and later calls.
+    """
+    key = lang if lang in _SPACY_LANGS else "en"
+    nlp = _sentencizers.get(key)
+    if nlp is None:
+        with _sentencizers_lock:
+            nlp = _sentencizers.get(key)
+            if nlp is None:
+                nlp = get_spacy_lang(key)
+                nlp.add_pipe("sentencizer")
+                _sentencizers[key] = nlp
+    return nlp
+
+
+@cache
+def _warn_no_spacy(error):
+    logger.warning("Splitting sentences by punctuation, Spacy could not be loaded: %s", error)
+
+
+def _merge_sentences(sentences, text_split_length):
+    """Join consecutive sentences up to `text_split_length` characters and wrap longer ones."""
+    text_splits = [""]
+    for sentence in sentences:
+        if len(text_splits[-1]) + len(sentence) <= text_split_length:
+            # if the last sentence + the current sentence is less than the text_split_length
+            # then add the current sentence to the last sentence
+            text_splits[-1] += " " + sentence
+            text_splits[-1] = text_splits[-1].lstrip()
+        elif len(sentence) > text_split_length:
+            # if the current sentence is greater than the text_split_length
+            for line in textwrap.wrap(
+                sentence,
+                width=text_split_length,
+                drop_whitespace=True,
+                break_on_hyphens=False,
+                tabsize=1,
+            ):
+                text_splits.append(str(line))
+        else:
+            text_splits.append(sentence)
 
+    if len(text_splits) > 1:
+        if text_splits[0] == "":
+            del text_splits[0]
     return text_splits
 
 
+def split_sentences(texts, lang, text_split_length=250):
+    """Split several texts into chunks of sentences of at most `text_split_length` characters each.
+
+    Texts shorter than `text_split_length` are kept as they are. The others are split by a shared spaCy sentencizer
+    in one `nlp.pipe()` pass, or by punctuation if spaCy is not installed.
+    """
+    text_splits = [[text.lstrip()] for text in texts]
+    long_texts = [i for i, text in enumerate(texts) if text_split_length is not None and len(text) >= text_split_length]
+    if not long_texts:
+        return text_splits
+    try:
+        nlp = get_sentencizer(lang)
+    except ImportError as e:
+        _warn_no_spacy(f"{e} ({e.__cause__})" if e.__cause__ else str(e))
+        docs = [[s for s in _sentence_end_re.split(texts[i].strip()) if s] for i in long_texts]
+    else:
+        docs = [[str(s) for s in doc.sents] for doc in nlp.pipe(texts[i] for i in long_texts)]
+    for i, sentences in zip(long_texts, docs):
+        text_splits[i] = _merge_sentences(sentences, text_split_length)
+    return text_splits
+
+
+def split_sentence(text, lang, text_split_length=250):
+    """Preprocess the input text"""
+    return split_sentences([text], lang, text_split_length)[0]
+
+
 # List of (regular expression, replacement) pairs for abbreviations:
 _abbreviations = {
     "en": [
@@ -537,12 +588,18 @@ def _expand_currency(m, lang="en", currency="USD"):
     return full_amount
 
 
+@lru_cache(maxsize=8192)
+def _num2words(number, lang, ordinal=False):
+    # most numbers in a text are small integers (counts, dates, years), which repeat a lot
+    return num2words(number, ordinal=ordinal, lang=lang)
+
+
 def _expand_ordinal(m, lang="en"):
-    return num2words(int(m.group(1)), ordinal=True, lang=lang)
+    return _num2words(int(m.group(1)), lang, ordinal=True)
 
 
 def _expand_number(m, lang="en"):
-    return num2words(int(m.group(0)), lang=lang)
+    return _num2words(int(m.group(0)), lang)
 
 
 def expand_numbers_multilingual(text, lang="en"):
@@ -557,7 +614,8 @@ def expand_numbers_multilingual(text, lang="en"):
             text = re.sub(_currency_re["GBP"], lambda m: _expand_currency(m, lang, "GBP"), text)
             text = re.sub(_currency_re["USD"], lambda m: _expand_currency(m, lang, "USD"), text)
             text = re.sub(_currency_re["EUR"], lambda m: _expand_currency(m, lang, "EUR"), text)
-        except:
+        except (NotImplementedError, TypeError, ValueError, OverflowError):
+            # unsupported by num2words, e.g. Turkish to_currency() has no `currency` argument
             pass
         if lang != "tr":
             text = re.sub(_decimal_number_re, lambda m: _expand_decimal_point(m, lang), text)
@@ -566,18 +624,117 @@ def expand_numbers_multilingual(text, lang="en"):
     return text
 
 
+def _compile_alternation(pairs):
+    """Combine the patterns of the ``(regex, replacement)`` pairs into one regex.
+
+    There are no capturing groups, so the regex engine can look for all the patterns at once, e.g. with a single
+    character set for the symbols. The replacement of a match is given by :func:`_dispatch`.
+    """
+    if not pairs:
+        return None
+    return re.compile("|".join(regex.pattern for regex, _ in pairs), re.IGNORECASE)
+
+
+def _dispatch(pairs, m):
+    """Return the replacement of the first pattern of `pairs` matching at the position of `m`."""
+    return next(replacement for regex, replacement in pairs if regex.match(m.string, m.start()))
+
+
+_digit_re = re.compile(r"\d")
+_currency_symbols = {"GBP": "£", "USD": "$", "EUR": "€"}  # in the order of `expand_numbers_multilingual()`
+
+
+class MultilingualNormalizer:
+    """Text normalizer of :func:`multilingual_cleaners` for one language.
+
+    It gives the same output as applying :func:`expand_numbers_multilingual`,
+    :func:`expand_abbreviations_multilingual` and :func:`expand_symbols_multilingual` in turn, but the patterns of
+    each step are combined into one regex, whose matches are dispatched to their replacement, so the text is scanned
+    once per step instead of once per pattern. Steps that can't match, e.g. the numbers of a text without digits,
+    are skipped.
+
+    Args:
+        lang (str): Language code.
+    """
+
+    def __init__(self, lang):
+        self.lang = lang
+        self._zh_num2words = zh_num2words() if lang == "zh" else None
+        if lang != "zh":
+            numbers = [f"(?P<ordinal>{_ordinal_re[lang].pattern})", f"(?P<number>{_number_re.pattern})"]
+            if lang != "tr":
+                numbers.insert(0, f"(?P<decimal>{_decimal_number_re.pattern})")
+            self._numbers = re.compile("|".join(numbers))
+            self._ordinal_digits = self._numbers.groupindex["ordinal"] + 1
+            self._number_handlers = {
+                "decimal": lambda m: _expand_decimal_point(m, lang),
+                "ordinal": lambda m: _num2words(int(m.group(self._ordinal_digits)), lang, ordinal=True),
+                "number": lambda m: _num2words(int(m.group()), lang),
+            }
+        self._abbreviations = _compile_alternation(_abbreviations[lang])
+        self._symbols = _compile_alternation(_symbols_multilingual[lang])
+
+    def expand_numbers(self, text):
+        if self._zh_num2words is not None:
+            return self._zh_num2words(text)
+        if _digit_re.search(text) is None:
+            return text
+        if self.lang in ["en", "ru"]:
+            text = re.sub(_comma_number_re, _remove_commas, text)
+        else:
+            text = re.sub(_dot_number_re, _remove_dots, text)
+        try:
+            # the currencies are expanded one after the other as the matches of different currencies can overlap
+            for currency, symbol in _currency_symbols.items():
+                if symbol in text:
+                    text = _currency_re[currency].sub(lambda m, c=currency: _expand_currency(m, self.lang, c), text)
+        except (NotImplementedError, TypeError, ValueError, OverflowError):
+            # unsupported by num2words, e.g. Turkish to_currency() has no `currency` argument
+            pass
+        return self._numbers.sub(lambda m: self._number_handlers[m.lastgroup](m), text)
+
+    def expand_abbreviations(self, text):
+        if self._abbreviations is None:
+            return text
+        matches = list(self._abbreviations.finditer(text))
+        if not matches:
+            return text
+        if any(prev.end() == m.start() for prev, m in zip(matches, matches[1:])):
+            # a replacement changes the word boundary at the start of the next match, keep the order of the patterns
+            return expand_abbreviations_multilingual(text, self.lang)
+        parts = []
+        end = 0
+        for m in matches:
+            parts += [text[end : m.start()], _dispatch(_abbreviations[self.lang], m)]
+            end = m.end()
+        parts.append(text[end:])
+        return "".join(parts)
+
+    def expand_symbols(self, text):
+        # unlike `expand_symbols_multilingual()`, double spaces are left to `collapse_whitespace()`
+        return self._symbols.sub(lambda m: _dispatch(_symbols_multilingual[self.lang], m), text)
+
+    def __call__(self, text):
+        text = text.replace('"', "")
+        if self.lang == "tr":
+            text = text.replace("İ", "i")
+            text = text.replace("Ö", "ö")
+            text = text.replace("Ü", "ü")
+        text = lowercase(text)
+        text = self.expand_numbers(text)
+        text = self.expand_abbreviations(text)
+        text = self.expand_symbols(text)
+        return collapse_whitespace(text)
+
+
+@cache
+def get_normalizer(lang):
+    """Return the cached :class:`MultilingualNormalizer` of `lang`."""
+    return MultilingualNormalizer(lang)
+
+
 def multilingual_cleaners(text, lang):
-    text = text.replace('"', "")
-    if lang == "tr":
-        text = text.replace("İ", "i")
-        text = text.replace("Ö", "ö")
-        text = text.replace("Ü", "ü")
-    text = lowercase(text)
-    text = expand_numbers_multilingual(text, lang)
-    text = expand_abbreviations_multilingual(text, lang)
-    text = expand_symbols_multilingual(text, lang=lang)
-    text = collapse_whitespace(text)
-    return text
+    return get_normalizer(lang)(text)
 
 
 def chinese_transliterate(text):
@@ -1,6 +1,7 @@
 import logging
 import os
 import warnings
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -20,13 +21,17 @@ from TTS.tts.layers.bark.hubert.tokenizer import HubertTokenizer
 from TTS.tts.layers.bark.inference_funcs import (
     codec_decode,
     generate_coarse,
+    generate_coarse_batch,
+    generate_coarse_stream,
     generate_fine,
     generate_text_semantic,
+    generate_text_semantic_batch,
 )
 from TTS.tts.layers.bark.load_model import load_model
 from TTS.tts.layers.bark.model import GPT
 from TTS.tts.layers.bark.model_fine import FineGPT
 from TTS.tts.models.base_tts import BaseTTS
+from TTS.utils.audio.torch_transforms import crossfade_chunk
 from TTS.utils.generic_utils import (
     is_pytorch_at_least_2_4,
     slugify,
@@ -173,6 +178,129 @@ class Bark(BaseTTS):
         )
         return audio_arr, x_semantic, coarse, fine
 
+    def generate_audio_batch(
+        self,
+        texts: list[str],
+        history_prompt: tuple[torch.Tensor | None, torch.Tensor | None, torch.Tensor | None],
+        text_temp: float = 0.7,
+        waveform_temp: float = 0.7,
+        base: tuple[torch.Tensor, torch.Tensor, torch.Tensor] | None = None,
+        allow_early_stop: bool = True,
+        **kwargs,
+    ) -> list[tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]]:
+        """Generate audio for several texts with the same voice.
+
+        The semantic and coarse stages run as one batch. Pass the same text several times to generate several
+        candidates. Arguments are the same as for `generate_audio()`.
+
+        Returns:
+            The outputs of `generate_audio()` for each text.
+        """
+        x_semantics = generate_text_semantic_batch(
+            texts,
+            self,
+            history_prompt=history_prompt,
+            temp=text_temp,
+            base=base,
+            allow_early_stop=allow_early_stop,
+            **kwargs,
+        )
+        x_coarse_gens = generate_coarse_batch(
+            x_semantics, self, history_prompt=history_prompt, temp=waveform_temp, base=base
+        )
+        outputs = []
+        for x_semantic, x_coarse_gen in zip(x_semantics, x_coarse_gens):
+            x_fine_gen = generate_fine(x_coarse_gen, self, history_prompt=history_prompt, temp=0.5, base=base)
+            outputs.append((codec_decode(x_fine_gen, self), x_semantic, x_coarse_gen, x_fine_gen))
+        return outputs
+
+    @torch.inference_mode()
+    def generate_audio_stream(
+        self,
+        text: str,
+        history_prompt: tuple[torch.Tensor | None, torch.Tensor | None, torch.Tensor | None],
+        text_temp: float = 0.7,
+        waveform_temp: float = 0.7,
+        base: tuple[torch.Tensor, torch.Tensor, torch.Tensor] | None = None,
+        allow_early_stop: bool = True,
+        *,
+        stream_chunk_size: int = 75,
+        overlap_wav_len: int = 1024,
+        decode_context_len: int = 75,
+        **kwargs,
+    ) -> Iterator[torch.Tensor]:
+        """Generate audio for the given text chunk by chunk.
+
+        The semantic tokens are generated first. The coarse model then runs one sliding window at a time and, as
+        soon as ``stream_chunk_size`` coarse frames are ready, they go through the fine model and the codec. Each
+        chunk is decoded with a few preceding frames as context and cross-faded with the previous one. Takes the
+        same arguments as `generate_audio()`, plus:
+
+        Args:
+            stream_chunk_size: Number of codec frames (75 per second) in each chunk. Defaults to 75.
+            overlap_wav_len: Number of samples cross-faded between consecutive chunks. Defaults to 1024.
+            decode_context_len: Number of preceding codec frames decoded again as context for each chunk. Defaults
+                to 75.
+
+        Yields:
+            Next audio chunk at 24kHz.
+        """
+        hop_length = self.encodec.sample_rate // self.encodec.frame_rate
+        if min(stream_chunk_size, decode_context_len) * hop_length < overlap_wav_len:
+            msg = (
+                f"`stream_chunk_size={stream_chunk_size}` and `decode_context_len={decode_context_len}` frames "
+                f"must cover `overlap_wav_len={overlap_wav_len}` samples."
+            )
+            raise ValueError(msg)
+        x_semantic = self.text_to_semantic(
+            text,
+            history_prompt=history_prompt,
+            temp=text_temp,
+            base=base,
+            allow_early_stop=allow_early_stop,
+            **kwargs,
+        )
+        coarse_windows = generate_coarse_stream(
+            x_semantic, self, history_prompt=history_prompt, temp=waveform_temp, base=base, silent=True
+        )
+        fine_history = base[2] if base is not None else history_prompt[2]
+        x_fine = None  # fine codes of the current chunk and its decoding context
+        n_frames = 0
+        wav_len = None
+        wav_overlap = None
+        pending = []
+        is_end = False
+        while not is_end:
+            try:
+                pending.append(next(coarse_windows))
+            except StopIteration:
+                is_end = True
+            if not pending or (not is_end and sum(x.shape[1] for x in pending) < stream_chunk_size):
+                continue
+            x_coarse = torch.cat(pending, dim=1)
+            pending = []
+            # the fine model sees the previous fine codes as history, like the voice prompt for the first chunk
+            fine = generate_fine(
+                x_coarse,
+                self,
+                history_prompt=(None, None, None),
+                temp=0.5,
+                base=None if fine_history is None else (None, None, fine_history),
+            )
+            fine_history = fine if fine_history is None else torch.cat([fine_history.to(fine.device), fine], dim=1)
+            fine_history = fine_history[:, -512:]
+            x_fine = fine if x_fine is None else torch.cat([x_fine[:, -decode_context_len:], fine], dim=1)
+            n_frames += fine.shape[1]
+            wav_gen = codec_decode(x_fine, self)
+            wav_gen_offset = (n_frames - x_fine.shape[1]) * hop_length
+            wav_chunk, wav_len, wav_overlap = crossfade_chunk(
+                wav_gen, wav_gen_offset, wav_len, wav_overlap, overlap_wav_len
+            )
+            if len(wav_chunk) > 0:
+                yield wav_chunk
+        if wav_overlap is not None:
+            yield wav_overlap
+
     def _generate_voice(self, speaker_wav: str | os.PathLike[Any]) -> dict[str, torch.Tensor]:
         """Generate a new voice from the given audio."""
         audio, sr = torchaudio.load(speaker_wav)
@@ -288,19 +416,49 @@ class Bark(BaseTTS):
         """
         if config is not None:
             warn_synthesize_config_deprecated()
-        if (speaker_id := kwargs.pop("speaker_id", None)) is not None:
-            speaker = speaker_id
-            warn_synthesize_speaker_id_deprecated()
-        history_prompt = None, None, None
-        if speaker_wav is not None or speaker is not None:
-            voice = self.clone_voice(speaker_wav, speaker, voice_dir)
-            history_prompt = (voice["semantic_prompt"], voice["coarse_prompt"], voice["fine_prompt"])
+        history_prompt = self._get_history_prompt(speaker, speaker_wav, voice_dir, kwargs)
         outputs = self.generate_audio(text, history_prompt=history_prompt, **kwargs)
         return {
             "wav": outputs[0],
             "text_inputs": text,
         }
 
+    def synthesize_stream(
+        self,
+        text: str,
+        *,
+        speaker: str | None = None,
+        speaker_wav: str | os.PathLike[Any] | list[str | os.PathLike[Any]] | None = None,
+        voice_dir: str | os.PathLike[Any] | None = None,
+        **kwargs,
+    ) -> Iterator[torch.Tensor]:
+        """Synthesize speech like `synthesize()`, but yield audio chunks as soon as they are generated.
+
+        Args:
+            **kwargs: Inference and streaming settings. See `generate_audio_stream()`.
+
+        Yields:
+            Next audio chunk at 24kHz.
+        """
+        history_prompt = self._get_history_prompt(speaker, speaker_wav, voice_dir, kwargs)
+        yield from self.generate_audio_stream(text, history_prompt=history_prompt, **kwargs)
+
+    def _get_history_prompt(
+        self,
+        speaker: str | None,
+        speaker_wav: str | os.PathLike[Any] | list[str | os.PathLike[Any]] | None,
+        voice_dir: str | os.PathLike[Any] | None,
+        kwargs: dict[str, Any],
+    ) -> tuple[torch.Tensor | None, torch.Tensor | None, torch.Tensor | None]:
+        """Return the history prompt of the requested voice, or no history for a random voice."""
+        if (speaker_id := kwargs.pop("speaker_id", None)) is not None:
+            speaker = speaker_id
+            warn_synthesize_speaker_id_deprecated()
+        if speaker_wav is None and speaker is None:
+            return None, None, None
+        voice = self.clone_voice(speaker_wav, speaker, voice_dir)
+        return voice["semantic_prompt"], voice["coarse_prompt"], voice["fine_prompt"]
+
     def forward(self): ...
 
     def inference(self): ...
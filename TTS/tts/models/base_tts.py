@@ -3,6 +3,7 @@ import os
 import random
 from typing import Any
 
+import numpy as np
 import torch
 import torch.distributed as dist
 from coqpit import Coqpit
@@ -19,7 +20,7 @@ from TTS.tts.datasets.dataset import TTSDataset
 from TTS.tts.utils.data import get_length_balancer_weights
 from TTS.tts.utils.languages import LanguageManager, get_language_balancer_weights
 from TTS.tts.utils.speakers import SpeakerManager, get_speaker_balancer_weights
-from TTS.tts.utils.synthesis import inv_spectrogram
+from TTS.tts.utils.synthesis import apply_griffin_lim, inv_spectrogram
 from TTS.tts.utils.visual import plot_alignment, plot_spectrogram
 from TTS.utils.generic_utils import warn_synthesize_config_deprecated, warn_synthesize_speaker_id_deprecated
 from TTS.utils.voices import CloningMixin
@@ -36,6 +37,9 @@ class BaseTTS(CloningMixin, BaseTrainerModel):
     """
 
     MODEL_TYPE = "tts"
+    # Whether `synthesize_batch()` decodes the texts in one batch. Unless the model overrides it, this requires that
+    # `inference()` accepts padded batches with `x_lengths`.
+    supports_batched_inference = False
 
     def __init__(
         self,
@@ -610,14 +614,25 @@ class BaseTTS(CloningMixin, BaseTrainerModel):
                 **extra_aux_input,
             },
         )
+        return self._format_synthesis_outputs(outputs, text_inputs, use_griffin_lim, do_trim_silence)
+
+    def _format_synthesis_outputs(
+        self,
+        outputs: dict[str, Any],
+        text_inputs: torch.Tensor,
+        use_griffin_lim: bool,
+        do_trim_silence: bool,
+        wav: np.ndarray | None = None,
+    ) -> dict[str, Any]:
+        """`wav` is the Griffin-Lim output if it was already computed for the whole batch."""
         model_outputs = outputs["model_outputs"]
         model_outputs = model_outputs[0].detach().cpu().numpy().squeeze()
         alignments = outputs["alignments"]
 
-        wav = None
         if model_outputs.ndim == 2:  # [T, C_spec]
             if use_griffin_lim:
-                wav = inv_spectrogram(model_outputs, self.ap, self.config)
+                if wav is None:
+                    wav = inv_spectrogram(model_outputs, self.ap, self.config)
                 if do_trim_silence:
                     wav = wav[: self.ap.find_endpoint(wav)]
         else:  # [T,]
@@ -629,6 +644,119 @@ class BaseTTS(CloningMixin, BaseTrainerModel):
             "outputs": outputs,
         }
 
+    def get_output_lengths(self, outputs: dict[str, Any]) -> torch.Tensor:
+        """Return the unpadded length of each item in `outputs["model_outputs"]` of a batched `inference()` call.
+
+        Must be implemented by models that set `supports_batched_inference`.
+        """
+        raise NotImplementedError
+
+    def synthesize_batch(
+        self,
+        texts: list[str],
+        *,
+        speakers: list[str | None] | None = None,
+        speaker_wavs: list[str | os.PathLike[Any] | list[str | os.PathLike[Any]] | None] | None = None,
+        voice_dir: str | os.PathLike[Any] | None = None,
+        languages: list[str | None] | None = None,
+        use_griffin_lim: bool = False,
+        do_trim_silence: bool = False,
+        extra_aux_input: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> list[dict[str, Any]]:
+        """Synthesize speech for several texts at once.
+
+        Models with `supports_batched_inference` run all texts through a single padded `inference()` call and split
+        the outputs again with `get_output_lengths()`. Other models, or inputs that cannot share a batch (e.g. speaker
+        IDs mixed with d-vectors), are synthesized one by one.
+
+        Args:
+            texts: Input texts.
+            speakers: Speaker name for each text (for multi-speaker models).
+            speaker_wavs: Reference audio for each text (for models with voice cloning).
+            languages: Language name for each text (for multilingual models).
+            **kwargs: Remaining arguments, same as for `synthesize()`.
+
+        Returns:
+            One output dictionary per text, in the same format as returned by `synthesize()`.
+        """
+        speakers = speakers or [None] * len(texts)
+        speaker_wavs = speaker_wavs or [None] * len(texts)
+        languages = languages or [None] * len(texts)
+
+        def _synthesize_sequentially():
+            return [
+                self.synthesize(
+                    text,
+                    speaker=speaker,
+                    speaker_wav=speaker_wav,
+                    voice_dir=voice_dir,
+                    language=language,
+                    use_griffin_lim=use_griffin_lim,
+                    do_trim_silence=do_trim_silence,
+                    **({} if extra_aux_input is None else {"extra_aux_input": extra_aux_input}),
+                    **kwargs,
+                )
+                for text, speaker, speaker_wav, language in zip(texts, speakers, speaker_wavs, languages)
+            ]
+
+        if not self.supports_batched_inference or len(texts) == 1:
+            return _synthesize_sequentially()
+
+        if (speaker_id := kwargs.pop("speaker_id", None)) is not None:
+            speakers = [speaker_id] * len(texts)
+            warn_synthesize_speaker_id_deprecated()
+        language_ids = [self._get_language_id(language) for language in languages]
+        speaker_ids, d_vectors = zip(
+            *(
+                self._get_speaker_id_or_dvector(speaker, speaker_wav, voice_dir)
+                for speaker, speaker_wav in zip(speakers, speaker_wavs)
+            )
+        )
+        for values in (language_ids, speaker_ids, d_vectors):
+            if any(value is None for value in values) and any(value is not None for value in values):
+                return _synthesize_sequentially()
+
+        token_ids = [self.tokenizer.text_to_ids(text, language=language) for text, language in zip(texts, languages)]
+        x_lengths = torch.tensor([len(ids) for ids in token_ids], device=self.device)
+        pad_id = self.tokenizer.pad_id if self.tokenizer.pad_id is not None else 0
+        text_inputs = torch.full((len(texts), int(x_lengths.max())), pad_id, dtype=torch.long, device=self.device)
+        for i, ids in enumerate(token_ids):
+            text_inputs[i, : len(ids)] = torch.as_tensor(ids, dtype=torch.long)
+
+        if extra_aux_input is None:
+            extra_aux_input = {}
+        outputs = self.inference(
+            text_inputs,
+            aux_input={
+                "x_lengths": x_lengths,
+                "speaker_ids": None if speaker_ids[0] is None else torch.stack(speaker_ids),
+                "d_vectors": None if d_vectors[0] is None else torch.cat(d_vectors),
+                "language_ids": None if language_ids[0] is None else torch.tensor(language_ids, device=self.device),
+                **extra_aux_input,
+            },
+        )
+        output_lengths = self.get_output_lengths(outputs)
+        model_outputs = outputs["model_outputs"]
+        # waveforms are [B, 1, T], spectrograms [B, T, C]
+        time_dim = 2 if model_outputs.shape[1] == 1 else 1
+        wavs = [None] * len(texts)
+        if use_griffin_lim and time_dim == 1:
+            wavs = apply_griffin_lim(model_outputs, output_lengths, self.config, self.ap)
+        results = []
+        for i, (ids, length) in enumerate(zip(token_ids, output_lengths.tolist())):
+            item_outputs = {
+                "model_outputs": model_outputs[i : i + 1].narrow(time_dim, 0, length),
+                "alignments": outputs["alignments"][i : i + 1],
+            }
+            item_text_inputs = torch.as_tensor(ids, dtype=torch.long, device=self.device).unsqueeze(0)
+            results.append(
+                self._format_synthesis_outputs(
+                    item_outputs, item_text_inputs, use_griffin_lim, do_trim_silence, wav=wavs[i]
+                )
+            )
+        return results
+
 
 class BaseTTSE2E(BaseTTS):
     def _set_model_args(self, config: Coqpit):
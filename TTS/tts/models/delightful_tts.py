@@ -100,12 +100,13 @@ class ForwardTTSE2eF0Dataset(F0Dataset):
         """
         compute pitch and return a numpy array of pitch values
         """
-        pitch_file = self.create_pitch_file_path(audio_name, self.cache_path)
-        if not os.path.exists(pitch_file):
-            pitch = self._compute_and_save_pitch(wav_file=wav_file, pitch_file=pitch_file)
-        else:
-            pitch = np.load(pitch_file)
-        return pitch.astype(np.float32)
+
+        def compute():
+            return self._compute_and_save_pitch(wav_file=wav_file).astype(np.float32)
+
+        if self.cache is None:
+            return compute()
+        return self.cache.get_or_compute(audio_name, compute).astype(np.float32, copy=False)
 
 
 class ForwardTTSE2eDataset(TTSDataset):
@@ -1,5 +1,6 @@
 import logging
 from dataclasses import dataclass, field
+from typing import Any
 
 import torch
 from coqpit import Coqpit
@@ -198,6 +199,11 @@ class ForwardTTS(BaseTTS):
         >>> model = ForwardTTS(config)
     """
 
+    @property
+    def supports_batched_inference(self) -> bool:
+        # only the transformer layers keep padded frames out of the outputs of shorter inputs
+        return self.args.encoder_type.lower() == "fftransformer" and self.args.decoder_type.lower() == "fftransformer"
+
     # pylint: disable=dangerous-default-value
     def __init__(
         self,
@@ -311,9 +317,9 @@ class ForwardTTS(BaseTTS):
         """Format predicted durations.
         1. Convert to linear scale from log scale
         2. Apply the length scale for speed adjustment
-        3. Apply masking.
-        4. Cast 0 durations to 1.
-        5. Round the duration values.
+        3. Cast 0 durations to 1.
+        4. Round the duration values.
+        5. Apply masking, so padded inputs get 0 durations.
 
         Args:
             o_dr_log: Log scale durations.
@@ -325,11 +331,15 @@ class ForwardTTS(BaseTTS):
         """
         o_dr = (torch.exp(o_dr_log) - 1) * x_mask * self.length_scale
         o_dr[o_dr < 1] = 1.0
-        o_dr = torch.round(o_dr)
+        o_dr = torch.round(o_dr) * x_mask
         return o_dr
 
     def _forward_encoder(
-        self, x: torch.LongTensor, x_mask: torch.FloatTensor, g: torch.FloatTensor | None = None
+        self,
+        x: torch.LongTensor,
+        x_mask: torch.FloatTensor,
+        g: torch.FloatTensor | None = None,
+        mask_padding: bool = False,
     ) -> tuple[torch.FloatTensor, torch.FloatTensor, torch.FloatTensor, torch.FloatTensor, torch.FloatTensor]:
         """Encoding forward pass.
 
@@ -342,6 +352,8 @@ class ForwardTTS(BaseTTS):
             x (torch.LongTensor): Input sequence IDs.
             x_mask (torch.FloatTensor): Input squence mask.
             g (torch.FloatTensor, optional): Conditioning vectors. In general speaker embeddings. Defaults to None.
+            mask_padding (bool, optional): Keep padded inputs out of the encoder outputs of shorter inputs. Only used
+                by the `fftransformer` encoder. Defaults to False.
 
         Returns:
             Tuple[torch.tensor, torch.tensor, torch.tensor, torch.tensor, torch.tensor]:
@@ -362,7 +374,7 @@ class ForwardTTS(BaseTTS):
         x_emb = self.emb(x)
         # encoder pass
         # o_en = self.encoder(torch.transpose(x_emb, 1, -1), x_mask)
-        o_en = self.encoder(torch.transpose(x_emb, 1, -1), x_mask, g)
+        o_en = self.encoder(torch.transpose(x_emb, 1, -1), x_mask, g, mask_padding=mask_padding)
         # speaker conditioning
         # TODO: try different ways of conditioning
         if g is not None:
@@ -378,6 +390,7 @@ class ForwardTTS(BaseTTS):
         x_mask: torch.FloatTensor,
         y_lengths: torch.IntTensor,
         g: torch.FloatTensor,
+        mask_padding: bool = False,
     ) -> tuple[torch.FloatTensor, torch.FloatTensor]:
         """Decoding forward pass.
 
@@ -393,6 +406,8 @@ class ForwardTTS(BaseTTS):
             x_mask (torch.IntTensor): Input sequence mask.
             y_lengths (torch.IntTensor): Output sequence lengths.
             g (torch.FloatTensor): Conditioning vectors. In general speaker embeddings.
+            mask_padding (bool, optional): Keep padded frames out of the decoder outputs of shorter inputs. Only used
+                by the `fftransformer` decoder. Defaults to False.
 
         Returns:
             Tuple[torch.FloatTensor, torch.FloatTensor]: Decoder output, attention map from durations.
@@ -403,7 +418,7 @@ class ForwardTTS(BaseTTS):
         if hasattr(self, "pos_encoder"):
             o_en_ex = self.pos_encoder(o_en_ex, y_mask)
         # decoder pass
-        o_de = self.decoder(o_en_ex, y_mask, g=g)
+        o_de = self.decoder(o_en_ex, y_mask, g=g, mask_padding=mask_padding)
         return o_de.transpose(1, 2), attn.transpose(1, 2)
 
     def _forward_pitch_predictor(
@@ -639,10 +654,12 @@ class ForwardTTS(BaseTTS):
             - g: [B, C]
         """
         g = self._set_speaker_input(aux_input)
-        x_lengths = torch.tensor(x.shape[1:2]).to(x.device)
+        x_lengths = aux_input.get("x_lengths")
+        if x_lengths is None:
+            x_lengths = torch.tensor(x.shape[1:2]).to(x.device)
         x_mask = torch.unsqueeze(sequence_mask(x_lengths, x.shape[1]), 1).to(x.dtype).float()
-        # encoder pass
-        o_en, x_mask, g, _ = self._forward_encoder(x, x_mask, g)
+        # encoder pass, padded inputs of batched inference are masked out
+        o_en, x_mask, g, _ = self._forward_encoder(x, x_mask, g, mask_padding=True)
         # duration predictor pass
         o_dr_log = self.duration_predictor(o_en.squeeze(), x_mask)
         o_dr = self.format_durations(o_dr_log, x_mask).squeeze(1)
@@ -659,16 +676,20 @@ class ForwardTTS(BaseTTS):
             o_energy_emb, o_energy = self._forward_energy_predictor(o_en, x_mask)
             o_en = o_en + o_energy_emb
         # decoder pass
-        o_de, attn = self._forward_decoder(o_en, o_dr, x_mask, y_lengths, g=None)
+        o_de, attn = self._forward_decoder(o_en, o_dr, x_mask, y_lengths, g=None, mask_padding=True)
         outputs = {
             "model_outputs": o_de,
             "alignments": attn,
             "pitch": o_pitch,
             "energy": o_energy,
             "durations_log": o_dr_log,
+            "y_mask": sequence_mask(y_lengths, o_de.shape[1]).unsqueeze(1).to(o_de.dtype),
         }
         return outputs
 
+    def get_output_lengths(self, outputs: dict[str, Any]) -> torch.Tensor:
+        return outputs["y_mask"].sum([1, 2]).long()
+
     def train_step(self, batch: dict, criterion: nn.Module):
         text_input = batch["text_input"]
         text_lengths = batch["text_lengths"]
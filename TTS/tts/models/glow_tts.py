@@ -58,6 +58,8 @@ class GlowTTS(BaseTTS):
         >>> model = GlowTTS.init_from_config(config)
     """
 
+    supports_batched_inference = True
+
     def __init__(
         self,
         config: GlowTTSConfig,
@@ -344,7 +346,7 @@ class GlowTTS(BaseTTS):
         o_mean, o_log_scale, o_dur_log, x_mask = self.encoder(x, x_lengths, g=g)
         # compute output durations
         w = (torch.exp(o_dur_log) - 1) * x_mask * self.length_scale
-        w_ceil = torch.clamp_min(torch.ceil(w), 1)
+        w_ceil = torch.clamp_min(torch.ceil(w), 1) * x_mask
         y_lengths = torch.clamp_min(torch.sum(w_ceil, [1, 2]), 1).long()
         y_max_length = None
         # compute masks
@@ -366,9 +368,15 @@ class GlowTTS(BaseTTS):
             "alignments": attn,
             "durations_log": o_dur_log.transpose(1, 2),
             "total_durations_log": o_attn_dur.transpose(1, 2),
+            "y_mask": y_mask,
         }
         return outputs
 
+    def get_output_lengths(self, outputs: dict[str, Any]) -> torch.Tensor:
+        # the decoder drops trailing frames that do not fill a whole squeeze group
+        y_lengths = outputs["y_mask"].sum([1, 2]).long()
+        return torch.div(y_lengths, self.num_squeeze, rounding_mode="floor") * self.num_squeeze
+
     def train_step(self, batch: dict, criterion: nn.Module):
         """A single training step. Forward pass and loss computation. Run data depended initialization for the
         first `config.data_dep_init_steps` steps.
@@ -36,6 +36,9 @@ from TTS.utils.generic_utils import (
 
 logger = logging.getLogger(__name__)
 
+# This is the token for coding silence, which is fixed in place with "fix_autoregressive_output"
+CALM_TOKEN = 83
+
 
 def pad_or_truncate(t, length):
     """
@@ -109,26 +112,38 @@ def fix_autoregressive_output(codes, stop_token, complain=True):
 
     Failing to do this padding will produce speech with a harsh end that sounds like "BLAH" or similar.
     """
+    return fix_autoregressive_outputs(codes.unsqueeze(0), stop_token, complain=complain)[0]
+
+
+def fix_autoregressive_outputs(codes, stop_token, complain=True):
+    """Apply `fix_autoregressive_output()` to each row of codes of shape ``[b, t]``, in place."""
     # Strip off the autoregressive stop token and add padding.
-    stop_token_indices = (codes == stop_token).nonzero()
-    if len(stop_token_indices) == 0:
-        if complain:
-            logger.warning(
-                "No stop tokens found in one of the generated voice clips. This typically means the spoken audio is "
-                "too long. In some cases, the output will still be good, though. Listen to it and if it is missing words, "
-                "try breaking up your input text."
-            )
-        return codes
-    codes[stop_token_indices] = 83
-    stm = stop_token_indices.min().item()
-    codes[stm:] = 83
-    if stm - 3 < codes.shape[0]:
-        codes[-3] = 45
-        codes[-2] = 45
-        codes[-1] = 248
+    is_stop = codes == stop_token
+    has_stop = is_stop.any(dim=1)
+    if complain and not has_stop.all():
+        logger.warning(
+            "No stop tokens found in one of the generated voice clips. This typically means the spoken audio is "
+            "too long. In some cases, the output will still be good, though. Listen to it and if it is missing words, "
+            "try breaking up your input text."
+        )
+    first_stop = torch.where(has_stop, is_stop.int().argmax(dim=1), codes.shape[1])
+    codes.masked_fill_(torch.arange(codes.shape[1], device=codes.device) >= first_stop.unsqueeze(1), CALM_TOKEN)
+    codes[has_stop, -3:] = torch.tensor([45, 45, 248], dtype=codes.dtype, device=codes.device)
     return codes
 
 
+def calm_token_lengths(codes, max_calm_tokens=8):
+    """
+    Return the number of codes to keep in each row of ``codes``, up to the first run of more than ``max_calm_tokens``
+    calm tokens. 8 tokens give the diffusion model some "breathing room" to terminate speech.
+    """
+    lengths = torch.full((codes.shape[0],), codes.shape[1], device=codes.device)
+    if codes.shape[1] > max_calm_tokens:
+        calm_runs = (codes == CALM_TOKEN).unfold(1, max_calm_tokens + 1, 1).all(dim=-1)
+        lengths = torch.where(calm_runs.any(dim=1), calm_runs.int().argmax(dim=1) + max_calm_tokens, lengths)
+    return lengths
+
+
 def do_spectrogram_diffusion(
     diffusion_model,
     diffuser,
@@ -139,6 +154,8 @@ def do_spectrogram_diffusion(
 ):
     """
     Uses the specified diffusion model to convert discrete codes into a spectrogram.
+
+    The latents of several candidates can be decoded in one batch if they are padded to the same length.
     """
     with torch.no_grad():
         output_seq_len = (
@@ -642,6 +659,7 @@ class Tortoise(BaseTTS):
         diffusion_temperature=1.0,
         sampler="ddim",
         half=True,
+        reuse_latents=True,
         **hf_generate_kwargs,
     ):
         """
@@ -674,6 +692,8 @@ class Tortoise(BaseTTS):
                 As cond_free_k increases, the output becomes dominated by the conditioning-free signal.
             diffusion_temperature: (float) Controls the variance of the noise fed into the diffusion model. [0,1]. Values at 0
                                       are the "mean" prediction of the diffusion network and will sound bland and smeared.
+            reuse_latents: (bool) Keep the autoregressive latents of the best candidates from the sampling pass
+                instead of computing them again with a second forward pass.
             hf_generate_kwargs: (`**kwargs`) The huggingface Transformers generate API is used for the autoregressive transformer.
                                     Extra keyword args fed to this function get forwarded directly to that API. Documentation
                                     here: https://huggingface.co/docs/transformers/internal/generation_utils
@@ -709,17 +729,17 @@ class Tortoise(BaseTTS):
         while num_autoregressive_samples % self.autoregressive_batch_size:
             self.autoregressive_batch_size //= 2
         with torch.no_grad():
-            samples = []
             num_batches = num_autoregressive_samples // self.autoregressive_batch_size
             stop_mel_token = self.autoregressive.stop_mel_token
-            calm_token = (
-                83  # This is the token for coding silence, which is fixed in place with "fix_autoregressive_output"
-            )
             self.autoregressive = self.autoregressive.to(self.device)
             logger.info("Generating autoregressive samples..")
+            # Each batch is ranked by CLVP right away and only the k best candidates and their latents are kept.
+            best_scores = best_results = best_latents = None
             with torch.autocast(device_type="cuda", dtype=torch.float16, enabled=half):
+                # the text side of CLVP is the same for all candidates
+                clvp_text_latents = self.clvp.encode_text(text_tokens)
                 for b in tqdm(range(num_batches), disable=not verbose):
-                    codes = self.autoregressive.inference_speech(
+                    outputs = self.autoregressive.inference_speech(
                         auto_conditioning,
                         text_tokens,
                         do_sample=True,
@@ -729,73 +749,64 @@ class Tortoise(BaseTTS):
                         length_penalty=length_penalty,
                         repetition_penalty=repetition_penalty,
                         max_generate_length=max_mel_tokens,
+                        return_latent=reuse_latents,
+                        calm_token=CALM_TOKEN,
                         **hf_generate_kwargs,
                     )
+                    codes, latents = outputs if reuse_latents else (outputs, None)
                     padding_needed = max_mel_tokens - codes.shape[1]
                     codes = F.pad(codes, (0, padding_needed), value=stop_mel_token)
-                    samples.append(codes)
+                    codes = fix_autoregressive_outputs(codes, stop_mel_token)
+                    scores = self.clvp.similarity(clvp_text_latents, self.clvp.encode_speech(codes))
+                    if best_scores is not None:
+                        scores = torch.cat([best_scores, scores])
+                        codes = torch.cat([best_results, codes])
+                    if reuse_latents:
+                        latents = F.pad(latents, (0, 0, 0, max_mel_tokens - latents.shape[1]))
+                        latents = latents if best_latents is None else torch.cat([best_latents, latents])
+                    best_scores, best_indices = torch.topk(scores, k=min(k, scores.shape[0]))
+                    best_results = codes[best_indices]
+                    best_latents = latents[best_indices] if reuse_latents else None
             self.autoregressive_batch_size = orig_batch_size  # in the case of single_sample
 
-            clip_results = []
-            with torch.autocast(device_type="cuda", dtype=torch.float16, enabled=half):
-                for batch in tqdm(samples, disable=not verbose):
-                    for i in range(batch.shape[0]):
-                        batch[i] = fix_autoregressive_output(batch[i], stop_mel_token)
-                    clvp_res = self.clvp(
-                        text_tokens.repeat(batch.shape[0], 1),
-                        batch,
-                        return_loss=False,
-                    )
-                    clip_results.append(clvp_res)
-
-                clip_results = torch.cat(clip_results, dim=0)
-                samples = torch.cat(samples, dim=0)
-                best_results = samples[torch.topk(clip_results, k=k).indices]
-            del samples
-
-            # The diffusion model actually wants the last hidden layer from the autoregressive model as conditioning
-            # inputs. Re-produce those for the top results. This could be made more efficient by storing all of these
-            # results, but will increase memory usage.
-            best_latents = self.autoregressive(
-                auto_conditioning.repeat(k, 1),
-                text_tokens.repeat(k, 1),
-                torch.tensor([text_tokens.shape[-1]], device=self.device),
-                best_results,
-                torch.tensor(
-                    [best_results.shape[-1] * self.autoregressive.mel_length_compression],
-                    device=self.device,
-                ),
-                return_latent=True,
-                clip_inputs=False,
-            )
+            # Find the first run of "calm" tokens in each result and trim the codes to that.
+            code_lengths = calm_token_lengths(best_results)
+            # The latents after the stop token are only generated until the calm tokens cover the trimmed length.
+            # The last 3 codes are changed by `fix_autoregressive_outputs`, so they need the full forward pass too.
+            if not reuse_latents or (code_lengths > max_mel_tokens - 2).any():
+                # The diffusion model actually wants the last hidden layer from the autoregressive model as
+                # conditioning inputs. Re-produce those for the top results.
+                best_latents = self.autoregressive(
+                    auto_conditioning.repeat(k, 1),
+                    text_tokens.repeat(k, 1),
+                    torch.tensor([text_tokens.shape[-1]], device=self.device),
+                    best_results,
+                    torch.tensor(
+                        [best_results.shape[-1] * self.autoregressive.mel_length_compression],
+                        device=self.device,
+                    ),
+                    return_latent=True,
+                    clip_inputs=False,
+                )
             del auto_conditioning
 
             logger.info("Transforming autoregressive outputs into audio..")
-            wav_candidates = []
-            for b in range(best_results.shape[0]):
-                codes = best_results[b].unsqueeze(0)
-                latents = best_latents[b].unsqueeze(0)
-
-                # Find the first occurrence of the "calm" token and trim the codes to that.
-                ctokens = 0
-                for code in range(codes.shape[-1]):
-                    if codes[0, code] == calm_token:
-                        ctokens += 1
-                    else:
-                        ctokens = 0
-                    if ctokens > 8:  # 8 tokens gives the diffusion model some "breathing room" to terminate speech.
-                        latents = latents[:, :code]
-                        break
-                mel = do_spectrogram_diffusion(
-                    self.diffusion,
-                    diffuser,
-                    latents,
-                    diffusion_conditioning,
-                    temperature=diffusion_temperature,
-                    verbose=verbose,
-                )
-                wav = self.vocoder.inference(mel)
-                wav_candidates.append(wav.cpu())
+            # All candidates are decoded in one batch. Shorter ones are padded by repeating their last latent, normally
+            # that of a calm token, and their spectrograms and waveforms are trimmed afterwards.
+            positions = torch.arange(int(code_lengths.max()), device=code_lengths.device)
+            positions = torch.minimum(positions, code_lengths.unsqueeze(1) - 1)
+            latents = best_latents.gather(1, positions.unsqueeze(-1).expand(-1, -1, best_latents.shape[-1]))
+            mels = do_spectrogram_diffusion(
+                self.diffusion,
+                diffuser,
+                latents,
+                diffusion_conditioning,
+                temperature=diffusion_temperature,
+                verbose=verbose,
+            )
+            wavs = self.vocoder.inference(mels).cpu()
+            wav_lengths = code_lengths * 4 * 24000 // 22050 * self.vocoder.hop_length
+            wav_candidates = [wav[None, :, :length] for wav, length in zip(wavs, wav_lengths.tolist())]
 
             def potentially_redact(clip, text):
                 if self.enable_redaction:
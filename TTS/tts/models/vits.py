@@ -470,6 +470,8 @@ class Vits(BaseTTS):
         >>> model = Vits(config)
     """
 
+    supports_batched_inference = True
+
     def __init__(
         self,
         config: Coqpit,
@@ -1006,6 +1008,11 @@ class Vits(BaseTTS):
         }
         return outputs
 
+    def get_output_lengths(self, outputs: dict[str, Any]) -> torch.Tensor:
+        y_mask = outputs["y_mask"][:, :, : self.max_inference_len]
+        hop_length = outputs["model_outputs"].shape[-1] // y_mask.shape[-1]
+        return y_mask.sum([1, 2]).long() * hop_length
+
     @torch.inference_mode()
     def voice_conversion(
         self,
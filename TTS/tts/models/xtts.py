@@ -1,5 +1,8 @@
 import logging
+import math
 import os
+from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -15,9 +18,10 @@ from TTS.tts.configs.shared_configs import BaseTTSConfig
 from TTS.tts.layers.xtts.gpt import GPT
 from TTS.tts.layers.xtts.hifigan_decoder import HifiDecoder
 from TTS.tts.layers.xtts.stream_generator import init_stream_support
-from TTS.tts.layers.xtts.tokenizer import VoiceBpeTokenizer, split_sentence
+from TTS.tts.layers.xtts.tokenizer import VoiceBpeTokenizer, split_sentence, split_sentences
 from TTS.tts.layers.xtts.xtts_manager import LanguageManager, SpeakerManager
 from TTS.tts.models.base_tts import BaseTTS
+from TTS.utils.audio.torch_transforms import crossfade_chunk
 from TTS.utils.generic_utils import (
     is_pytorch_at_least_2_4,
     warn_synthesize_config_deprecated,
@@ -195,6 +199,8 @@ class Xtts(BaseTTS):
         >>> model.load_checkpoint(config, checkpoint_dir="paths/to/models_dir/", eval=True)
     """
 
+    supports_batched_inference = True
+
     def __init__(self, config: Coqpit):
         super().__init__(config, ap=None, tokenizer=None)
         self.mel_stats_path = None
@@ -414,6 +420,81 @@ class Xtts(BaseTTS):
         """
         if config is not None:
             warn_synthesize_config_deprecated()
+        gpt_cond_latent, speaker_embedding, inference_settings = self._get_synthesis_inputs(
+            speaker=speaker, speaker_wav=speaker_wav, voice_dir=voice_dir, language=language, **kwargs
+        )
+        return self.inference(text, language, gpt_cond_latent, speaker_embedding, **inference_settings)
+
+    def synthesize_stream(
+        self,
+        text: str,
+        *,
+        speaker: str | None = None,
+        speaker_wav: str | os.PathLike[Any] | list[str | os.PathLike[Any]] | None = None,
+        voice_dir: str | os.PathLike[Any] | None = None,
+        language: str | None = None,
+        **kwargs,
+    ) -> Iterator[torch.Tensor]:
+        """Synthesize speech like :meth:`synthesize`, but yield audio chunks as soon as they are generated.
+
+        Args:
+            **kwargs: Inference and streaming settings. See `inference_stream()`.
+
+        Yields:
+            Tensor: Next audio chunk at 24kHz.
+        """
+        gpt_cond_latent, speaker_embedding, inference_settings = self._get_synthesis_inputs(
+            speaker=speaker, speaker_wav=speaker_wav, voice_dir=voice_dir, language=language, **kwargs
+        )
+        yield from self.inference_stream(text, language, gpt_cond_latent, speaker_embedding, **inference_settings)
+
+    def synthesize_batch(
+        self,
+        texts: list[str],
+        *,
+        speakers: list[str | None] | None = None,
+        speaker_wavs: list[str | os.PathLike[Any] | list[str | os.PathLike[Any]] | None] | None = None,
+        voice_dir: str | os.PathLike[Any] | None = None,
+        languages: list[str | None] | None = None,
+        **kwargs,
+    ) -> list[dict[str, Any]]:
+        """Synthesize speech for several texts at once, with batched GPT and HiFi-GAN decoding.
+
+        See :meth:`inference_batch`. The voices and languages may differ between the texts.
+
+        Args:
+            texts: Input texts.
+            speakers: Custom speaker ID for each text.
+            speaker_wavs: Reference audio for each text.
+            voice_dir: Folder for cached voices.
+            languages: Language of each text.
+            **kwargs: Inference settings shared by all texts. See `inference()`.
+
+        Returns:
+            One output dictionary per text, in the same format as returned by `inference()`.
+        """
+        speakers = speakers or [None] * len(texts)
+        speaker_wavs = speaker_wavs or [None] * len(texts)
+        languages = languages or [None] * len(texts)
+        gpt_cond_latents, speaker_embeddings = [], []
+        for speaker, speaker_wav, language in zip(speakers, speaker_wavs, languages):
+            gpt_cond_latent, speaker_embedding, inference_settings = self._get_synthesis_inputs(
+                speaker=speaker, speaker_wav=speaker_wav, voice_dir=voice_dir, language=language, **kwargs
+            )
+            gpt_cond_latents.append(gpt_cond_latent)
+            speaker_embeddings.append(speaker_embedding)
+        return self.inference_batch(texts, languages, gpt_cond_latents, speaker_embeddings, **inference_settings)
+
+    def _get_synthesis_inputs(
+        self,
+        *,
+        speaker: str | None,
+        speaker_wav: str | os.PathLike[Any] | list[str | os.PathLike[Any]] | None,
+        voice_dir: str | os.PathLike[Any] | None,
+        language: str | None,
+        **kwargs,
+    ) -> tuple[torch.Tensor, torch.Tensor, dict[str, Any]]:
+        """Return the conditioning latents, speaker embedding and inference settings for `synthesize()`."""
         if (speaker_id := kwargs.pop("speaker_id", None)) is not None:
             speaker = speaker_id
             warn_synthesize_speaker_id_deprecated()
@@ -442,7 +523,7 @@ class Xtts(BaseTTS):
             voice = self.clone_voice(speaker_wav, speaker, voice_dir, **voice_settings)
             gpt_cond_latent = voice["gpt_conditioning_latents"]
             speaker_embedding = voice["speaker_embedding"]
-        return self.inference(text, language, gpt_cond_latent, speaker_embedding, **inference_settings)
+        return gpt_cond_latent, speaker_embedding, inference_settings
 
     @torch.inference_mode()
     def inference(
@@ -461,6 +542,7 @@ class Xtts(BaseTTS):
         num_beams: int = 1,
         speed: float = 1.0,
         enable_text_splitting: bool = False,
+        max_batch_size: int | None = None,
         **hf_generate_kwargs: Any,
     ):
         """
@@ -489,6 +571,13 @@ class Xtts(BaseTTS):
             top_p: (float) P value used in nucleus sampling. (0,1]. Lower values mean the decoder produces more "likely"
                 (aka boring) outputs. Defaults to 0.8.
 
+            enable_text_splitting: (bool) Split the text into sentences, which are decoded in batches. Defaults to
+                False.
+
+            max_batch_size: (int) Maximum number of sentences decoded together. Defaults to None, which decodes up to 8
+                sentences together on GPUs and one at a time otherwise. Sampled codes depend on the other sentences
+                of a batch, and on CPUs padded batches are slower than single sentences.
+
             hf_generate_kwargs: (`**kwargs`) The huggingface Transformers generate API is used for the autoregressive
                 transformer. Extra keyword args fed to this function get forwarded directly to that API. Documentation
                 here: https://huggingface.co/docs/transformers/internal/generation_utils
@@ -497,93 +586,198 @@ class Xtts(BaseTTS):
             Generated audio clip(s) as a torch tensor. Shape 1,S if k=1 else, (k,1,S) where S is the sample length.
             Sample rate is 24kHz.
         """
-        language = language.split("-")[0]  # remove the country code
-        length_scale = 1.0 / max(speed, 0.05)
-        gpt_cond_latent = gpt_cond_latent.to(self.device)
-        speaker_embedding = speaker_embedding.to(self.device)
-        if enable_text_splitting:
-            text = split_sentence(text, language, self.tokenizer.char_limits[language])
-        else:
-            text = [text]
+        return self.inference_batch(
+            [text],
+            [language],
+            [gpt_cond_latent],
+            [speaker_embedding],
+            temperature=temperature,
+            length_penalty=length_penalty,
+            repetition_penalty=repetition_penalty,
+            top_k=top_k,
+            top_p=top_p,
+            do_sample=do_sample,
+            num_beams=num_beams,
+            speed=speed,
+            enable_text_splitting=enable_text_splitting,
+            max_batch_size=max_batch_size,
+            **hf_generate_kwargs,
+        )[0]
 
-        wavs = []
-        gpt_latents_list = []
-        for sent in text:
-            sent = sent.strip().lower()
-            text_tokens = torch.IntTensor(self.tokenizer.encode(sent, lang=language)).unsqueeze(0).to(self.device)
+    @torch.inference_mode()
+    def inference_batch(
+        self,
+        texts: list[str],
+        languages: list[str],
+        gpt_cond_latents: list[torch.Tensor],
+        speaker_embeddings: list[torch.Tensor],
+        # GPT inference
+        temperature: float = 0.75,
+        length_penalty: float = 1.0,
+        repetition_penalty: float = 10.0,
+        top_k: int = 50,
+        top_p: float = 0.85,
+        do_sample: bool = True,
+        num_beams: int = 1,
+        speed: float = 1.0,
+        enable_text_splitting: bool = False,
+        max_batch_size: int | None = None,
+        **hf_generate_kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        """Produce audio clips for several texts, each with its own language and reference voice.
 
-            assert text_tokens.shape[-1] < self.args.gpt_max_text_tokens, (
-                " ❗ XTTS can only generate text with a maximum of 400 tokens."
-            )
+        Takes the same arguments as :meth:`inference`, with one text, language, conditioning latent and speaker
+        embedding per clip. The sentences of all texts are decoded by the GPT in batches of up to ``max_batch_size``
+        sentences, by default only on GPUs. The resulting latents of the same length are decoded together by the
+        HiFi-GAN decoder. Beam search decodes one sentence at a time.
 
-            with torch.no_grad():
-                gpt_codes = self.gpt.generate(
-                    cond_latents=gpt_cond_latent,
-                    text_inputs=text_tokens,
-                    do_sample=do_sample,
-                    top_p=top_p,
-                    top_k=top_k,
-                    temperature=temperature,
-                    num_return_sequences=self.gpt_batch_size,
-                    num_beams=num_beams,
-                    length_penalty=length_penalty,
-                    repetition_penalty=repetition_penalty,
-                    output_attentions=False,
-                    **hf_generate_kwargs,
-                )
-                expected_output_len = torch.tensor(
-                    [gpt_codes.shape[-1] * self.gpt.code_stride_len], device=text_tokens.device
-                )
+        Returns:
+            List of output dictionaries, one per text, in the same format as returned by :meth:`inference`.
+        """
+        length_scale = 1.0 / max(speed, 0.05)
+        gpt_cond_latents = [gpt_cond_latent.to(self.device) for gpt_cond_latent in gpt_cond_latents]
+        speaker_embeddings = [speaker_embedding.to(self.device) for speaker_embedding in speaker_embeddings]
 
-                text_len = torch.tensor([text_tokens.shape[-1]], device=self.device)
-                gpt_latents = self.gpt(
-                    text_tokens,
-                    text_len,
-                    gpt_codes,
-                    expected_output_len,
-                    cond_latents=gpt_cond_latent,
-                    return_attentions=False,
-                    return_latent=True,
+        languages = [language.split("-")[0] for language in languages]  # remove the country code
+        text_splits = [[text] for text in texts]
+        if enable_text_splitting:
+            # the texts of each language are split in one pass
+            for language in set(languages):
+                indices = [i for i, lang in enumerate(languages) if lang == language]
+                splits = split_sentences([texts[i] for i in indices], language, self.tokenizer.char_limits[language])
+                for i, split in zip(indices, splits):
+                    text_splits[i] = split
+
+        # (index of the text, text tokens) of all sentences
+        sentences = []
+        for i, (text, language) in enumerate(zip(text_splits, languages)):
+            for sent in text:
+                sent = sent.strip().lower()
+                text_tokens = torch.IntTensor(self.tokenizer.encode(sent, lang=language)).to(self.device)
+                assert text_tokens.shape[-1] < self.args.gpt_max_text_tokens, (
+                    " ❗ XTTS can only generate text with a maximum of 400 tokens."
                 )
+                sentences.append((i, text_tokens))
+
+        # the latents are collected while sampling, beam search needs a second pass to compute them
+        single_pass = num_beams == 1
+        if max_batch_size is None:
+            # padded batches only pay off on GPUs, as in Synthesizer.tts()
+            max_batch_size = 8 if self.device.type == "cuda" else 1
+        if not single_pass:
+            max_batch_size = 1
+        generate_kwargs = {
+            "do_sample": do_sample,
+            "top_p": top_p,
+            "top_k": top_k,
+            "temperature": temperature,
+            "num_return_sequences": self.gpt_batch_size,
+            "num_beams": num_beams,
+            "length_penalty": length_penalty,
+            "repetition_penalty": repetition_penalty,
+            "output_attentions": False,
+            **hf_generate_kwargs,
+        }
+        wavs = [None] * len(sentences)
+        gpt_latents = [None] * len(sentences)
+        # sentences of similar length need less padding
+        order = sorted(range(len(sentences)), key=lambda k: sentences[k][1].shape[-1])
+        for start in range(0, len(order), max_batch_size):
+            batch = order[start : start + max_batch_size]
+            latents = self._generate_latents(
+                [sentences[k][1] for k in batch],
+                torch.cat([gpt_cond_latents[sentences[k][0]] for k in batch]),
+                single_pass=single_pass,
+                **generate_kwargs,
+            )
+            if length_scale != 1.0:
+                latents = [
+                    F.interpolate(x.transpose(1, 2), scale_factor=length_scale, mode="linear").transpose(1, 2)
+                    for x in latents
+                ]
+            speaker_embedding = torch.cat([speaker_embeddings[sentences[k][0]] for k in batch])
+            for k, latent, wav in zip(batch, latents, self._decode_latents(latents, speaker_embedding)):
+                gpt_latents[k] = latent.cpu()
+                wavs[k] = wav.cpu().squeeze()
+
+        outputs = []
+        for i, speaker_embedding in enumerate(speaker_embeddings):
+            text_sentences = [k for k, (owner, _) in enumerate(sentences) if owner == i]
+            outputs.append(
+                {
+                    "wav": torch.cat([wavs[k] for k in text_sentences], dim=0).numpy(),
+                    "gpt_latents": torch.cat([gpt_latents[k] for k in text_sentences], dim=1).numpy(),
+                    "speaker_embedding": speaker_embedding,
+                }
+            )
+        return outputs
 
-                if length_scale != 1.0:
-                    gpt_latents = F.interpolate(
-                        gpt_latents.transpose(1, 2), scale_factor=length_scale, mode="linear"
-                    ).transpose(1, 2)
+    def _generate_latents(
+        self, text_tokens: list[torch.Tensor], gpt_cond_latents: torch.Tensor, *, single_pass: bool, **generate_kwargs
+    ) -> list[torch.Tensor]:
+        """Sample the audio codes of a batch of sentences.
+
+        Returns the GPT latents of each sentence, `(gpt_batch_size, m, d)`.
+        """
+        text_lengths = torch.tensor([x.shape[-1] for x in text_tokens], device=self.device)
+        text_inputs = torch.nn.utils.rnn.pad_sequence(text_tokens, batch_first=True)
+        if single_pass:
+            gpt_codes, gpt_latents = self.gpt.generate(
+                cond_latents=gpt_cond_latents,
+                text_inputs=text_inputs,
+                text_lengths=text_lengths,
+                return_latents=True,
+                **generate_kwargs,
+            )
+            # finished rows are padded with the stop token, the `gpt_batch_size` rows of a sentence are kept up to
+            # the end of the longest one, as when it is decoded alone
+            is_stop = gpt_codes == self.gpt.stop_audio_token
+            code_lengths = torch.where(is_stop.any(1), is_stop.int().argmax(1) + 1, gpt_codes.shape[1])
+            code_lengths = code_lengths.view(len(text_tokens), -1).amax(1)
+            return [
+                latents[:, :length]
+                for latents, length in zip(gpt_latents.split(self.gpt_batch_size), code_lengths.tolist())
+            ]
+
+        assert len(text_tokens) == 1, " ❗ Beam search decodes one sentence at a time."
+        gpt_codes = self.gpt.generate(cond_latents=gpt_cond_latents, text_inputs=text_inputs, **generate_kwargs)
+        expected_output_len = torch.tensor([gpt_codes.shape[-1] * self.gpt.code_stride_len], device=self.device)
+        gpt_latents = self.gpt(
+            text_inputs,
+            text_lengths,
+            gpt_codes,
+            expected_output_len,
+            cond_latents=gpt_cond_latents,
+            return_attentions=False,
+            return_latent=True,
+        )
+        return [gpt_latents]
 
-                gpt_latents_list.append(gpt_latents.cpu())
-                wavs.append(self.hifigan_decoder(gpt_latents, g=speaker_embedding).cpu().squeeze())
+    def _decode_latents(self, gpt_latents: list[torch.Tensor], speaker_embedding: torch.Tensor) -> list[torch.Tensor]:
+        """Run the HiFi-GAN decoder on the latents of several sentences, `(gpt_batch_size, m, d)` each.
 
-        return {
-            "wav": torch.cat(wavs, dim=0).numpy(),
-            "gpt_latents": torch.cat(gpt_latents_list, dim=1).numpy(),
-            "speaker_embedding": speaker_embedding,
-        }
+        Latents of the same length are decoded as one batch. Shorter latents are not padded to a common length, the
+        receptive field of the decoder would reach into the padding and change the end of their waveforms.
+        `speaker_embedding` has one row per sentence.
+        """
+        if len(gpt_latents) == 1:
+            return [self.hifigan_decoder(gpt_latents[0], g=speaker_embedding)]
+        indices_by_length = defaultdict(list)
+        for i, x in enumerate(gpt_latents):
+            indices_by_length[x.shape[1]].append(i)
+        wavs = [None] * len(gpt_latents)
+        for indices in indices_by_length.values():
+            batch = torch.cat([gpt_latents[i] for i in indices])
+            g = speaker_embedding[indices].repeat_interleave(self.gpt_batch_size, dim=0)
+            for i, wav in zip(indices, self.hifigan_decoder(batch, g=g).split(self.gpt_batch_size)):
+                wavs[i] = wav
+        return wavs
 
     def handle_chunks(self, wav_gen, wav_gen_prev, wav_overlap, overlap_len):
         """Handle chunk formatting in streaming mode"""
-        wav_chunk = wav_gen[:-overlap_len]
-        if wav_gen_prev is not None:
-            wav_chunk = wav_gen[(wav_gen_prev.shape[0] - overlap_len) : -overlap_len]
-        if wav_overlap is not None:
-            # cross fade the overlap section
-            if overlap_len > len(wav_chunk):
-                # wav_chunk is smaller than overlap_len, pass on last wav_gen
-                if wav_gen_prev is not None:
-                    wav_chunk = wav_gen[(wav_gen_prev.shape[0] - overlap_len) :]
-                else:
-                    # not expecting will hit here as problem happens on last chunk
-                    wav_chunk = wav_gen[-overlap_len:]
-                return wav_chunk, wav_gen, None
-            else:
-                crossfade_wav = wav_chunk[:overlap_len]
-                crossfade_wav = crossfade_wav * torch.linspace(0.0, 1.0, overlap_len).to(crossfade_wav.device)
-                wav_chunk[:overlap_len] = wav_overlap * torch.linspace(1.0, 0.0, overlap_len).to(wav_overlap.device)
-                wav_chunk[:overlap_len] += crossfade_wav
-
-        wav_overlap = wav_gen[-overlap_len:]
-        wav_gen_prev = wav_gen
-        return wav_chunk, wav_gen_prev, wav_overlap
+        prev_len = None if wav_gen_prev is None else wav_gen_prev.shape[0]
+        wav_chunk, _, wav_overlap = crossfade_chunk(wav_gen, 0, prev_len, wav_overlap, overlap_len)
+        return wav_chunk, wav_gen, wav_overlap
 
     @torch.inference_mode()
     def inference_stream(
@@ -595,6 +789,7 @@ class Xtts(BaseTTS):
         # Streaming
         stream_chunk_size=20,
         overlap_wav_len=1024,
+        stream_context_len: int | None = None,
         # GPT inference
         temperature=0.75,
         length_penalty=1.0,
@@ -606,6 +801,20 @@ class Xtts(BaseTTS):
         enable_text_splitting=False,
         **hf_generate_kwargs,
     ):
+        """Generate audio for the given text chunk by chunk while the GPT is sampling.
+
+        Takes the same arguments as :meth:`inference`, plus:
+
+        Args:
+            stream_chunk_size (int): Number of GPT tokens to collect before decoding a new chunk. Defaults to 20.
+            overlap_wav_len (int): Number of samples cross-faded between consecutive chunks. Defaults to 1024.
+            stream_context_len (int, optional): If set, each chunk only vocodes the new GPT latents plus this many
+                preceding latents as receptive-field context, so the decoding cost per chunk stays constant along a
+                sentence. ``None`` re-decodes all latents of the sentence for every chunk. Defaults to None.
+
+        Yields:
+            Tensor: Next audio chunk at 24kHz.
+        """
         language = language.split("-")[0]  # remove the country code
         length_scale = 1.0 / max(speed, 0.05)
         gpt_cond_latent = gpt_cond_latent.to(self.device)
@@ -629,6 +838,7 @@ class Xtts(BaseTTS):
             )
             gpt_generator = self.gpt.get_generator(
                 fake_inputs=fake_inputs,
+                cond_latents=gpt_cond_latent,
                 top_k=top_k,
                 top_p=top_p,
                 temperature=temperature,
@@ -643,32 +853,74 @@ class Xtts(BaseTTS):
                 **hf_generate_kwargs,
             )
 
-            last_tokens = []
-            all_latents = []
-            wav_gen_prev = None
-            wav_overlap = None
-            is_end = False
-
-            while not is_end:
-                try:
-                    x, latent = next(gpt_generator)
-                    last_tokens += [x]
-                    all_latents += [latent]
-                except StopIteration:
-                    is_end = True
-
-                if is_end or (stream_chunk_size > 0 and len(last_tokens) >= stream_chunk_size):
-                    gpt_latents = torch.cat(all_latents, dim=0)[None, :]
-                    if length_scale != 1.0:
-                        gpt_latents = F.interpolate(
-                            gpt_latents.transpose(1, 2), scale_factor=length_scale, mode="linear"
-                        ).transpose(1, 2)
-                    wav_gen = self.hifigan_decoder(gpt_latents, g=speaker_embedding.to(self.device))
-                    wav_chunk, wav_gen_prev, wav_overlap = self.handle_chunks(
-                        wav_gen.squeeze(), wav_gen_prev, wav_overlap, overlap_wav_len
-                    )
-                    last_tokens = []
-                    yield wav_chunk
+            yield from self.decode_stream(
+                gpt_generator,
+                speaker_embedding,
+                stream_chunk_size=stream_chunk_size,
+                overlap_wav_len=overlap_wav_len,
+                stream_context_len=stream_context_len,
+                length_scale=length_scale,
+            )
+
+    @torch.inference_mode()
+    def decode_stream(
+        self,
+        gpt_generator,
+        speaker_embedding,
+        *,
+        stream_chunk_size: int = 20,
+        overlap_wav_len: int = 1024,
+        stream_context_len: int | None = None,
+        length_scale: float = 1.0,
+    ):
+        """Vocode the ``(token, latent)`` pairs of a streaming GPT generator into cross-faded audio chunks.
+
+        See :meth:`inference_stream` for the streaming arguments.
+        """
+        if (
+            stream_context_len is not None
+            and self.hifigan_decoder.get_output_length(math.floor(stream_context_len * length_scale) - 1)
+            < overlap_wav_len
+        ):
+            msg = (
+                f"`stream_context_len={stream_context_len}` is too short to cover `overlap_wav_len={overlap_wav_len}`."
+            )
+            raise ValueError(msg)
+
+        last_tokens = []
+        all_latents = []
+        num_latents = 0
+        wav_len = None
+        wav_overlap = None
+        is_end = False
+
+        while not is_end:
+            try:
+                x, latent = next(gpt_generator)
+                last_tokens += [x]
+                all_latents += [latent]
+                num_latents += 1
+            except StopIteration:
+                is_end = True
+
+            if is_end or (stream_chunk_size > 0 and len(last_tokens) >= stream_chunk_size):
+                gpt_latents = torch.cat(all_latents, dim=0)[None, :]
+                if length_scale != 1.0:
+                    gpt_latents = F.interpolate(
+                        gpt_latents.transpose(1, 2), scale_factor=length_scale, mode="linear"
+                    ).transpose(1, 2)
+                wav_gen = self.hifigan_decoder(gpt_latents, g=speaker_embedding.to(self.device)).squeeze()
+                wav_gen_offset = 0
+                if stream_context_len is not None:
+                    # the window ends where the full sentence decoding would end
+                    total_len = self.hifigan_decoder.get_output_length(math.floor(num_latents * length_scale))
+                    wav_gen_offset = total_len - wav_gen.shape[0]
+                    all_latents = all_latents[max(0, len(all_latents) - stream_context_len) :]
+                wav_chunk, wav_len, wav_overlap = crossfade_chunk(
+                    wav_gen, wav_gen_offset, wav_len, wav_overlap, overlap_wav_len
+                )
+                last_tokens = []
+                yield wav_chunk
 
     def forward(self):
         raise NotImplementedError(
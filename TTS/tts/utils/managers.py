@@ -1,6 +1,7 @@
 import json
 import os
 import random
+from collections.abc import Iterator
 from typing import Any
 
 import fsspec
@@ -37,6 +38,28 @@ def save_file(obj: Any, path: str | os.PathLike[Any]):
         raise ValueError("Unsupported file type")
 
 
+def load_encoder_input(wav_file: str | os.PathLike[Any], ap: AudioProcessor, use_torch_spec: bool) -> torch.Tensor:
+    """Load an audio file as the input `[1, ...]` of a speaker encoder: the waveform or the melspectrogram."""
+    waveform = ap.load_wav(wav_file, sr=ap.sample_rate)
+    m_input = waveform if use_torch_spec else ap.melspectrogram(waveform)
+    return torch.from_numpy(m_input).unsqueeze(0)
+
+
+class EncoderInputDataset(torch.utils.data.Dataset):
+    """Speaker encoder inputs of a list of audio files, for loading them in DataLoader processes."""
+
+    def __init__(self, wav_files: list[str | os.PathLike[Any]], ap: AudioProcessor, use_torch_spec: bool):
+        self.wav_files = wav_files
+        self.ap = ap
+        self.use_torch_spec = use_torch_spec
+
+    def __len__(self) -> int:
+        return len(self.wav_files)
+
+    def __getitem__(self, idx: int) -> torch.Tensor:
+        return load_encoder_input(self.wav_files[idx], self.ap, self.use_torch_spec)
+
+
 class BaseIDManager:
     """Base `ID` Manager class. Every new `ID` manager must inherit this.
     It defines common `ID` manager specific functions.
@@ -348,16 +371,10 @@ class EmbeddingManager(BaseIDManager):
         """
 
         def _compute(wav_file: str | os.PathLike[Any]):
-            waveform = self.encoder_ap.load_wav(wav_file, sr=self.encoder_ap.sample_rate)
-            if not self.encoder_config.model_params.get("use_torch_spec", False):
-                m_input = self.encoder_ap.melspectrogram(waveform)
-                m_input = torch.from_numpy(m_input)
-            else:
-                m_input = torch.from_numpy(waveform)
-
+            use_torch_spec = self.encoder_config.model_params.get("use_torch_spec", False)
+            m_input = load_encoder_input(wav_file, self.encoder_ap, use_torch_spec)
             if self.use_cuda:
                 m_input = m_input.cuda()
-            m_input = m_input.unsqueeze(0)
             embedding = self.encoder.compute_embedding(m_input)
             return embedding
 
@@ -374,6 +391,30 @@ class EmbeddingManager(BaseIDManager):
         embedding = _compute(wav_file)
         return embedding[0].tolist()
 
+    def compute_embeddings_from_clips(
+        self, wav_files: list[str | os.PathLike[Any]], *, batch_size: int = 32, num_workers: int = 0
+    ) -> Iterator[list[list[float]]]:
+        """Compute the embeddings of many audio files, one batch at a time.
+
+        The audio files are loaded and converted to encoder inputs by `num_workers` DataLoader processes while the
+        encoder runs on the previous batch. Each embedding is the same as from `compute_embedding_from_clip()`.
+
+        Args:
+            wav_files (List[str]): Audio file paths.
+            batch_size (int): Number of files per batch. Defaults to 32.
+            num_workers (int): Number of loader processes. Defaults to 0, i.e. load in the main process.
+
+        Yields:
+            List[List[float]]: The embeddings of the next `batch_size` files, in the order of `wav_files`.
+        """
+        use_torch_spec = self.encoder_config.model_params.get("use_torch_spec", False)
+        dataset = EncoderInputDataset(wav_files, self.encoder_ap, use_torch_spec)
+        loader = torch.utils.data.DataLoader(dataset, batch_size=batch_size, num_workers=num_workers, collate_fn=list)
+        for inputs in loader:
+            if self.use_cuda:
+                inputs = [x.cuda() for x in inputs]
+            yield self.encoder.compute_embedding_batch(inputs).tolist()
+
     def compute_embeddings(self, feats: torch.Tensor | np.ndarray) -> list:
         """Compute embedding from features.
 
@@ -1,3 +1,6 @@
+import torch
+
+
 def inv_spectrogram(postnet_output, ap, CONFIG):
     if CONFIG.model.lower() in ["tacotron"]:
         wav = ap.inv_spectrogram(postnet_output.T)
@@ -6,19 +9,17 @@ def inv_spectrogram(postnet_output, ap, CONFIG):
     return wav
 
 
-# TODO: perform GL with pytorch for batching
 def apply_griffin_lim(inputs, input_lens, CONFIG, ap):
-    """Apply griffin-lim to each sample iterating throught the first dimension.
+    """Apply griffin-lim to all the samples of a batch at once.
     Args:
         inputs (Tensor or np.Array): Features to be converted by GL. First dimension is the batch size.
         input_lens (Tensor or np.Array): 1D array of sample lengths.
         CONFIG (Dict): TTS config.
         ap (AudioProcessor): TTS audio processor.
     """
-    wavs = []
-    for idx, spec in enumerate(inputs):
-        wav_len = (input_lens[idx] * ap.hop_length) - ap.hop_length  # inverse librosa padding
-        wav = inv_spectrogram(spec, ap, CONFIG)
-        # assert len(wav) == wav_len, f" [!] wav lenght: {len(wav)} vs expected: {wav_len}"
-        wavs.append(wav[:wav_len])
-    return wavs
+    specs = [spec[: int(length)].T for spec, length in zip(inputs, input_lens)]
+    if isinstance(inputs, torch.Tensor):
+        specs = [spec.detach().cpu().numpy() for spec in specs]
+    if CONFIG.model.lower() in ["tacotron"]:
+        return ap.inv_spectrogram_batch(specs)
+    return ap.inv_melspectrogram_batch(specs)
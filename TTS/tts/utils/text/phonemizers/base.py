@@ -136,6 +136,13 @@ class BasePhonemizer(abc.ABC):
         phonemized = self._phonemize_postprocess(phonemized, punctuations)
         return phonemized
 
+    def phonemize_batch(self, texts: list[str], separator="|", language: str = None) -> list[str]:
+        """Returns each of the `texts` phonemized, see `phonemize()`
+
+        Override this if the backend can process several texts more efficiently at once.
+        """
+        return [self.phonemize(text, separator, language) for text in texts]
+
     def print_logs(self, level: int = 0):
         indent = "\t" * level
         logger.info("%s| phoneme language: %s", indent, self.language)
@@ -0,0 +1,188 @@
+"""In-process binding of the libespeak-ng shared library via ctypes.
+
+Used by :class:`~TTS.tts.utils.text.phonemizers.espeak_wrapper.ESpeak` to avoid starting an ``espeak-ng``
+subprocess for every text. The system library is preferred, the one of the optional ``espeakng-loader`` package
+is only used if espeak is not installed, so that the phonemes come from the espeak-ng data models were trained with.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import shutil
+import threading
+from functools import cache
+
+logger = logging.getLogger(__name__)
+
+_AUDIO_OUTPUT_SYNCHRONOUS = 0x02
+_CHARS_UTF8 = 1
+_PHONEMES = 0x100
+_ENDPAUSE = 0x1000
+_PHONEMES_IPA = 0x02
+_PHONEMES_TIE = 0x80
+
+_SynthCallback = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p)
+
+
+class _EspeakVoice(ctypes.Structure):
+    _fields_ = [
+        ("name", ctypes.c_char_p),
+        ("languages", ctypes.c_char_p),
+        ("identifier", ctypes.c_char_p),
+        ("gender", ctypes.c_ubyte),
+        ("age", ctypes.c_ubyte),
+        ("variant", ctypes.c_ubyte),
+        ("xx1", ctypes.c_ubyte),
+        ("score", ctypes.c_int),
+        ("spare", ctypes.c_void_p),
+    ]
+
+
+def _find_library() -> tuple[str, str | None] | None:
+    """Return the path to libespeak-ng and its data directory (``None`` for the compiled-in default)."""
+    if (path := ctypes.util.find_library("espeak-ng")) is not None:
+        return path, None
+    if shutil.which("espeak-ng") is not None or shutil.which("espeak") is not None:
+        # the command-line tool is used rather than a different espeak-ng version
+        return None
+    try:
+        import espeakng_loader
+
+        return espeakng_loader.get_library_path(), espeakng_loader.get_data_path()
+    except ImportError:
+        return None
+
+
+def _load_libc() -> ctypes.CDLL:
+    """Return the C library, used to write the phoneme trace of libespeak-ng to memory."""
+    if (path := ctypes.util.find_library("c")) is None:
+        msg = "C library not found"
+        raise OSError(msg)
+    libc = ctypes.CDLL(path)
+    if not hasattr(libc, "open_memstream"):
+        msg = "open_memstream() is not available"
+        raise OSError(msg)
+    libc.open_memstream.restype = ctypes.c_void_p
+    libc.open_memstream.argtypes = [ctypes.POINTER(ctypes.c_char_p), ctypes.POINTER(ctypes.c_size_t)]
+    libc.fflush.argtypes = [ctypes.c_void_p]
+    libc.rewind.argtypes = [ctypes.c_void_p]
+    return libc
+
+
+class ESpeakLibrary:
+    """Long-lived libespeak-ng engine for grapheme-to-phoneme conversion.
+
+    The phonemes are computed like with ``espeak-ng -q --ipa``: the text is synthesized and the phoneme trace, one
+    line per clause, is written to a memory stream. ``espeak_TextToPhonemes()`` is not used because it does not
+    apply the same sentence level stress, e.g. "not an" gives "nˌɑːt æn" instead of "nˈɑːt æn".
+
+    The library keeps global state and is not thread-safe, so all calls are serialized and a single shared
+    instance should be used, see :func:`get_espeak_library`.
+
+    Args:
+        library_path (str): Path to the ``libespeak-ng`` shared library.
+        data_path (str, optional): Path to the ``espeak-ng-data`` directory. Defaults to the library's default.
+    """
+
+    def __init__(self, library_path: str, data_path: str | None = None) -> None:
+        self._lib = ctypes.cdll.LoadLibrary(library_path)
+        self._lib.espeak_Initialize.restype = ctypes.c_int
+        self._lib.espeak_Initialize.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_char_p, ctypes.c_int]
+        self._lib.espeak_Info.restype = ctypes.c_char_p
+        self._lib.espeak_Info.argtypes = [ctypes.c_void_p]
+        self._lib.espeak_SetVoiceByName.restype = ctypes.c_int
+        self._lib.espeak_SetVoiceByName.argtypes = [ctypes.c_char_p]
+        self._lib.espeak_SetVoiceByProperties.restype = ctypes.c_int
+        self._lib.espeak_SetVoiceByProperties.argtypes = [ctypes.POINTER(_EspeakVoice)]
+        self._lib.espeak_ListVoices.restype = ctypes.POINTER(ctypes.POINTER(_EspeakVoice))
+        self._lib.espeak_ListVoices.argtypes = [ctypes.POINTER(_EspeakVoice)]
+        self._lib.espeak_SetPhonemeTrace.restype = None
+        self._lib.espeak_SetPhonemeTrace.argtypes = [ctypes.c_int, ctypes.c_void_p]
+        self._lib.espeak_SetSynthCallback.restype = None
+        self._lib.espeak_SetSynthCallback.argtypes = [_SynthCallback]
+        self._lib.espeak_Synth.restype = ctypes.c_int
+        self._lib.espeak_Synth.argtypes = [
+            ctypes.c_char_p,
+            ctypes.c_size_t,
+            ctypes.c_uint,
+            ctypes.c_int,
+            ctypes.c_uint,
+            ctypes.c_uint,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+        ]
+
+        self._libc = _load_libc()
+        self._trace_buffer = ctypes.c_char_p()
+        self._trace_size = ctypes.c_size_t()
+        self._trace = self._libc.open_memstream(ctypes.byref(self._trace_buffer), ctypes.byref(self._trace_size))
+        if not self._trace:
+            msg = "Failed to open the phoneme trace stream"
+            raise OSError(msg)
+
+        data = None if data_path is None else data_path.encode()
+        if self._lib.espeak_Initialize(_AUDIO_OUTPUT_SYNCHRONOUS, 0, data, 0) <= 0:
+            msg = f"Failed to initialize {library_path}"
+            raise RuntimeError(msg)
+        # the audio is discarded, a reference is kept for the lifetime of the library
+        self._synth_callback = _SynthCallback(lambda wav, num_samples, events: 0)
+        self._lib.espeak_SetSynthCallback(self._synth_callback)
+        self.version = self._lib.espeak_Info(None).decode().split()[0]
+        self._voice = None
+        self.lock = threading.RLock()
+
+    def set_voice(self, voice: str) -> None:
+        """Select a voice by name or language, like the ``-v`` option of the ``espeak-ng`` command."""
+        if voice == self._voice:
+            return
+        if self._lib.espeak_SetVoiceByName(voice.encode()) != 0:
+            voice_spec = _EspeakVoice(languages=voice.encode())
+            if self._lib.espeak_SetVoiceByProperties(ctypes.byref(voice_spec)) != 0:
+                msg = f"Unknown espeak-ng voice: {voice}"
+                raise ValueError(msg)
+        self._voice = voice
+
+    def text_to_phonemes(self, text: str, voice: str, separator: str = "_", *, tie: bool = False) -> list[str]:
+        """Convert text to IPA phonemes, one string per clause.
+
+        Args:
+            text (str): Text to convert.
+            voice (str): Voice name or language.
+            separator (str): Character between the phonemes of a word. Defaults to "_".
+            tie (bool): Join the characters of multi-letter phonemes with '͡' instead of separating all phonemes.
+        """
+        mode = _PHONEMES_IPA | (_PHONEMES_TIE | (ord("͡") << 8) if tie else ord(separator) << 8)
+        data = text.encode()
+        with self.lock:
+            self.set_voice(voice)
+            self._libc.rewind(self._trace)
+            self._lib.espeak_SetPhonemeTrace(mode, self._trace)
+            self._lib.espeak_Synth(data, len(data) + 1, 0, 0, 0, _CHARS_UTF8 | _PHONEMES | _ENDPAUSE, None, None)
+            self._libc.fflush(self._trace)
+            trace = ctypes.string_at(self._trace_buffer, self._trace_size.value).decode()
+        return [line.strip() for line in trace.split("\n") if line.strip()]
+
+    def list_voices(self) -> dict[str, str]:
+        """Return a dictionary mapping the main language of each voice to the voice name."""
+        with self.lock:
+            voices = self._lib.espeak_ListVoices(None)
+            langs = {}
+            i = 0
+            while voices[i]:
+                voice = voices[i].contents
+                # `languages` is a priority byte followed by the language name
+                langs[voice.languages[1:].decode()] = voice.name.decode()
+                i += 1
+        return langs
+
+
+@cache
+def get_espeak_library() -> ESpeakLibrary | None:
+    """Return the shared :class:`ESpeakLibrary` instance, or ``None`` if libespeak-ng is not available."""
+    if (paths := _find_library()) is None:
+        return None
+    try:
+        return ESpeakLibrary(*paths)
+    except (OSError, RuntimeError) as e:
+        logger.warning("Could not load libespeak-ng from %s: %s", paths[0], e)
+        return None
@@ -9,6 +9,7 @@ from pathlib import Path
 from packaging.version import Version
 
 from TTS.tts.utils.text.phonemizers.base import BasePhonemizer
+from TTS.tts.utils.text.phonemizers.espeak_lib import get_espeak_library
 from TTS.tts.utils.text.punctuation import Punctuation
 
 logger = logging.getLogger(__name__)
@@ -46,6 +47,10 @@ if _is_tool("espeak-ng"):
 elif _is_tool("espeak"):
     _DEF_ESPEAK_LIB = "espeak"
     _DEF_ESPEAK_VER = get_espeak_version()
+elif get_espeak_library() is not None:
+    # only the libespeak-ng library is installed, e.g. with `pip install espeakng-loader`
+    _DEF_ESPEAK_LIB = "espeak-ng"
+    _DEF_ESPEAK_VER = get_espeak_library().version
 else:
     _DEF_ESPEAK_LIB = None
     _DEF_ESPEAK_VER = None
@@ -75,7 +80,10 @@ def _espeak_exe(espeak_lib: str, args: list) -> list[str]:
 
 
 class ESpeak(BasePhonemizer):
-    """Wrapper calling `espeak` or `espeak-ng` from the command-line to perform G2P.
+    """Wrapper calling `espeak` or `espeak-ng` to perform G2P.
+
+    The `espeak-ng` backend runs in-process through the libespeak-ng library if it is available, instead of
+    starting a command-line process for every text.
 
     Args:
         language (str):
@@ -91,6 +99,11 @@ class ESpeak(BasePhonemizer):
         keep_puncs (bool):
             If True, keep the punctuations after phonemization. Defaults to True.
 
+        use_library (bool):
+            If True, use the libespeak-ng library for the `espeak-ng` backend when it is available. Otherwise
+            always call the command-line tool. The library of the `espeak` extra is only used if espeak is not
+            installed on the system. Defaults to True.
+
     Example:
 
         >>> from TTS.tts.utils.text.phonemizers import ESpeak
@@ -106,10 +119,13 @@ class ESpeak(BasePhonemizer):
         backend: str | None = None,
         punctuations: str = Punctuation.default_puncs(),
         keep_puncs: bool = True,
+        *,
+        use_library: bool = True,
     ):
         if _DEF_ESPEAK_LIB is None:
             msg = "[!] No espeak backend found. Install espeak-ng or espeak to your system."
             raise FileNotFoundError(msg)
+        self._library = get_espeak_library() if use_library else None
         self.backend = _DEF_ESPEAK_LIB
 
         # band-aid for backwards compatibility
@@ -136,7 +152,14 @@ class ESpeak(BasePhonemizer):
             msg = f"Unknown backend: {backend}"
             raise ValueError(msg)
         self._ESPEAK_LIB = backend
-        self._ESPEAK_VER = get_espeakng_version() if backend == "espeak-ng" else get_espeak_version()
+        if self._use_library:
+            self._ESPEAK_VER = self._library.version
+        else:
+            self._ESPEAK_VER = get_espeakng_version() if backend == "espeak-ng" else get_espeak_version()
+
+    @property
+    def _use_library(self) -> bool:
+        return self._library is not None and self._ESPEAK_LIB == "espeak-ng"
 
     def auto_set_espeak_lib(self) -> None:
         if _is_tool("espeak-ng"):
@@ -164,6 +187,12 @@ class ESpeak(BasePhonemizer):
                 consecutive characters of a single phoneme. Else separate phoneme
                 with '_'. This option requires espeak>=1.49. Default to False.
         """
+        if self._use_library:
+            # the command-line tool prints one line per clause
+            clauses = self._library.text_to_phonemes(text, self._language, tie=tie)
+            phonemes = "".join(re.sub(r"\(.+?\)", "", clause).strip() for clause in clauses)
+            return phonemes.replace("_", separator)
+
         # set arguments
         args = ["-v", f"{self._language}"]
         # espeak and espeak-ng parses `ipa` differently
@@ -212,6 +241,13 @@ class ESpeak(BasePhonemizer):
     def _phonemize(self, text: str, separator: str = "") -> str:
         return self.phonemize_espeak(text, separator, tie=False)
 
+    def phonemize_batch(self, texts: list[str], separator: str = "|", language: str | None = None) -> list[str]:
+        if not self._use_library:
+            return super().phonemize_batch(texts, separator, language)
+        # keep the library engine for the whole batch
+        with self._library.lock:
+            return super().phonemize_batch(texts, separator, language)
+
     @staticmethod
     def supported_languages() -> dict[str, str]:
         """Get a dictionary of supported languages.
@@ -221,6 +257,8 @@ class ESpeak(BasePhonemizer):
         """
         if _DEF_ESPEAK_LIB is None:
             return {}
+        if _DEF_ESPEAK_LIB == "espeak-ng" and (library := get_espeak_library()) is not None:
+            return library.list_voices()
         args = ["--voices"]
         langs = {}
         for count, line in enumerate(_espeak_exe(_DEF_ESPEAK_LIB, args)):
@@ -242,7 +280,7 @@ class ESpeak(BasePhonemizer):
     @classmethod
     def is_available(cls) -> bool:
         """Return true if ESpeak is available else false."""
-        return _is_tool("espeak") or _is_tool("espeak-ng")
+        return _is_tool("espeak") or _is_tool("espeak-ng") or get_espeak_library() is not None
 
 
 if __name__ == "__main__":
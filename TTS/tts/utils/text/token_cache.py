@@ -0,0 +1,151 @@
+"""Caching of tokenizer outputs for repeated inference inputs."""
+
+import abc
+import array
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class BaseTokenStore(abc.ABC):
+    """Persistent second tier of a :class:`TokenCache`.
+
+    Stores are shared between tokenizers and processes, so keys already identify the text processing settings
+    and implementations only need to map strings to token IDs.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> tuple[list[int], float] | None:
+        """Return the token IDs and the time it took to compute them, or ``None``."""
+        ...
+
+    @abc.abstractmethod
+    def put(self, key: str, token_ids: list[int], compute_time: float) -> None:
+        """Store token IDs and the time it took to compute them, in seconds."""
+        ...
+
+
+class SqliteTokenStore(BaseTokenStore):
+    """Token store in an SQLite database that can be shared by several processes.
+
+    Args:
+        path: Path of the database file, created if it doesn't exist.
+        timeout: Seconds to wait for a lock held by another process.
+    """
+
+    def __init__(self, path: str | os.PathLike[Any], timeout: float = 5.0) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, token_ids BLOB NOT NULL, compute_time REAL)"
+        )
+
+    def get(self, key: str) -> tuple[list[int], float] | None:
+        with self._lock:
+            row = self._conn.execute("SELECT token_ids, compute_time FROM tokens WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return array.array("i", row[0]).tolist(), row[1] or 0.0
+
+    def put(self, key: str, token_ids: list[int], compute_time: float) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO tokens VALUES (?, ?, ?)",
+                    (key, array.array("i", token_ids).tobytes(), compute_time),
+                )
+        except sqlite3.OperationalError as e:
+            # the cache is only an optimization, don't fail inference if the database is busy
+            logger.warning("Could not write to token cache %s: %s", self.path, e)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TokenCache:
+    """Thread-safe bounded LRU cache of :meth:`~TTS.tts.utils.text.tokenizer.TTSTokenizer.text_to_ids` outputs.
+
+    Misses in memory fall back to an optional persistent ``store``, whose entries are then kept in memory too.
+    Next to the hit and miss counters, the cache tracks how much tokenization time the hits saved, based on the
+    time it took to compute each entry originally.
+
+    Args:
+        max_entries: Maximum number of entries kept in memory. 0 only uses the ``store``.
+        store: Optional persistent store, e.g. :class:`SqliteTokenStore`.
+    """
+
+    def __init__(self, max_entries: int = 10000, store: BaseTokenStore | None = None) -> None:
+        self.max_entries = max_entries
+        self.store = store
+        self._entries: OrderedDict[str, tuple[tuple[int, ...], float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.time_saved = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> list[int] | None:
+        """Return the cached token IDs for ``key`` or ``None``."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                token_ids, compute_time = self._entries[key]
+                self.hits += 1
+                self.time_saved += compute_time
+                return list(token_ids)
+        if self.store is not None and (stored := self.store.get(key)) is not None:
+            token_ids, compute_time = stored
+            with self._lock:
+                self.store_hits += 1
+                self.time_saved += compute_time
+            self._put_memory(key, token_ids, compute_time)
+            return token_ids
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, token_ids: list[int], compute_time: float = 0.0) -> None:
+        """Add token IDs to the cache and the store."""
+        self._put_memory(key, token_ids, compute_time)
+        if self.store is not None:
+            self.store.put(key, token_ids, compute_time)
+
+    def _put_memory(self, key: str, token_ids: list[int], compute_time: float) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (tuple(token_ids), compute_time)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from memory. The store is not modified."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        """Return the hit/miss counters, the hit rate and the time saved by cache hits in seconds."""
+        with self._lock:
+            lookups = self.hits + self.store_hits + self.misses
+            return {
+                "hits": self.hits,
+                "store_hits": self.store_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.store_hits) / lookups if lookups else 0.0,
+                "time_saved": self.time_saved,
+                "entries": len(self._entries),
+            }
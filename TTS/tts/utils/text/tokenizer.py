@@ -1,4 +1,7 @@
+import hashlib
+import json
 import logging
+import time
 from collections.abc import Callable
 from typing import Union
 
@@ -6,6 +9,7 @@ from TTS.tts.utils.text import cleaners
 from TTS.tts.utils.text.characters import BaseCharacters, Graphemes, IPAPhonemes
 from TTS.tts.utils.text.phonemizers import DEF_LANG_TO_PHONEMIZER, get_phonemizer_by_name
 from TTS.tts.utils.text.phonemizers.multi_phonemizer import MultiPhonemizer
+from TTS.tts.utils.text.token_cache import TokenCache
 from TTS.utils.generic_utils import get_import_path, import_class
 
 logger = logging.getLogger(__name__)
@@ -29,6 +33,11 @@ class TTSTokenizer:
         phonemizer (Phonemizer):
             A phonemizer object or a dict that maps language codes to phonemizer objects. Defaults to None.
 
+        cache (TokenCache):
+            Optional cache of :meth:`text_to_ids` outputs, useful at inference time when the same sentences are
+            synthesized repeatedly. Entries are keyed by the text, language, cleaner, phonemizer and character set.
+            Defaults to None.
+
     Example:
 
         >>> from TTS.tts.utils.text.tokenizer import TTSTokenizer
@@ -47,6 +56,7 @@ class TTSTokenizer:
         phonemizer: Union["Phonemizer", dict] | None = None,
         add_blank: bool = False,
         use_eos_bos: bool = False,
+        cache: TokenCache | None = None,
     ):
         self.text_cleaner = text_cleaner
         self.use_phonemes = use_phonemes
@@ -55,6 +65,7 @@ class TTSTokenizer:
         self.characters = characters
         self.not_found_characters = []
         self.phonemizer = phonemizer
+        self.cache = cache
 
     @property
     def characters(self):
@@ -65,6 +76,7 @@ class TTSTokenizer:
         self._characters = new_characters
         self.pad_id = self.characters.char_to_id(self.characters.pad) if self.characters.pad else None
         self.blank_id = self.characters.char_to_id(self.characters.blank) if self.characters.blank else None
+        self._vocab_hash = hashlib.sha256("\0".join(self.characters.vocab).encode()).hexdigest()
 
     def encode(self, text: str) -> list[int]:
         """Encodes a string of text as a sequence of IDs."""
@@ -107,6 +119,17 @@ class TTSTokenizer:
         4. Add BOS and EOS characters
         5. Text to token IDs
         """
+        if self.cache is None:
+            return self._text_to_ids(text, language)
+        key = self._cache_key(text, language)
+        if (token_ids := self.cache.get(key)) is not None:
+            return token_ids
+        start = time.perf_counter()
+        token_ids = self._text_to_ids(text, language)
+        self.cache.put(key, token_ids, time.perf_counter() - start)
+        return token_ids
+
+    def _text_to_ids(self, text: str, language: str | None = None) -> list[int]:
         # TODO: text cleaner should pick the right routine based on the language
         logger.debug("Tokenizer input text: %s", text)
         if self.text_cleaner is not None:
@@ -122,6 +145,22 @@ class TTSTokenizer:
             text = self.pad_with_bos_eos(text)
         return text
 
+    def _cache_key(self, text: str, language: str | None) -> str:
+        """Identify the output of :meth:`text_to_ids` by its input and all settings that affect it."""
+        cleaner = None
+        if self.text_cleaner is not None:
+            cleaner = getattr(self.text_cleaner, "__qualname__", type(self.text_cleaner).__qualname__)
+            cleaner = f"{self.text_cleaner.__module__}.{cleaner}"
+        phonemizer = None
+        if self.use_phonemes:
+            backend = self.phonemizer
+            if isinstance(backend, MultiPhonemizer):
+                backend = backend.lang_to_phonemizer.get(language)
+            if backend is not None:
+                phonemizer = [backend.name(), str(backend.version()), getattr(backend, "language", None)]
+        settings = [text, language, cleaner, phonemizer, self._vocab_hash, self.add_blank, self.use_eos_bos]
+        return hashlib.sha256(json.dumps(settings, ensure_ascii=False).encode()).hexdigest()
+
     def ids_to_text(self, id_sequence: list[int]) -> str:
         """Converts a sequence of token IDs to a string of text."""
         return self.decode(id_sequence)
@@ -131,10 +131,16 @@ def spec_to_mel(*, spec: np.ndarray, mel_basis: np.ndarray, **kwargs) -> np.ndar
     return np.dot(mel_basis, spec)
 
 
-def mel_to_spec(*, mel: np.ndarray, mel_basis: np.ndarray, **kwargs) -> np.ndarray:
-    """Convert a melspectrogram to full scale spectrogram."""
+def mel_to_spec(
+    *, mel: np.ndarray, mel_basis: np.ndarray, inv_mel_basis: np.ndarray | None = None, **kwargs
+) -> np.ndarray:
+    """Convert a melspectrogram to full scale spectrogram.
+
+    ``inv_mel_basis`` is the pseudo-inverse of ``mel_basis``, computed on every call if not given.
+    """
     assert (mel < 0).sum() == 0, " [!] Input values must be non-negative."
-    inv_mel_basis = np.linalg.pinv(mel_basis)
+    if inv_mel_basis is None:
+        inv_mel_basis = np.linalg.pinv(mel_basis)
     return np.maximum(1e-10, np.dot(inv_mel_basis, mel))
 
 
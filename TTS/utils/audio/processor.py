@@ -4,6 +4,7 @@ from typing import Any
 
 import librosa
 import numpy as np
+import torch
 
 from TTS.tts.utils.helpers import StandardScaler
 from TTS.utils.audio.numpy_transforms import (
@@ -13,7 +14,6 @@ from TTS.utils.audio.numpy_transforms import (
     db_to_amp,
     deemphasis,
     find_endpoint,
-    griffin_lim,
     load_wav,
     mel_to_spec,
     millisec_to_length,
@@ -25,6 +25,7 @@ from TTS.utils.audio.numpy_transforms import (
     trim_silence,
     volume_norm,
 )
+from TTS.utils.audio.torch_transforms import get_hann_window, griffin_lim
 
 logger = logging.getLogger(__name__)
 
@@ -105,12 +106,19 @@ class AudioProcessor:
         stft_pad_mode (str, optional):
             Padding mode for STFT. Defaults to 'reflect'.
 
+        feature_backend (str, optional):
+            Backend for computing spectrograms, 'numpy' (librosa) or 'torch'. The torch backend computes a whole
+            batch of `spectrogram_batch()` or `melspectrogram_batch()` with a single STFT. Defaults to 'numpy'.
+
         clip_norm (bool, optional):
             enable/disable clipping the our of range values in the normalized audio signal. Defaults to True.
 
         griffin_lim_iters (int, optional):
             Number of GriffinLim iterations. Defaults to None.
 
+        griffin_lim_momentum (float, optional):
+            Momentum of the fast Griffin-Lim algorithm, e.g. 0.99. 0 runs the original algorithm. Defaults to 0.0.
+
         do_trim_silence (bool, optional):
             enable/disable silence trimming when loading the audio signal. Defaults to False.
 
@@ -160,8 +168,10 @@ class AudioProcessor:
         pitch_fmin=None,
         spec_gain=20,
         stft_pad_mode="reflect",
+        feature_backend="numpy",
         clip_norm=True,
         griffin_lim_iters=None,
+        griffin_lim_momentum=0.0,
         do_trim_silence=False,
         trim_db=60,
         do_sound_norm=False,
@@ -185,6 +195,7 @@ class AudioProcessor:
         self.power = power
         self.preemphasis = preemphasis
         self.griffin_lim_iters = griffin_lim_iters
+        self.griffin_lim_momentum = griffin_lim_momentum
         self.signal_norm = signal_norm
         self.symmetric_norm = symmetric_norm
         self.mel_fmin = mel_fmin or 0
@@ -193,6 +204,7 @@ class AudioProcessor:
         self.pitch_fmax = pitch_fmax
         self.spec_gain = float(spec_gain)
         self.stft_pad_mode = stft_pad_mode
+        self.feature_backend = feature_backend
         self.max_norm = 1.0 if max_norm is None else float(max_norm)
         self.clip_norm = clip_norm
         self.do_trim_silence = do_trim_silence
@@ -211,6 +223,9 @@ class AudioProcessor:
         else:
             msg = " [!] unknown `log_func` value."
             raise ValueError(msg)
+        if feature_backend not in ("numpy", "torch"):
+            msg = f" [!] unknown `feature_backend` value: {feature_backend}"
+            raise ValueError(msg)
         # setup stft parameters
         if hop_length is None:
             # compute stft parameters from given time values
@@ -237,6 +252,8 @@ class AudioProcessor:
             mel_fmax=self.mel_fmax,
             mel_fmin=self.mel_fmin,
         )
+        self.inv_mel_basis = np.linalg.pinv(self.mel_basis)
+        self._torch_mel_basis = {}
         # setup scaler
         if stats_path and signal_norm:
             mel_mean, mel_std, linear_mean, linear_std, _ = self.load_stats(stats_path)
@@ -350,7 +367,15 @@ class AudioProcessor:
         linear_std = stats["linear_std"]
         stats_config = stats["audio_config"]
         # check all audio parameters used for computing stats
-        skip_parameters = ["griffin_lim_iters", "stats_path", "do_trim_silence", "ref_level_db", "power"]
+        skip_parameters = [
+            "griffin_lim_iters",
+            "griffin_lim_momentum",
+            "feature_backend",
+            "stats_path",
+            "do_trim_silence",
+            "ref_level_db",
+            "power",
+        ]
         for key in stats_config:
             if key in skip_parameters:
                 continue
@@ -406,6 +431,8 @@ class AudioProcessor:
         Returns:
             np.ndarray: Spectrogram.
         """
+        if self.feature_backend == "torch":
+            return self.spectrogram_batch([y])[0]
         if self.preemphasis != 0:
             y = self.apply_preemphasis(y)
         D = stft(
@@ -420,6 +447,8 @@ class AudioProcessor:
 
     def melspectrogram(self, y: np.ndarray) -> np.ndarray:
         """Compute a melspectrogram from a waveform."""
+        if self.feature_backend == "torch":
+            return self.melspectrogram_batch([y])[0]
         if self.preemphasis != 0:
             y = self.apply_preemphasis(y)
         D = stft(
@@ -435,21 +464,97 @@ class AudioProcessor:
 
         return self.normalize(S).astype(np.float32)
 
+    def spectrogram_batch(self, wavs: list[np.ndarray], device: str | torch.device = "cpu") -> list[np.ndarray]:
+        """Compute the spectrograms of waveforms of different lengths.
+
+        With the torch backend all waveforms are transformed at once on `device`, otherwise one after the other.
+        """
+        if self.feature_backend != "torch":
+            return [self.spectrogram(y) for y in wavs]
+        S, spans = self._stft_batch(wavs, device)
+        if self.do_amp_to_db_linear:
+            S = self._amp_to_db_torch(S)
+        return self._normalize_batch(S, spans)
+
+    def melspectrogram_batch(self, wavs: list[np.ndarray], device: str | torch.device = "cpu") -> list[np.ndarray]:
+        """Compute the melspectrograms of waveforms of different lengths.
+
+        With the torch backend all waveforms are transformed at once on `device`, otherwise one after the other.
+        """
+        if self.feature_backend != "torch":
+            return [self.melspectrogram(y) for y in wavs]
+        S, spans = self._stft_batch(wavs, device)
+        key = f"{S.dtype}_{S.device}"
+        if key not in self._torch_mel_basis:
+            self._torch_mel_basis[key] = torch.from_numpy(self.mel_basis).to(dtype=S.dtype, device=S.device)
+        S = torch.matmul(self._torch_mel_basis[key], S)
+        if self.do_amp_to_db_mel:
+            S = self._amp_to_db_torch(S)
+        return self._normalize_batch(S, spans)
+
+    def _stft_batch(
+        self, wavs: list[np.ndarray], device: str | torch.device
+    ) -> tuple[torch.Tensor, list[tuple[int, int]]]:
+        """Magnitude spectrogram ``[C, T]`` of the concatenated waveforms and the frame span of each of them.
+
+        Each waveform is padded like by librosa with ``center=True`` and then to a multiple of the hop length, so
+        that no STFT frame overlaps two waveforms and each spectrogram is the same as if computed on its own. This
+        wastes no frames on padding to the longest waveform.
+        """
+        pad = self.fft_size // 2
+        padded = []
+        spans = []
+        start = 0
+        for y in wavs:
+            if self.preemphasis != 0:
+                y = self.apply_preemphasis(y)
+            y = np.pad(y, pad, mode=self.stft_pad_mode)
+            padded.append(np.pad(y, (0, -len(y) % self.hop_length)))
+            spans.append((start, 1 + (len(y) - 2 * pad) // self.hop_length))
+            start += len(padded[-1]) // self.hop_length
+        y = torch.from_numpy(np.concatenate(padded)).to(device=device, dtype=torch.float32)
+        D = torch.stft(
+            y,
+            self.fft_size,
+            hop_length=self.hop_length,
+            win_length=self.win_length,
+            window=get_hann_window(self.win_length, y.dtype, y.device),
+            center=False,
+            return_complex=True,
+        )
+        # faster than D.abs()
+        S = (D.real.square() + D.imag.square()).sqrt_()
+        return S, spans
+
+    def _amp_to_db_torch(self, x: torch.Tensor) -> torch.Tensor:
+        x = torch.clamp(x, min=1e-8)
+        return self.spec_gain * (torch.log10(x) if self.base == 10 else torch.log(x))
+
+    def _normalize_batch(self, S: torch.Tensor, spans: list[tuple[int, int]]) -> list[np.ndarray]:
+        S = S.cpu().numpy()
+        return [self.normalize(S[:, start : start + length]).astype(np.float32) for start, length in spans]
+
     def inv_spectrogram(self, spectrogram: np.ndarray) -> np.ndarray:
         """Convert a spectrogram to a waveform using Griffi-Lim vocoder."""
-        S = self.denormalize(spectrogram)
-        S = db_to_amp(x=S, gain=self.spec_gain, base=self.base)
-        # Reconstruct phase
-        W = self._griffin_lim(S**self.power)
-        return self.apply_inv_preemphasis(W) if self.preemphasis != 0 else W
+        return self.inv_spectrogram_batch([spectrogram])[0]
 
     def inv_melspectrogram(self, mel_spectrogram: np.ndarray) -> np.ndarray:
         """Convert a melspectrogram to a waveform using Griffi-Lim vocoder."""
-        D = self.denormalize(mel_spectrogram)
-        S = db_to_amp(x=D, gain=self.spec_gain, base=self.base)
-        S = mel_to_spec(mel=S, mel_basis=self.mel_basis)  # Convert back to linear
-        W = self._griffin_lim(S**self.power)
-        return self.apply_inv_preemphasis(W) if self.preemphasis != 0 else W
+        return self.inv_melspectrogram_batch([mel_spectrogram])[0]
+
+    def inv_spectrogram_batch(self, spectrograms: list[np.ndarray]) -> list[np.ndarray]:
+        """Convert spectrograms of different lengths to waveforms with one batched Griffin-Lim run."""
+        specs = [db_to_amp(x=self.denormalize(S), gain=self.spec_gain, base=self.base) for S in spectrograms]
+        return self._griffin_lim_batch([S**self.power for S in specs])
+
+    def inv_melspectrogram_batch(self, mel_spectrograms: list[np.ndarray]) -> list[np.ndarray]:
+        """Convert melspectrograms of different lengths to waveforms with one batched Griffin-Lim run."""
+        specs = []
+        for mel in mel_spectrograms:
+            S = db_to_amp(x=self.denormalize(mel), gain=self.spec_gain, base=self.base)
+            S = mel_to_spec(mel=S, mel_basis=self.mel_basis, inv_mel_basis=self.inv_mel_basis)
+            specs.append(S**self.power)
+        return self._griffin_lim_batch(specs)
 
     def out_linear_to_mel(self, linear_spec: np.ndarray) -> np.ndarray:
         """Convert a full scale linear spectrogram output of a network to a melspectrogram.
@@ -467,14 +572,33 @@ class AudioProcessor:
         return self.normalize(S)
 
     def _griffin_lim(self, S):
-        return griffin_lim(
-            spec=S,
-            num_iter=self.griffin_lim_iters,
+        return self._griffin_lim_batch([S])[0]
+
+    def _griffin_lim_batch(self, specs: list[np.ndarray]) -> list[np.ndarray]:
+        """Run Griffin-Lim on zero padded spectrograms ``[C, T_i]`` and cut each waveform to its length."""
+        wavs = [np.array([0.0])] * len(specs)
+        valid = [i for i, S in enumerate(specs) if np.isfinite(S).all()]
+        if len(valid) < len(specs):
+            logger.warning("Spectrogram is not finite everywhere. Skipping the GL.")
+        if not valid:
+            return wavs
+        max_len = max(specs[i].shape[1] for i in valid)
+        batch = torch.zeros(len(valid), specs[valid[0]].shape[0], max_len)
+        for row, i in enumerate(valid):
+            batch[row, :, : specs[i].shape[1]] = torch.from_numpy(np.abs(specs[i]))
+        batch = griffin_lim(
+            batch,
+            n_fft=self.fft_size,
             hop_length=self.hop_length,
             win_length=self.win_length,
-            fft_size=self.fft_size,
+            num_iter=self.griffin_lim_iters,
+            momentum=self.griffin_lim_momentum,
             pad_mode=self.stft_pad_mode,
-        )
+        ).numpy()
+        for row, i in enumerate(valid):
+            wav = batch[row, : (specs[i].shape[1] - 1) * self.hop_length]
+            wavs[i] = self.apply_inv_preemphasis(wav) if self.preemphasis != 0 else wav
+        return wavs
 
     def compute_f0(self, x: np.ndarray) -> np.ndarray:
         """Compute pitch (f0) of a waveform using the same parameters used for computing melspectrogram.
@@ -11,6 +11,14 @@ hann_window = {}
 mel_basis = {}
 
 
+def get_hann_window(win_length: int, dtype: torch.dtype, device: torch.device) -> torch.Tensor:
+    """Return the Hann window of the given length, cached per dtype and device."""
+    wnsize_dtype_device = f"{win_length}_{dtype}_{device}"
+    if wnsize_dtype_device not in hann_window:
+        hann_window[wnsize_dtype_device] = torch.hann_window(win_length).to(dtype=dtype, device=device)
+    return hann_window[wnsize_dtype_device]
+
+
 def amp_to_db(x: torch.Tensor, *, spec_gain: float = 1.0, clip_val: float = 1e-5) -> torch.Tensor:
     """Spectral normalization / dynamic range compression."""
     return torch.log(torch.clamp(x, min=clip_val) * spec_gain)
@@ -36,11 +44,6 @@ def wav_to_spec(y: torch.Tensor, n_fft: int, hop_length: int, win_length: int, *
     if torch.max(y) > 1.0:
         logger.info("max value is %.3f", torch.max(y))
 
-    global hann_window
-    wnsize_dtype_device = f"{win_length}_{y.dtype}_{y.device}"
-    if wnsize_dtype_device not in hann_window:
-        hann_window[wnsize_dtype_device] = torch.hann_window(win_length).to(dtype=y.dtype, device=y.device)
-
     y = torch.nn.functional.pad(
         y.unsqueeze(1),
         (int((n_fft - hop_length) / 2), int((n_fft - hop_length) / 2)),
@@ -54,7 +57,7 @@ def wav_to_spec(y: torch.Tensor, n_fft: int, hop_length: int, win_length: int, *
             n_fft,
             hop_length=hop_length,
             win_length=win_length,
-            window=hann_window[wnsize_dtype_device].clone(),
+            window=get_hann_window(win_length, y.dtype, y.device).clone(),
             center=center,
             pad_mode="reflect",
             normalized=False,
@@ -109,6 +112,116 @@ def wav_to_mel(
     return spec_to_mel(spec, n_fft, num_mels, sample_rate, fmin, fmax)
 
 
+def _stft(y: torch.Tensor, pad_mode: str, n_fft: int, **kwargs) -> torch.Tensor:
+    """Centered STFT that, like librosa, also reflects signals shorter than the ``n_fft // 2`` padding."""
+    pad = n_fft // 2
+    if pad_mode != "reflect" or y.shape[-1] > pad:
+        return torch.stft(y, n_fft, pad_mode=pad_mode, return_complex=True, **kwargs)
+    # torch only reflects once, `np.pad` keeps reflecting the signal until the padding is filled
+    n = y.shape[-1]
+    idx = torch.arange(-pad, n + pad, device=y.device).abs()
+    if n > 1:
+        idx = idx % (2 * (n - 1))
+        idx = torch.where(idx >= n, 2 * (n - 1) - idx, idx)
+    else:
+        idx = torch.zeros_like(idx)
+    return torch.stft(y[..., idx], n_fft, center=False, return_complex=True, **kwargs)
+
+
+def griffin_lim(
+    spec: torch.Tensor,
+    *,
+    n_fft: int,
+    hop_length: int,
+    win_length: int | None = None,
+    num_iter: int = 60,
+    momentum: float = 0.0,
+    pad_mode: str = "reflect",
+    angles: torch.Tensor | None = None,
+) -> torch.Tensor:
+    """Reconstruct waveforms from magnitude spectrograms with the (fast) Griffin-Lim algorithm.
+
+    Each iteration extrapolates the phase estimate with ``momentum`` (Perraudin et al., 2013), which converges in
+    fewer iterations than the original algorithm (``momentum=0``). The STFT parameters match the librosa based
+    :func:`TTS.utils.audio.numpy_transforms.griffin_lim`.
+
+    Args:
+        spec (Tensor): Magnitude spectrograms.
+        n_fft (int): FFT size.
+        hop_length (int): Hop length of the STFT.
+        win_length (int, optional): Length of the Hann window. Defaults to ``n_fft``.
+        num_iter (int, optional): Number of iterations. Defaults to 60.
+        momentum (float, optional): Momentum in ``[0, 1)``, e.g. 0.99. Defaults to 0.
+        pad_mode (str, optional): Padding mode of the STFT. Defaults to "reflect".
+        angles (Tensor, optional): Initial complex phases with the shape of ``spec``. Random if not given.
+
+    Args Shapes:
+        - spec : :math:`[B, C, T]` or :math:`[C, T]`
+
+    Return Shapes:
+        - wav : :math:`[B, (T - 1) * hop\\_length]` or :math:`[(T - 1) * hop\\_length]`
+    """
+    win_length = win_length or n_fft
+    window = get_hann_window(win_length, spec.dtype, spec.device)
+    stft_kwargs = {"n_fft": n_fft, "hop_length": hop_length, "win_length": win_length, "window": window}
+    length = (spec.shape[-1] - 1) * hop_length
+    if length == 0:
+        return spec.new_zeros(spec.shape[:-2] + (0,))
+
+    if angles is None:
+        angles = torch.polar(torch.ones_like(spec), 2 * torch.pi * torch.rand_like(spec))
+    spec = spec.to(angles.dtype)
+    previous = None
+    for _ in range(num_iter):
+        y = torch.istft(spec * angles, length=length, **stft_kwargs)
+        rebuilt = _stft(y, pad_mode, **stft_kwargs)
+        angles = rebuilt if previous is None or momentum == 0 else rebuilt - momentum / (1 + momentum) * previous
+        angles = angles / (angles.abs() + 1e-16)
+        previous = rebuilt
+    return torch.istft(spec * angles, length=length, **stft_kwargs)
+
+
+def crossfade_chunk(
+    wav_gen: torch.Tensor,
+    wav_gen_offset: int,
+    prev_len: int | None,
+    wav_overlap: torch.Tensor | None,
+    overlap_len: int,
+) -> tuple[torch.Tensor, int, torch.Tensor | None]:
+    """Cut the new samples out of a decoded window and cross-fade them with the previous chunk.
+
+    Args:
+        wav_gen (Tensor): Decoded samples ``[wav_gen_offset, wav_gen_offset + len(wav_gen))`` of the utterance.
+        wav_gen_offset (int): Position of the first sample of ``wav_gen`` in the utterance waveform.
+        prev_len (int): Utterance length covered by the previous window, ``None`` for the first one.
+        wav_overlap (Tensor): Tail of the previous window to cross-fade with, if any.
+        overlap_len (int): Cross-fade length in samples.
+
+    Returns:
+        The chunk to emit, the utterance length covered so far and the tail kept for the next cross-fade.
+    """
+    start = 0 if prev_len is None else prev_len - overlap_len - wav_gen_offset
+    wav_len = wav_gen_offset + wav_gen.shape[0]
+    wav_chunk = wav_gen[start:-overlap_len]
+    if wav_overlap is not None:
+        # cross fade the overlap section
+        if overlap_len > len(wav_chunk):
+            # wav_chunk is smaller than overlap_len, pass on last wav_gen
+            if prev_len is not None:
+                wav_chunk = wav_gen[start:]
+            else:
+                # not expecting will hit here as problem happens on last chunk
+                wav_chunk = wav_gen[-overlap_len:]
+            return wav_chunk, wav_len, None
+        else:
+            crossfade_wav = wav_chunk[:overlap_len]
+            crossfade_wav = crossfade_wav * torch.linspace(0.0, 1.0, overlap_len).to(crossfade_wav.device)
+            wav_chunk[:overlap_len] = wav_overlap * torch.linspace(1.0, 0.0, overlap_len).to(wav_overlap.device)
+            wav_chunk[:overlap_len] += crossfade_wav
+
+    return wav_chunk, wav_len, wav_gen[-overlap_len:]
+
+
 class TorchSTFT(nn.Module):  # pylint: disable=abstract-method
     """Some of the audio processing funtions using Torch for faster batch processing.
 
@@ -1,6 +1,10 @@
 import logging
 import os
+import queue
+import threading
 import time
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -23,12 +27,19 @@ from TTS.vc.models.base_vc import BaseVC
 from TTS.vc.models.openvoice import OpenVoice
 from TTS.vocoder.models import setup_model as setup_vocoder_model
 from TTS.vocoder.models.base_vocoder import BaseVocoder
+from TTS.vocoder.models.gan import GAN
+from TTS.vocoder.models.wavernn import Wavernn
 from TTS.vocoder.utils.generic_utils import interpolate_vocoder_input
 
 logger = logging.getLogger(__name__)
 
 
 class Synthesizer(nn.Module):
+    # number of sentences the TTS model may run ahead of the vocoder, see `_synthesize_pipelined()`
+    pipeline_queue_size = 2
+    # number of silent samples after each sentence
+    sentence_pause = 10000
+
     def __init__(
         self,
         *,
@@ -50,7 +61,8 @@ class Synthesizer(nn.Module):
         model and synthesize speech from the provided text.
 
         The text is divided into a list of sentences using `pysbd` and synthesize
-        speech on each sentence separately.
+        speech on each sentence separately. With a separate vocoder, the TTS model
+        already runs on the next sentence while the vocoder processes the current one.
 
         If you have certain special characters in your text, you need to handle
         them before providing the text to Synthesizer.
@@ -265,19 +277,18 @@ class Synthesizer(nn.Module):
         """
         return self.seg.segment(text)
 
-    def save_wav(self, wav: list[int] | torch.Tensor | np.ndarray, path: str, pipe_out=None) -> None:
+    def save_wav(self, wav: list[float] | torch.Tensor | np.ndarray, path: str, pipe_out=None) -> None:
         """Save the waveform as a file.
 
         Args:
-            wav (List[int]): waveform as a list of values.
+            wav (np.ndarray): waveform as an array, tensor or list of values.
             path (str): output path to save the waveform.
             pipe_out (BytesIO, optional): Flag to stdout the generated TTS wav file for shell pipe.
         """
         # if tensor convert to numpy
         if isinstance(wav, torch.Tensor):
             wav = wav.cpu().numpy()
-        if isinstance(wav, list):
-            wav = np.array(wav)
+        wav = np.asarray(wav)
         save_wav(wav=wav, path=path, sample_rate=self.output_sample_rate, pipe_out=pipe_out)
 
     def voice_conversion(
@@ -314,6 +325,330 @@ class Synthesizer(nn.Module):
         logger.info("Real-time factor: %.3f", process_time / audio_time)
         return output
 
+    def _get_vocoder_input(self, mel_postnet_spec: torch.Tensor) -> torch.Tensor:
+        """Convert a TTS model output spectrogram ``[T, C]`` into a vocoder input ``[1, C, T]``."""
+        mel_postnet_spec = mel_postnet_spec.detach().cpu().numpy()
+        # denormalize tts output based on tts audio config
+        mel_postnet_spec = self.tts_model.ap.denormalize(mel_postnet_spec.T).T
+        # renormalize spectrogram based on vocoder config
+        vocoder_input = self.vocoder_ap.normalize(mel_postnet_spec.T)
+        # compute scale factor for possible sample rate mismatch
+        scale_factor = [
+            1,
+            self.vocoder_config["audio"]["sample_rate"] / self.tts_model.ap.sample_rate,
+        ]
+        if scale_factor[1] != 1:
+            logger.info("Interpolating TTS model output.")
+            return interpolate_vocoder_input(scale_factor, vocoder_input)
+        return torch.tensor(vocoder_input).unsqueeze(0)  # pylint: disable=not-callable
+
+    @torch.inference_mode()
+    def _vocode_batch(self, vocoder_inputs: list[torch.Tensor]) -> list[np.ndarray]:
+        """Run the vocoder on several ``[1, C, T]`` inputs.
+
+        GAN vocoders process the inputs of the same length as one batch. Inputs are not padded to a common
+        length, the zero padding of the generator convolutions at the end of a shorter input would change its last
+        samples. WaveRNN samples all inputs in one batch with
+        :meth:`~TTS.vocoder.models.wavernn.Wavernn.inference_batch`. Other vocoders are run once per input.
+        """
+        device = self._vocoder_device()
+        if isinstance(self.vocoder_model, Wavernn):
+            return [w.squeeze() for w in self.vocoder_model.inference_batch([x.to(device) for x in vocoder_inputs])]
+        if not isinstance(self.vocoder_model, GAN) or len(vocoder_inputs) == 1:
+            return [self._run_vocoder(x).squeeze() for x in vocoder_inputs]
+        indices_by_length = defaultdict(list)
+        for i, x in enumerate(vocoder_inputs):
+            indices_by_length[x.shape[-1]].append(i)
+        waveforms = [None] * len(vocoder_inputs)
+        for indices in indices_by_length.values():
+            batch = torch.cat([vocoder_inputs[i] for i in indices]).to(device)
+            for i, waveform in zip(indices, self.vocoder_model.inference(batch).cpu().numpy()):
+                waveforms[i] = waveform.squeeze()
+        return waveforms
+
+    def _run_tts_model(
+        self,
+        text: str,
+        *,
+        speaker_name: str | None,
+        language_name: str | None,
+        speaker_wav,
+        voice_dir: Path | None,
+        **kwargs,
+    ) -> np.ndarray | torch.Tensor:
+        """Run the TTS model on a single sentence.
+
+        Returns:
+            The waveform if there is no separate vocoder, otherwise the vocoder input ``[1, C, T]``.
+        """
+        use_gl = self.vocoder_model is None
+        outputs = self.tts_model.synthesize(
+            text=text,
+            speaker=speaker_name,
+            voice_dir=voice_dir,
+            speaker_wav=speaker_wav,
+            language=language_name,
+            use_griffin_lim=use_gl,
+            **kwargs,
+        )
+        if use_gl:
+            return outputs["wav"]
+        return self._get_vocoder_input(outputs["outputs"]["model_outputs"][0])
+
+    def _vocoder_device(self) -> str | torch.device:
+        return "cuda" if self.use_cuda else next(self.vocoder_model.parameters()).device
+
+    def _run_vocoder(self, vocoder_input: torch.Tensor) -> np.ndarray:
+        # [1, T, C]
+        return self.vocoder_model.inference(vocoder_input.to(self._vocoder_device())).cpu().numpy()
+
+    def _trim_waveform(self, waveform: np.ndarray) -> np.ndarray:
+        waveform = waveform.squeeze()
+        if "do_trim_silence" in self.tts_config.audio and self.tts_config.audio["do_trim_silence"]:
+            waveform = waveform[: self.tts_model.ap.find_endpoint(waveform)]
+        return waveform
+
+    @staticmethod
+    def _style_kwargs(style_wav, style_text) -> dict:
+        """Return the style arguments that are set, for the models that support them (Tacotron with GST/Capacitron)."""
+        style = {"style_wav": style_wav, "style_text": style_text}
+        return {key: value for key, value in style.items() if value is not None}
+
+    def _synthesize_sentence(self, text: str, **kwargs) -> np.ndarray:
+        """Run the TTS model and the vocoder on a single sentence."""
+        waveform = self._run_tts_model(text, **kwargs)
+        if self.vocoder_model is not None:
+            waveform = self._run_vocoder(waveform)
+        return self._trim_waveform(waveform)
+
+    @classmethod
+    def _join_sentences(cls, waveforms: Iterable[np.ndarray | torch.Tensor]) -> np.ndarray:
+        """Concatenate sentence waveforms into one float32 array, with a pause after each sentence.
+
+        The chunks are collected first and copied once into the output, so long inputs don't build up
+        intermediate copies.
+        """
+        pause = np.zeros(cls.sentence_pause, dtype=np.float32)
+        chunks = []
+        for waveform in waveforms:
+            if isinstance(waveform, torch.Tensor):
+                waveform = waveform.detach().cpu().numpy()
+            chunks.append(np.asarray(waveform, dtype=np.float32).reshape(-1))
+            chunks.append(pause)
+        return np.concatenate(chunks)
+
+    def _synthesize_pipelined(self, sens: list[str], **kwargs) -> Iterator[np.ndarray]:
+        """Synthesize sentences one by one, overlapping the TTS model of a sentence with the previous one's vocoder.
+
+        The TTS model runs on a background thread and hands its outputs to the vocoder in the calling thread through
+        a bounded queue. Without a separate vocoder, or for a single sentence, the sentences are simply synthesized
+        in order.
+
+        Yields:
+            np.ndarray: the waveform of each sentence.
+        """
+        if self.vocoder_model is None or len(sens) == 1:
+            for sen in sens:
+                yield self._synthesize_sentence(sen, **kwargs)
+            return
+
+        vocoder_inputs: queue.Queue = queue.Queue(maxsize=self.pipeline_queue_size)
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    vocoder_inputs.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def run_tts_model() -> None:
+            try:
+                with torch.inference_mode():
+                    for sen in sens:
+                        if not put(self._run_tts_model(sen, **kwargs)):
+                            return
+            except Exception as e:  # pylint: disable=broad-except
+                put(e)
+                return
+            put(None)
+
+        thread = threading.Thread(target=run_tts_model, name="tts-acoustic-model", daemon=True)
+        thread.start()
+        try:
+            while (vocoder_input := vocoder_inputs.get()) is not None:
+                if isinstance(vocoder_input, Exception):
+                    raise vocoder_input
+                yield self._trim_waveform(self._run_vocoder(vocoder_input))
+        finally:
+            stop.set()
+            thread.join()
+
+    def _synthesize_sentences(
+        self,
+        sens: list[str],
+        *,
+        speaker_names: list[str | None],
+        language_names: list[str | None],
+        speaker_wavs: list,
+        **kwargs,
+    ) -> list[np.ndarray]:
+        """Run the TTS model on all sentences in one batch and the vocoder on the resulting spectrograms."""
+        voice_dir = Path(d) if (d := kwargs.pop("voice_dir", None)) is not None else self.voice_dir
+        use_gl = self.vocoder_model is None
+        outputs = self.tts_model.synthesize_batch(
+            sens,
+            speakers=speaker_names,
+            speaker_wavs=speaker_wavs,
+            voice_dir=voice_dir,
+            languages=language_names,
+            use_griffin_lim=use_gl,
+            **kwargs,
+        )
+        if use_gl:
+            waveforms = [output["wav"] for output in outputs]
+        else:
+            vocoder_inputs = [self._get_vocoder_input(output["outputs"]["model_outputs"][0]) for output in outputs]
+            waveforms = self._vocode_batch(vocoder_inputs)
+        return [self._trim_waveform(w.cpu().numpy() if isinstance(w, torch.Tensor) else w) for w in waveforms]
+
+    def tts_stream(
+        self,
+        text: str,
+        speaker_name: str | None = None,
+        language_name: str | None = None,
+        speaker_wav=None,
+        style_wav=None,
+        style_text=None,
+        split_sentences: bool = True,
+        **kwargs,
+    ) -> Iterator[np.ndarray]:
+        """Synthesize speech and yield the audio in chunks as soon as they are ready.
+
+        Models with a `synthesize_stream()` method (XTTS, Bark) yield several chunks per sentence while it is decoded,
+        other models yield each sentence once it is synthesized. Sentences are followed by the same pause as in
+        `tts()`.
+
+        Args:
+            text (str): input text.
+            speaker_name (str, optional): speaker id for multi-speaker models. Defaults to None.
+            language_name (str, optional): language id for multi-language models. Defaults to None.
+            speaker_wav (Union[str, List[str]], optional): path to the speaker wav for voice cloning. Defaults to None.
+            style_wav ([type], optional): style waveform for GST. Defaults to None.
+            style_text ([type], optional): transcription of style_wav for Capacitron. Defaults to None.
+            split_sentences (bool, optional): split the input text into sentences. Defaults to True.
+            **kwargs: additional arguments to pass to the TTS model.
+
+        Yields:
+            np.ndarray: the next float32 audio chunk.
+        """
+        if self.tts_model is None:
+            msg = "Text-to-speech model not loaded"
+            raise RuntimeError(msg)
+        if not text:
+            msg = "Streaming requires a `text` input."
+            raise ValueError(msg)
+        sens = self.split_into_sentences(text) if split_sentences else [text]
+        logger.info("Input: %s", sens)
+        voice_dir = Path(d) if (d := kwargs.pop("voice_dir", None)) is not None else self.voice_dir
+        kwargs.update(self._style_kwargs(style_wav, style_text))
+        pause = np.zeros(self.sentence_pause, dtype=np.float32)
+
+        if not hasattr(self.tts_model, "synthesize_stream"):
+            for waveform in self._synthesize_pipelined(
+                sens,
+                speaker_name=speaker_name,
+                language_name=language_name,
+                speaker_wav=speaker_wav,
+                voice_dir=voice_dir,
+                **kwargs,
+            ):
+                yield np.asarray(waveform, dtype=np.float32)
+                yield pause
+            return
+
+        for sen in sens:
+            for chunk in self.tts_model.synthesize_stream(
+                sen,
+                speaker=speaker_name,
+                speaker_wav=speaker_wav,
+                voice_dir=voice_dir,
+                language=language_name,
+                **kwargs,
+            ):
+                yield chunk.cpu().numpy().astype(np.float32, copy=False)
+            yield pause
+
+    def tts_batch(
+        self,
+        texts: list[str],
+        speaker_names: list[str | None] | None = None,
+        language_names: list[str | None] | None = None,
+        speaker_wavs: list | None = None,
+        style_wav=None,
+        style_text=None,
+        split_sentences: bool = True,
+        return_list: bool = False,
+        **kwargs,
+    ) -> list[np.ndarray] | list[list[float]]:
+        """Synthesize several texts at once.
+
+        The sentences of all texts go through the TTS model in a single `synthesize_batch()` call and the
+        resulting spectrograms through the vocoder in a single batch, where the models support it.
+
+        Args:
+            texts (List[str]): input texts.
+            speaker_names (List[str], optional): speaker id for each text. Defaults to None.
+            language_names (List[str], optional): language id for each text. Defaults to None.
+            speaker_wavs (List, optional): reference audio for each text. Defaults to None.
+            style_wav ([type], optional): style waveform for GST, shared by all texts. Defaults to None.
+            style_text ([type], optional): transcription of style_wav for Capacitron. Defaults to None.
+            split_sentences (bool, optional): split the input texts into sentences. Defaults to True.
+            return_list (bool, optional): return lists instead of arrays, see `tts()`. Defaults to False.
+            **kwargs: additional arguments to pass to the TTS model, shared by all texts.
+
+        Returns:
+            List[np.ndarray]: one waveform per text, in the same format as returned by `tts()`.
+        """
+        if self.tts_model is None:
+            msg = "Text-to-speech model not loaded"
+            raise RuntimeError(msg)
+        start_time = time.time()
+        speaker_names = speaker_names or [None] * len(texts)
+        language_names = language_names or [None] * len(texts)
+        speaker_wavs = speaker_wavs or [None] * len(texts)
+
+        # flatten the sentences of all texts and remember which text they belong to
+        sens, owners = [], []
+        for i, text in enumerate(texts):
+            text_sens = self.split_into_sentences(text) if split_sentences else [text]
+            sens += text_sens
+            owners += [i] * len(text_sens)
+        logger.info("Input: %s", sens)
+
+        waveforms = self._synthesize_sentences(
+            sens,
+            speaker_names=[speaker_names[i] for i in owners],
+            language_names=[language_names[i] for i in owners],
+            speaker_wavs=[speaker_wavs[i] for i in owners],
+            **self._style_kwargs(style_wav, style_text),
+            **kwargs,
+        )
+        text_waveforms = [[] for _ in texts]
+        for owner, waveform in zip(owners, waveforms):
+            text_waveforms[owner].append(waveform)
+        wavs = [self._join_sentences(w) for w in text_waveforms]
+
+        process_time = time.time() - start_time
+        audio_time = sum(len(wav) for wav in wavs) / self.tts_config.audio["sample_rate"]
+        logger.info("Processing time: %.3f", process_time)
+        logger.info("Real-time factor: %.3f", process_time / audio_time)
+        if return_list:
+            return [wav.tolist() for wav in wavs]
+        return wavs
+
     def tts(
         self,
         text: str = "",
@@ -325,10 +660,16 @@ class Synthesizer(nn.Module):
         source_wav=None,
         source_speaker_name=None,
         split_sentences: bool = True,
+        batch_sentences: bool | None = None,
+        return_list: bool = False,
         **kwargs,
-    ) -> list[int]:
+    ) -> np.ndarray | list[float]:
         """🐸 TTS magic. Run all the models and generate speech.
 
+        For models with batched inference support (e.g. VITS, Glow-TTS, FastPitch), the sentences can go through the
+        TTS model and the vocoder in a single batch. This is done by default on GPUs only. On CPUs, the sentences are
+        synthesized one by one, because padding them to the longest one adds more work than batching saves.
+
         Args:
             text (str): input text.
             speaker_name (str, optional): speaker id for multi-speaker models. Defaults to "".
@@ -339,15 +680,18 @@ class Synthesizer(nn.Module):
             source_wav ([type], optional): source waveform for voice conversion. Defaults to None.
             source_speaker_name ([type], optional): speaker id of source waveform. Defaults to None.
             split_sentences (bool, optional): split the input text into sentences. Defaults to True.
+            batch_sentences (bool, optional): synthesize all sentences in one batch if the model supports it.
+                Defaults to None, which batches the sentences on GPUs only.
+            return_list (bool, optional): return the waveform as a list of floats, as in earlier versions, instead
+                of a float32 array. Defaults to False.
             **kwargs: additional arguments to pass to the TTS model.
         Returns:
-            List[int]: [description]
+            np.ndarray: the float32 waveform, with a pause after each sentence.
         """
         if self.tts_model is None:
             msg = "Text-to-speech model not loaded"
             raise RuntimeError(msg)
         start_time = time.time()
-        wavs = []
 
         if not text and not speaker_wav and not speaker_name:
             msg = (
@@ -364,6 +708,7 @@ class Synthesizer(nn.Module):
             logger.info("Input: %s", sens)
 
         voice_dir = Path(d) if (d := kwargs.pop("voice_dir", None)) is not None else self.voice_dir
+        kwargs.update(self._style_kwargs(style_wav, style_text))
         vocoder_device = "cpu"
         use_gl = self.vocoder_model is None
         if not use_gl:
@@ -371,82 +716,52 @@ class Synthesizer(nn.Module):
         if self.use_cuda:
             vocoder_device = "cuda"
 
-        if not source_wav:  # not voice conversion
-            for sen in sens:
-                outputs = self.tts_model.synthesize(
-                    text=sen,
-                    speaker=speaker_name,
+        # padding the sentences to the longest one only pays off on GPUs
+        batch_sentences = getattr(self.tts_model, "supports_batched_inference", False) and (
+            batch_sentences if batch_sentences is not None else self.tts_model.device.type != "cpu"
+        )
+        if not source_wav and len(sens) > 1 and batch_sentences:
+            # synthesize all sentences in one batch
+            wavs = self._join_sentences(
+                self._synthesize_sentences(
+                    sens,
+                    speaker_names=[speaker_name] * len(sens),
+                    language_names=[language_name] * len(sens),
+                    speaker_wavs=[speaker_wav] * len(sens),
                     voice_dir=voice_dir,
+                    **kwargs,
+                )
+            )
+        elif not source_wav:  # not voice conversion
+            wavs = self._join_sentences(
+                self._synthesize_pipelined(
+                    sens,
+                    speaker_name=speaker_name,
+                    language_name=language_name,
                     speaker_wav=speaker_wav,
-                    language=language_name,
-                    use_griffin_lim=use_gl,
+                    voice_dir=voice_dir,
                     **kwargs,
                 )
-                waveform = outputs["wav"]
-                if not use_gl:
-                    mel_postnet_spec = outputs["outputs"]["model_outputs"][0].detach().cpu().numpy()
-                    # denormalize tts output based on tts audio config
-                    mel_postnet_spec = self.tts_model.ap.denormalize(mel_postnet_spec.T).T
-                    # renormalize spectrogram based on vocoder config
-                    vocoder_input = self.vocoder_ap.normalize(mel_postnet_spec.T)
-                    # compute scale factor for possible sample rate mismatch
-                    scale_factor = [
-                        1,
-                        self.vocoder_config["audio"]["sample_rate"] / self.tts_model.ap.sample_rate,
-                    ]
-                    if scale_factor[1] != 1:
-                        logger.info("Interpolating TTS model output.")
-                        vocoder_input = interpolate_vocoder_input(scale_factor, vocoder_input)
-                    else:
-                        vocoder_input = torch.tensor(vocoder_input).unsqueeze(0)  # pylint: disable=not-callable
-                    # run vocoder model
-                    # [1, T, C]
-                    waveform = self.vocoder_model.inference(vocoder_input.to(vocoder_device))
-                if isinstance(waveform, torch.Tensor) and waveform.device != torch.device("cpu") and not use_gl:
-                    waveform = waveform.cpu()
-                if not use_gl:
-                    waveform = waveform.numpy()
-                waveform = waveform.squeeze()
-
-                # trim silence
-                if "do_trim_silence" in self.tts_config.audio and self.tts_config.audio["do_trim_silence"]:
-                    waveform = waveform[: self.tts_model.ap.find_endpoint(waveform)]
-
-                wavs += list(waveform)
-                wavs += [0] * 10000
+            )
         else:
             outputs = self.tts_model.voice_conversion(
                 source_wav, speaker_wav, source_speaker=source_speaker_name, speaker=speaker_name, voice_dir=voice_dir
             )
             waveform = outputs
             if not use_gl:
-                mel_postnet_spec = outputs[0].detach().cpu().numpy()
-                # denormalize tts output based on tts audio config
-                mel_postnet_spec = self.tts_model.ap.denormalize(mel_postnet_spec.T).T
-                # renormalize spectrogram based on vocoder config
-                vocoder_input = self.vocoder_ap.normalize(mel_postnet_spec.T)
-                # compute scale factor for possible sample rate mismatch
-                scale_factor = [
-                    1,
-                    self.vocoder_config["audio"]["sample_rate"] / self.tts_model.ap.sample_rate,
-                ]
-                if scale_factor[1] != 1:
-                    logger.info("Interpolating TTS model output.")
-                    vocoder_input = interpolate_vocoder_input(scale_factor, vocoder_input)
-                else:
-                    vocoder_input = torch.tensor(vocoder_input).unsqueeze(0)  # pylint: disable=not-callable
+                vocoder_input = self._get_vocoder_input(outputs[0])
                 # run vocoder model
                 # [1, T, C]
                 waveform = self.vocoder_model.inference(vocoder_input.to(vocoder_device))
-            if isinstance(waveform, torch.Tensor) and waveform.device != torch.device("cpu"):
-                waveform = waveform.cpu()
-            if not use_gl:
-                waveform = waveform.numpy()
-            wavs = waveform.squeeze()
+            if isinstance(waveform, torch.Tensor):
+                waveform = waveform.detach().cpu().numpy()
+            wavs = np.asarray(waveform.squeeze(), dtype=np.float32)
 
         # compute stats
         process_time = time.time() - start_time
         audio_time = len(wavs) / self.tts_config.audio["sample_rate"]
         logger.info("Processing time: %.3f", process_time)
         logger.info("Real-time factor: %.3f", process_time / audio_time)
+        if return_list:
+            return wavs.tolist()
         return wavs
@@ -4,10 +4,15 @@ import datetime
 import importlib.metadata
 import logging
 import os
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Hashable
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import torch
 
 from TTS.utils.generic_utils import is_pytorch_at_least_2_4, slugify
@@ -46,6 +51,98 @@ class VoiceMetadata:
         return cls(**data)
 
 
+def _nbytes(value: Any) -> int:
+    """Approximate memory used by the tensors and arrays in a (nested) voice dictionary."""
+    if isinstance(value, torch.Tensor):
+        return value.element_size() * value.nelement()
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(v) for v in value)
+    return 0
+
+
+def _file_state(path: str | os.PathLike[Any]) -> tuple[str, int, int]:
+    """Identify a file version by its resolved path, modification time and size, without reading it."""
+    path = Path(path).resolve()
+    stat = path.stat()
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+class VoiceCache:
+    """Thread-safe in-memory LRU cache of cloned and loaded voices.
+
+    Entries are evicted in least recently used order once there are more than ``max_entries`` of them or their
+    tensors take up more than ``max_bytes``. Keys include the modification time and size of the source files, so
+    changed files are never served from the cache. A process-wide instance is available as :data:`voice_cache`.
+
+    Args:
+        max_entries: Maximum number of cached voices. 0 disables the cache.
+        max_bytes: Maximum total size of the cached tensors and arrays.
+    """
+
+    def __init__(self, max_entries: int = 64, max_bytes: int = 512 * 2**20) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._num_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for ``key`` or ``None``."""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Add a value to the cache. Values larger than ``max_bytes`` are not cached."""
+        num_bytes = _nbytes(value)
+        if self.max_entries <= 0 or num_bytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._num_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, num_bytes)
+            self._num_bytes += num_bytes
+            while len(self._entries) > self.max_entries or self._num_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self._num_bytes -= evicted_bytes
+                self.evictions += 1
+
+    def invalidate(self, model_id: str | None = None) -> None:
+        """Remove all entries of the given model, or all entries if ``model_id`` is ``None``."""
+        with self._lock:
+            for key in list(self._entries):
+                if model_id is None or key[0] == model_id:
+                    self._num_bytes -= self._entries.pop(key)[1]
+
+    def stats(self) -> dict[str, int]:
+        """Return the hit/miss counters and the current size of the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._num_bytes,
+            }
+
+
+voice_cache = VoiceCache()
+
+
 class CloningMixin:
     """Add voice cloning with caching support.
 
@@ -79,6 +176,9 @@ class CloningMixin:
         specified. If there already is a voice for ``speaker_id``, it will be overwritten with
         the newly generated one.
 
+        Generated and loaded voices are also kept in the in-memory :data:`voice_cache`, so
+        repeated requests with the same unchanged files skip the audio processing and loading.
+
         Args:
             speaker_wav:
                 Path(s) to the reference audio files.
@@ -97,9 +197,8 @@ class CloningMixin:
             if voice_dir is None:
                 msg = "Specified only `speaker_id`, but no `voice_dir` to load the voice from"
                 raise RuntimeError(msg)
-            return self.load_voice_file(speaker_id, voice_dir)
-        voice, model_metadata = self._clone_voice(speaker_wav, **generate_kwargs)
-        logger.info("Generated voice from reference audio")
+            return self._load_voice_file_cached(speaker_id, voice_dir)
+        voice, model_metadata = self._clone_voice_cached(speaker_wav, **generate_kwargs)
         if speaker_id is not None and voice_dir is not None:
             speaker_id = slugify(speaker_id)
             voice_fn = Path(voice_dir) / f"{speaker_id}.pth"
@@ -114,6 +213,52 @@ class CloningMixin:
             logger.info("Voice `%s` saved to: %s", speaker_id, voice_fn)
         return voice
 
+    @property
+    def voice_cache_id(self) -> str:
+        """Unique ID of this model instance in the :data:`voice_cache`."""
+        if getattr(self, "_voice_cache_id", None) is None:
+            self._voice_cache_id = uuid.uuid4().hex
+        return self._voice_cache_id
+
+    def clear_voice_cache(self) -> None:
+        """Remove all voices of this model from the :data:`voice_cache`."""
+        voice_cache.invalidate(self.voice_cache_id)
+
+    def _clone_voice_cached(
+        self,
+        speaker_wav: str | os.PathLike[Any] | list[str | os.PathLike[Any]],
+        **generate_kwargs: Any,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Call ``_clone_voice()``, unless the same reference audio was already cloned with the same settings."""
+        speaker_wavs = speaker_wav if isinstance(speaker_wav, list) else [speaker_wav]
+        try:
+            files = tuple(_file_state(wav) for wav in speaker_wavs)
+        except (OSError, TypeError):
+            # not a local file, e.g. an URL
+            voice, model_metadata = self._clone_voice(speaker_wav, **generate_kwargs)
+            logger.info("Generated voice from reference audio")
+            return voice, model_metadata
+        key = (self.voice_cache_id, "clone", files, repr(sorted(generate_kwargs.items())))
+        if (cached := voice_cache.get(key)) is not None:
+            logger.info("Reusing voice generated from the same reference audio")
+            return dict(cached[0]), dict(cached[1])
+        voice, model_metadata = self._clone_voice(speaker_wav, **generate_kwargs)
+        logger.info("Generated voice from reference audio")
+        voice_cache.put(key, (voice, model_metadata))
+        return dict(voice), dict(model_metadata)
+
+    def _load_voice_file_cached(self, speaker_id: str, voice_dir: str | os.PathLike[Any]) -> dict[str, Any]:
+        """Call ``load_voice_file()``, unless the voice file was already loaded and has not changed since."""
+        candidates = [Path(voice_dir) / f"{speaker_id}{suffix}" for suffix in (".pth", ".npz")]
+        files = tuple(_file_state(path) for path in candidates if path.is_file())
+        if not files:
+            return self.load_voice_file(speaker_id, voice_dir)
+        key = (self.voice_cache_id, "file", files)
+        if (voice := voice_cache.get(key)) is None:
+            voice = self.load_voice_file(speaker_id, voice_dir)
+            voice_cache.put(key, voice)
+        return dict(voice)
+
     def _clone_voice(
         self,
         speaker_wav: str | os.PathLike[Any] | list[str | os.PathLike[Any]],
@@ -298,105 +298,157 @@ class Wavernn(BaseVocoder):
         x = F.relu(self.fc2(x))
         return self.fc3(x)
 
-    def inference(self, mels, batched=None, target=None, overlap=None):
-        self.eval()
-        output = []
-        start = time.time()
-        rnn1 = self.get_gru_cell(self.rnn1)
-        rnn2 = self.get_gru_cell(self.rnn2)
-
-        with torch.inference_mode():
-            if isinstance(mels, np.ndarray):
-                mels = torch.FloatTensor(mels).to(str(next(self.parameters()).device))
-
-            if mels.ndim == 2:
-                mels = mels.unsqueeze(0)
-            wave_len = (mels.size(-1) - 1) * self.config.audio.hop_length
+    def inference(self, mels, batched=None, target=None, overlap=None, verbose=False):
+        """Generate a waveform from a mel spectrogram.
 
-            mels = self.pad_tensor(mels.transpose(1, 2), pad=self.args.pad, side="both")
-            mels, aux = self.upsample(mels.transpose(1, 2))
+        Args:
+            mels (torch.Tensor | np.ndarray): Mel spectrogram ``[C, T]`` or ``[1, C, T]``.
+            batched (bool): Fold the input into overlapping segments that are generated in parallel and crossfaded
+                afterwards. Defaults to None.
+            target (int): Number of samples generated by each fold.
+            overlap (int): Number of samples used for the crossfade and the RNN warmup of each fold.
+            verbose (bool): Print the generation speed. Defaults to False.
+
+        Returns:
+            np.ndarray: The waveform.
+        """
+        return self.inference_batch([mels], batched, target, overlap, verbose=verbose)[0]
 
-            if batched:
-                mels = self.fold_with_overlap(mels, target, overlap)
-                if aux is not None:
-                    aux = self.fold_with_overlap(aux, target, overlap)
+    @torch.inference_mode()
+    def inference_batch(self, mels, batched=None, target=None, overlap=None, verbose=False):
+        """Generate the waveforms of several mel spectrograms at once.
 
-            b_size, seq_len, _ = mels.size()
+        The utterances, or all their folds with ``batched``, are sampled as one batch of the recurrent network. The
+        model is used in its current mode, call ``eval()`` before inference.
 
-            h1 = torch.zeros(b_size, self.args.rnn_dims).type_as(mels)
-            h2 = torch.zeros(b_size, self.args.rnn_dims).type_as(mels)
-            x = torch.zeros(b_size, 1).type_as(mels)
+        Args:
+            mels (list): Mel spectrograms ``[C, T]`` or ``[1, C, T]`` as tensors or arrays.
+            batched (bool): Fold the inputs into overlapping segments. See :meth:`inference`.
+            target (int): Number of samples generated by each fold.
+            overlap (int): Number of samples used for the crossfade and the RNN warmup of each fold.
+            verbose (bool): Print the generation speed. Defaults to False.
+
+        Returns:
+            list[np.ndarray]: One waveform per input.
+        """
+        device = next(self.parameters()).device
+        hop_length = self.config.audio.hop_length
+        conds = []
+        wave_lens = []
+        for mel in mels:
+            mel = torch.as_tensor(mel, dtype=torch.float32, device=device)
+            if mel.ndim == 2:
+                mel = mel.unsqueeze(0)
+            wave_lens.append((mel.size(-1) - 1) * hop_length)
+            mel = self.pad_tensor(mel.transpose(1, 2), pad=self.args.pad, side="both")
+            mel, aux = self.upsample(mel.transpose(1, 2))
+            cond = mel if aux is None else torch.cat([mel, aux], dim=2)
+            conds.append(self.fold_with_overlap(cond, target, overlap) if batched else cond)
 
-            if self.args.use_aux_net:
-                d = self.aux_dims
-                aux_split = [aux[:, :, d * i : d * (i + 1)] for i in range(4)]
-
-            for i in range(seq_len):
-                m_t = mels[:, i, :]
-
-                if self.args.use_aux_net:
-                    a1_t, a2_t, a3_t, a4_t = (a[:, i, :] for a in aux_split)
-
-                x = torch.cat([x, m_t, a1_t], dim=1) if self.args.use_aux_net else torch.cat([x, m_t], dim=1)
-                x = self.I(x)
-                h1 = rnn1(x, h1)
-
-                x = x + h1
-                inp = torch.cat([x, a2_t], dim=1) if self.args.use_aux_net else x
-                h2 = rnn2(inp, h2)
-
-                x = x + h2
-                x = torch.cat([x, a3_t], dim=1) if self.args.use_aux_net else x
-                x = F.relu(self.fc1(x))
-
-                x = torch.cat([x, a4_t], dim=1) if self.args.use_aux_net else x
-                x = F.relu(self.fc2(x))
-
-                logits = self.fc3(x)
-
-                if self.args.mode == "mold":
-                    sample = sample_from_discretized_mix_logistic(logits.unsqueeze(0).transpose(1, 2))
-                    output.append(sample.view(-1))
-                    x = sample.transpose(0, 1).type_as(mels)
-                elif self.args.mode == "gauss":
-                    sample = sample_from_gaussian(logits.unsqueeze(0).transpose(1, 2))
-                    output.append(sample.view(-1))
-                    x = sample.transpose(0, 1).type_as(mels)
-                elif isinstance(self.args.mode, int):
-                    posterior = F.softmax(logits, dim=1)
-                    distrib = torch.distributions.Categorical(posterior)
-
-                    sample = 2 * distrib.sample().float() / (self.n_classes - 1.0) - 1.0
-                    output.append(sample)
-                    x = sample.unsqueeze(-1)
-                else:
-                    raise RuntimeError("Unknown model mode value - ", self.args.mode)
-
-                if i % 100 == 0:
-                    self.gen_display(i, seq_len, b_size, start)
-
-        output = torch.stack(output).transpose(0, 1)
-        output = output.cpu()
         if batched:
-            output = output.numpy()
-            output = output.astype(np.float64)
-
-            output = self.xfade_and_unfold(output, target, overlap)
+            outputs = self._generate(torch.cat(conds), verbose=verbose).cpu().double().numpy()
+            folds = np.cumsum([cond.shape[0] for cond in conds])[:-1]
+            outputs = [self.xfade_and_unfold(y, target, overlap) for y in np.split(outputs, folds)]
         else:
-            output = output[0]
-
-        if self.args.mulaw and isinstance(self.args.mode, int):
-            output = mulaw_decode(wav=output, mulaw_qc=self.args.mode)
-
-        # Fade-out at the end to avoid signal cutting out suddenly
-        fade_out = np.linspace(1, 0, 20 * self.config.audio.hop_length)
-        output = output[:wave_len]
-
-        if wave_len > len(fade_out):
-            output[-20 * self.config.audio.hop_length :] *= fade_out
+            seq_len = max(cond.shape[1] for cond in conds)
+            conds = [self.pad_tensor(cond, seq_len - cond.shape[1], side="after") for cond in conds]
+            outputs = list(self._generate(torch.cat(conds), verbose=verbose).cpu().numpy())
+
+        fade_len = 20 * hop_length
+        waveforms = []
+        for output, wave_len in zip(outputs, wave_lens):
+            if self.args.mulaw and isinstance(self.args.mode, int):
+                output = mulaw_decode(wav=output, mulaw_qc=self.args.mode)
+            output = output[:wave_len]
+            # Fade-out at the end to avoid signal cutting out suddenly
+            if wave_len > fade_len:
+                output[-fade_len:] *= np.linspace(1, 0, fade_len)
+            waveforms.append(output)
+        return waveforms
+
+    def _generate(self, cond, verbose=False, chunk_size=1024):
+        """Sample a batch of waveforms from upsampled conditioning features ``[B, T, C]``.
+
+        The layer inputs are concatenations of the previous sample or hidden state and of conditioning features. The
+        parts that only depend on the conditioning features are computed ``chunk_size`` steps at a time into buffers
+        that are reused, so each step only multiplies the previous sample and the hidden states.
+
+        Returns:
+            torch.Tensor: The samples ``[B, T]``.
+        """
+        b_size, seq_len, _ = cond.shape
+        rnn_dims, fc_dims = self.args.rnn_dims, self.args.fc_dims
+        cond_dims = self.args.feat_dims + (self.aux_dims if self.args.use_aux_net else 0)
+        w_sample = self.I.weight[:, 0]
+        w_ih1_sample = self.rnn1.weight_ih_l0 @ w_sample
+        w_ih2, w_fc1, w_fc2 = self.rnn2.weight_ih_l0, self.fc1.weight, self.fc2.weight
+        # weights applied to the previous sample and the hidden states at each step
+        w_hh1, b_hh1 = self.rnn1.weight_hh_l0.T, self.rnn1.bias_hh_l0
+        w_hh2, b_hh2 = self.rnn2.weight_hh_l0.T, self.rnn2.bias_hh_l0
+        w_ih2_x, w_fc1_x, w_fc2_x = w_ih2[:, :rnn_dims].T, w_fc1[:, :rnn_dims].T, w_fc2[:, :fc_dims].T
+        w_fc3, b_fc3 = self.fc3.weight.T, self.fc3.bias
+
+        cond = cond.transpose(0, 1)  # time first, so that the slices of the buffers are contiguous
+        cond_i = cond.new_empty(chunk_size, b_size, rnn_dims)
+        cond_ih1 = cond.new_empty(chunk_size, b_size, 3 * rnn_dims)
+        cond_ih2 = cond.new_empty(chunk_size, b_size, 3 * rnn_dims)
+        cond_fc1 = cond.new_empty(chunk_size, b_size, fc_dims)
+        cond_fc2 = cond.new_empty(chunk_size, b_size, fc_dims)
+
+        def fill_buffers(start):
+            c = cond[start : start + chunk_size]
+            n = c.shape[0]
+            torch.matmul(c[..., :cond_dims], self.I.weight[:, 1:].T, out=cond_i[:n]).add_(self.I.bias)
+            torch.matmul(cond_i[:n], self.rnn1.weight_ih_l0.T, out=cond_ih1[:n]).add_(self.rnn1.bias_ih_l0)
+            if self.args.use_aux_net:
+                a2, a3, a4 = c[..., cond_dims:].chunk(3, dim=-1)
+                torch.matmul(a2, w_ih2[:, rnn_dims:].T, out=cond_ih2[:n]).add_(self.rnn2.bias_ih_l0)
+                torch.matmul(a3, w_fc1[:, rnn_dims:].T, out=cond_fc1[:n]).add_(self.fc1.bias)
+                torch.matmul(a4, w_fc2[:, fc_dims:].T, out=cond_fc2[:n]).add_(self.fc2.bias)
+            else:
+                cond_ih2[:n] = self.rnn2.bias_ih_l0
+                cond_fc1[:n] = self.fc1.bias
+                cond_fc2[:n] = self.fc2.bias
+
+        h1 = cond.new_zeros(b_size, rnn_dims)
+        h2 = cond.new_zeros(b_size, rnn_dims)
+        x = cond.new_zeros(b_size, 1)
+        output = cond.new_empty(seq_len, b_size)
+        start = time.time()
+        for i in range(seq_len):
+            j = i % chunk_size
+            if j == 0:
+                fill_buffers(i)
+            x_i = torch.addcmul(cond_i[j], x, w_sample)
+            h1 = self._gru_cell(torch.addcmul(cond_ih1[j], x, w_ih1_sample), torch.addmm(b_hh1, h1, w_hh1), h1)
+            x = x_i + h1
+            h2 = self._gru_cell(torch.addmm(cond_ih2[j], x, w_ih2_x), torch.addmm(b_hh2, h2, w_hh2), h2)
+            x = x + h2
+            x = torch.addmm(cond_fc1[j], x, w_fc1_x).relu_()
+            x = torch.addmm(cond_fc2[j], x, w_fc2_x).relu_()
+            x = self._sample(torch.addmm(b_fc3, x, w_fc3))
+            output[i] = x[:, 0]
+
+            if verbose and i % 100 == 0:
+                self.gen_display(i, seq_len, b_size, start)
+        return output.T
 
-        self.train()
-        return output
+    @staticmethod
+    def _gru_cell(gi, gh, h):
+        """GRU cell update from the input and hidden state projections, like :class:`torch.nn.GRUCell`."""
+        hidden_size = h.shape[1]
+        r, z = torch.sigmoid(gi[:, : 2 * hidden_size] + gh[:, : 2 * hidden_size]).chunk(2, dim=1)
+        n = torch.tanh(torch.addcmul(gi[:, 2 * hidden_size :], r, gh[:, 2 * hidden_size :]))
+        return torch.lerp(n, h, z)
+
+    def _sample(self, logits):
+        """Sample the next values ``[B, 1]`` from the output logits ``[B, n_classes]``."""
+        if self.args.mode == "mold":
+            return sample_from_discretized_mix_logistic(logits.T.unsqueeze(0)).T
+        if self.args.mode == "gauss":
+            return sample_from_gaussian(logits.unsqueeze(1)).squeeze(1)
+        posterior = F.softmax(logits, dim=1)
+        return 2 * torch.multinomial(posterior, 1, True).float() / (self.n_classes - 1.0) - 1.0
 
     def gen_display(self, i, seq_len, b_size, start):
         gen_rate = (i + 1) / (time.time() - start) * b_size / 1000
@@ -438,15 +490,8 @@ class Wavernn(BaseVocoder):
             padding = target + 2 * overlap - remaining
             x = self.pad_tensor(x, padding, side="after")
 
-        folded = torch.zeros(num_folds, target + 2 * overlap, features).to(x.device)
-
-        # Get the values for the folded tensor
-        for i in range(num_folds):
-            start = i * (target + overlap)
-            end = start + target + 2 * overlap
-            folded[i] = x[:, start:end, :]
-
-        return folded
+        # Overlapping windows as a strided view of the input
+        return x[0].unfold(0, target + 2 * overlap, target + overlap).transpose(1, 2)
 
     @staticmethod
     def get_gru_cell(gru):
@@ -516,15 +561,12 @@ class Wavernn(BaseVocoder):
         y[:, :overlap] *= fade_in
         y[:, -overlap:] *= fade_out
 
-        unfolded = np.zeros((total_len), dtype=np.float64)
-
-        # Loop to add up all the samples
-        for i in range(num_folds):
-            start = i * (target + overlap)
-            end = start + target + 2 * overlap
-            unfolded[start:end] += y[i]
-
-        return unfolded
+        # Add up all the samples, each fold overlaps with the next one by `overlap` samples
+        hop = target + overlap
+        unfolded = np.zeros((num_folds + 1) * hop, dtype=np.float64)
+        unfolded[: num_folds * hop] = y[:, :hop].reshape(-1)
+        unfolded[hop:].reshape(num_folds, hop)[:, :overlap] += y[:, hop:]
+        return unfolded[:total_len]
 
     def train_step(self, batch: dict, criterion: dict) -> tuple[dict, dict]:
         mels = batch["input"]
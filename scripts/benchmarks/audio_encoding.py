@@ -0,0 +1,86 @@
+"""Encoding time and peak memory of complete `/v1/audio/speech` responses per format.
+
+Compares `TTS.server.streaming.encode_audio()` with the former path of the server, which wrote a WAV file with
+`save_wav()`, decoded it with `torchaudio.load()` and encoded it again with `torchaudio.save()`. A random waveform
+is used, so no model is needed. Peak memory is measured with tracemalloc, which tracks NumPy arrays and Python
+objects but not allocations inside torch or the audio libraries.
+
+Example:
+    python scripts/benchmarks/audio_encoding.py --seconds 120
+"""
+
+import argparse
+import io
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+import torch
+import torchaudio
+
+from TTS.server.streaming import AUDIO_FORMATS, encode_audio
+from TTS.utils.audio.numpy_transforms import save_wav
+
+TORCHAUDIO_ARGS = {
+    "mp3": {"format": "mp3"},
+    "opus": {"format": "ogg", "encoding": "opus"},
+    "aac": {"format": "mp4", "encoding": "aac"},
+    "flac": {"format": "flac"},
+}
+
+
+def encode_former(wav, fmt, sample_rate):
+    out = io.BytesIO()
+    save_wav(wav=wav, path=out, sample_rate=sample_rate)
+    if fmt == "wav":
+        return out.getvalue()
+    out.seek(0)
+    waveform, sample_rate = torchaudio.load(out)
+    if fmt == "pcm":
+        return (waveform * 32767).to(torch.int16).numpy().tobytes()
+    buffer = io.BytesIO()
+    torchaudio.save(buffer, waveform, sample_rate, **TORCHAUDIO_ARGS[fmt])
+    return buffer.getvalue()
+
+
+def measure(encode, wav, fmt, sample_rate, repeat):
+    try:
+        encode(wav, fmt, sample_rate)
+    except Exception:  # pylint: disable=broad-except
+        return None
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        encode(wav, fmt, sample_rate)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    encode(wav, fmt, sample_rate)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(times), peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=60.0, help="Length of the audio.")
+    parser.add_argument("--sample_rate", type=int, default=22050)
+    parser.add_argument("--formats", nargs="+", default=list(AUDIO_FORMATS), choices=list(AUDIO_FORMATS))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    wav = (0.5 * rng.uniform(-1, 1, int(args.seconds * args.sample_rate))).astype(np.float32)
+    print(f"{args.seconds:.0f}s of audio at {args.sample_rate} Hz")
+    print(f"{'format':<8}{'former s':>10}{'MiB':>8}{'encode_audio s':>16}{'MiB':>8}")
+    for fmt in args.formats:
+        row = f"{fmt:<8}"
+        for encode in (encode_former, encode_audio):
+            result = measure(encode, wav, fmt, args.sample_rate, args.repeat)
+            width = 10 if encode is encode_former else 16
+            row += f"{'n/a':>{width}}{'':>8}" if result is None else f"{result[0]:>{width}.3f}{result[1]:>8.1f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
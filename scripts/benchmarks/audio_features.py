@@ -0,0 +1,54 @@
+"""Feature extraction time of `AudioProcessor` per backend, as done by `TTSDataset.collate_fn`.
+
+Batches of ``--batch_size`` LJSpeech test clips are converted to melspectrograms (and linear spectrograms with
+``--linear``) with the default ``BaseAudioConfig``. ``--seconds`` crops the clips to the same length, like the
+speaker encoder dataset does; otherwise the clips keep their different lengths and are zero padded in the torch
+backend.
+
+Example:
+    python scripts/benchmarks/audio_features.py --batch_size 16 --seconds 2
+"""
+
+import argparse
+import os
+import time
+
+import torch
+
+from TTS.config import BaseAudioConfig
+from TTS.utils.audio.processor import AudioProcessor
+
+WAV_DIR = os.path.join(os.path.dirname(__file__), "../../tests/data/ljspeech/wavs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch_size", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=None, help="Crop the clips to this length.")
+    parser.add_argument("--linear", action="store_true", help="Also compute linear spectrograms.")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    ap = AudioProcessor(**BaseAudioConfig())
+    files = sorted(f for f in os.listdir(WAV_DIR) if f.endswith(".wav"))[: args.batch_size]
+    wavs = [ap.load_wav(os.path.join(WAV_DIR, f)) for f in files]
+    if args.seconds is not None:
+        wavs = [wav[: int(args.seconds * ap.sample_rate)] for wav in wavs]
+    seconds = sum(len(wav) for wav in wavs) / ap.sample_rate
+
+    print(f"{torch.get_num_threads()} CPU threads, {len(wavs)} clips, {seconds:.1f}s of audio")
+    print(f"{'backend':<10}{'ms/batch':>10}")
+    for backend in ("numpy", "torch"):
+        ap = AudioProcessor(**BaseAudioConfig(feature_backend=backend))
+        ap.melspectrogram_batch(wavs)  # warm up
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            ap.melspectrogram_batch(wavs)
+            if args.linear:
+                ap.spectrogram_batch(wavs)
+        elapsed = (time.perf_counter() - start) / args.repeats
+        print(f"{backend:<10}{elapsed * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
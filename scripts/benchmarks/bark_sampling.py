@@ -0,0 +1,107 @@
+"""Tokens per second of the Bark semantic and coarse stages for several concurrent prompts.
+
+Each batch size is run once with the prompts generated one after the other and once as a single batch. Randomly
+initialised GPT models are used (by default of the size of the small Bark models), so no model download is needed.
+The end of sentence token is disabled so that every prompt generates the same number of tokens.
+
+Example:
+    python scripts/benchmarks/bark_sampling.py --batch_sizes 1 4 8 --max_gen_duration_s 2
+"""
+
+import argparse
+import time
+from types import SimpleNamespace
+
+import torch
+
+from TTS.tts.layers.bark.inference_funcs import (
+    generate_coarse,
+    generate_coarse_batch,
+    generate_text_semantic,
+    generate_text_semantic_batch,
+)
+from TTS.tts.layers.bark.model import GPT, GPTConfig
+
+# token IDs of the default BarkConfig, which can't be imported without downloading the Bark tokenizer
+BARK_CONFIG = SimpleNamespace(
+    SEMANTIC_RATE_HZ=49.9,
+    SEMANTIC_VOCAB_SIZE=10_000,
+    CODEBOOK_SIZE=1024,
+    N_COARSE_CODEBOOKS=2,
+    COARSE_RATE_HZ=75,
+    TEXT_ENCODING_OFFSET=10_048,
+    SEMANTIC_PAD_TOKEN=10_000,
+    TEXT_PAD_TOKEN=129_595,
+    SEMANTIC_INFER_TOKEN=129_599,
+    COARSE_SEMANTIC_PAD_TOKEN=12_048,
+    COARSE_INFER_TOKEN=12_050,
+)
+TEXT = "Hello, my name is Suno. And, uh — and I like pizza."
+
+
+class CharTokenizer:
+    def encode(self, text, add_special_tokens=False):  # pylint: disable=unused-argument
+        return [ord(c) % 1000 for c in text]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch_sizes", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--max_gen_duration_s", type=float, default=2.0, help="Length of the generated audio.")
+    parser.add_argument("--n_layer", type=int, default=12)
+    parser.add_argument("--n_embd", type=int, default=768)
+    parser.add_argument("--n_head", type=int, default=12)
+    args = parser.parse_args()
+
+    def gpt(input_vocab_size, output_vocab_size):
+        config = GPTConfig(
+            n_layer=args.n_layer,
+            n_head=args.n_head,
+            n_embd=args.n_embd,
+            input_vocab_size=input_vocab_size,
+            output_vocab_size=output_vocab_size,
+        )
+        return GPT(config).eval()
+
+    torch.manual_seed(0)
+    model = SimpleNamespace(
+        config=BARK_CONFIG,
+        semantic_model=gpt(129_600, 10_048),
+        coarse_model=gpt(12_096, 12_096),
+        tokenizer=CharTokenizer(),
+        device=torch.device("cpu"),
+    )
+    history = (None, None, None)
+    semantic_args = {"max_gen_duration_s": args.max_gen_duration_s, "allow_early_stop": False, "silent": True}
+
+    print(f"{torch.get_num_threads()} CPU threads, tokens/s (speedup over one prompt at a time)")
+    print(f"{'prompts':<9}{'semantic':>20}{'coarse':>20}")
+    for batch_size in args.batch_sizes:
+        texts = [TEXT] * batch_size
+        semantic, semantic_single = timed(
+            lambda texts=texts: [generate_text_semantic(t, model, history, **semantic_args) for t in texts]
+        )
+        _, semantic_batch = timed(
+            lambda texts=texts: generate_text_semantic_batch(texts, model, history, **semantic_args)
+        )
+        coarse, coarse_single = timed(
+            lambda semantic=semantic: [generate_coarse(x, model, history, silent=True) for x in semantic]
+        )
+        _, coarse_batch = timed(lambda semantic=semantic: generate_coarse_batch(semantic, model, history, silent=True))
+        n_semantic = sum(len(x) for x in semantic)
+        n_coarse = sum(x.numel() for x in coarse)
+        print(
+            f"{batch_size:<9}"
+            f"{n_semantic / semantic_batch:>12.1f} ({semantic_single / semantic_batch:.2f}x)"
+            f"{n_coarse / coarse_batch:>12.1f} ({coarse_single / coarse_batch:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Phonemization throughput of the in-process libespeak-ng backend vs. the espeak-ng command line.
+
+Example:
+    python scripts/benchmarks/espeak_phonemizer.py --num_sentences 200
+"""
+
+import argparse
+import time
+
+from TTS.tts.utils.text.phonemizers.espeak_wrapper import ESpeak, _is_tool
+
+SENTENCES = [
+    "The quick brown fox jumps over the lazy dog.",
+    "She sells sea shells by the sea shore, and the shells she sells are surely sea shells.",
+    "A journey of a thousand miles begins with a single step.",
+    "How much wood would a woodchuck chuck if a woodchuck could chuck wood?",
+]
+
+
+def run(name, fn, texts):
+    t0 = time.perf_counter()
+    fn(texts)
+    elapsed = time.perf_counter() - t0
+    print(f"{name:<24} {len(texts) / elapsed:10.1f} sentences/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--num_sentences", type=int, default=200)
+    parser.add_argument("--language", default="en-us")
+    args = parser.parse_args()
+    texts = [SENTENCES[i % len(SENTENCES)] for i in range(args.num_sentences)]
+
+    phonemizer = ESpeak(args.language, backend="espeak-ng", use_library=True)
+    if phonemizer._library is not None:
+        run("library", lambda t: [phonemizer.phonemize(x, separator="") for x in t], texts)
+        run("library (batch)", lambda t: phonemizer.phonemize_batch(t, separator=""), texts)
+    else:
+        print("libespeak-ng not found, install `coqui-tts[espeak]`")
+    if _is_tool("espeak-ng"):
+        phonemizer = ESpeak(args.language, backend="espeak-ng", use_library=False)
+        run("command line", lambda t: [phonemizer.phonemize(x, separator="") for x in t], texts)
+    else:
+        print("espeak-ng command not found")
+
+
+if __name__ == "__main__":
+    main()
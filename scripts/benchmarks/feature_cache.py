@@ -0,0 +1,70 @@
+"""Write and read time of the phoneme/F0/energy caches of `TTSDataset`, for ``--samples`` random F0 like arrays.
+
+- ``npy files``: one ``.npy`` file per sample, as the caches were stored before.
+- ``packed``: :class:`TTS.tts.datasets.cache.PackedCache`, one memory mapped data file and its index.
+
+Reads are done in a random order, like a shuffled data loader. Run it with ``--cache_dir`` on the file system the
+caches are used on, e.g. a network file system, where opening files is a lot slower than on a local disk.
+
+Example:
+    python scripts/benchmarks/feature_cache.py --samples 20000 --cache_dir /mnt/nfs/tmp
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+from TTS.tts.datasets.cache import PackedCache, string2filename
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--length", type=int, default=400, help="Mean number of values per sample.")
+    parser.add_argument("--cache_dir", type=str, default=None, help="Directory to create the caches in.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    arrays = {
+        f"ljspeech#wavs/LJ{i:06d}": rng.random(rng.integers(args.length // 2, args.length * 3 // 2), dtype=np.float32)
+        for i in range(args.samples)
+    }
+    keys = list(arrays)
+    random.Random(0).shuffle(keys)
+
+    def npy_files(cache_path):
+        for key, array in arrays.items():
+            np.save(os.path.join(cache_path, string2filename(key) + "_pitch.npy"), array)
+        yield
+        for key in keys:
+            np.load(os.path.join(cache_path, string2filename(key) + "_pitch.npy"))
+
+    def packed(cache_path):
+        cache = PackedCache(cache_path, "pitch")
+        for key, array in arrays.items():
+            cache.put(key, array)
+        yield
+        cache = PackedCache(cache_path, "pitch")
+        for key in keys:
+            cache.get(key)
+
+    print(f"{args.samples} samples")
+    print(f"{'cache':<12}{'files':>8}{'write s':>10}{'read s':>10}")
+    for name, run in {"npy files": npy_files, "packed": packed}.items():
+        with tempfile.TemporaryDirectory(dir=args.cache_dir) as cache_path:
+            steps = run(cache_path)
+            start = time.perf_counter()
+            next(steps)
+            write = time.perf_counter() - start
+            start = time.perf_counter()
+            next(steps, None)
+            read = time.perf_counter() - start
+            print(f"{name:<12}{len(os.listdir(cache_path)):>8}{write:>10.2f}{read:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
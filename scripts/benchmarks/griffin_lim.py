@@ -0,0 +1,88 @@
+"""Speed and quality of the Griffin-Lim vocoder of `AudioProcessor`.
+
+Melspectrograms of ``--utterances`` LJSpeech test clips are converted back to waveforms with the default
+``BaseAudioConfig``. Quality is the spectral convergence of the result, i.e. the relative distance between its
+magnitude spectrogram and the one the mel spectrogram was inverted to (lower is better). Rows:
+
+- ``numpy``: the librosa based ``numpy_transforms.griffin_lim`` applied to one utterance after the other.
+- ``torch``: ``torch_transforms.griffin_lim`` without momentum, one utterance after the other.
+- ``torch batch``: the same with all utterances in one zero padded batch.
+- ``fast batch``: the batch with momentum 0.99 (fast Griffin-Lim), i.e. ``griffin_lim_momentum=0.99``.
+
+Example:
+    python scripts/benchmarks/griffin_lim.py --iters 60 30
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import torch
+
+from TTS.config import BaseAudioConfig
+from TTS.utils.audio import numpy_transforms
+from TTS.utils.audio.processor import AudioProcessor
+from TTS.utils.audio.torch_transforms import griffin_lim
+
+WAV_DIR = os.path.join(os.path.dirname(__file__), "../../tests/data/ljspeech/wavs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--utterances", type=int, default=4)
+    parser.add_argument("--iters", nargs="+", type=int, default=[60, 30], help="Numbers of iterations to run.")
+    args = parser.parse_args()
+
+    ap = AudioProcessor(**BaseAudioConfig())
+    stft_kwargs = {"fft_size": ap.fft_size, "hop_length": ap.hop_length, "win_length": ap.win_length}
+    files = sorted(f for f in os.listdir(WAV_DIR) if f.endswith(".wav"))[: args.utterances]
+    specs = []
+    for f in files:
+        mel = ap.melspectrogram(ap.load_wav(os.path.join(WAV_DIR, f)))
+        mel = numpy_transforms.db_to_amp(x=ap.denormalize(mel), gain=ap.spec_gain, base=ap.base)
+        specs.append(numpy_transforms.mel_to_spec(mel=mel, mel_basis=ap.mel_basis) ** ap.power)
+
+    def quality(wavs):
+        scores = []
+        for wav, spec in zip(wavs, specs):
+            rebuilt = np.abs(numpy_transforms.stft(y=wav.astype(np.float32), **stft_kwargs))
+            scores.append(np.linalg.norm(rebuilt - spec) / np.linalg.norm(spec))
+        return np.mean(scores)
+
+    def torch_batch(num_iter, momentum):
+        batch = torch.zeros(len(specs), specs[0].shape[0], max(spec.shape[1] for spec in specs))
+        for i, spec in enumerate(specs):
+            batch[i, :, : spec.shape[1]] = torch.from_numpy(spec)
+        wavs = griffin_lim(
+            batch, n_fft=ap.fft_size, hop_length=ap.hop_length, num_iter=num_iter, momentum=momentum
+        ).numpy()
+        return [wav[: (spec.shape[1] - 1) * ap.hop_length] for wav, spec in zip(wavs, specs)]
+
+    runs = {
+        "numpy": lambda n: [numpy_transforms.griffin_lim(spec=spec, num_iter=n, **stft_kwargs) for spec in specs],
+        "torch": lambda n: [
+            griffin_lim(
+                torch.from_numpy(spec).float(), n_fft=ap.fft_size, hop_length=ap.hop_length, num_iter=n, momentum=0
+            ).numpy()
+            for spec in specs
+        ],
+        "torch batch": lambda n: torch_batch(n, 0),
+        "fast batch": lambda n: torch_batch(n, 0.99),
+    }
+
+    seconds = sum(spec.shape[1] - 1 for spec in specs) * ap.hop_length / ap.sample_rate
+    print(f"{torch.get_num_threads()} CPU threads, {len(specs)} utterances, {seconds:.1f}s of audio")
+    print(f"{'run':<14}{'iters':>6}{'seconds':>10}{'x realtime':>12}{'conv.':>8}")
+    for num_iter in args.iters:
+        for name, run in runs.items():
+            np.random.seed(0)
+            torch.manual_seed(0)
+            start = time.perf_counter()
+            wavs = run(num_iter)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<14}{num_iter:>6}{elapsed:>10.2f}{seconds / elapsed:>12.1f}{quality(wavs):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Load test for the TTS server: throughput and latency at increasing numbers of concurrent clients.
+
+Start the server first, e.g. with and without request batching:
+    tts-server --model_name tts_models/en/ljspeech/vits --max_batch_size 8
+    tts-server --model_name tts_models/en/ljspeech/vits --max_batch_size 1
+
+Example:
+    python scripts/benchmarks/server_load_test.py --concurrency 1 2 4 8 --requests 32
+"""
+
+import argparse
+import json
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+SENTENCES = [
+    "The quick brown fox jumps over the lazy dog.",
+    "She sells sea shells by the sea shore.",
+    "A journey of a thousand miles begins with a single step.",
+    "How much wood would a woodchuck chuck if a woodchuck could chuck wood?",
+]
+
+
+def request_tts(url, text):
+    t0 = time.perf_counter()
+    with urllib.request.urlopen(f"{url}/api/tts?{urllib.parse.urlencode({'text': text})}") as response:
+        response.read()
+    return time.perf_counter() - t0
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:5002")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--requests", type=int, default=32, help="Requests per concurrency level.")
+    args = parser.parse_args()
+
+    request_tts(args.url, SENTENCES[0])  # warm-up
+    print(f"{'clients':>8}{'req/s':>10}{'p50 s':>10}{'p95 s':>10}")
+    for concurrency in args.concurrency:
+        texts = [SENTENCES[i % len(SENTENCES)] for i in range(args.requests)]
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as executor:
+            latencies = list(executor.map(lambda text: request_tts(args.url, text), texts))
+        elapsed = time.perf_counter() - t0
+        print(
+            f"{concurrency:>8}{len(texts) / elapsed:>10.2f}"
+            f"{percentile(latencies, 0.5):>10.3f}{percentile(latencies, 0.95):>10.3f}"
+        )
+
+    try:
+        with urllib.request.urlopen(f"{args.url}/api/scheduler_stats") as response:
+            print("Server scheduler stats:", json.dumps(json.load(response), indent=2))
+    except urllib.error.HTTPError:
+        pass  # batching is disabled
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Time to first audio and total time of streamed vs. complete responses from the TTS server.
+
+Start the server first, e.g.:
+    tts-server --model_name tts_models/multilingual/multi-dataset/xtts_v2 --speaker_idx "Ana Florence"
+
+Example:
+    python scripts/benchmarks/server_streaming.py --repeat 3
+"""
+
+import argparse
+import json
+import statistics
+import time
+import urllib.request
+
+TEXT = (
+    "The quick brown fox jumps over the lazy dog. "
+    "She sells sea shells by the sea shore, and the shells she sells are surely sea shells. "
+    "A journey of a thousand miles begins with a single step. "
+    "How much wood would a woodchuck chuck if a woodchuck could chuck wood?"
+)
+WAV_HEADER_SIZE = 44
+
+
+def request_speech(url, text, fmt, stream):
+    """Return the time until the first audio bytes arrived and the total time."""
+    payload = json.dumps({"input": text, "response_format": fmt, "stream": stream}).encode()
+    req = urllib.request.Request(f"{url}/v1/audio/speech", data=payload, headers={"Content-Type": "application/json"})
+    t0 = time.perf_counter()
+    first_audio = None
+    received = 0
+    with urllib.request.urlopen(req) as response:
+        while chunk := response.read1(65536):
+            received += len(chunk)
+            # the streamed WAV header is sent before any audio is synthesized
+            if first_audio is None and (fmt != "wav" or received > WAV_HEADER_SIZE):
+                first_audio = time.perf_counter() - t0
+    return first_audio, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:5002")
+    parser.add_argument("--text", default=TEXT)
+    parser.add_argument("--format", default="wav", choices=["wav", "pcm", "mp3", "opus"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    request_speech(args.url, "Warm up.", args.format, False)
+    print(f"{'mode':<10}{'first audio s':>15}{'total s':>10}")
+    for stream in (False, True):
+        results = [request_speech(args.url, args.text, args.format, stream) for _ in range(args.repeat)]
+        first_audio = statistics.median(r[0] for r in results)
+        total = statistics.median(r[1] for r in results)
+        print(f"{'stream' if stream else 'complete':<10}{first_audio:>15.3f}{total:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
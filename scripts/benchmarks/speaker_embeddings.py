@@ -0,0 +1,80 @@
+"""Speaker embedding extraction speed of `compute_embeddings.py`, in audio clips per second.
+
+A randomly initialised speaker encoder is used, so no model download is needed: the LSTM encoder of the test config
+(melspectrogram inputs) or with ``--resnet`` a small H/ASP ResNet encoder on waveforms, like the released one. All
+``.wav`` files of the LJSpeech test data are embedded ``--repeats`` times:
+
+- ``per clip``: :meth:`EmbeddingManager.compute_embedding_from_clip` for one clip after the other, as before.
+- ``batched``: :meth:`EmbeddingManager.compute_embeddings_from_clips` with ``--num_workers`` loader processes.
+
+Example:
+    python scripts/benchmarks/speaker_embeddings.py --resnet --num_workers 2
+"""
+
+import argparse
+import glob
+import os
+import tempfile
+import time
+
+import torch
+from trainer.io import save_checkpoint
+
+from TTS.config import load_config
+from TTS.encoder.utils.generic_utils import setup_encoder_model
+from TTS.tts.utils.managers import EmbeddingManager
+
+TESTS_DIR = os.path.join(os.path.dirname(__file__), "../../tests")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resnet", action="store_true", help="Use a ResNet encoder on waveforms.")
+    parser.add_argument("--batch_size", type=int, default=32)
+    parser.add_argument("--num_workers", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=2, help="Number of times each clip is embedded.")
+    args = parser.parse_args()
+
+    config = load_config(os.path.join(TESTS_DIR, "inputs/test_speaker_encoder_config.json"))
+    if args.resnet:
+        config.model_params = {
+            "model_name": "resnet",
+            "input_dim": 64,
+            "proj_dim": 512,
+            "layers": [1, 1, 1, 1],
+            "use_torch_spec": True,
+        }
+        config.audio.num_mels = 64
+    wav_files = sorted(glob.glob(os.path.join(TESTS_DIR, "data/ljspeech/wavs/*.wav"))) * args.repeats
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        torch.manual_seed(0)
+        save_checkpoint(config, setup_encoder_model(config), tmp_dir, current_step=0, epoch=0)
+        config_path = os.path.join(tmp_dir, "config.json")
+        config.save_json(config_path)
+        manager = EmbeddingManager(
+            encoder_model_path=os.path.join(tmp_dir, "checkpoint_0.pth"), encoder_config_path=config_path
+        )
+
+    runs = {
+        "per clip": lambda: [manager.compute_embedding_from_clip(f) for f in wav_files],
+        "batched": lambda: [
+            e
+            for batch in manager.compute_embeddings_from_clips(
+                wav_files, batch_size=args.batch_size, num_workers=args.num_workers
+            )
+            for e in batch
+        ],
+    }
+    model = "resnet" if args.resnet else "lstm"
+    print(f"{torch.get_num_threads()} CPU threads, {len(wav_files)} clips, {model}, {args.num_workers} workers")
+    print(f"{'run':<10}{'seconds':>10}{'clips/s':>10}")
+    for name, run in runs.items():
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<10}{elapsed:>10.2f}{len(wav_files) / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
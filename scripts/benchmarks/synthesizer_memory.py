@@ -0,0 +1,73 @@
+"""Time and peak memory of joining long-form synthesis output into one waveform and saving it.
+
+Compares the former accumulation of the sentences in a Python list with the float32 array now returned by
+`Synthesizer.tts()`. Random sentence waveforms are used, so no model is needed.
+
+Example:
+    python scripts/benchmarks/synthesizer_memory.py --minutes 10
+"""
+
+import argparse
+import io
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+
+from TTS.utils.audio.numpy_transforms import save_wav
+from TTS.utils.synthesizer import Synthesizer
+
+
+def join_list(waveforms):
+    wavs = []
+    for waveform in waveforms:
+        wavs += list(waveform)
+        wavs += [0] * Synthesizer.sentence_pause
+    return wavs
+
+
+def join_array(waveforms):
+    return Synthesizer._join_sentences(waveforms)  # pylint: disable=protected-access
+
+
+def run(join, waveforms, sample_rate):
+    wav = join(waveforms)
+    save_wav(wav=np.asarray(wav), path=io.BytesIO(), sample_rate=sample_rate)
+
+
+def measure(join, waveforms, sample_rate, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(join, waveforms, sample_rate)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    run(join, waveforms, sample_rate)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(times), peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=float, default=5.0, help="Length of the synthesized audio.")
+    parser.add_argument("--sentence_seconds", type=float, default=4.0)
+    parser.add_argument("--sample_rate", type=int, default=22050)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    num_sentences = max(1, round(args.minutes * 60 / args.sentence_seconds))
+    sentence_length = int(args.sentence_seconds * args.sample_rate)
+    waveforms = [rng.uniform(-1, 1, sentence_length).astype(np.float32) for _ in range(num_sentences)]
+
+    print(f"{num_sentences} sentences, {args.minutes:.1f} min of audio at {args.sample_rate} Hz")
+    list_time, list_peak = measure(join_list, waveforms, args.sample_rate, args.repeat)
+    array_time, array_peak = measure(join_array, waveforms, args.sample_rate, args.repeat)
+    print(f"list:  {list_time:.3f}s, peak {list_peak:.1f} MiB")
+    print(f"array: {array_time:.3f}s, peak {array_peak:.1f} MiB ({list_time / array_time:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Latency of multi-sentence synthesis with and without overlapping the TTS model and the vocoder.
+
+By default, Tacotron2 + HiFiGAN and Glow-TTS + MelGAN are compared. Overlapping only helps with several CPU cores
+or with a GPU.
+
+Example:
+    python scripts/benchmarks/synthesizer_pipeline.py --repeat 3
+    python scripts/benchmarks/synthesizer_pipeline.py --model_path model.pth --config_path config.json \\
+        --vocoder_path vocoder.pth --vocoder_config_path vocoder_config.json
+"""
+
+import argparse
+import statistics
+import time
+
+import torch
+
+from TTS.api import TTS
+
+PARAGRAPH = (
+    "The quick brown fox jumps over the lazy dog. "
+    "She sells sea shells by the sea shore. "
+    "A journey of a thousand miles begins with a single step. "
+    "How much wood would a woodchuck chuck if a woodchuck could chuck wood? "
+    "Thank you for calling, please hold the line. "
+    "Press one for billing, or two for technical support."
+)
+
+MODELS = [
+    ("tts_models/en/ljspeech/tacotron2-DDC", "vocoder_models/en/ljspeech/hifigan_v2"),
+    ("tts_models/en/ljspeech/glow-tts", "vocoder_models/en/ljspeech/multiband-melgan"),
+]
+
+
+def timed(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def benchmark(api, repeat):
+    synthesizer = api.synthesizer
+    sentences = synthesizer.split_into_sentences(PARAGRAPH)
+    # one tts() call per sentence cannot overlap the models
+    sequential = timed(lambda: [synthesizer.tts(s, split_sentences=False) for s in sentences], repeat)
+    pipelined = timed(lambda: synthesizer.tts(PARAGRAPH, batch_sentences=False), repeat)
+    print(f"  {len(sentences)} sentences, {torch.get_num_threads()} CPU threads")
+    print(f"  sequential: {sequential:.3f}s")
+    print(f"  pipelined:  {pipelined:.3f}s ({sequential / pipelined:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model_path", default=None)
+    parser.add_argument("--config_path", default=None)
+    parser.add_argument("--vocoder_path", default=None)
+    parser.add_argument("--vocoder_config_path", default=None)
+    parser.add_argument("--device", default="cuda" if torch.cuda.is_available() else "cpu")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.model_path is not None:
+        api = TTS(
+            model_path=args.model_path,
+            config_path=args.config_path,
+            vocoder_path=args.vocoder_path,
+            vocoder_config_path=args.vocoder_config_path,
+        ).to(args.device)
+        print(args.model_path)
+        benchmark(api, args.repeat)
+        return
+    for model_name, vocoder_name in MODELS:
+        api = TTS(model_name, vocoder_name=vocoder_name).to(args.device)
+        print(f"{model_name} + {vocoder_name}")
+        benchmark(api, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
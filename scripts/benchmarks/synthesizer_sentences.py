@@ -0,0 +1,61 @@
+"""Latency of multi-sentence synthesis with batched vs. one-by-one sentences.
+
+Example:
+    python scripts/benchmarks/synthesizer_sentences.py --model_name tts_models/en/ljspeech/vits --repeat 3
+"""
+
+import argparse
+import statistics
+import time
+
+import torch
+
+from TTS.api import TTS
+
+PARAGRAPH = (
+    "The quick brown fox jumps over the lazy dog. "
+    "She sells sea shells by the sea shore. "
+    "A journey of a thousand miles begins with a single step. "
+    "How much wood would a woodchuck chuck if a woodchuck could chuck wood? "
+    "Thank you for calling, please hold the line. "
+    "Press one for billing, or two for technical support. "
+    "All our agents are currently busy. "
+    "Your call is important to us. "
+    "Please stay on the line. "
+    "Goodbye and have a nice day."
+)
+
+
+def timed(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model_name", default="tts_models/en/ljspeech/vits")
+    parser.add_argument("--model_path", default=None)
+    parser.add_argument("--config_path", default=None)
+    parser.add_argument("--device", default="cuda" if torch.cuda.is_available() else "cpu")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    model_name = args.model_name if args.model_path is None else None
+    api = TTS(model_name, model_path=args.model_path, config_path=args.config_path).to(args.device)
+    synthesizer = api.synthesizer
+    sentences = synthesizer.split_into_sentences(PARAGRAPH)
+    print(f"{len(sentences)} sentences, batched inference: {synthesizer.tts_model.supports_batched_inference}")
+    print(f"{torch.get_num_threads()} CPU threads")
+
+    sequential = timed(lambda: [synthesizer.tts(s, split_sentences=False) for s in sentences], args.repeat)
+    batched = timed(lambda: synthesizer.tts(PARAGRAPH, batch_sentences=True), args.repeat)
+    print(f"one by one: {sequential:.3f}s")
+    print(f"batched:    {batched:.3f}s ({sequential / batched:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
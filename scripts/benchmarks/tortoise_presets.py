@@ -0,0 +1,81 @@
+"""Wall-clock time of Tortoise inference for each quality preset.
+
+Uses small randomly initialised models, so no model download is needed. The stop token logit of the autoregressive
+model is raised by ``--stop_bias`` so that the samples end after some dozens of codes instead of running to the
+maximum length. With the default bias and sampling settings the longest sample of a batch has about 200 codes.
+
+``--candidates`` sets the number of candidates ``k`` that are decoded by the diffusion model and the vocoder.
+
+Example:
+    python scripts/benchmarks/tortoise_presets.py --presets ultra_fast fast standard
+    python scripts/benchmarks/tortoise_presets.py --presets fast --candidates 1 2 4
+"""
+
+import argparse
+import time
+
+import torch
+
+from TTS.tts.configs.tortoise_config import TortoiseConfig
+from TTS.tts.models.tortoise import Tortoise, TortoiseArgs
+
+PRESETS = ["ultra_fast", "very_fast", "fast", "standard", "high_quality"]
+TEXT = "The quick brown fox jumps over the lazy dog."
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--presets", nargs="+", default=PRESETS, choices=PRESETS)
+    parser.add_argument("--candidates", nargs="+", type=int, default=[1], help="Values of k to run.")
+    parser.add_argument("--stop_bias", type=float, default=1.5, help="Added to the stop token logit.")
+    parser.add_argument("--batch_size", type=int, default=16, help="Autoregressive batch size.")
+    parser.add_argument("--model_dim", type=int, default=256, help="Width of the autoregressive model.")
+    parser.add_argument("--layers", type=int, default=4, help="Depth of the autoregressive model.")
+    args = parser.parse_args()
+
+    model_args = TortoiseArgs(
+        autoregressive_batch_size=args.batch_size,
+        ar_layers=args.layers,
+        ar_model_dim=args.model_dim,
+        ar_heads=4,
+        diff_model_channels=128,
+        diff_num_layers=2,
+        diff_in_latent_channels=args.model_dim,
+        diff_num_heads=4,
+        clvp_dim_text=256,
+        clvp_dim_speech=256,
+        clvp_dim_latent=256,
+        clvp_text_enc_depth=4,
+        clvp_speech_enc_depth=4,
+        clvp_text_heads=4,
+        clvp_speech_heads=4,
+    )
+    torch.manual_seed(0)
+    model = Tortoise(TortoiseConfig(model_args=model_args)).eval()
+    model.autoregressive.post_init_gpt2_config(model.args.kv_cache)  # done by load_checkpoint()
+    with torch.no_grad():
+        model.autoregressive.mel_head.bias[model.autoregressive.stop_mel_token] += args.stop_bias
+    conditioning_latents = (torch.randn(1, args.model_dim), torch.randn(1, 2 * 128))
+
+    print(f"{torch.get_num_threads()} CPU threads, stop bias {args.stop_bias}")
+    print(f"{'preset':<14}{'k':>4}{'seconds':>10}")
+    for preset in args.presets:
+        for k in args.candidates:
+            start = time.perf_counter()
+            try:
+                model.inference_with_config(
+                    TEXT,
+                    preset=preset,
+                    k=k,
+                    conditioning_latents=conditioning_latents,
+                    use_deterministic_seed=0,
+                    verbose=False,
+                )
+            except ModuleNotFoundError as e:  # k_diffusion samplers
+                print(f"{preset:<14}{k:>4}{'skipped':>10}  ({e})")
+                break
+            print(f"{preset:<14}{k:>4}{time.perf_counter() - start:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Generation speed of WaveRNN in kHz, i.e. thousands of audio samples per second of wall-clock time.
+
+A randomly initialised model with the default ``WavernnConfig`` is used, so no model download is needed. Each row
+vocodes ``--utterances`` random spectrograms of ``--seconds`` seconds:
+
+- ``single``: one utterance after the other with :meth:`Wavernn.inference`.
+- ``folded``: the same, with each utterance folded into segments of ``--target`` samples (``batched=True``).
+- ``batch``: all utterances in one call of :meth:`Wavernn.inference_batch`.
+- ``batch folded``: all segments of all utterances in one call of :meth:`Wavernn.inference_batch`.
+
+Example:
+    python scripts/benchmarks/wavernn_inference.py --utterances 4 --seconds 0.5
+"""
+
+import argparse
+import time
+
+import torch
+
+from TTS.vocoder.configs import WavernnConfig
+from TTS.vocoder.models.wavernn import Wavernn
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--utterances", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=0.5, help="Length of each utterance.")
+    parser.add_argument("--target", type=int, default=2750, help="Samples per fold.")
+    parser.add_argument("--overlap", type=int, default=275, help="Overlap of the folds.")
+    parser.add_argument("--mode", default="mold", help="`mold`, `gauss` or the number of bits.")
+    args = parser.parse_args()
+
+    config = WavernnConfig()
+    config.model_args.mode = int(args.mode) if args.mode.isdigit() else args.mode
+    torch.manual_seed(0)
+    model = Wavernn(config).eval()
+    num_frames = int(args.seconds * config.audio.sample_rate / config.audio.hop_length) + 1
+    mels = [torch.rand(config.model_args.feat_dims, num_frames) for _ in range(args.utterances)]
+    folding = {"batched": True, "target": args.target, "overlap": args.overlap}
+    runs = {
+        "single": lambda: [model.inference(mel) for mel in mels],
+        "folded": lambda: [model.inference(mel, **folding) for mel in mels],
+        "batch": lambda: model.inference_batch(mels),
+        "batch folded": lambda: model.inference_batch(mels, **folding),
+    }
+
+    print(f"{torch.get_num_threads()} CPU threads, {args.utterances} x {args.seconds}s, mode {args.mode}")
+    print(f"{'run':<14}{'seconds':>10}{'kHz':>10}")
+    for name, run in runs.items():
+        start = time.perf_counter()
+        waveforms = run()
+        elapsed = time.perf_counter() - start
+        num_samples = sum(len(wav) for wav in waveforms)
+        print(f"{name:<14}{elapsed:>10.2f}{num_samples / elapsed / 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Aggregate GPT decoding throughput of XTTS for batches of sentences with different texts and voices.
+
+Each batch is decoded by a single ``gpt.generate()`` call with padded texts, as in `Xtts.inference_batch`. Batch size
+1 decodes the sentences one after another, as before.
+
+The GPT has the size of the released XTTS v2 model with random weights, so no model download is needed. The end of
+sentence token is suppressed to generate exactly ``--codes`` codes per sentence (~21.5 per second of audio).
+
+Example:
+    python scripts/benchmarks/xtts_gpt_batch.py --batch_sizes 1 2 4 8 --codes 50
+"""
+
+import argparse
+import time
+
+import torch
+
+from TTS.tts.layers.xtts.gpt import GPT
+from TTS.tts.models.xtts import XttsArgs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch_sizes", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("--codes", type=int, default=50, help="Number of audio codes generated per sentence.")
+    parser.add_argument("--sentences", type=int, default=8, help="Number of sentences decoded per batch size.")
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    # text vocabulary and conditioning of the released XTTS v2 model
+    xtts_args = XttsArgs(
+        gpt_number_text_tokens=6681,
+        gpt_start_text_token=261,
+        gpt_stop_text_token=0,
+        gpt_num_audio_tokens=1026,
+        gpt_start_audio_token=1024,
+        gpt_stop_audio_token=1025,
+        gpt_use_perceiver_resampler=True,
+    )
+    gpt = GPT(
+        layers=xtts_args.gpt_layers,
+        model_dim=xtts_args.gpt_n_model_channels,
+        start_text_token=xtts_args.gpt_start_text_token,
+        stop_text_token=xtts_args.gpt_stop_text_token,
+        heads=xtts_args.gpt_n_heads,
+        max_text_tokens=xtts_args.gpt_max_text_tokens,
+        max_mel_tokens=xtts_args.gpt_max_audio_tokens,
+        max_prompt_tokens=xtts_args.gpt_max_prompt_tokens,
+        number_text_tokens=xtts_args.gpt_number_text_tokens,
+        num_audio_tokens=xtts_args.gpt_num_audio_tokens,
+        start_audio_token=xtts_args.gpt_start_audio_token,
+        stop_audio_token=xtts_args.gpt_stop_audio_token,
+        use_perceiver_resampler=xtts_args.gpt_use_perceiver_resampler,
+        code_stride_len=xtts_args.gpt_code_stride_len,
+    ).eval()
+    gpt.init_gpt_for_inference()
+    gpt.max_gen_mel_tokens = args.codes
+    # two voices and sentences of 20 to 60 text tokens
+    voices = torch.randn(2, 32, xtts_args.gpt_n_model_channels)
+    cond_latents = voices[torch.arange(args.sentences) % 2]
+    text_lengths = torch.randint(20, 61, (args.sentences,))
+    text_tokens = torch.randint(1, xtts_args.gpt_number_text_tokens - 1, (args.sentences, 60))
+    kwargs = {"do_sample": True, "top_k": 50, "top_p": 0.85, "temperature": 0.75, "min_new_tokens": args.codes}
+
+    print(f"{torch.get_num_threads()} CPU threads, {args.sentences} sentences of {args.codes} codes")
+    print(f"{'batch size':<12}{'s':>8}{'codes/s':>10}")
+    with torch.inference_mode():
+        gpt.generate(cond_latents[:1], text_tokens[:1], text_lengths[:1], **kwargs)  # warm up
+        for batch_size in args.batch_sizes:
+            start = time.perf_counter()
+            for i in range(0, args.sentences, batch_size):
+                batch = slice(i, i + batch_size)
+                gpt.generate(cond_latents[batch], text_tokens[batch], text_lengths[batch], **kwargs)
+            elapsed = time.perf_counter() - start
+            print(f"{batch_size:<12}{elapsed:>8.2f}{args.sentences * args.codes / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""GPT time per sentence of `Xtts.inference`: sampling plus a second pass for the latents vs. a single pass.
+
+- ``two pass``: ``gpt.generate()`` samples the codes, then ``gpt(..., return_latent=True)`` runs over the whole
+  sequence again to compute the latents for the HiFi-GAN decoder, as before.
+- ``single pass``: ``gpt.generate(..., return_latents=True)`` keeps the latents of the decoding steps.
+
+The GPT has the size of the released XTTS v2 model with random weights, so no model download is needed. The end of
+sentence token is suppressed to generate exactly ``--codes`` codes (~21.5 per second of audio).
+
+Example:
+    python scripts/benchmarks/xtts_gpt_latents.py --codes 200 --text_tokens 60
+"""
+
+import argparse
+import time
+
+import torch
+
+from TTS.tts.layers.xtts.gpt import GPT
+from TTS.tts.models.xtts import XttsArgs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--codes", type=int, default=200, help="Number of audio codes generated per sentence.")
+    parser.add_argument("--text_tokens", type=int, default=60)
+    parser.add_argument("--repeats", type=int, default=2)
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    # text vocabulary and conditioning of the released XTTS v2 model
+    xtts_args = XttsArgs(
+        gpt_number_text_tokens=6681,
+        gpt_start_text_token=261,
+        gpt_stop_text_token=0,
+        gpt_num_audio_tokens=1026,
+        gpt_start_audio_token=1024,
+        gpt_stop_audio_token=1025,
+        gpt_use_perceiver_resampler=True,
+    )
+    gpt = GPT(
+        layers=xtts_args.gpt_layers,
+        model_dim=xtts_args.gpt_n_model_channels,
+        start_text_token=xtts_args.gpt_start_text_token,
+        stop_text_token=xtts_args.gpt_stop_text_token,
+        heads=xtts_args.gpt_n_heads,
+        max_text_tokens=xtts_args.gpt_max_text_tokens,
+        max_mel_tokens=xtts_args.gpt_max_audio_tokens,
+        max_prompt_tokens=xtts_args.gpt_max_prompt_tokens,
+        number_text_tokens=xtts_args.gpt_number_text_tokens,
+        num_audio_tokens=xtts_args.gpt_num_audio_tokens,
+        start_audio_token=xtts_args.gpt_start_audio_token,
+        stop_audio_token=xtts_args.gpt_stop_audio_token,
+        use_perceiver_resampler=xtts_args.gpt_use_perceiver_resampler,
+        code_stride_len=xtts_args.gpt_code_stride_len,
+    ).eval()
+    gpt.init_gpt_for_inference()
+    gpt.max_gen_mel_tokens = args.codes
+    cond_latents = torch.randn(1, 32, xtts_args.gpt_n_model_channels)
+    text_tokens = torch.randint(1, xtts_args.gpt_number_text_tokens - 1, (1, args.text_tokens))
+    kwargs = {"do_sample": True, "top_k": 50, "top_p": 0.85, "temperature": 0.75, "min_new_tokens": args.codes}
+
+    def two_pass():
+        codes = gpt.generate(cond_latents, text_tokens, **kwargs)
+        return gpt(
+            text_tokens,
+            torch.tensor([text_tokens.shape[-1]]),
+            codes,
+            torch.tensor([codes.shape[-1] * gpt.code_stride_len]),
+            cond_latents=cond_latents,
+            return_latent=True,
+        )
+
+    def single_pass():
+        return gpt.generate(cond_latents, text_tokens, return_latents=True, **kwargs)[1]
+
+    print(f"{torch.get_num_threads()} CPU threads, {args.codes} codes, {args.text_tokens} text tokens")
+    print(f"{'run':<14}{'s/sentence':>12}")
+    with torch.inference_mode():
+        for name, run in {"two pass": two_pass, "single pass": single_pass}.items():
+            run()  # warm up
+            start = time.perf_counter()
+            for _ in range(args.repeats):
+                run()
+            print(f"{name:<14}{(time.perf_counter() - start) / args.repeats:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
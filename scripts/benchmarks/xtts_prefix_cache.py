@@ -0,0 +1,88 @@
+"""Time to the first audio code of `Xtts.inference_stream` with and without the GPT prefix cache.
+
+The transformer keys and values of a voice's conditioning latents are kept in ``GPT.prefix_cache``, so only the text
+tokens are prefilled for the following sentences of that voice. ``uncached`` disables the cache, which runs the
+conditioning latents through the transformer for every sentence as before.
+
+The GPT has the size of the released XTTS v2 model with random weights, so no model download is needed.
+
+Example:
+    python scripts/benchmarks/xtts_prefix_cache.py --text_tokens 10 30 100
+"""
+
+import argparse
+import time
+
+import torch
+
+from TTS.tts.layers.xtts.gpt import GPT
+from TTS.tts.models.xtts import XttsArgs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--text_tokens", nargs="+", type=int, default=[10, 30, 100], help="Sentence lengths.")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    # text vocabulary and conditioning of the released XTTS v2 model
+    xtts_args = XttsArgs(
+        gpt_number_text_tokens=6681,
+        gpt_start_text_token=261,
+        gpt_stop_text_token=0,
+        gpt_num_audio_tokens=1026,
+        gpt_start_audio_token=1024,
+        gpt_stop_audio_token=1025,
+        gpt_use_perceiver_resampler=True,
+    )
+    gpt = GPT(
+        layers=xtts_args.gpt_layers,
+        model_dim=xtts_args.gpt_n_model_channels,
+        start_text_token=xtts_args.gpt_start_text_token,
+        stop_text_token=xtts_args.gpt_stop_text_token,
+        heads=xtts_args.gpt_n_heads,
+        max_text_tokens=xtts_args.gpt_max_text_tokens,
+        max_mel_tokens=xtts_args.gpt_max_audio_tokens,
+        max_prompt_tokens=xtts_args.gpt_max_prompt_tokens,
+        number_text_tokens=xtts_args.gpt_number_text_tokens,
+        num_audio_tokens=xtts_args.gpt_num_audio_tokens,
+        start_audio_token=xtts_args.gpt_start_audio_token,
+        stop_audio_token=xtts_args.gpt_stop_audio_token,
+        use_perceiver_resampler=xtts_args.gpt_use_perceiver_resampler,
+        code_stride_len=xtts_args.gpt_code_stride_len,
+    ).eval()
+    cond_latents = torch.randn(1, 32, xtts_args.gpt_n_model_channels)
+
+    def time_to_first_code(text_tokens):
+        start = time.perf_counter()
+        fake_inputs = gpt.compute_embeddings(cond_latents, text_tokens)
+        generator = gpt.get_generator(
+            fake_inputs,
+            cond_latents=cond_latents,
+            do_sample=True,
+            top_k=50,
+            top_p=0.85,
+            num_beams=1,
+            num_return_sequences=1,
+            output_hidden_states=True,
+            return_dict_in_generate=True,
+        )
+        next(generator)
+        return time.perf_counter() - start
+
+    print(f"{torch.get_num_threads()} CPU threads, TTFT in ms")
+    print(f"{'text tokens':<14}{'uncached':>10}{'cached':>10}")
+    with torch.inference_mode():
+        for num_tokens in args.text_tokens:
+            text_tokens = torch.randint(1, xtts_args.gpt_number_text_tokens - 1, (1, num_tokens))
+            times = []
+            for entries in (0, 32):
+                gpt.init_gpt_for_inference(prefix_cache_entries=entries)
+                time_to_first_code(text_tokens)  # warm up, fills the cache
+                times.append(min(time_to_first_code(text_tokens) for _ in range(args.repeats)))
+            print(f"{num_tokens:<14}{times[0] * 1000:>10.1f}{times[1] * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
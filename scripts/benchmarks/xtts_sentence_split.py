@@ -0,0 +1,71 @@
+"""Documents per second of the XTTS sentence splitting with ``enable_text_splitting=True``.
+
+- ``new pipeline``: a new spaCy pipeline with a sentencizer for every document, as before.
+- ``cached``: ``split_sentence()`` with the spaCy pipeline shared between calls.
+- ``batched``: ``split_sentences()`` for all documents, one ``nlp.pipe()`` pass.
+- ``punctuation``: the fallback splitter used when spaCy is not installed.
+
+Example:
+    python scripts/benchmarks/xtts_sentence_split.py --documents 200 --lang en
+"""
+
+import argparse
+import time
+from unittest import mock
+
+from TTS.tts.layers.xtts import tokenizer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--sentences", type=int, default=10, help="Number of sentences per document.")
+    parser.add_argument("--lang", type=str, default="en")
+    args = parser.parse_args()
+
+    sentences = [
+        "The quick brown fox jumps over the lazy dog.",
+        "Did you hear what happened at the station yesterday?",
+        "It was raining, so we stayed at home and read books.",
+        "Wow!",
+        "Speech synthesis turns written text into natural sounding audio.",
+    ]
+    documents = [
+        " ".join(sentences[(i + j) % len(sentences)] for j in range(args.sentences)) for i in range(args.documents)
+    ]
+    text_split_length = 250
+
+    def new_pipeline():
+        for document in documents:
+            nlp = tokenizer.get_spacy_lang(args.lang)
+            nlp.add_pipe("sentencizer")
+            tokenizer._merge_sentences([str(s) for s in nlp(document).sents], text_split_length)
+
+    def cached():
+        for document in documents:
+            tokenizer.split_sentence(document, args.lang, text_split_length)
+
+    def batched():
+        tokenizer.split_sentences(documents, args.lang, text_split_length)
+
+    def punctuation():
+        with mock.patch.object(tokenizer, "get_sentencizer", side_effect=ImportError):
+            for document in documents:
+                tokenizer.split_sentence(document, args.lang, text_split_length)
+
+    print(f"{args.documents} documents of {args.sentences} sentences")
+    print(f"{'splitter':<14}{'docs/s':>10}")
+    for name, run in {
+        "new pipeline": new_pipeline,
+        "cached": cached,
+        "batched": batched,
+        "punctuation": punctuation,
+    }.items():
+        run()  # warm up, builds the cached pipeline
+        start = time.perf_counter()
+        run()
+        print(f"{name:<14}{args.documents / (time.perf_counter() - start):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark the XTTS streaming vocoder: full re-decoding vs. windowed decoding.
+
+Uses a randomly initialised HiFi-GAN decoder and random GPT latents, so no model download is needed.
+
+Example:
+    python scripts/benchmarks/xtts_stream_decoder.py --num_latents 400 --stream_context_len 8
+"""
+
+import argparse
+import time
+
+import torch
+from torch.nn.utils import parametrize
+from torch.utils.flop_counter import FlopCounterMode
+
+from TTS.tts.configs.xtts_config import XttsConfig
+from TTS.tts.models.xtts import Xtts
+
+
+def _fake_generator(latents):
+    for i, latent in enumerate(latents):
+        yield i, latent[None]
+
+
+def run(model, latents, speaker_embedding, stream_chunk_size, stream_context_len):
+    chunks = model.decode_stream(
+        _fake_generator(latents),
+        speaker_embedding,
+        stream_chunk_size=stream_chunk_size,
+        stream_context_len=stream_context_len,
+    )
+    latencies = []
+    with FlopCounterMode(display=False) as flop_counter:
+        t0 = time.perf_counter()
+        for _ in chunks:
+            latencies.append(time.perf_counter() - t0)
+            t0 = time.perf_counter()
+    return latencies, flop_counter.get_total_flops()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--num_latents", type=int, default=400, help="GPT latents in the sentence (~21.5 per second).")
+    parser.add_argument("--stream_chunk_size", type=int, default=20)
+    parser.add_argument("--stream_context_len", type=int, default=8)
+    parser.add_argument("--threads", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.threads is not None:
+        torch.set_num_threads(args.threads)
+    torch.manual_seed(0)
+    model = Xtts(XttsConfig())
+    model.hifigan_decoder.eval()
+    # FlopCounterMode cannot trace through the weight norm parametrizations
+    for module in model.hifigan_decoder.waveform_decoder.modules():
+        if parametrize.is_parametrized(module, "weight"):
+            parametrize.remove_parametrizations(module, "weight")
+    latents = 0.3 * torch.randn(args.num_latents, model.args.decoder_input_dim)
+    speaker_embedding = torch.randn(1, model.args.d_vector_dim, 1)
+
+    print(f"{args.num_latents} latents, {args.stream_chunk_size} tokens per chunk")
+    print(f"torch threads: {torch.get_num_threads()}")
+    print(f"{'mode':<14}{'GFLOPs':>10}{'total s':>10}{'first ms':>10}{'mean ms':>10}{'last ms':>10}")
+    for name, context_len in (("full", None), (f"window ({args.stream_context_len})", args.stream_context_len)):
+        latencies, flops = run(model, latents, speaker_embedding, args.stream_chunk_size, context_len)
+        print(
+            f"{name:<14}{flops / 1e9:>10.1f}{sum(latencies):>10.2f}{latencies[0] * 1e3:>10.1f}"
+            f"{sum(latencies) / len(latencies) * 1e3:>10.1f}{latencies[-1] * 1e3:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
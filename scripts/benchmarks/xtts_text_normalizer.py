@@ -0,0 +1,75 @@
+"""Characters per second of the XTTS text normalization (`multilingual_cleaners`).
+
+- ``sequential``: ``expand_numbers_multilingual()``, ``expand_abbreviations_multilingual()`` and
+  ``expand_symbols_multilingual()`` one after the other, one regex pass per pattern, as before. The ``num2words``
+  cache is cleared for every text.
+- ``uncached``: :class:`TTS.tts.layers.xtts.tokenizer.MultilingualNormalizer` with the ``num2words`` cache cleared
+  for every text.
+- ``normalizer``: ``multilingual_cleaners()``, the normalizer with the ``num2words`` cache.
+
+``plain`` texts have no digits, ``numbers`` texts have amounts, ordinals, decimals and abbreviations.
+
+Example:
+    python scripts/benchmarks/xtts_text_normalizer.py --langs en de --repeats 500
+"""
+
+import argparse
+import time
+
+from TTS.tts.layers.xtts import tokenizer
+
+TEXTS = {
+    "plain": {
+        "en": "It took me quite a long time to develop a voice, and now that I have it I'm not going to be silent.",
+        "de": "Es hat lange gedauert, eine Stimme zu entwickeln, und jetzt habe ich sie und werde nicht schweigen.",
+        "fr": "Il m'a fallu beaucoup de temps pour développer une voix, et maintenant je ne vais pas me taire.",
+        "ru": "Мне потребовалось много времени, чтобы развить голос, и теперь я не собираюсь молчать.",
+    },
+    "numbers": {
+        "en": "Mr. Smith paid $20 on the 3rd of May 2024, 12.5% more than the 1,250 people at St. Mary's & Co.",
+        "de": "Herr Dr. Müller zahlte am 3. Mai 2024 20€, 12,5% mehr als die 1.250 Leute bei St. Marien & Co.",
+        "fr": "Mme. Dupont a payé 20€ le 3e mai 2024, 12,5% de plus que les 1.250 personnes de St. Marie & Co.",
+        "ru": "Г-н Иванов заплатил 20€ 3-го мая 2024 года, на 12.5% больше, чем 1,250 человек в д-р Сергея & Ко.",
+    },
+}
+
+
+def sequential(text, lang):
+    tokenizer._num2words.cache_clear()
+    text = text.replace('"', "")
+    text = tokenizer.lowercase(text)
+    text = tokenizer.expand_numbers_multilingual(text, lang)
+    text = tokenizer.expand_abbreviations_multilingual(text, lang)
+    text = tokenizer.expand_symbols_multilingual(text, lang=lang)
+    return tokenizer.collapse_whitespace(text)
+
+
+def uncached(text, lang):
+    tokenizer._num2words.cache_clear()
+    return tokenizer.multilingual_cleaners(text, lang)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--langs", nargs="+", default=["en", "de", "fr", "ru"])
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    runs = {"sequential": sequential, "uncached": uncached, "normalizer": tokenizer.multilingual_cleaners}
+    print("characters/s")
+    print(f"{'lang':<6}{'texts':<10}" + "".join(f"{name:>12}" for name in runs))
+    for lang in args.langs:
+        for kind, texts in TEXTS.items():
+            text = texts[lang]
+            assert len({run(text, lang) for run in runs.values()}) == 1
+            speeds = []
+            for run in runs.values():
+                start = time.perf_counter()
+                for _ in range(args.repeats):
+                    run(text, lang)
+                speeds.append(len(text) * args.repeats / (time.perf_counter() - start))
+            print(f"{lang:<6}{kind:<10}" + "".join(f"{speed:>12.0f}" for speed in speeds))
+
+
+if __name__ == "__main__":
+    main()
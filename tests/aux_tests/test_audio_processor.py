@@ -1,5 +1,6 @@
 import os
 
+import numpy as np
 import pytest
 
 from tests import get_tests_input_path
@@ -57,6 +58,31 @@ def test_audio_synthesis(tmp_path, ap, norms):
     ap.save_wav(wav_, tmp_path / file_name)
 
 
+def test_inv_melspectrogram_batch(ap):
+    mel = ap.melspectrogram(ap.load_wav(WAV_FILE)[:22050])
+    mels = [mel, mel[:, :40]]
+    wavs = ap.inv_melspectrogram_batch(mels)
+    assert [len(wav) for wav in wavs] == [(m.shape[1] - 1) * ap.hop_length for m in mels]
+    assert wavs[0].shape == ap.inv_melspectrogram(mel).shape
+
+
+@pytest.mark.parametrize("preemphasis", [0.0, 0.97])
+def test_torch_feature_backend(preemphasis):
+    ap = AudioProcessor(**{**conf, "preemphasis": preemphasis})
+    ap_torch = AudioProcessor(**{**conf, "preemphasis": preemphasis, "feature_backend": "torch"})
+    wav = ap.load_wav(WAV_FILE)
+    wavs = [wav[:22050], wav[:20000], wav[:1000]]
+    for expected, mel in zip([ap.melspectrogram(w) for w in wavs], ap_torch.melspectrogram_batch(wavs)):
+        assert mel.shape == expected.shape and mel.dtype == expected.dtype
+        assert np.allclose(mel, expected, atol=1e-3)
+    # float32 rounding shows in the quietest bins of the linear spectrogram
+    for expected, spec in zip([ap.spectrogram(w) for w in wavs], ap_torch.spectrogram_batch(wavs)):
+        assert spec.shape == expected.shape
+        assert np.allclose(spec, expected, atol=5e-2)
+        assert np.abs(spec - expected).mean() < 1e-4
+    assert np.allclose(ap_torch.melspectrogram(wav), ap.melspectrogram(wav), atol=1e-3)
+
+
 def test_normalize(ap):
     """Check normalization and denormalization for range values and consistency"""
     print(" > Testing normalization and denormalization.")
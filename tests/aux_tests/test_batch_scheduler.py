@@ -0,0 +1,79 @@
+import threading
+
+import pytest
+
+from TTS.server.scheduler import BatchScheduler
+
+
+class FakeSynthesizer:
+    """Returns the text of each request and records the batches it was called with."""
+
+    def __init__(self, fail_on=None):
+        self.batches = []
+        self.fail_on = fail_on
+        self.release = threading.Event()
+
+    def __call__(self, requests):
+        self.release.wait(5)
+        self.batches.append([r.text for r in requests])
+        if any(r.text == self.fail_on for r in requests):
+            raise RuntimeError("synthesis failed")
+        return [r.text.upper() for r in requests]
+
+
+@pytest.fixture
+def synthesizer():
+    return FakeSynthesizer(fail_on="bad")
+
+
+def test_batching(synthesizer):
+    scheduler = BatchScheduler(synthesizer, max_batch_size=3, max_wait_ms=200)
+    requests = [scheduler.submit(f"text {i}", speaker="a") for i in range(5)]
+    synthesizer.release.set()
+    assert [r.result(5) for r in requests] == [f"TEXT {i}" for i in range(5)]
+    scheduler.close(5)
+
+    assert synthesizer.batches == [["text 0", "text 1", "text 2"], ["text 3", "text 4"]]
+    assert [r.batch_size for r in requests] == [3, 3, 3, 2, 2]
+    stats = scheduler.stats()
+    assert stats["requests"] == 5
+    assert stats["batches"] == 2
+    assert stats["mean_batch_size"] == 2.5
+    assert stats["latency_p50"] >= stats["queue_time_p50"] >= 0
+
+
+def test_incompatible_requests(synthesizer):
+    scheduler = BatchScheduler(synthesizer, max_batch_size=8, max_wait_ms=200)
+    requests = [
+        scheduler.submit("a", speaker="a"),
+        scheduler.submit("b", speaker_wav="b.wav"),
+        scheduler.submit("c", speaker="c"),
+        scheduler.submit("d", speaker="d", speed=1.5),
+        scheduler.submit("e", speaker_wav="e.wav"),
+    ]
+    synthesizer.release.set()
+    assert [r.result(5) for r in requests] == ["A", "B", "C", "D", "E"]
+    scheduler.close(5)
+    assert synthesizer.batches == [["a", "c"], ["b", "e"], ["d"]]
+
+
+def test_failed_request(synthesizer):
+    scheduler = BatchScheduler(synthesizer, max_batch_size=8, max_wait_ms=200)
+    requests = [scheduler.submit(text) for text in ("good", "bad", "fine")]
+    synthesizer.release.set()
+    assert requests[0].result(5) == "GOOD"
+    with pytest.raises(RuntimeError):
+        requests[1].result(5)
+    assert requests[2].result(5) == "FINE"
+    scheduler.close(5)
+
+    # the failed batch is retried one request at a time
+    assert synthesizer.batches == [["good", "bad", "fine"], ["good"], ["bad"], ["fine"]]
+    stats = scheduler.stats()
+    assert stats["requests"] == 3
+    assert stats["failed_requests"] == 1
+
+
+def test_invalid_batch_size(synthesizer):
+    with pytest.raises(ValueError):
+        BatchScheduler(synthesizer, max_batch_size=0)
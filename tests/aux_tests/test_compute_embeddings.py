@@ -0,0 +1,46 @@
+import os
+
+import torch
+from trainer.io import save_checkpoint
+
+from tests import get_tests_data_path, get_tests_input_path
+from TTS.bin.compute_embeddings import main
+from TTS.config import load_config
+from TTS.encoder.utils.generic_utils import setup_encoder_model
+from TTS.tts.utils.managers import EmbeddingManager, load_file, save_file
+
+encoder_config_path = os.path.join(get_tests_input_path(), "test_speaker_encoder_config.json")
+
+
+def test_compute_embeddings(tmp_path):
+    config = load_config(encoder_config_path)
+    model = setup_encoder_model(config)
+    save_checkpoint(config, model, str(tmp_path), current_step=0, epoch=0)
+    model_path = str(tmp_path / "checkpoint_0.pth")
+    output_path = tmp_path / "speakers.pth"
+    args = ["--model_path", model_path, "--config_path", encoder_config_path, "--output_path", str(output_path)]
+    args += ["--formatter_name", "ljspeech", "--dataset_name", "ljspeech", "--meta_file_train", "metadata.csv"]
+    args += ["--dataset_path", os.path.join(get_tests_data_path(), "ljspeech"), "--no_eval", "--disable_cuda"]
+    args += ["--batch_size", "3", "--num_workers", "1", "--checkpoint_interval", "4"]
+
+    main(args)
+    embeddings = load_file(output_path)
+    assert len(embeddings) == 8
+    assert not (tmp_path / "speakers.pth.partial").exists()
+    manager = EmbeddingManager(encoder_model_path=model_path, encoder_config_path=encoder_config_path)
+    key, value = next(iter(embeddings.items()))
+    audio_file = os.path.join(get_tests_data_path(), "ljspeech", key.split("#")[1] + ".wav")
+    assert torch.allclose(
+        torch.tensor(value["embedding"]), torch.tensor(manager.compute_embedding_from_clip(audio_file)), atol=1e-5
+    )
+
+    # resume from the checkpoint of an interrupted run
+    save_file({key: {"name": "ljspeech", "embedding": [0.0] * 256}}, tmp_path / "speakers.pth.partial" / "000000.pth")
+    main(args)
+    assert load_file(output_path)[key]["embedding"] == [0.0] * 256
+    assert not (tmp_path / "speakers.pth.partial").exists()
+
+    # reuse the embeddings of an old file
+    new_output_path = tmp_path / "new_speakers.pth"
+    main(args + ["--old_file", str(output_path), "--output_path", str(new_output_path)])
+    assert load_file(new_output_path) == load_file(output_path)
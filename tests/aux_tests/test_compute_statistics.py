@@ -1,10 +1,47 @@
+import shutil
 from pathlib import Path
 
-from tests import get_tests_input_path, run_main
-from TTS.bin.compute_statistics import main
+import numpy as np
+
+from tests import get_tests_data_path, get_tests_input_path, run_main
+from TTS.bin.compute_statistics import feature_stats, main, merge_stats
 
 
 def test_compute_statistics(tmp_path):
     config_path = Path(get_tests_input_path()) / "test_glow_tts_config.json"
     output_path = tmp_path / "scale_stats.npy"
     run_main(main, ["--config_path", str(config_path), "--out_path", str(output_path)])
+
+
+def test_merge_stats():
+    x = np.random.default_rng(0).normal(1000.0, 2.0, size=(3, 100))
+    stats = merge_stats(feature_stats(x[:, :30]), feature_stats(x[:, 30:]))
+    assert stats["count"][0] == 100
+    assert np.allclose(stats["mean"], x.mean(1))
+    assert np.allclose(np.sqrt(stats["m2"] / stats["count"]), x.std(1))
+
+
+def test_compute_statistics_update(tmp_path):
+    config_path = str(Path(get_tests_input_path()) / "test_glow_tts_config.json")
+    wav_files = sorted((Path(get_tests_data_path()) / "ljspeech" / "wavs").glob("*.wav"))[:6]
+    data_path = tmp_path / "wavs"
+    data_path.mkdir()
+    for wav_file in wav_files[:3]:
+        shutil.copy(wav_file, data_path)
+    output_path = tmp_path / "scale_stats.npy"
+    args = [config_path, str(output_path), "--data_path", str(data_path), "--num_workers", "2", "--chunk_size", "2"]
+    run_main(main, args)
+    assert len(np.load(output_path, allow_pickle=True).item()["files"]) == 3
+
+    # only the new files are computed
+    for wav_file in wav_files[3:]:
+        shutil.copy(wav_file, data_path)
+    run_main(main, args + ["--update"])
+    updated = np.load(output_path, allow_pickle=True).item()
+    assert len(updated["files"]) == 6
+
+    full_path = tmp_path / "full_stats.npy"
+    run_main(main, [config_path, str(full_path), "--data_path", str(data_path), "--num_workers", "1"])
+    full = np.load(full_path, allow_pickle=True).item()
+    for key in ["mel_mean", "mel_std", "linear_mean", "linear_std"]:
+        assert np.allclose(updated[key], full[key])
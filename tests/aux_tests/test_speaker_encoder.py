@@ -68,6 +68,25 @@ class ResNetSpeakerEncoderTests(unittest.TestCase):
         assert len(output.shape) == 2
 
 
+def test_compute_embedding_batch():
+    # mel inputs are shorter than `num_frames` in their second dimension, so each gives one window
+    model = LSTMSpeakerEncoder(input_dim=40, proj_dim=32, lstm_dim=64, num_lstm_layers=2).eval()
+    inputs = [T.rand(1, 40, n) for n in (30, 50, 50)]
+    expected = T.cat([model.compute_embedding(x) for x in inputs])
+    assert T.allclose(model.compute_embedding_batch(inputs), expected, atol=1e-5)
+
+    # waveform inputs, cut into `num_eval` overlapping windows of equal length
+    audio_config = {"fft_size": 400, "win_length": 400, "hop_length": 160, "sample_rate": 16000, "preemphasis": 0.97}
+    audio_config["num_mels"] = 64
+    model = ResNetSpeakerEncoder(
+        input_dim=64, proj_dim=32, layers=[1, 1, 1, 1], use_torch_spec=True, audio_config=audio_config
+    ).eval()
+    inputs = [T.rand(1, n) for n in (6000, 16000, 8030, 12000)]
+    expected = T.cat([model.compute_embedding(x.clone(), num_frames=50, num_eval=5) for x in inputs])
+    output = model.compute_embedding_batch(inputs, num_frames=50, num_eval=5, max_batch_size=4)
+    assert T.allclose(output, expected, atol=1e-5)
+
+
 class GE2ELossTests(unittest.TestCase):
     # pylint: disable=R0201
     def test_in_out(self):
@@ -0,0 +1,95 @@
+import inspect
+import io
+
+import numpy as np
+import pytest
+import soundfile as sf
+import torch
+import torchaudio
+
+from TTS.server.streaming import StreamResampler, encode_audio, encode_stream
+from TTS.utils.audio.numpy_transforms import save_wav
+
+SAMPLE_RATE = 22050
+
+
+@pytest.fixture
+def chunks():
+    t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+    return [(0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32) for _ in range(3)]
+
+
+def test_pcm_stream(chunks):
+    data = list(encode_stream(chunks, "pcm", SAMPLE_RATE))
+    assert len(data) == len(chunks)
+    pcm = np.frombuffer(b"".join(data), dtype="<i2")
+    assert np.allclose(pcm / 32767, np.concatenate(chunks), atol=1e-4)
+
+
+def test_wav_stream(chunks):
+    data = list(encode_stream(chunks, "wav", SAMPLE_RATE))
+    assert len(data[0]) == 44  # header is sent before any audio
+    wav, sr = sf.read(io.BytesIO(b"".join(data)), dtype="float32")
+    assert sr == SAMPLE_RATE
+    assert np.allclose(wav, np.concatenate(chunks), atol=1e-4)
+
+
+def test_opus_stream(chunks):
+    data = b"".join(encode_stream(chunks, "opus", SAMPLE_RATE))
+    wav, sr = sf.read(io.BytesIO(data))
+    assert sr == 48000  # resampled to a sample rate supported by Opus
+    assert abs(len(wav) / sr - len(chunks)) < 0.1
+
+
+def test_mp3_stream(chunks):
+    data = b"".join(encode_stream(chunks, "mp3", SAMPLE_RATE))
+    wav, sr = sf.read(io.BytesIO(data))
+    assert sr == SAMPLE_RATE
+    assert abs(len(wav) / sr - len(chunks)) < 0.1
+
+
+def test_mp3_encoder_soundfile_version():
+    # `compression_level` and `bitrate_mode` of the MP3 encoder were added in soundfile 0.13.0, the minimum version
+    parameters = inspect.signature(sf.SoundFile).parameters
+    assert "compression_level" in parameters
+    assert "bitrate_mode" in parameters
+
+
+@pytest.mark.parametrize(("orig_freq", "new_freq"), [(22050, 48000), (44100, 48000), (48000, 22050)])
+def test_stream_resampler(orig_freq, new_freq):
+    wav = np.random.default_rng(0).standard_normal(20000).astype(np.float32)
+    expected = torchaudio.functional.resample(torch.from_numpy(wav), orig_freq, new_freq).numpy()
+    resampler = StreamResampler(orig_freq, new_freq)
+    # chunk boundaries don't change the output
+    chunks = [resampler.resample(chunk) for chunk in np.split(wav, [1, 700, 701, 5000, 12345])]
+    output = np.concatenate([*chunks, resampler.flush()])
+    assert output.shape == expected.shape
+    assert np.allclose(output, expected, atol=1e-6)
+
+
+def test_unsupported_format(chunks):
+    with pytest.raises(ValueError):
+        list(encode_stream(chunks, "flac", SAMPLE_RATE))
+    with pytest.raises(ValueError):
+        encode_audio(chunks[0], "ogg", SAMPLE_RATE)
+
+
+def test_encode_wav(chunks):
+    wav = np.concatenate(chunks)
+    buffer = io.BytesIO()
+    save_wav(wav=wav, path=buffer, sample_rate=SAMPLE_RATE)
+    assert encode_audio(wav, "wav", SAMPLE_RATE) == buffer.getvalue()
+
+
+@pytest.mark.parametrize("fmt", ["pcm", "flac", "mp3"])
+def test_encode_audio(chunks, fmt):
+    wav = np.concatenate(chunks)
+    data = encode_audio(wav, fmt, SAMPLE_RATE, normalize=False)
+    if fmt == "pcm":
+        decoded = np.frombuffer(data, dtype="<i2") / 32767
+    else:
+        decoded, sr = sf.read(io.BytesIO(data))
+        assert sr == SAMPLE_RATE
+    assert abs(len(decoded) - len(wav)) < 0.01 * SAMPLE_RATE
+    if fmt != "mp3":  # lossless
+        assert np.allclose(decoded, wav, atol=1e-4)
@@ -2,7 +2,7 @@ import numpy as np
 import torch
 
 from TTS.utils.audio import numpy_transforms as np_transforms
-from TTS.utils.audio.torch_transforms import amp_to_db, db_to_amp
+from TTS.utils.audio.torch_transforms import amp_to_db, db_to_amp, griffin_lim
 
 
 def test_amplitude_db_conversion():
@@ -14,3 +14,54 @@ def test_amplitude_db_conversion():
     assert torch.allclose(x, o2)
     assert torch.allclose(o1, torch.tensor(np_o1))
     assert torch.allclose(o2, torch.tensor(np_o2))
+
+
+def _spectral_convergence(wav, spec, **kwargs):
+    rebuilt = np.abs(np_transforms.stft(y=wav.astype(np.float32), **kwargs))
+    return np.linalg.norm(rebuilt - spec) / np.linalg.norm(spec)
+
+
+def test_griffin_lim():
+    t = np.arange(11025) / 22050
+    wav = (0.5 * np.sin(2 * np.pi * (200 + 300 * t) * t) + 0.3 * np.sin(2 * np.pi * 1200 * t)).astype(np.float32)
+    stft_kwargs = {"fft_size": 1024, "hop_length": 256, "win_length": 1024, "pad_mode": "reflect"}
+    spec = np.abs(np_transforms.stft(y=wav, **stft_kwargs))
+    gl_kwargs = {"n_fft": 1024, "hop_length": 256, "win_length": 1024}
+
+    # same initial phases as the numpy implementation
+    np.random.seed(0)
+    angles = torch.from_numpy(np.exp(2j * np.pi * np.random.rand(*spec.shape))).to(torch.complex64)
+    np.random.seed(0)
+    expected = np_transforms.griffin_lim(spec=spec, num_iter=10, **stft_kwargs)
+    output = griffin_lim(torch.from_numpy(spec), num_iter=10, momentum=0, angles=angles, **gl_kwargs)
+    assert output.shape == expected.shape
+    assert np.allclose(output.numpy(), expected, atol=1e-4)
+
+    # batched with zero padding
+    specs = torch.stack([torch.from_numpy(spec), torch.nn.functional.pad(torch.from_numpy(spec[:, :30]), (0, 14))])
+    angles = torch.stack([angles, angles])
+    output = griffin_lim(specs, num_iter=10, momentum=0, angles=angles, **gl_kwargs)
+    assert torch.allclose(output[0], torch.from_numpy(expected).float(), atol=1e-4)
+    assert output.shape == (2, expected.shape[0])
+
+    # fast Griffin-Lim converges faster
+    torch.manual_seed(0)
+    fast = griffin_lim(torch.from_numpy(spec), num_iter=16, momentum=0.99, **gl_kwargs).numpy()
+    torch.manual_seed(0)
+    slow = griffin_lim(torch.from_numpy(spec), num_iter=32, momentum=0, **gl_kwargs).numpy()
+    assert _spectral_convergence(fast, spec, **stft_kwargs) < _spectral_convergence(slow, spec, **stft_kwargs)
+
+
+def test_griffin_lim_short():
+    # outputs shorter than the STFT padding are reflected like in librosa
+    stft_kwargs = {"fft_size": 1024, "hop_length": 256, "win_length": 1024, "pad_mode": "reflect"}
+    gl_kwargs = {"n_fft": 1024, "hop_length": 256, "win_length": 1024}
+    spec = np.random.rand(513, 3)
+    np.random.seed(0)
+    angles = torch.from_numpy(np.exp(2j * np.pi * np.random.rand(*spec.shape))).to(torch.complex64)
+    np.random.seed(0)
+    expected = np_transforms.griffin_lim(spec=spec, num_iter=5, **stft_kwargs)
+    output = griffin_lim(torch.from_numpy(spec).float(), num_iter=5, momentum=0, angles=angles, **gl_kwargs)
+    assert output.shape == expected.shape
+    assert np.allclose(output.numpy(), expected, atol=1e-4)
+    assert griffin_lim(torch.rand(513, 1), **gl_kwargs).shape == (0,)
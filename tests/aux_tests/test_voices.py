@@ -0,0 +1,75 @@
+import torch
+
+from TTS.utils.voices import CloningMixin, VoiceCache, voice_cache
+
+
+class DummyCloner(CloningMixin):
+    def __init__(self):
+        self.num_clones = 0
+
+    def _clone_voice(self, speaker_wav, **generate_kwargs):
+        self.num_clones += 1
+        return {"embedding": torch.randn(4)}, {"name": "dummy"}
+
+
+def test_voice_cache_lru():
+    cache = VoiceCache(max_entries=2, max_bytes=1000)
+    cache.put(("m", 1), {"a": torch.zeros(10)})
+    cache.put(("m", 2), {"a": torch.zeros(10)})
+    assert cache.get(("m", 1)) is not None  # 1 is now the most recently used
+    cache.put(("m", 3), {"a": torch.zeros(10)})
+    assert cache.get(("m", 2)) is None
+    assert cache.get(("m", 1)) is not None
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 1, "entries": 2, "bytes": 80}
+
+    cache.put(("m", 4), {"a": torch.zeros(300)})  # larger than max_bytes
+    assert cache.get(("m", 4)) is None
+    cache.put(("m", 4), {"a": torch.zeros(250)})  # evicts everything else
+    assert len(cache) == 1
+
+    cache.invalidate("other")
+    assert len(cache) == 1
+    cache.invalidate("m")
+    assert len(cache) == 0
+    assert cache.stats()["bytes"] == 0
+
+
+def test_clone_voice_cache(tmp_path):
+    wav = tmp_path / "ref.wav"
+    wav.write_bytes(b"audio")
+    model = DummyCloner()
+
+    voice = model.clone_voice(wav)
+    assert torch.equal(model.clone_voice(str(wav))["embedding"], voice["embedding"])
+    assert model.num_clones == 1
+    model.clone_voice(wav, load_sr=16000)  # different settings
+    assert model.num_clones == 2
+    # other model instances don't share voices
+    other = DummyCloner()
+    other.clone_voice(wav)
+    assert other.num_clones == 1
+
+    wav.write_bytes(b"changed audio")
+    model.clone_voice(wav)
+    assert model.num_clones == 3
+
+    model.clear_voice_cache()
+    model.clone_voice(wav)
+    assert model.num_clones == 4
+
+
+def test_load_voice_file_cache(tmp_path, monkeypatch):
+    wav = tmp_path / "ref.wav"
+    wav.write_bytes(b"audio")
+    model = DummyCloner()
+    voice = model.clone_voice(wav, speaker_id="speaker", voice_dir=tmp_path)
+
+    loads = []
+    load_voice_file = model.load_voice_file
+    monkeypatch.setattr(model, "load_voice_file", lambda *args: loads.append(args) or load_voice_file(*args))
+    hits = voice_cache.hits
+    for _ in range(3):
+        loaded = model.clone_voice(None, speaker_id="speaker", voice_dir=tmp_path)
+        assert torch.equal(loaded["embedding"], voice["embedding"])
+    assert len(loads) == 1
+    assert voice_cache.hits == hits + 2
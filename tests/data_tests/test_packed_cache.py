@@ -0,0 +1,69 @@
+import pickle
+from multiprocessing import Pool
+
+import numpy as np
+
+from TTS.tts.datasets.cache import PackedCache, string2filename
+
+
+def _fill(args):
+    cache_path, start = args
+    cache = PackedCache(cache_path, "test")
+    for i in range(start, start + 20):
+        cache.get_or_compute(f"sample_{i}", lambda i=i: np.arange(i, dtype=np.float32))
+
+
+def test_packed_cache(tmp_path):
+    cache = PackedCache(tmp_path, "test")
+    assert cache.get("a") is None
+    ids = cache.put("a", np.array([1, 2, 3], dtype=np.int32))
+    assert ids.dtype == np.int32 and ids.tolist() == [1, 2, 3]
+    assert not ids.flags.writeable  # a view into the memory map
+    assert cache.put("empty", np.zeros(0)).shape == (0,)
+
+    # reopened and appended to
+    cache = PackedCache(tmp_path, "test")
+    assert cache.get("a").tolist() == [1, 2, 3]
+    assert cache.get_or_compute("b", lambda: np.array([0.5])).tolist() == [0.5]
+    assert cache.get_or_compute("b", lambda: np.array([1.0])).tolist() == [0.5]
+    assert len(cache) == 3
+
+    # files of the previous one file per sample format are imported
+    np.save(tmp_path / f"{string2filename('legacy')}_test.npy", np.array([4, 5]))
+    assert PackedCache(tmp_path, "test").get("legacy") is None
+    cache = PackedCache(tmp_path, "test", legacy_suffix="_test.npy")
+    assert cache.get("legacy").tolist() == [4, 5]
+    assert pickle.loads(pickle.dumps(cache)).get("legacy").tolist() == [4, 5]
+
+
+def test_packed_cache_partial_index_line(tmp_path):
+    cache = PackedCache(tmp_path, "test")
+    cache.put("a", np.array([1, 2, 3]))
+    # a process crashed while appending an index line
+    with open(cache.index_file, "ab") as f:
+        f.write(b'{"key": "b", "off')
+    cache = PackedCache(tmp_path, "test")
+    assert cache.get("a").tolist() == [1, 2, 3]
+    assert cache.get("b") is None
+    assert cache.put("b", np.array([4, 5])).tolist() == [4, 5]
+    cache = PackedCache(tmp_path, "test")
+    assert len(cache) == 2
+    assert cache.get("b").tolist() == [4, 5]
+
+    # caches where a later line was appended to the partial one before this fix
+    with open(cache.index_file, "ab") as f:
+        f.write(b'{"key": "c", "off{"key": "d", "offset": 0, "length": 0, "dtype": "<f4"}\n')
+    cache = PackedCache(tmp_path, "test")
+    assert cache.get("c") is None
+    assert cache.put("d", np.array([6])).tolist() == [6]
+    assert len(cache) == 3
+
+
+def test_packed_cache_concurrent_writes(tmp_path):
+    # overlapping samples written by several processes
+    with Pool(4) as pool:
+        pool.map(_fill, [(tmp_path, start) for start in (0, 10, 20, 30)])
+    cache = PackedCache(tmp_path, "test")
+    assert len(cache) == 50
+    for i in range(50):
+        assert np.array_equal(cache.get(f"sample_{i}"), np.arange(i, dtype=np.float32))
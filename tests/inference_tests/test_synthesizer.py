@@ -1,30 +1,58 @@
 import os
+import shutil
+import tempfile
+import threading
 import unittest
 
+import numpy as np
 from trainer.io import save_checkpoint
 
 from tests import get_tests_input_path
 from TTS.config import load_config
+from TTS.tts.configs.glow_tts_config import GlowTTSConfig
 from TTS.tts.models import setup_model
 from TTS.utils.synthesizer import Synthesizer
+from TTS.vocoder.configs.multiband_melgan_config import MultibandMelganConfig
+from TTS.vocoder.models import setup_model as setup_vocoder_model
 
 
 class SynthesizerTest(unittest.TestCase):
     # pylint: disable=R0201
-    def _create_random_model(self):
-        # pylint: disable=global-statement
-        config = load_config(os.path.join(get_tests_input_path(), "dummy_model_config.json"))
-        model = setup_model(config)
-        output_path = os.path.join(get_tests_input_path())
-        save_checkpoint(config, model, output_path, current_step=10, epoch=1)
+    def _create_synthesizer(self) -> Synthesizer:
+        """Return a synthesizer with a random model, saved to a temporary directory."""
+        config_path = os.path.join(get_tests_input_path(), "dummy_model_config.json")
+        config = load_config(config_path)
+        output_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_path)
+        save_checkpoint(config, setup_model(config), output_path, current_step=10, epoch=1)
+        synthesizer = Synthesizer(
+            tts_checkpoint=os.path.join(output_path, "checkpoint_10.pth"), tts_config_path=config_path
+        )
+        synthesizer.tts_model.decoder.max_decoder_steps = 50  # the random model might not stop on its own
+        return synthesizer
 
     def test_in_out(self):
-        self._create_random_model()
-        tts_root_path = get_tests_input_path()
-        tts_checkpoint = os.path.join(tts_root_path, "checkpoint_10.pth")
-        tts_config = os.path.join(tts_root_path, "dummy_model_config.json")
-        synthesizer = Synthesizer(tts_checkpoint=tts_checkpoint, tts_config_path=tts_config)
-        synthesizer.tts("Better this test works!!")
+        synthesizer = self._create_synthesizer()
+        wav = synthesizer.tts("Better this test works!!")
+        assert isinstance(wav, np.ndarray)
+        assert wav.dtype == np.float32
+        assert wav.ndim == 1
+        assert not wav[-synthesizer.sentence_pause :].any()
+
+    def test_tts_batch(self):
+        synthesizer = self._create_synthesizer()
+        texts = ["Better this test works!!", "Two sentences. In one text."]
+        wavs = synthesizer.tts_batch(texts)
+        assert len(wavs) == len(texts)
+        assert all(len(wav) > 0 for wav in wavs)
+        assert all(wav.dtype == np.float32 for wav in wavs)
+
+    def test_tts_stream(self):
+        synthesizer = self._create_synthesizer()
+        text = "Two sentences. In one text."
+        chunks = list(synthesizer.tts_stream(text))
+        assert len(chunks) == 4  # one chunk per sentence, each followed by a pause
+        assert all(chunk.dtype == np.float32 for chunk in chunks)
 
     def test_split_into_sentences(self):
         """Check demo server sentences split as expected"""
@@ -77,3 +105,57 @@ class SynthesizerTest(unittest.TestCase):
             "b. The second item",
             "c. The third list item",
         ]
+
+
+def _create_glow_tts_synthesizer(output_path, with_vocoder=False):
+    config = GlowTTSConfig(inference_noise_scale=0.0)
+    save_checkpoint(config, setup_model(config), output_path, current_step=0, epoch=1)
+    config.save_json(os.path.join(output_path, "glow_tts_config.json"))
+    vocoder_args = {}
+    if with_vocoder:
+        vocoder_path = os.path.join(output_path, "vocoder")
+        os.makedirs(vocoder_path, exist_ok=True)
+        vocoder_config = MultibandMelganConfig()
+        save_checkpoint(vocoder_config, setup_vocoder_model(vocoder_config), vocoder_path, current_step=0, epoch=1)
+        vocoder_config.save_json(os.path.join(vocoder_path, "config.json"))
+        vocoder_args = {
+            "vocoder_checkpoint": os.path.join(vocoder_path, "checkpoint_0.pth"),
+            "vocoder_config": os.path.join(vocoder_path, "config.json"),
+        }
+    return Synthesizer(
+        tts_checkpoint=os.path.join(output_path, "checkpoint_0.pth"),
+        tts_config_path=os.path.join(output_path, "glow_tts_config.json"),
+        **vocoder_args,
+    )
+
+
+def test_tts_return_list(tmp_path):
+    synthesizer = _create_glow_tts_synthesizer(tmp_path, with_vocoder=True)
+    text = "Two sentences. In one text."
+    wav = synthesizer.tts(text)
+    wav_list = synthesizer.tts(text, return_list=True)
+    assert isinstance(wav_list, list)
+    assert isinstance(wav_list[0], float)
+    np.testing.assert_allclose(np.array(wav_list, dtype=np.float32), wav, atol=1e-6)
+
+
+def test_tts_batched_sentences(tmp_path):
+    # with a vocoder, as the random phases of Griffin-Lim differ between runs
+    synthesizer = _create_glow_tts_synthesizer(tmp_path, with_vocoder=True)
+    text = "Two sentences. In one text. And a third, longer one."
+    wav = synthesizer.tts(text, batch_sentences=True)
+    np.testing.assert_allclose(wav, synthesizer.tts(text, batch_sentences=False), atol=1e-5)
+
+
+def test_tts_pipelined_vocoder(tmp_path):
+    synthesizer = _create_glow_tts_synthesizer(tmp_path, with_vocoder=True)
+    text = "Two sentences. In one text. And a third one."
+    wav = synthesizer.tts(text, batch_sentences=False)
+    sentence_wavs = [synthesizer.tts(sentence) for sentence in synthesizer.split_into_sentences(text)]
+    np.testing.assert_allclose(wav, np.concatenate(sentence_wavs), atol=1e-6)
+
+    # the TTS model thread stops when the output is not consumed anymore
+    stream = synthesizer.tts_stream(text)
+    next(stream)
+    stream.close()
+    assert not any(thread.name == "tts-acoustic-model" for thread in threading.enumerate())
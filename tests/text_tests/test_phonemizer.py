@@ -5,6 +5,7 @@ from packaging.version import Version
 
 from TTS.tts.utils.text.phonemizers import ESpeak, Gruut, JA_JP_Phonemizer, ZH_CN_Phonemizer
 from TTS.tts.utils.text.phonemizers.bangla_phonemizer import BN_Phonemizer
+from TTS.tts.utils.text.phonemizers.espeak_lib import get_espeak_library
 from TTS.tts.utils.text.phonemizers.espeak_wrapper import _is_tool
 from TTS.tts.utils.text.phonemizers.multi_phonemizer import MultiPhonemizer
 
@@ -138,6 +139,27 @@ class TestEspeakNgPhonemizer(unittest.TestCase):
         self.assertTrue(self.phonemizer.is_available())
 
 
+@pytest.mark.skipif(get_espeak_library() is None, reason="libespeak-ng not installed")
+class TestEspeakNgLibrary(unittest.TestCase):
+    def setUp(self):
+        self.phonemizer = ESpeak(language="en-us", backend="espeak-ng")
+
+    def test_phonemize_batch(self):
+        texts = EXAMPLE_TEXTs + ["Be a voice, not an! echo?"]
+        self.assertEqual(self.phonemizer.phonemize_batch(texts), [self.phonemizer.phonemize(t) for t in texts])
+
+    def test_switch_language(self):
+        phonemizer_pl = ESpeak(language="pl")
+        self.assertEqual(phonemizer_pl.phonemize("źrebię", separator=""), "ʑrˈɛbjɛ")
+        self.assertEqual(self.phonemizer.phonemize("hello", separator=""), "həlˈoʊ")
+
+    @pytest.mark.skipif(not _is_tool("espeak-ng"), reason="espeak-ng not installed")
+    def test_same_as_command_line(self):
+        phonemizer_cli = ESpeak(language="en-us", backend="espeak-ng", use_library=False)
+        for text in EXAMPLE_TEXTs + ["Be a voice, not an! echo?"]:
+            self.assertEqual(self.phonemizer.phonemize(text), phonemizer_cli.phonemize(text))
+
+
 class TestGruutPhonemizer(unittest.TestCase):
     def setUp(self):
         self.phonemizer = Gruut(language="en-us", use_espeak_phonemes=True, keep_stress=False)
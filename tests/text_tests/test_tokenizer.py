@@ -1,10 +1,14 @@
+import os
+import tempfile
 import unittest
 from dataclasses import dataclass, field
 
 from coqpit import Coqpit
 
 from TTS.tts.utils.text.characters import Graphemes, IPAPhonemes, _blank, _bos, _eos, _pad, _phonemes, _punctuations
+from TTS.tts.utils.text.cleaners import basic_cleaners
 from TTS.tts.utils.text.phonemizers import ESpeak
+from TTS.tts.utils.text.token_cache import SqliteTokenStore, TokenCache
 from TTS.tts.utils.text.tokenizer import TTSTokenizer
 
 
@@ -98,3 +102,53 @@ class TestTTSTokenizer(unittest.TestCase):
         ids = tokenizer_ph.text_to_ids(text)
         test_hat = tokenizer_ph.ids_to_text(ids)
         self.assertEqual(text_ph, test_hat)
+
+
+class TestTokenCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = TokenCache(max_entries=2)
+        self.tokenizer = TTSTokenizer(characters=Graphemes(), text_cleaner=basic_cleaners, cache=self.cache)
+
+    def test_text_to_ids_cached(self):
+        ids = self.tokenizer.text_to_ids("Hello world!")
+        self.assertEqual(self.tokenizer.text_to_ids("Hello world!"), ids)
+        self.assertEqual(
+            ids, TTSTokenizer(characters=Graphemes(), text_cleaner=basic_cleaners).text_to_ids("Hello world!")
+        )
+        stats = self.cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertGreater(stats["time_saved"], 0)
+
+    def test_settings_in_key(self):
+        ids = self.tokenizer.text_to_ids("Hello world!")
+        self.tokenizer.add_blank = True
+        self.assertNotEqual(self.tokenizer.text_to_ids("Hello world!"), ids)
+        self.tokenizer.text_cleaner = None
+        self.tokenizer.text_to_ids("Hello world!")
+        self.assertEqual(self.cache.stats()["misses"], 3)
+
+    def test_lru_eviction(self):
+        for text in ("a", "b", "a", "c"):
+            self.tokenizer.text_to_ids(text)
+        self.assertEqual(len(self.cache), 2)
+        self.tokenizer.text_to_ids("a")
+        self.tokenizer.text_to_ids("b")
+        self.assertEqual(self.cache.stats()["hits"], 2)
+
+    def test_sqlite_store(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = SqliteTokenStore(os.path.join(tmp_dir, "tokens.db"))
+            self.tokenizer.cache = TokenCache(store=store)
+            ids = self.tokenizer.text_to_ids("Hello world!")
+            store.close()
+
+            # a new process starts with an empty memory cache
+            cache = TokenCache(store=SqliteTokenStore(os.path.join(tmp_dir, "tokens.db")))
+            self.tokenizer.cache = cache
+            self.assertEqual(self.tokenizer.text_to_ids("Hello world!"), ids)
+            self.assertEqual(self.tokenizer.text_to_ids("Hello world!"), ids)
+            self.assertEqual(cache.stats()["store_hits"], 1)
+            self.assertEqual(cache.stats()["hits"], 1)
+            cache.store.close()
@@ -0,0 +1,135 @@
+from types import SimpleNamespace
+
+import torch
+from torch import nn
+
+from TTS.tts.layers.bark.inference_funcs import (
+    _sample,
+    generate_coarse,
+    generate_coarse_batch,
+    generate_coarse_stream,
+    generate_text_semantic,
+    generate_text_semantic_batch,
+)
+from TTS.tts.layers.bark.model import GPT, GPTConfig, KVCache
+
+# token IDs of the default BarkConfig, which can't be imported without downloading the Bark tokenizer
+BARK_CONFIG = SimpleNamespace(
+    SEMANTIC_RATE_HZ=49.9,
+    SEMANTIC_VOCAB_SIZE=10_000,
+    CODEBOOK_SIZE=1024,
+    N_COARSE_CODEBOOKS=2,
+    N_FINE_CODEBOOKS=8,
+    COARSE_RATE_HZ=75,
+    TEXT_ENCODING_OFFSET=10_048,
+    SEMANTIC_PAD_TOKEN=10_000,
+    TEXT_PAD_TOKEN=129_595,
+    SEMANTIC_INFER_TOKEN=129_599,
+    COARSE_SEMANTIC_PAD_TOKEN=12_048,
+    COARSE_INFER_TOKEN=12_050,
+)
+NO_HISTORY = (None, None, None)
+
+
+class CharTokenizer:
+    def encode(self, text, add_special_tokens=False):  # pylint: disable=unused-argument
+        return [ord(c) % 1000 for c in text]
+
+
+class EosAfterModel(nn.Module):
+    """Semantic model that predicts token 7 until the end of sentence token at a given step of each row."""
+
+    def __init__(self, eos_steps):
+        super().__init__()
+        self.eos_steps = torch.tensor(eos_steps)
+        self.dummy = nn.Parameter(torch.zeros(1))
+
+    def forward(self, idx, merge_context=False, past_kv=None):  # pylint: disable=unused-argument
+        logits = torch.zeros(idx.shape[0], 1, 10_048)
+        logits[:, 0, 7] = 10.0
+        logits[idx.shape[1] - 513 >= self.eos_steps, 0, BARK_CONFIG.SEMANTIC_PAD_TOKEN] = 20.0
+        return logits, None
+
+
+def _gpt(input_vocab_size, output_vocab_size):
+    config = GPTConfig(
+        n_layer=2, n_head=2, n_embd=32, input_vocab_size=input_vocab_size, output_vocab_size=output_vocab_size
+    )
+    return GPT(config).eval()
+
+
+def _bark(semantic_model=None):
+    torch.manual_seed(0)
+    return SimpleNamespace(
+        config=BARK_CONFIG,
+        semantic_model=semantic_model or _gpt(129_600, 10_048),
+        coarse_model=_gpt(12_096, 12_096),
+        tokenizer=CharTokenizer(),
+        device=torch.device("cpu"),
+    )
+
+
+@torch.inference_mode()
+def test_kv_cache():
+    model = _gpt(100, 100)
+    idx = torch.randint(0, 100, (3, 20))
+    expected = torch.cat([model(idx[:, : t + 1])[0] for t in range(10, 20)], dim=1)
+
+    kv_cache = KVCache(model.config, batch_size=3, max_len=20)
+    logits = [model(idx[:, :11], past_kv=kv_cache)[0]]
+    logits += [model(idx[:, t : t + 1], past_kv=kv_cache)[0] for t in range(11, 20)]
+    assert kv_cache.length == 20
+    assert torch.allclose(torch.cat(logits, dim=1), expected, atol=1e-5)
+
+    past_kv = model(idx[:, :11], use_cache=True)[1]
+    logits, _ = model(idx[:, 11:12], past_kv=past_kv, use_cache=True)
+    assert torch.allclose(logits[:, 0], expected[:, 1], atol=1e-5)
+
+
+def test_sample():
+    logits = torch.randn(4, 50)
+    for kwargs in ({"top_k": 1}, {"top_p": 1e-6}):
+        tokens, probs = _sample(logits, temp=0.7, **kwargs)
+        assert torch.equal(tokens, logits.argmax(-1))
+        assert torch.allclose(probs.max(-1).values, torch.ones(4))
+    tokens, probs = _sample(logits, temp=0.7, top_k=5)
+    assert ((probs > 0).sum(-1) == 5).all()
+    assert (probs.gather(1, tokens.unsqueeze(1)) > 0).all()
+
+
+def test_generate_text_semantic_batch_eos():
+    model = _bark(EosAfterModel([3, 0, 5]))
+    outs = generate_text_semantic_batch(["a", "b", "c"], model, NO_HISTORY, top_k=1, silent=True, use_kv_caching=False)
+    assert [len(out) for out in outs] == [3, 0, 5]
+    assert all((out == 7).all() for out in outs)
+
+
+def test_generate_batch_matches_single():
+    model = _bark()
+    texts = ["Hello world.", "A longer text in the same batch."]
+    single = [
+        generate_text_semantic(text, model, NO_HISTORY, top_k=1, max_gen_duration_s=0.5, silent=True) for text in texts
+    ]
+    batch = generate_text_semantic_batch(texts, model, NO_HISTORY, top_k=1, max_gen_duration_s=0.5, silent=True)
+    assert all(torch.equal(a, b) for a, b in zip(single, batch))
+
+    x_semantics = [torch.randint(0, 10_000, (100,)), torch.randint(0, 10_000, (40,))]
+    single = [generate_coarse(x, model, NO_HISTORY, top_k=1, silent=True) for x in x_semantics]
+    batch = generate_coarse_batch(x_semantics, model, NO_HISTORY, top_k=1, silent=True)
+    assert [x.shape for x in batch] == [(2, 150), (2, 60)]
+    assert all(torch.equal(a, b) for a, b in zip(single, batch))
+
+
+def test_generate_coarse_stream():
+    model = _bark()
+    x_semantic = torch.randint(0, 10_000, (100,))
+    history = (torch.randint(0, 10_000, (60,)), torch.randint(0, 1024, (2, 90)), None)
+    for kwargs in ({}, {"base": history}):
+        torch.manual_seed(1)
+        expected = generate_coarse(x_semantic, model, NO_HISTORY, silent=True, **kwargs)
+        torch.manual_seed(1)
+        windows = list(
+            generate_coarse_stream(x_semantic, model, NO_HISTORY, silent=True, sliding_window_len=61, **kwargs)
+        )
+        assert len(windows) == 5
+        assert torch.equal(torch.cat(windows, dim=1), expected)
@@ -1,5 +1,6 @@
 import torch as T
 
+from TTS.tts.configs.fast_pitch_config import FastPitchConfig
 from TTS.tts.models.forward_tts import ForwardTTS, ForwardTTSArgs
 from TTS.tts.utils.helpers import sequence_mask
 
@@ -123,3 +124,23 @@ def test_model_input_output():
     assert outputs["o_alignment_dur"].shape == (2, 21)
     assert outputs["pitch_avg"].shape == (2, 1, 21)
     assert outputs["pitch_avg_gt"].shape == (2, 1, 21)
+
+
+def test_synthesize_batch():
+    config = FastPitchConfig()
+    model = ForwardTTS.init_from_config(config)
+    model.eval()
+    texts = ["Hello world.", "This is a longer sentence to test padding.", "Hi!"]
+    outputs = model.synthesize_batch(texts)
+    assert len(outputs) == len(texts)
+    for text, output in zip(texts, outputs):
+        reference = model.synthesize(text)["outputs"]["model_outputs"]
+        mel = output["outputs"]["model_outputs"]
+        assert mel.shape == reference.shape
+        assert T.allclose(mel, reference, atol=1e-4)
+
+    # Griffin-Lim runs once for the whole batch
+    outputs = model.synthesize_batch(texts, use_griffin_lim=True)
+    for output in outputs:
+        mel = output["outputs"]["model_outputs"]
+        assert output["wav"].shape == ((mel.shape[1] - 1) * model.ap.hop_length,)
@@ -197,6 +197,20 @@ class TestGlowTTS(unittest.TestCase):
         self._test_inference(1)
         self._test_inference(3)
 
+    def test_synthesize_batch(self):
+        config = GlowTTSConfig()
+        model = GlowTTS.init_from_config(config).to(device)
+        model.eval()
+        model.inference_noise_scale = 0.0
+        texts = ["Hello world.", "This is a longer sentence to test padding.", "Hi!"]
+        outputs = model.synthesize_batch(texts)
+        self.assertEqual(len(outputs), len(texts))
+        for text, output in zip(texts, outputs):
+            reference = model.synthesize(text)["outputs"]["model_outputs"]
+            mel = output["outputs"]["model_outputs"]
+            self.assertEqual(mel.shape, reference.shape)
+            self.assertTrue(torch.allclose(mel, reference, atol=1e-5))
+
     def _test_inference_with_d_vector(self, batch_size):
         input_dummy, input_lengths, mel_spec, mel_lengths, speaker_ids = self._create_inputs(batch_size)
         d_vector = torch.rand(batch_size, 256).to(device)
@@ -0,0 +1,112 @@
+import torch
+import torch.nn.functional as F
+
+from TTS.tts.configs.tortoise_config import TortoiseConfig
+from TTS.tts.layers.tortoise.autoregressive import UnifiedVoice
+from TTS.tts.layers.tortoise.clvp import CLVP
+from TTS.tts.models.tortoise import (
+    CALM_TOKEN,
+    Tortoise,
+    TortoiseArgs,
+    calm_token_lengths,
+    fix_autoregressive_output,
+    fix_autoregressive_outputs,
+)
+
+STOP = 8193
+
+
+def test_fix_autoregressive_outputs():
+    codes = torch.randint(0, 8000, (3, 30))
+    codes[0, 10] = STOP
+    codes[0, 20:] = STOP
+    codes[2, 25:] = STOP
+    expected = torch.stack([fix_autoregressive_output(row.clone(), STOP) for row in codes])
+    codes = fix_autoregressive_outputs(codes, STOP)
+    assert torch.equal(codes, expected)
+    assert (codes[0, 10:-3] == CALM_TOKEN).all()
+    assert codes[2, -3:].tolist() == [45, 45, 248]
+    assert (codes[1] != CALM_TOKEN).all()
+
+
+def test_calm_token_lengths():
+    codes = torch.randint(0, 80, (3, 40))
+    codes[0, 10:18] = CALM_TOKEN  # 8 calm tokens are kept
+    codes[1, 5:15] = CALM_TOKEN
+    codes[2, 30:] = CALM_TOKEN
+    assert calm_token_lengths(codes).tolist() == [40, 13, 38]
+
+
+@torch.inference_mode()
+def test_inference_speech_latents():
+    torch.manual_seed(0)
+    model = UnifiedVoice(
+        layers=2, model_dim=64, heads=4, max_mel_tokens=60, max_text_tokens=40, number_text_tokens=255
+    ).eval()
+    model.post_init_gpt2_config()
+    model.mel_head.bias[STOP] += 3.5  # end the samples early
+    conditioning = torch.randn(1, 64)
+    text = torch.randint(0, 200, (1, 12))
+
+    codes, latents = model.inference_speech(
+        conditioning, text, do_sample=True, num_return_sequences=4, max_generate_length=60, return_latent=True
+    )
+    assert latents.shape[0] == codes.shape[0] and latents.shape[1] >= codes.shape[1]
+    codes = fix_autoregressive_outputs(F.pad(codes, (0, 60 - codes.shape[1]), value=STOP), STOP)
+    lengths = calm_token_lengths(codes)
+    assert (lengths <= latents.shape[1]).all()
+    expected = model(
+        conditioning.repeat(4, 1),
+        text.repeat(4, 1),
+        torch.tensor([text.shape[-1]]),
+        codes,
+        torch.tensor([codes.shape[-1] * model.mel_length_compression]),
+        return_latent=True,
+        clip_inputs=False,
+    )
+    for i, length in enumerate(lengths):
+        assert torch.allclose(latents[i, :length], expected[i, :length], atol=1e-5)
+
+
+@torch.inference_mode()
+def test_clvp_similarity():
+    model = CLVP(dim_text=64, dim_speech=64, dim_latent=64, text_enc_depth=2, speech_enc_depth=2).eval()
+    text = torch.randint(0, 256, (1, 20))
+    speech = torch.randint(0, 8192, (5, 60))
+    scores = model.similarity(model.encode_text(text), model.encode_speech(speech))
+    assert torch.allclose(scores, model(text.repeat(5, 1), speech), atol=1e-5)
+
+
+@torch.inference_mode()
+def test_inference_candidates():
+    args = TortoiseArgs(
+        autoregressive_batch_size=4,
+        ar_layers=2,
+        ar_model_dim=64,
+        ar_heads=4,
+        diff_model_channels=64,
+        diff_num_layers=1,
+        diff_in_latent_channels=64,
+        diff_num_heads=4,
+        clvp_dim_text=64,
+        clvp_dim_speech=64,
+        clvp_dim_latent=64,
+        clvp_text_enc_depth=1,
+        clvp_speech_enc_depth=1,
+    )
+    torch.manual_seed(0)
+    model = Tortoise(TortoiseConfig(model_args=args)).eval()
+    model.autoregressive.post_init_gpt2_config(model.args.kv_cache)
+    model.autoregressive.mel_head.bias[STOP] += 2.0
+    conditioning_latents = (torch.randn(1, 64), torch.randn(1, 128))
+    kwargs = {"num_autoregressive_samples": 4, "diffusion_iterations": 2, "max_mel_tokens": 100, "verbose": False}
+
+    # the candidates are decoded in one padded batch
+    wavs = model.inference("Hello.", conditioning_latents=conditioning_latents, k=3, use_deterministic_seed=1, **kwargs)
+    wavs = wavs["wav"]
+    assert len(wavs) == 3
+    assert len({wav.shape[-1] for wav in wavs}) > 1
+    single = model.inference(
+        "Hello.", conditioning_latents=conditioning_latents, k=1, use_deterministic_seed=1, **kwargs
+    )
+    assert single["wav"].shape == wavs[0].shape
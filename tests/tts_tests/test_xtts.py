@@ -0,0 +1,211 @@
+import importlib.util
+import sys
+import types
+
+import pytest
+import torch
+
+from TTS.tts.configs.xtts_config import XttsConfig
+from TTS.tts.layers.xtts import tokenizer
+from TTS.tts.layers.xtts.gpt import GPT
+from TTS.tts.models.xtts import Xtts
+
+torch.manual_seed(1)
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = Xtts(XttsConfig())
+    model.hifigan_decoder.eval()
+    return model
+
+
+def _fake_generator(latents):
+    for i, latent in enumerate(latents):
+        yield i, latent[None]
+
+
+@pytest.mark.parametrize("length_scale", [1.0, 0.5])
+def test_decode_stream_window(model, length_scale):
+    latents = 0.3 * torch.randn(45, model.args.decoder_input_dim)
+    speaker_embedding = torch.randn(1, model.args.d_vector_dim, 1)
+
+    def decode(**kwargs):
+        chunks = model.decode_stream(_fake_generator(latents), speaker_embedding, length_scale=length_scale, **kwargs)
+        return torch.cat(list(chunks))
+
+    full = decode()
+    # the tail kept for cross-fading is not emitted after the last chunk
+    expected_len = model.hifigan_decoder.get_output_length(int(latents.shape[0] * length_scale)) - 1024
+    assert full.shape[0] == expected_len
+    # a window covering the whole sentence is the same as re-decoding everything
+    assert torch.equal(decode(stream_context_len=100), full)
+    windowed = decode(stream_context_len=8)
+    assert windowed.shape == full.shape
+    assert torch.allclose(windowed, full, atol=1e-2)
+
+    with pytest.raises(ValueError):
+        decode(stream_context_len=1)
+
+
+def _small_gpt():
+    return GPT(
+        layers=2,
+        model_dim=64,
+        heads=4,
+        max_text_tokens=50,
+        max_mel_tokens=60,
+        number_text_tokens=100,
+        num_audio_tokens=1026,
+        start_audio_token=1024,
+        stop_audio_token=1025,
+        start_text_token=99,
+        use_perceiver_resampler=True,
+    ).eval()
+
+
+def test_generate_return_latents():
+    gpt = _small_gpt()
+    gpt.init_gpt_for_inference()
+    cond_latents = torch.randn(1, 32, 64)
+    text_tokens = torch.randint(1, 90, (1, 12))
+    kwargs = {"do_sample": True, "top_k": 50, "top_p": 0.85, "num_return_sequences": 2}
+
+    with torch.inference_mode():
+        torch.manual_seed(0)
+        codes = gpt.generate(cond_latents, text_tokens, **kwargs)
+        torch.manual_seed(0)
+        same_codes, latents = gpt.generate(cond_latents, text_tokens, return_latents=True, **kwargs)
+        expected = gpt(
+            text_tokens.repeat(2, 1),
+            torch.tensor([12, 12]),
+            codes,
+            torch.tensor([codes.shape[-1] * gpt.code_stride_len] * 2),
+            cond_latents=cond_latents.repeat(2, 1, 1),
+            return_latent=True,
+        )
+    assert torch.equal(same_codes, codes)
+    assert latents.shape == expected.shape
+    assert torch.allclose(latents, expected, atol=1e-5)
+
+    # the latents are returned instead of the output object
+    with torch.inference_mode():
+        torch.manual_seed(0)
+        dict_codes, dict_latents = gpt.generate(
+            cond_latents, text_tokens, return_latents=True, return_dict_in_generate=True, **kwargs
+        )
+    assert torch.equal(dict_codes, codes)
+    assert torch.equal(dict_latents, latents)
+
+
+def test_generate_prefix_cache():
+    gpt = _small_gpt()
+    cond_latents = torch.randn(1, 32, 64)
+    text_tokens = torch.randint(1, 90, (1, 12))
+    kwargs = {"do_sample": True, "top_k": 50, "top_p": 0.85}
+
+    def generate(num_return_sequences):
+        torch.manual_seed(0)
+        return gpt.generate(cond_latents, text_tokens, num_return_sequences=num_return_sequences, **kwargs)
+
+    with torch.inference_mode():
+        gpt.init_gpt_for_inference(prefix_cache_entries=0)
+        expected = [generate(1), generate(2)]
+        gpt.init_gpt_for_inference()
+        codes = [generate(1), generate(1), generate(2)]
+    assert gpt.prefix_cache.stats()["hits"] == 2
+    assert torch.equal(codes[0], expected[0])
+    assert torch.equal(codes[1], expected[0])
+    assert torch.equal(codes[2], expected[1])
+
+
+def test_prefix_cache_disabled_with_deepspeed(monkeypatch):
+    # the kernels injected by DeepSpeed keep the keys and values in their own layout
+    deepspeed = types.SimpleNamespace(init_inference=lambda model, **kwargs: types.SimpleNamespace(module=model))
+    monkeypatch.setitem(sys.modules, "deepspeed", deepspeed)
+    gpt = _small_gpt()
+    gpt.init_gpt_for_inference(use_deepspeed=True)
+    assert gpt.prefix_cache.max_entries == 0
+
+
+def test_generate_batch():
+    gpt = _small_gpt()
+    gpt.init_gpt_for_inference()
+    cond_latents = torch.randn(3, 32, 64)
+    text_tokens = torch.randint(1, 90, (3, 12))
+    text_lengths = torch.tensor([12, 5, 9])
+    kwargs = {"do_sample": False, "repetition_penalty": 2.0}
+
+    with torch.inference_mode():
+        codes, latents = gpt.generate(cond_latents, text_tokens, text_lengths, return_latents=True, **kwargs)
+        for i, length in enumerate(text_lengths):
+            expected_codes, expected_latents = gpt.generate(
+                cond_latents[i : i + 1], text_tokens[i : i + 1, :length], return_latents=True, **kwargs
+            )
+            num_codes = expected_codes.shape[1]
+            assert torch.equal(codes[i, :num_codes], expected_codes[0])
+            assert torch.all(codes[i, num_codes:] == gpt.stop_audio_token)
+            assert torch.allclose(latents[i, :num_codes], expected_latents[0], atol=1e-5)
+
+
+def test_decode_latents(model):
+    latents = [
+        0.3 * torch.randn(1, 30, model.args.decoder_input_dim),
+        0.3 * torch.randn(1, 45, model.args.decoder_input_dim),
+        0.3 * torch.randn(1, 30, model.args.decoder_input_dim),
+    ]
+    speaker_embedding = torch.randn(3, model.args.d_vector_dim, 1)
+
+    with torch.inference_mode():
+        wavs = model._decode_latents(latents, speaker_embedding)
+        for x, wav, g in zip(latents, wavs, speaker_embedding):
+            expected = model.hifigan_decoder(x, g=g[None])
+            assert wav.shape == expected.shape
+            assert torch.allclose(wav, expected, atol=1e-5)
+
+
+@pytest.mark.parametrize("use_spacy", [True, False])
+def test_split_sentences(monkeypatch, caplog, use_spacy):
+    if use_spacy and importlib.util.find_spec("spacy") is None:
+        pytest.skip("spacy not installed")
+    if not use_spacy:
+
+        def no_spacy(lang):
+            raise ImportError("No module named 'spacy'")
+
+        monkeypatch.setattr(tokenizer, "get_sentencizer", no_spacy)
+        tokenizer._warn_no_spacy.cache_clear()
+    text = "This is the first sentence. Is this the second one? Yes! " * 3
+    expected = ["This is the first sentence. Is this the second one? Yes!"] * 3
+    assert tokenizer.split_sentence(text, "en", 55) == expected
+    assert tokenizer.split_sentences([text, "Short text.", text], "en", 55) == [expected, ["Short text."], expected]
+    assert tokenizer.split_sentence("今天天气很好。我们去公园吧。好的", "zh", 10) == [
+        "今天天气很好。",
+        "我们去公园吧。 好的",
+    ]
+    if not use_spacy:
+        assert "No module named 'spacy'" in caplog.text
+    if use_spacy:
+        # one shared pipeline for all languages split like English
+        assert tokenizer.get_sentencizer("en") is tokenizer.get_sentencizer("fr")
+
+
+@pytest.mark.parametrize("lang", ["en", "de", "fr", "pl", "ru", "tr", "hu"])
+def test_multilingual_normalizer(lang):
+    texts = [
+        'He said "Hello Mr. Smith", Dr.St. Co. is 1st & 2nd @ 12.5% and 100,000.5°.',
+        "That will be $20, 20.15€ or £1,000.99 at 5$£ and 1.2.3$, no\tdigits  here  # !",
+        "Dies ist ein 1. Test, Frau Dr. Müller. Pilim %14 dolu. Ez az 3. teszt İÖÜ",
+        "P. Kowalski, M. Nowak, Г-н Иванов и Д-р Смирнов, г-жаг-н. B. Yılmaz, Dr. Szabó",
+        "No numbers, abbreviations or symbols.",
+    ]
+    for text in texts:
+        # the patterns applied one after the other
+        expected = text.replace('"', "")
+        if lang == "tr":
+            expected = expected.replace("İ", "i").replace("Ö", "ö").replace("Ü", "ü")
+        expected = tokenizer.expand_numbers_multilingual(expected.lower(), lang)
+        expected = tokenizer.expand_abbreviations_multilingual(expected, lang)
+        expected = " ".join(tokenizer.expand_symbols_multilingual(expected, lang).split())
+        assert tokenizer.multilingual_cleaners(text, lang) == expected
+    assert tokenizer.get_normalizer(lang) is tokenizer.get_normalizer(lang)
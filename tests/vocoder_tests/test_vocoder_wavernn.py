@@ -49,3 +49,51 @@ def test_wavernn():
     assert np.all(output.shape == (2, 1280, 2**4)), output.shape
     output = model.inference(dummy_y, True, 5500, 550)
     assert np.all(output.shape == (256 * (y_size - 1),))
+
+
+def _deterministic_wavernn(use_aux_net):
+    """Small 4-bit model that always samples the most likely class."""
+    config = WavernnConfig()
+    config.model_args = WavernnArgs(
+        rnn_dims=32, fc_dims=32, mode=4, mulaw=False, use_aux_net=use_aux_net, num_res_blocks=2, res_out_dims=32
+    )
+    torch.manual_seed(0)
+    model = Wavernn(config).eval()
+    model._sample = lambda logits: 2 * logits.argmax(dim=1, keepdim=True).float() / 15 - 1
+    return model
+
+
+def test_wavernn_inference_teacher_forcing():
+    for use_aux_net in (True, False):
+        model = _deterministic_wavernn(use_aux_net)
+        mel = torch.rand(80, 30)
+        wav = torch.from_numpy(model.inference(mel)).float()
+        with torch.no_grad():
+            padded = model.pad_tensor(mel.T.unsqueeze(0), pad=2).transpose(1, 2)
+            x = torch.zeros(1, 30 * 256)
+            x[0, 1 : len(wav)] = wav[:-1]
+            logits = model(x, padded)
+        expected = 2 * logits.argmax(-1)[0].float() / 15 - 1
+        # the last 20 frames are faded out
+        num_samples = 9 * 256
+        assert torch.allclose(wav[:num_samples], expected[:num_samples])
+
+
+def test_wavernn_inference_batch():
+    model = _deterministic_wavernn(True)
+    mels = [torch.rand(80, 30), torch.rand(80, 12), torch.rand(1, 80, 21).numpy()]
+    for kwargs in ({}, {"batched": True, "target": 1000, "overlap": 100}):
+        waveforms = model.inference_batch(mels, **kwargs)
+        assert [len(wav) for wav in waveforms] == [29 * 256, 11 * 256, 20 * 256]
+        for mel, wav in zip(mels, waveforms):
+            assert np.allclose(model.inference(mel, **kwargs), wav, atol=1e-6)
+
+
+def test_fold_with_overlap():
+    x = torch.arange(1, 11).view(1, 10, 1)
+    folded = Wavernn.fold_with_overlap(Wavernn, x, target=2, overlap=1)
+    assert folded[..., 0].tolist() == [[1, 2, 3, 4], [4, 5, 6, 7], [7, 8, 9, 10]]
+
+    # each fold starts with 2 samples of silence and a fade-in of 2 samples, and ends with the reverse
+    unfolded = Wavernn.xfade_and_unfold(np.ones((3, 10)), target=2, overlap=4)
+    assert unfolded.tolist() == [0, 0, 0, 1, 1, 1, 1, 0, 0, 1, 1, 1, 1, 0, 0, 1, 1, 1, 1, 0, 0, 0]